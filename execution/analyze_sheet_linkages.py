@@ -21,7 +21,7 @@ Examples:
 import argparse
 import re
 from google.oauth2.credentials import Credentials
-import gspread
+from sheets_quota import authorize
 
 def find_linkages(spreadsheet_id, source_sheet_name, target_sheet_name):
     """Find all cells in source_sheet referenced by formulas in target_sheet"""
@@ -29,7 +29,7 @@ def find_linkages(spreadsheet_id, source_sheet_name, target_sheet_name):
     creds = Credentials.from_authorized_user_file("token.json", 
         scopes=["https://www.googleapis.com/auth/spreadsheets"])
     
-    client = gspread.authorize(creds)
+    client = authorize(creds)
     spreadsheet = client.open_by_key(spreadsheet_id)
     
     target_sheet = spreadsheet.worksheet(target_sheet_name)
@@ -112,7 +112,7 @@ def find_all_linkages(spreadsheet_id):
     creds = Credentials.from_authorized_user_file("token.json", 
         scopes=["https://www.googleapis.com/auth/spreadsheets"])
     
-    client = gspread.authorize(creds)
+    client = authorize(creds)
     spreadsheet = client.open_by_key(spreadsheet_id)
     
     worksheets = spreadsheet.worksheets()
@@ -30,14 +30,7 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-try:
-    import gspread
-except ImportError:
-    print("Installing gspread...")
-    import subprocess
-
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "gspread"])
-    import gspread
+from sheets_quota import authorize
 
 
 class AuditStatus(Enum):
@@ -83,7 +76,7 @@ def get_sheets_client():
         with open("token.json", "w") as token:
             token.write(creds.to_json())
 
-    return gspread.authorize(creds)
+    return authorize(creds)
 
 
 def parse_value(val) -> float:
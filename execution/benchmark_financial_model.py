@@ -0,0 +1,685 @@
+#!/usr/bin/env python3
+"""
+Financial Model Builder Benchmarks
+==================================
+
+Measures how long FinancialModelBuilder takes to build and save a model and
+how large the resulting .xlsx is. Uses either a real project config or a
+synthetic config of configurable size.
+
+Benchmarks:
+    styles     Interned style registry vs. fresh style objects per cell
+    backends   openpyxl vs. streaming backend: time and peak memory by size
+    periods    annual / hybrid / monthly time axes against a time budget
+    writers    openpyxl save vs. xlsxwriter with and without shared formulas:
+               save time, load time (openpyxl, optionally `formulas`), size
+    scaling    sweep streams (1-500), departments (1-100), funding rounds
+               (1-20) and years (5-40) one axis at a time; per-sheet build
+               time and peak memory, save time and file size, compared
+               against a baseline JSON (regressions exit 1)
+
+Usage:
+    python execution/benchmark_financial_model.py styles
+    python execution/benchmark_financial_model.py backends --years 11 41 --streams 10 300
+    python execution/benchmark_financial_model.py styles --config config.json --repeat 5
+    python execution/benchmark_financial_model.py periods --build-budget 5 --validate-budget 120
+    python execution/benchmark_financial_model.py styles --streams 100 --years 21 --json out.json
+    python execution/benchmark_financial_model.py writers --streams 100 --years 21
+    python execution/benchmark_financial_model.py scaling --baseline benchmarks/scaling.json
+    python execution/benchmark_financial_model.py scaling --streams 1 500 --years 5 40 \
+        --baseline benchmarks/scaling.json --update-baseline
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, Optional
+
+from build_financial_model import SHEET_SEQUENCE, FinancialModelBuilder
+
+
+# =============================================================================
+# CONFIG GENERATION
+# =============================================================================
+def synthetic_config(
+    streams: int = 10, departments: int = 8, fixed_costs: int = 10, rounds: int = 3
+) -> Dict[str, Any]:
+    """Deterministic config with the requested number of line items."""
+    return {
+        "company_name": f"Synthetic {streams}x{departments}x{rounds}",
+        "starting_year": 2026,
+        "revenue_streams": [
+            {
+                "name": f"Stream {i + 1}",
+                "price": 500 + 37 * i,
+                "volume": 10 + i % 7,
+                "growth": 0.15 + (i % 5) * 0.05,
+                "cogs_pct": 0.2 + (i % 4) * 0.1,
+            }
+            for i in range(streams)
+        ],
+        "fixed_costs": [
+            {"name": f"Fixed Cost {i + 1}", "annual_cost": 12000 + 1000 * i}
+            for i in range(fixed_costs)
+        ],
+        "headcount": {
+            "departments": [
+                {
+                    "name": f"Department {i + 1}",
+                    "salary": 50000 + 2500 * i,
+                    "y0_count": 1 + i % 4,
+                    "growth": 0.2,
+                }
+                for i in range(departments)
+            ]
+        },
+        "funding": {
+            "rounds": [
+                {
+                    "name": f"Round {i + 1}",
+                    "amount": 1000000 * (i + 1),
+                    "year": i,
+                    "pre_money": 4000000 * (i + 1),
+                }
+                for i in range(rounds)
+            ]
+        },
+    }
+
+
+def load_config(args) -> Dict[str, Any]:
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return synthetic_config(args.streams, args.departments, args.fixed_costs, args.rounds)
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+def measure_build(
+    config: Dict[str, Any], years: int, repeat: int, interning: bool = True
+) -> Dict[str, Any]:
+    """Best-of-N build and save time plus file size for one builder setup."""
+    best_build = best_save = float("inf")
+    size = 0
+    builder: Optional[FinancialModelBuilder] = None
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "model.xlsx")
+        for _ in range(repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                builder = FinancialModelBuilder(json.loads(json.dumps(config)), years)
+                builder.styles.interning = interning
+                started = time.perf_counter()
+                builder.build_all()
+                built = time.perf_counter()
+                builder.save(path)
+                saved = time.perf_counter()
+            best_build = min(best_build, built - started)
+            best_save = min(best_save, saved - built)
+            size = os.path.getsize(path)
+    wb = builder.wb
+    return {
+        "build_ms": round(best_build * 1000, 1),
+        "save_ms": round(best_save * 1000, 1),
+        "file_bytes": size,
+        "style_objects_created": builder.styles.created,
+        "style_cache_hits": builder.styles.applied,
+        "fonts": len(wb._fonts),
+        "fills": len(wb._fills),
+        "cell_xfs": len(wb._cell_styles),
+    }
+
+
+def _change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def bench_styles(args) -> Dict[str, Any]:
+    config = load_config(args)
+    legacy = measure_build(config, args.years, args.repeat, interning=False)
+    interned = measure_build(config, args.years, args.repeat, interning=True)
+
+    print("STYLE REGISTRY BENCHMARK")
+    print("=" * 60)
+    print(f"{'Metric':<24}{'Per-cell objects':>18}{'Interned':>12}{'Change':>10}")
+    for key in ["build_ms", "save_ms", "file_bytes", "style_objects_created", "cell_xfs"]:
+        before, after = legacy[key], interned[key]
+        print(f"{key:<24}{before:>18,}{after:>12,}{_change(before, after):>10}")
+    print("=" * 60)
+    return {"benchmark": "styles", "legacy": legacy, "interned": interned}
+
+
+def measure_peak(config: Dict[str, Any], years: int, backend: str) -> Dict[str, Any]:
+    """Build + save once under tracemalloc; returns time and peak heap."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "model.xlsx")
+        tracemalloc.start()
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder = FinancialModelBuilder(config, years, backend=backend)
+            builder.build_all()
+            builder.save(path)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        size = os.path.getsize(path)
+    return {
+        "backend": backend,
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "peak_mb": round(peak / 1e6, 2),
+        "file_bytes": size,
+    }
+
+
+def bench_backends(args) -> Dict[str, Any]:
+    import sheet_plan  # noqa: F401  (keep import cost out of the first measurement)
+
+    rows = []
+    print("BACKEND BENCHMARK (peak = traced Python heap during build + save)")
+    print("=" * 72)
+    print(f"{'Streams':>8}{'Years':>7}  {'Backend':<11}{'Time (ms)':>12}{'Peak (MB)':>12}{'File (KB)':>12}")
+    for streams in args.streams:
+        for years in args.years:
+            for backend in FinancialModelBuilder.BACKENDS:
+                config = synthetic_config(streams, args.departments, args.fixed_costs, args.rounds)
+                result = measure_peak(config, years, backend)
+                result.update({"streams": streams, "years": years})
+                rows.append(result)
+                print(
+                    f"{streams:>8}{years:>7}  {backend:<11}{result['elapsed_ms']:>12,.0f}"
+                    f"{result['peak_mb']:>12.2f}{result['file_bytes'] / 1024:>12,.0f}"
+                )
+    print("=" * 72)
+    return {"benchmark": "backends", "results": rows}
+
+
+# (granularity, years) -> 11, 44 and 120 period columns
+PERIOD_CASES = [("annual", 11), ("hybrid", 11), ("monthly", 10)]
+
+
+def measure_axis(
+    config: Dict[str, Any], years: int, granularity: str, validate: bool
+) -> Dict[str, Any]:
+    """Build, save, compute natively and (optionally) validate one time axis."""
+    from validate_excel_model import ExcelModelValidator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "model.xlsx")
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            builder = FinancialModelBuilder(config, years, granularity=granularity)
+            builder.build_all()
+            built = time.perf_counter()
+            builder.save(path)
+            saved = time.perf_counter()
+            engine_ms = builder.compute().elapsed_ms
+            result = {
+                "granularity": granularity,
+                "years": years,
+                "periods": builder.num_periods,
+                "build_ms": round((built - started) * 1000, 1),
+                "save_ms": round((saved - built) * 1000, 1),
+                "engine_ms": round(engine_ms, 2),
+                "file_bytes": os.path.getsize(path),
+                "validate_ms": None,
+                "valid": None,
+            }
+            if validate:
+                validator = ExcelModelValidator(path)
+                result["valid"], _ = validator.validate()
+                result["validate_ms"] = round((time.perf_counter() - saved) * 1000, 1)
+    return result
+
+
+def bench_periods(args) -> Dict[str, Any]:
+    config = load_config(args)
+    rows = []
+    print(
+        f"TIME AXIS BENCHMARK (budget: build+save {args.build_budget:g}s, "
+        f"validate {args.validate_budget:g}s)"
+    )
+    print("=" * 78)
+    print(
+        f"{'Axis':<9}{'Periods':>8}{'Build (ms)':>12}{'Save (ms)':>11}"
+        f"{'Engine (ms)':>13}{'Validate (ms)':>15}  Budget"
+    )
+    for granularity, years in PERIOD_CASES:
+        result = measure_axis(config, years, granularity, not args.no_validate)
+        build_s = (result["build_ms"] + result["save_ms"]) / 1000
+        validate_s = (result["validate_ms"] or 0) / 1000
+        result["within_budget"] = (
+            build_s <= args.build_budget
+            and validate_s <= args.validate_budget
+            and result["valid"] is not False
+        )
+        rows.append(result)
+        validate_txt = f"{result['validate_ms']:,.0f}" if result["validate_ms"] else "-"
+        print(
+            f"{granularity:<9}{result['periods']:>8}{result['build_ms']:>12,.0f}"
+            f"{result['save_ms']:>11,.0f}{result['engine_ms']:>13.2f}{validate_txt:>15}"
+            f"  {'OK' if result['within_budget'] else 'OVER'}"
+        )
+    print("=" * 78)
+    return {
+        "benchmark": "periods",
+        "build_budget_s": args.build_budget,
+        "validate_budget_s": args.validate_budget,
+        "within_budget": all(r["within_budget"] for r in rows),
+        "results": rows,
+    }
+
+
+WRITERS = [
+    ("openpyxl", None),
+    ("xlsxwriter", False),
+    ("xlsxwriter-shared", True),
+]
+
+
+def measure_load(path: str, formulas_load: bool) -> Dict[str, Any]:
+    """Time to load a saved model with openpyxl (and optionally `formulas`)."""
+    from openpyxl import load_workbook
+
+    started = time.perf_counter()
+    load_workbook(path)
+    result = {"openpyxl_load_ms": round((time.perf_counter() - started) * 1000, 1)}
+    if formulas_load:
+        import formulas
+
+        started = time.perf_counter()
+        with contextlib.redirect_stderr(io.StringIO()):
+            formulas.ExcelModel().loads(path).finish()
+        result["formulas_load_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def bench_writers(args) -> Dict[str, Any]:
+    from layout_ir import compile_xlsx
+
+    config = load_config(args)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            reference = FinancialModelBuilder(json.loads(json.dumps(config)), args.years)
+            reference.build_all()
+            layout = FinancialModelBuilder(
+                json.loads(json.dumps(config)), args.years, backend="layout"
+            )
+            layout.build_all()
+        for name, shared in WRITERS:
+            path = os.path.join(tmp, f"{name}.xlsx")
+            best = float("inf")
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                if shared is None:
+                    reference.wb.save(path)
+                else:
+                    compile_xlsx(layout.wb, path, shared_formulas=shared)
+                best = min(best, time.perf_counter() - started)
+            row = {"writer": name, "save_ms": round(best * 1000, 1)}
+            row["file_bytes"] = os.path.getsize(path)
+            row.update(measure_load(path, args.formulas_load))
+            rows.append(row)
+
+    print("WRITER BENCHMARK (same layout, save only; load = openpyxl.load_workbook)")
+    print("=" * 78)
+    header = f"{'Writer':<20}{'Save (ms)':>11}{'File (KB)':>11}{'Load (ms)':>11}"
+    print(header + (f"{'formulas load (ms)':>20}" if args.formulas_load else ""))
+    base = rows[0]
+    for row in rows:
+        line = (
+            f"{row['writer']:<20}{row['save_ms']:>11,.0f}"
+            f"{row['file_bytes'] / 1024:>11,.0f}{row['openpyxl_load_ms']:>11,.0f}"
+        )
+        if args.formulas_load:
+            line += f"{row['formulas_load_ms']:>20,.0f}"
+        print(line)
+    print("-" * 78)
+    for row in rows[1:]:
+        print(
+            f"{row['writer']:<20} save {_change(base['save_ms'], row['save_ms'])}, "
+            f"size {_change(base['file_bytes'], row['file_bytes'])}, "
+            f"load {_change(base['openpyxl_load_ms'], row['openpyxl_load_ms'])} vs openpyxl"
+        )
+    print("=" * 78)
+    return {"benchmark": "writers", "years": args.years, "results": rows}
+
+
+# Scaling sweep: each axis is varied on its own around BASE_POINT
+BASE_POINT = {"streams": 10, "departments": 8, "rounds": 3, "years": 11}
+SCALING_AXES = {
+    "streams": [1, 10, 50, 100, 250, 500],
+    "departments": [1, 10, 25, 50, 100],
+    "rounds": [1, 5, 10, 20],
+    "years": [5, 11, 20, 40],
+}
+# Case metrics compared against the baseline (per-sheet build_ms too)
+BASELINE_METRICS = ["build_ms", "save_ms", "file_bytes", "peak_mb"]
+
+
+def scaling_points(axes: Dict[str, list]) -> list:
+    """Unique sweep points: BASE_POINT with one axis replaced at a time."""
+    points = []
+    for axis, values in axes.items():
+        for value in values:
+            point = dict(BASE_POINT, **{axis: value})
+            if point not in points:
+                points.append(point)
+    return points
+
+
+def case_id(point: Dict[str, int]) -> str:
+    return ",".join(f"{k}={point[k]}" for k in BASE_POINT)
+
+
+def measure_sheets(
+    config: Dict[str, Any], years: int, repeat: int = 1
+) -> Dict[str, Any]:
+    """Per-sheet build time and peak memory, then save time and file size.
+
+    Times come from untraced runs with the garbage collector paused (best
+    of `repeat`); peak memory from one extra run under tracemalloc, as the
+    heap growth above the level at the start of each sheet.
+    """
+    sheet_ms = {name: float("inf") for name in SHEET_SEQUENCE}
+    best_build = best_save = float("inf")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "model.xlsx")
+        for _ in range(repeat):
+            gc.collect()
+            gc.disable()
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    builder = FinancialModelBuilder(json.loads(json.dumps(config)), years)
+                    started = time.perf_counter()
+                    for name in SHEET_SEQUENCE:
+                        t = time.perf_counter()
+                        builder._build_sheet(name)
+                        sheet_ms[name] = min(sheet_ms[name], time.perf_counter() - t)
+                    built = time.perf_counter()
+                    builder.save(path)
+                    saved = time.perf_counter()
+            finally:
+                gc.enable()
+            best_build = min(best_build, built - started)
+            best_save = min(best_save, saved - built)
+        size = os.path.getsize(path)
+
+        sheet_peak = {}
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder = FinancialModelBuilder(json.loads(json.dumps(config)), years)
+            for name in SHEET_SEQUENCE:
+                base, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                builder._build_sheet(name)
+                sheet_peak[name] = tracemalloc.get_traced_memory()[1] - base
+            tracemalloc.reset_peak()
+            builder.save(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    total_peak = max([peak] + list(sheet_peak.values()))
+    return {
+        "build_ms": round(best_build * 1000, 1),
+        "save_ms": round(best_save * 1000, 1),
+        "file_bytes": size,
+        "peak_mb": round(total_peak / 1e6, 2),
+        "sheets": {
+            name: {
+                "build_ms": round(sheet_ms[name] * 1000, 2),
+                "peak_kb": round(sheet_peak[name] / 1024, 1),
+            }
+            for name in SHEET_SEQUENCE
+        },
+    }
+
+
+def compare_to_baseline(
+    cases: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Any],
+    tolerance: float,
+    time_tolerance: float,
+    min_ms: float,
+) -> list:
+    """Metrics that grew past their tolerance.
+
+    File size and peak memory are deterministic and use `tolerance`;
+    timings use the looser `time_tolerance` and must also grow by more than
+    `min_ms` to count.
+    """
+
+    def worse(metric, before, after):
+        if before is None:
+            return False
+        if metric.endswith("_ms"):
+            return after > before * (1 + time_tolerance) and after - before > min_ms
+        return after > before * (1 + tolerance)
+
+    regressions = []
+    for cid, case in cases.items():
+        old = baseline.get("cases", {}).get(cid)
+        if old is None:
+            continue
+        checks = [(None, m, old.get(m), case[m]) for m in BASELINE_METRICS]
+        checks += [
+            (sheet, "build_ms", old.get("sheets", {}).get(sheet, {}).get("build_ms"), v["build_ms"])
+            for sheet, v in case["sheets"].items()
+        ]
+        for sheet, metric, before, after in checks:
+            if worse(metric, before, after):
+                regressions.append(
+                    {
+                        "case": cid,
+                        "sheet": sheet,
+                        "metric": metric,
+                        "baseline": before,
+                        "current": after,
+                        "change": _change(before, after),
+                    }
+                )
+    return regressions
+
+
+def bench_scaling(args) -> Dict[str, Any]:
+    axes = {
+        axis: getattr(args, axis) or values for axis, values in SCALING_AXES.items()
+    }
+    points = scaling_points(axes)
+    cases = {}
+    print(f"SCALING BENCHMARK ({len(points)} cases, peak = traced Python heap)")
+    print("=" * 86)
+    print(
+        f"{'Streams':>8}{'Depts':>7}{'Rounds':>8}{'Years':>7}{'Build (ms)':>12}"
+        f"{'Save (ms)':>11}{'File (KB)':>11}{'Peak (MB)':>11}  Slowest sheet"
+    )
+    for point in points:
+        config = synthetic_config(
+            point["streams"], point["departments"], args.fixed_costs, point["rounds"]
+        )
+        case = measure_sheets(config, point["years"], args.repeat)
+        case.update(point)
+        cases[case_id(point)] = case
+        slowest = max(case["sheets"], key=lambda n: case["sheets"][n]["build_ms"])
+        print(
+            f"{point['streams']:>8}{point['departments']:>7}{point['rounds']:>8}"
+            f"{point['years']:>7}{case['build_ms']:>12,.0f}{case['save_ms']:>11,.0f}"
+            f"{case['file_bytes'] / 1024:>11,.0f}{case['peak_mb']:>11.2f}  {slowest}"
+        )
+    print("=" * 86)
+
+    result = {
+        "benchmark": "scaling",
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "base_point": BASE_POINT,
+        "cases": cases,
+        "regressions": [],
+    }
+    if not args.baseline:
+        return result
+
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        result["baseline"] = args.baseline
+        result["regressions"] = compare_to_baseline(
+            cases, baseline, args.tolerance, args.time_tolerance, args.min_ms
+        )
+        compared = sum(cid in baseline.get("cases", {}) for cid in cases)
+        print(f"Compared {compared}/{len(cases)} cases against {args.baseline}")
+        for r in result["regressions"]:
+            where = f"{r['case']} {r['sheet']}" if r["sheet"] else r["case"]
+            print(
+                f"  REGRESSION {where} {r['metric']}: "
+                f"{r['baseline']:,} -> {r['current']:,} ({r['change']})"
+            )
+        if not result["regressions"]:
+            print(
+                f"No regressions (tolerance: size/memory {args.tolerance:.0%}, "
+                f"time {args.time_tolerance:.0%})"
+            )
+    else:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({k: v for k, v in result.items() if k != "regressions"}, f, indent=2)
+        print(f"Baseline written: {args.baseline}")
+    return result
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark FinancialModelBuilder build/save performance",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Benchmark to run")
+
+    styles_parser = subparsers.add_parser(
+        "styles", help="Interned style registry vs. per-cell style objects"
+    )
+    styles_parser.add_argument("--config", "-c", help="Project config (default: synthetic)")
+    styles_parser.add_argument("--streams", type=int, default=30, help="Synthetic revenue streams")
+    styles_parser.add_argument("--years", type=int, default=11, help="Model years")
+    styles_parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best-of)")
+
+    backends_parser = subparsers.add_parser(
+        "backends", help="openpyxl vs. streaming backend time and peak memory"
+    )
+    backends_parser.add_argument(
+        "--streams", type=int, nargs="+", default=[10, 100, 300], help="Stream counts"
+    )
+    backends_parser.add_argument(
+        "--years", type=int, nargs="+", default=[11, 41], help="Year horizons"
+    )
+
+    periods_parser = subparsers.add_parser(
+        "periods", help="Annual / hybrid / monthly (120-column) models vs. a time budget"
+    )
+    periods_parser.add_argument("--config", "-c", help="Project config (default: synthetic)")
+    periods_parser.add_argument("--streams", type=int, default=10, help="Synthetic revenue streams")
+    periods_parser.add_argument(
+        "--build-budget", type=float, default=5.0, help="Max build + save seconds (default: 5)"
+    )
+    periods_parser.add_argument(
+        "--validate-budget", type=float, default=120.0, help="Max validation seconds (default: 120)"
+    )
+    periods_parser.add_argument(
+        "--no-validate", action="store_true", help="Skip formula recalculation"
+    )
+
+    writers_parser = subparsers.add_parser(
+        "writers", help="openpyxl vs. xlsxwriter (plain / shared formulas): save, load, size"
+    )
+    writers_parser.add_argument("--config", "-c", help="Project config (default: synthetic)")
+    writers_parser.add_argument("--streams", type=int, default=100, help="Synthetic revenue streams")
+    writers_parser.add_argument("--years", type=int, default=21, help="Model years")
+    writers_parser.add_argument("--repeat", type=int, default=3, help="Saves per writer (best-of)")
+    writers_parser.add_argument(
+        "--formulas-load",
+        action="store_true",
+        help="Also time loading into the `formulas` engine (slow: ~1 min per file)",
+    )
+
+    scaling_parser = subparsers.add_parser(
+        "scaling", help="Sweep streams/departments/rounds/years; compare to a baseline"
+    )
+    for axis, values in SCALING_AXES.items():
+        scaling_parser.add_argument(
+            f"--{axis}",
+            type=int,
+            nargs="+",
+            help=f"Sweep points for {axis} (default: {' '.join(map(str, values))})",
+        )
+    scaling_parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per case (best-of, default: 3)"
+    )
+    scaling_parser.add_argument(
+        "--baseline", help="Baseline JSON: compared against if present, else written"
+    )
+    scaling_parser.add_argument(
+        "--update-baseline", action="store_true", help="Overwrite the baseline with this run"
+    )
+    scaling_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed file size / peak memory growth (default: 0.10)",
+    )
+    scaling_parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed build/save time growth (default: 0.5)",
+    )
+    scaling_parser.add_argument(
+        "--min-ms",
+        type=float,
+        default=50.0,
+        help="Ignore timing regressions smaller than this (default: 50 ms)",
+    )
+
+    for sub in [styles_parser, backends_parser, periods_parser, writers_parser]:
+        sub.add_argument("--departments", type=int, default=15, help="Synthetic departments")
+        sub.add_argument("--rounds", type=int, default=3, help="Synthetic funding rounds")
+    for sub in [styles_parser, backends_parser, periods_parser, writers_parser, scaling_parser]:
+        sub.add_argument("--fixed-costs", type=int, default=20, help="Synthetic fixed costs")
+        sub.add_argument("--json", "-j", help="Write results to this JSON file")
+
+    args = parser.parse_args()
+
+    if args.command == "styles":
+        result = bench_styles(args)
+    elif args.command == "backends":
+        result = bench_backends(args)
+    elif args.command == "periods":
+        result = bench_periods(args)
+    elif args.command == "writers":
+        result = bench_writers(args)
+    elif args.command == "scaling":
+        result = bench_scaling(args)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"Saved: {args.json}")
+
+    if result.get("within_budget") is False or result.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,22 +12,45 @@ Usage:
     python execution/build_financial_model.py --config config.json
     python execution/build_financial_model.py --config config.json --up-to "P&L"
     python execution/build_financial_model.py --config config.json --sheets "Assumptions" "Revenue"
+    python execution/build_financial_model.py --config config.json --compute
+    python execution/build_financial_model.py --config config.json --years 41 --streaming
+    python execution/build_financial_model.py --config config.json --granularity hybrid
+    python execution/build_financial_model.py --config config.json --monte-carlo 10000
+    python execution/build_financial_model.py --config config.json --formats xlsx sheets csv
+    python execution/build_financial_model.py --config config.json --profile build.jsonl
+    python execution/build_financial_model.py --configs ".tmp/*/config/*_config.json" --validate
+    python execution/build_financial_model.py --configs-dir configs/ --workers 8 --report report.json
 """
 
 import argparse
+import contextlib
+import glob
+import hashlib
+import inspect
+import io
 import json
 import os
 import sys
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from copy import copy
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 try:
-    from openpyxl import Workbook
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.cell.cell import MergedCell
     from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    from openpyxl.styles.cell_style import StyleArray
     from openpyxl.utils import get_column_letter
 except ImportError:
     print("ERROR: openpyxl not installed. Run: pip install openpyxl")
     sys.exit(1)
 
+from config_schema import compile_config
+from time_axis import TimeAxis
+
 
 # =============================================================================
 # COLOR PALETTE (matches directives/SHEET_BUILD_GUIDE.md)
@@ -46,6 +69,61 @@ class Colors:
     GRAY = "808080"
 
 
+# =============================================================================
+# STYLE REGISTRY
+# =============================================================================
+class StyleRegistry:
+    """Interns cell styles so each visual style is built once per workbook.
+
+    openpyxl hashes every Font/PatternFill/Alignment/Border assigned to a cell
+    to look up its index in the workbook style tables. The registry resolves
+    each (current style, requested change) pair once, caches the resulting
+    style tuple and applies it to every later cell by reference.
+    """
+
+    def __init__(self, interning: bool = True):
+        self.interning = interning  # False = fresh objects per cell (benchmarks)
+        self._resolved: Dict[tuple, StyleArray] = {}
+        self.created = 0  # style objects built (cache misses)
+        self.applied = 0  # cells styled from the cache
+
+    def apply(self, cell, **attrs):
+        current = tuple(cell._style) if cell._style is not None else _EMPTY_STYLE
+        key = (current, tuple(sorted(attrs.items())))
+        style = self._resolved.get(key) if self.interning else None
+        if style is None:
+            for attr, spec in attrs.items():
+                setattr(cell, attr, _STYLE_FACTORIES[attr](spec))
+            if self.interning:
+                self._resolved[key] = copy(cell._style)
+            self.created += len(attrs)
+        else:
+            cell._style = copy(style)
+            self.applied += 1
+
+
+_EMPTY_STYLE = tuple(StyleArray())
+_REGISTRIES: "weakref.WeakKeyDictionary[Workbook, StyleRegistry]" = (
+    weakref.WeakKeyDictionary()
+)
+_STYLE_FACTORIES = {
+    "font": lambda spec: Font(**dict(spec)),
+    "fill": lambda color: PatternFill(
+        start_color=color, end_color=color, fill_type="solid"
+    ),
+    "alignment": lambda spec: Alignment(**dict(spec)),
+    "border": lambda spec: THIN_BORDER,
+}
+
+
+def style_registry(wb) -> StyleRegistry:
+    """Return the StyleRegistry bound to a workbook (created on first use)."""
+    registry = _REGISTRIES.get(wb)
+    if registry is None:
+        registry = _REGISTRIES[wb] = StyleRegistry()
+    return registry
+
+
 # =============================================================================
 # STYLING HELPERS
 # =============================================================================
@@ -55,20 +133,38 @@ THIN_BORDER = Border(
     top=Side(style="thin"),
     bottom=Side(style="thin"),
 )
+_CENTER = (("horizontal", "center"), ("vertical", "center"))
+_CENTER_WRAP = _CENTER + (("wrap_text", True),)
+
+
+def style_font(cell, **font):
+    """Apply an interned Font, e.g. style_font(cell, bold=True, size=11)."""
+    style_registry(cell.parent.parent).apply(cell, font=tuple(sorted(font.items())))
+
+
+def style_fill(cell, color):
+    """Apply an interned solid fill."""
+    style_registry(cell.parent.parent).apply(cell, fill=color)
 
 
 def style_title(cell, text, bg=Colors.TITLE_BLUE):
     cell.value = text
-    cell.font = Font(name="Calibri", size=14, bold=True, color=Colors.WHITE)
-    cell.fill = PatternFill(start_color=bg, end_color=bg, fill_type="solid")
-    cell.alignment = Alignment(horizontal="center", vertical="center")
+    style_registry(cell.parent.parent).apply(
+        cell,
+        font=(("bold", True), ("color", Colors.WHITE), ("name", "Calibri"), ("size", 14)),
+        fill=bg,
+        alignment=_CENTER,
+    )
 
 
 def style_header(cell, bg=Colors.DARK_BLUE, fg=Colors.WHITE, size=12, bold=True):
-    cell.font = Font(name="Calibri", size=size, bold=bold, color=fg)
-    cell.fill = PatternFill(start_color=bg, end_color=bg, fill_type="solid")
-    cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    cell.border = THIN_BORDER
+    style_registry(cell.parent.parent).apply(
+        cell,
+        font=(("bold", bold), ("color", fg), ("name", "Calibri"), ("size", size)),
+        fill=bg,
+        alignment=_CENTER_WRAP,
+        border="thin",
+    )
 
 
 def style_section_header(cell, text, bg=Colors.DARK_BLUE):
@@ -82,27 +178,19 @@ def style_column_headers(ws, row, headers, bg=Colors.MEDIUM_BLUE, end_col=10):
         c.value = header
         style_header(c, bg=bg, size=10)
     for col in range(len(headers) + 1, end_col + 1):
-        ws.cell(row, col).fill = PatternFill(
-            start_color=bg, end_color=bg, fill_type="solid"
-        )
+        style_fill(ws.cell(row, col), bg)
 
 
 def style_category_header(ws, row, text, end_col=10):
     ws.cell(row, 1).value = text
-    ws.cell(row, 1).font = Font(name="Calibri", size=10, bold=True, color=Colors.BLACK)
+    style_font(ws.cell(row, 1), name="Calibri", size=10, bold=True, color=Colors.BLACK)
     for col in range(1, end_col + 1):
-        ws.cell(row, col).fill = PatternFill(
-            start_color=Colors.LIGHT_BLUE,
-            end_color=Colors.LIGHT_BLUE,
-            fill_type="solid",
-        )
+        style_fill(ws.cell(row, col), Colors.LIGHT_BLUE)
 
 
 def style_total_row(ws, row, start_col, end_col):
     for col in range(start_col, end_col + 1):
-        ws.cell(row, col).fill = PatternFill(
-            start_color=Colors.GREEN, end_color=Colors.GREEN, fill_type="solid"
-        )
+        style_fill(ws.cell(row, col), Colors.GREEN)
 
 
 def year_headers(n=11, starting_year=None):
@@ -116,202 +204,12 @@ def year_headers(n=11, starting_year=None):
 # CONFIG NORMALIZER
 # =============================================================================
 def normalize_config(raw: Dict[str, Any]) -> Dict[str, Any]:
-    """Normalize various config formats into a canonical structure."""
-    cfg = dict(raw)
-
-    # Company name
-    if isinstance(cfg.get("company"), dict):
-        cfg["company_name"] = cfg["company"].get("name", "Company")
-    elif "company_name" not in cfg:
-        cfg["company_name"] = cfg.get("company", "Company")
-
-    # General defaults
-    defaults = {
-        "tax_rate": 0.25,
-        "capex_y0": 150000,
-        "capex_annual": 50000,
-        "depreciation_years": 5,
-        "debtor_days": 45,
-        "creditor_days": 30,
-        "interest_rate": 0.10,
-        "cost_inflation": 0.05,
-    }
-    gen = cfg.get("general", {})
-    if not isinstance(gen, dict):
-        gen = {}
-    for k, v in defaults.items():
-        gen.setdefault(k, v)
-    cfg["general"] = gen
-
-    # Currency (default USD)
-    cfg.setdefault("currency", gen.get("currency", "USD"))
-
-    # Starting year (default current year + 1)
-    if "starting_year" not in cfg:
-        from datetime import datetime
-
-        cfg["starting_year"] = gen.get("starting_year", datetime.now().year + 1)
-
-    # Tax rate at top level
-    if "tax_rate" not in cfg:
-        cfg["tax_rate"] = gen["tax_rate"]
-
-    # Revenue streams: ensure list of dicts with required keys
-    streams = cfg.get("revenue_streams", [])
-    for s in streams:
-        s.setdefault("name", "Product")
-        s.setdefault("price", 1000)
-        s.setdefault("volume", 10)
-        s.setdefault("growth", 0.25)
-        s.setdefault("cogs_pct", 0.30)
-    cfg["revenue_streams"] = streams
-
-    # Fixed costs: normalize to list of {name, annual_cost}
-    fc = cfg.get("fixed_costs", [])
-    if isinstance(fc, dict):
-        fc = [{"name": k, "annual_cost": v} for k, v in fc.items()]
-    elif isinstance(fc, list):
-        normalized = []
-        for item in fc:
-            if isinstance(item, dict):
-                name = item.get("name", item.get("category", "Cost"))
-                cost = item.get("annual_cost", item.get("amount", item.get("value", 0)))
-                normalized.append({"name": name, "annual_cost": cost})
-        fc = normalized
-    cfg["fixed_costs"] = fc
-
-    # Headcount: normalize to departments list
-    hc = cfg.get("headcount", {})
-    if "departments" not in hc:
-        # Legacy flat format: detect all <prefix>_salary keys dynamically
-        known_prefixes = [
-            ("engineering", "Engineering"),
-            ("sales", "Sales & Marketing"),
-            ("ops", "Operations"),
-            ("ga", "G&A"),
-            ("product", "Product"),
-            ("data", "Data Science"),
-            ("support", "Customer Support"),
-            ("marketing", "Marketing"),
-            ("finance", "Finance"),
-            ("hr", "Human Resources"),
-            ("design", "Design"),
-            ("devops", "DevOps"),
-            ("research", "Research"),
-        ]
-        # Also detect any unknown prefixes from _salary keys
-        detected = set()
-        for key in hc:
-            if key.endswith("_salary"):
-                pfx = key.replace("_salary", "")
-                detected.add(pfx)
-
-        depts = []
-        for prefix, label in known_prefixes:
-            salary = hc.get(f"{prefix}_salary")
-            y0 = hc.get(f"{prefix}_y0")
-            if salary is not None or y0 is not None:
-                growth = hc.get(f"{prefix}_growth", 0.30)
-                depts.append(
-                    {
-                        "name": label,
-                        "salary": salary or 60000,
-                        "y0_count": y0 or 0,
-                        "growth": growth,
-                    }
-                )
-                detected.discard(prefix)
-
-        # Handle unknown prefixes
-        for pfx in sorted(detected):
-            salary = hc.get(f"{pfx}_salary", 60000)
-            y0 = hc.get(f"{pfx}_y0", 0)
-            growth = hc.get(f"{pfx}_growth", 0.30)
-            label = pfx.replace("_", " ").title()
-            if y0 > 0 or salary > 0:
-                depts.append(
-                    {"name": label, "salary": salary, "y0_count": y0, "growth": growth}
-                )
+    """Normalize various config formats into a canonical structure.
 
-        if not depts:
-            depts = [{"name": "Team", "salary": 60000, "y0_count": 5, "growth": 0.30}]
-        hc["departments"] = depts
-    cfg["headcount"] = hc
-
-    # Funding: normalize to rounds list
-    fund = cfg.get("funding", {})
-    if "rounds" not in fund:
-        rounds = []
-        for key, label in [
-            ("seed", "Seed"),
-            ("series_a", "Series A"),
-            ("series_b", "Series B"),
-        ]:
-            amt = fund.get(key, 0)
-            yr = fund.get(f"{key}_year", 0)
-            pre = fund.get(f"{key}_pre", amt * 3)
-            if amt > 0:
-                rounds.append(
-                    {"name": label, "amount": amt, "year": yr, "pre_money": pre}
-                )
-        fund["rounds"] = rounds
-    cfg["funding"] = fund
-
-    # TAM: normalize to streams list
-    tam = cfg.get("tam", {})
-    if "streams" not in tam:
-        streams_tam = []
-        for k, v in tam.items():
-            if isinstance(v, (int, float)):
-                streams_tam.append(
-                    {
-                        "name": k.title(),
-                        "value_m": v,
-                        "source": "",
-                        "confidence": "MEDIUM",
-                    }
-                )
-        tam["streams"] = streams_tam
-    cfg["tam"] = tam
-
-    # SAM: normalize to regions list
-    sam = cfg.get("sam", {})
-    if "regions" not in sam:
-        regions = []
-        for k, v in sam.items():
-            if isinstance(v, (int, float)):
-                regions.append(
-                    {"name": k.replace("_", " ").title(), "value_m": v, "years": ""}
-                )
-        sam["regions"] = regions
-    cfg["sam"] = sam
-
-    # SOM defaults (accept terminal_revenue_m or year8_revenue_m)
-    som = cfg.get("som", {})
-    if "year8_revenue_m" not in som:
-        som["year8_revenue_m"] = som.get(
-            "terminal_revenue_m", som.get("year8_revenue", 0)
-        )
-    cfg["som"] = som
-
-    # Valuation defaults
-    val = cfg.get("valuation", {})
-    val.setdefault("wacc", 0.15)
-    val.setdefault("terminal_growth", 0.03)
-    val.setdefault("exit_multiple", 5.0)
-    val.setdefault(
-        "terminal_year", 8
-    )  # 0-indexed year offset for valuation/sensitivity
-    cfg["valuation"] = val
-
-    # Customer acquisition defaults
-    ca = cfg.get("customer_acquisition", {})
-    ca.setdefault("cac", 0)
-    ca.setdefault("churn_rate", 0.05)
-    ca.setdefault("new_customers_y0", 0)
-    cfg["customer_acquisition"] = ca
-
-    return cfg
+    The rules live in config_schema.py (shared with validate_config.py); the
+    result is memoized by config content and returned as a private copy.
+    """
+    return compile_config(raw).config
 
 
 # =============================================================================
@@ -335,30 +233,226 @@ SHEET_SEQUENCE = [
 ]
 
 
+# =============================================================================
+# SHEET DEPENDENCIES (incremental rebuild)
+# =============================================================================
+# Bump when a shared helper (styles, headers) changes what sheets look like,
+# so cached sheets from older builds are not reused.
+BUILD_CACHE_VERSION = 1
+
+
+def sheet_inputs(config=(), refs=(), when=None):
+    """Declare what a `_build_*` method reads.
+
+    config: normalized-config paths written into the sheet, dotted with `*`
+            for every list item (e.g. "revenue_streams.*.name").
+    refs:   row_refs produced by upstream sheets that its formulas point at.
+    when:   {config key: extra paths} read only while that key is set.
+    """
+
+    def mark(fn):
+        fn.config_inputs = tuple(config)
+        fn.ref_inputs = tuple(refs)
+        fn.conditional_inputs = dict(when or {})
+        return fn
+
+    return mark
+
+
+def resolve_config_path(config: Any, path: str) -> Any:
+    """Value at a dotted config path; `*` maps over list items."""
+    head, _, rest = path.partition(".")
+    if head == "*":
+        items = config if isinstance(config, list) else []
+        return [resolve_config_path(item, rest) if rest else item for item in items]
+    value = config.get(head) if isinstance(config, dict) else None
+    return resolve_config_path(value, rest) if rest else value
+
+
+_SOURCE_DIGESTS: Dict[str, str] = {}
+
+
+def _source_digest(fn) -> str:
+    """Digest of a builder method's source, so code edits invalidate caches."""
+    name = fn.__qualname__
+    if name not in _SOURCE_DIGESTS:
+        try:
+            source = inspect.getsource(fn)
+        except (OSError, TypeError):
+            source = name
+        _SOURCE_DIGESTS[name] = hashlib.sha1(source.encode("utf-8")).hexdigest()
+    return _SOURCE_DIGESTS[name]
+
+
+def build_cache_path(workbook_path: str) -> str:
+    """Sidecar file holding per-sheet fingerprints: model.xlsx -> model.build.json"""
+    return os.path.splitext(workbook_path)[0] + ".build.json"
+
+
+# =============================================================================
+# BUILD PROFILING
+# =============================================================================
+PROFILE_ENV = "FINANCIAL_MODEL_PROFILE"
+
+
+class BuildProfiler:
+    """Appends per-sheet build and save metrics as JSON lines.
+
+    `path` is a file to append to, or "-" for stderr. Enabled with
+    FinancialModelBuilder(profile=...), --profile, or the
+    FINANCIAL_MODEL_PROFILE environment variable.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def emit(self, event: str, **fields):
+        line = json.dumps({"event": event, **fields}) + "\n"
+        if self.path == "-":
+            sys.stderr.write(line)
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def _is_formula(value) -> bool:
+    return isinstance(value, str) and value.startswith("=")
+
+
 # =============================================================================
 # FINANCIAL MODEL BUILDER
 # =============================================================================
 class FinancialModelBuilder:
-    """Builds a 14-sheet financial model from config. Zero hardcoded data."""
-
-    def __init__(self, config: Dict[str, Any], num_years: int = 11):
-        self.config = normalize_config(config)
+    """Builds a 14-sheet financial model from config. Zero hardcoded data.
+
+    backend="openpyxl" (default) keeps the whole workbook in memory so sheets
+    can be inspected or rebuilt; backend="streaming" lays each sheet out row
+    by row into a constant-memory xlsxwriter file (see sheet_plan.py);
+    backend="layout" keeps the laid-out WorkbookPlan so `export()` can
+    compile it to xlsx, a Sheets batchUpdate payload and snapshot CSVs
+    (see layout_ir.py). Both xlsxwriter paths write column-shifted formula
+    runs as shared formulas with shared_formulas=True (smaller files, faster
+    saves, but about 2x slower openpyxl loads).
+
+    granularity="monthly" or "hybrid" (monthly for the first `monthly_months`
+    months, then annual) replaces the yearly columns with a TimeAxis of
+    periods; see time_axis.py for the flow/stock conventions.
+
+    Every sheet built is fingerprinted from the inputs its `_build_*` method
+    declares (see `sheet_inputs`); `rebuild()` and `build_incremental()` use
+    those fingerprints to regenerate only the sheets whose inputs changed.
+    With build_cache=True (implied once `rebuild()` or `build_incremental()`
+    is used), save/export also write the fingerprints to a
+    `<model>.build.json` sidecar for the next run's `build_incremental()`.
+
+    On save the formula results are computed natively (formula_eval.py) and
+    cached in the formula cells, so data_only readers and viewers that do not
+    recalculate see numbers; cached_values=False skips this. The streaming
+    backend flushes rows before their results are known and never caches.
+
+    profile="build.jsonl" (or FINANCIAL_MODEL_PROFILE) records wall time,
+    cells, formulas and style objects created per sheet, plus save time and
+    file size, as JSON lines (see BuildProfiler).
+    """
+
+    BACKENDS = ("openpyxl", "streaming", "layout")
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        num_years: int = 11,
+        backend: str = "openpyxl",
+        granularity: str = "annual",
+        monthly_months: int = 36,
+        profile: Optional[str] = None,
+        shared_formulas: bool = False,
+        cached_values: bool = True,
+        build_cache: bool = False,
+    ):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Valid: {self.BACKENDS}")
+        self.axis = TimeAxis(num_years, granularity, monthly_months)
         self.num_years = num_years
-        self.wb = Workbook()
-        if "Sheet" in self.wb.sheetnames:
-            del self.wb["Sheet"]
+        self.num_periods = len(self.axis)
+        self.backend = backend
+        self.shared_formulas = shared_formulas
+        self.cached_values = cached_values and backend != "streaming"
+        if backend == "streaming":
+            from sheet_plan import StreamingWorkbook
+
+            self.wb = StreamingWorkbook(shared_formulas)
+        elif backend == "layout":
+            from sheet_plan import WorkbookPlan
+
+            self.wb = WorkbookPlan()
+        else:
+            self.wb = Workbook()
+            if "Sheet" in self.wb.sheetnames:
+                del self.wb["Sheet"]
+        self.styles = style_registry(self.wb)
         self.row_refs: Dict[str, int] = {}
-        self._end_col = 2 + num_years  # last year column index
+        self._end_col = 2 + self.num_periods  # last period column index
+        # sheet name -> {"fingerprint": ..., "row_refs": {...}} for built sheets
+        self.sheet_cache: Dict[str, Dict[str, Any]] = {}
+        self.build_cache = build_cache
+        profile = profile or os.environ.get(PROFILE_ENV)
+        self.profiler = BuildProfiler(profile) if profile else None
+        self._set_config(config)
+
+    def _set_config(self, config: Dict[str, Any]):
+        self.config = normalize_config(config)
         self.currency = self.config.get("currency", "USD")
         self.starting_year = self.config.get("starting_year")
         # Terminal year for valuation/sensitivity (0-indexed year offset)
         # Defaults to year 8, but capped at last available year
         val_cfg = self.config.get("valuation", {})
-        self._terminal_yr = min(val_cfg.get("terminal_year", 8), num_years - 1)
+        self._terminal_yr = min(val_cfg.get("terminal_year", 8), self.num_years - 1)
+        self._assets = None  # fixed-asset schedule, computed on first use
+
+    def _fixed_assets(self) -> Dict[str, Any]:
+        """Capex-vintage schedule shared by P&L, Cash Flow and Balance Sheet."""
+        if self._assets is None:
+            from financial_engine import asset_classes, fixed_asset_schedule
+
+            self._assets = fixed_asset_schedule(asset_classes(self.config), self.axis)
+        return self._assets
 
     def _year_headers(self):
-        """Year column headers using starting_year from config."""
-        return year_headers(self.num_years, self.starting_year)
+        """Period column headers using starting_year from config."""
+        if self.axis.is_annual:
+            return year_headers(self.num_years, self.starting_year)
+        return self.axis.labels(self.starting_year)
+
+    def _grow_expr(self, prev_ref: str, rate, p) -> str:
+        """Excel expression carrying a per-period flow from the previous period.
+
+        Annual to annual is `prev*(1+rate)`; shorter steps compound by
+        (1+rate)^(months/12) and rescale when the period length changes.
+        """
+        prev = self.axis[p.index - 1]
+        scale = f"*{p.months // prev.months}" if p.months != prev.months else ""
+        step = "" if prev.months == 12 else f"^({prev.months}/12)"
+        return f"{prev_ref}{scale}*(1+{rate}){step}"
+
+    @staticmethod
+    def _share(amount, p):
+        """Period's share of an annual amount (unchanged for annual periods)."""
+        return amount if p.is_annual else amount * p.fraction
+
+    def _per_period(self, p) -> str:
+        """Formula suffix turning an annual amount into the period's share."""
+        return "" if p.is_annual else f"*{p.months}/12"
+
+    def _year_ref(self, sheet: str, row: int, year: int, stock: bool = False) -> str:
+        """Reference to a model year: the column itself, or the sum of its
+        periods (flows) / its last period (stocks) on a sub-annual axis."""
+        periods = self.axis.year_periods(year)
+        if stock or len(periods) == 1:
+            return f"{sheet}!{get_column_letter(3 + periods[-1].index)}{row}"
+        first = get_column_letter(3 + periods[0].index)
+        last = get_column_letter(3 + periods[-1].index)
+        return f"SUM({sheet}!{first}{row}:{last}{row})"
 
     # ---- public API ----
 
@@ -401,16 +495,242 @@ class FinancialModelBuilder:
         print(f"Created {len(self.wb.sheetnames)} sheets")
         return self.wb
 
+    def rebuild(self, config: Dict[str, Any]) -> List[str]:
+        """Swap in an edited config and rebuild only the sheets it affects.
+
+        Sheets whose declared inputs are unchanged are kept as they are in the
+        current workbook. Returns the names of the sheets rebuilt.
+        """
+        self.build_cache = True
+        self._set_config(config)
+        return self._build_changed()
+
+    def build_incremental(self, previous: str) -> List[str]:
+        """Build on top of a workbook saved by an earlier run.
+
+        Loads `previous` and its build cache sidecar and regenerates only the
+        sheets whose inputs differ from when it was saved; without a usable
+        cache every sheet is built. Returns the names of the sheets rebuilt.
+        """
+        self.build_cache = True
+        cache_file = build_cache_path(previous)
+        cache = None
+        if os.path.exists(previous) and os.path.exists(cache_file):
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("version") != BUILD_CACHE_VERSION:
+                cache = None
+        if cache is None:
+            self.build_all()
+            return list(SHEET_SEQUENCE)
+        self._require_workbook("build_incremental")
+        self.wb = load_workbook(previous)
+        self.styles = style_registry(self.wb)
+        self.sheet_cache = cache["sheets"]
+        return self._build_changed()
+
+    def compute(self):
+        """Evaluate the model natively (NumPy) without building the workbook.
+
+        Returns a financial_engine.ModelResults keyed by the same names as
+        `row_refs`; the numbers match what Excel computes from the formulas.
+        """
+        from financial_engine import compute_model
+
+        return compute_model(self.config, num_years=self.num_years, axis=self.axis)
+
     def save(self, filepath: str) -> str:
         os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
-        self.wb.save(filepath)
+        started = time.perf_counter()
+        values = self._formula_values()
+        if self.backend == "layout":
+            from layout_ir import compile_xlsx
+
+            compile_xlsx(self.wb, filepath, self.shared_formulas, values)
+        else:
+            self.wb.save(filepath)
+            if values:
+                from formula_eval import fill_cached_values
+
+                fill_cached_values(filepath, values)
+        if self.profiler:
+            self._profile(
+                "save",
+                path=filepath,
+                wall_ms=round((time.perf_counter() - started) * 1000, 2),
+                file_bytes=os.path.getsize(filepath),
+                sheets=len(self.wb.sheetnames),
+            )
+        self._write_build_cache(filepath)
         print(f"\nSaved: {filepath}")
         return filepath
 
+    def export(self, filepath: str, formats=("xlsx",)) -> Dict[str, str]:
+        """Compile the laid-out model to several formats (layout backend).
+
+        The xlsx goes to `filepath`; the Sheets payload and snapshot CSVs
+        go next to it (see layout_ir.output_paths).
+        """
+        if self.backend != "layout":
+            raise ValueError("export() needs the layout backend")
+        from layout_ir import compile_outputs
+
+        title = self.config.get("company_name", self.config.get("company", ""))
+        started = time.perf_counter()
+        written = compile_outputs(
+            self.wb,
+            filepath,
+            formats,
+            title=title,
+            shared_formulas=self.shared_formulas,
+            values=self._formula_values(),
+        )
+        if self.profiler:
+            self._profile(
+                "export",
+                path=filepath,
+                formats=sorted(written),
+                wall_ms=round((time.perf_counter() - started) * 1000, 2),
+            )
+        if "xlsx" in written:
+            self._write_build_cache(filepath)
+        for fmt, path in written.items():
+            print(f"Saved {fmt}: {path}")
+        return written
+
+    def _write_build_cache(self, filepath: str):
+        """Write the per-sheet fingerprints next to `filepath` (build_cache only)."""
+        if not self.build_cache:
+            return
+        with open(build_cache_path(filepath), "w", encoding="utf-8") as f:
+            json.dump({"version": BUILD_CACHE_VERSION, "sheets": self.sheet_cache}, f, indent=2)
+
+    def _formula_values(self) -> Optional[Dict[str, Dict[Any, Any]]]:
+        """Computed formula results to cache on save (None when disabled)."""
+        if not self.cached_values:
+            return None
+        from formula_eval import FormulaEvaluator, workbook_cells
+
+        started = time.perf_counter()
+        evaluator = FormulaEvaluator(workbook_cells(self.wb))
+        values = evaluator.evaluate()
+        if self.profiler:
+            self._profile(
+                "evaluate",
+                formulas=sum(len(v) for v in values.values()),
+                unsupported=evaluator.unsupported,
+                wall_ms=round((time.perf_counter() - started) * 1000, 2),
+            )
+        return values
+
     # ---- internal dispatch ----
 
+    def _require_workbook(self, action: str):
+        if self.backend != "openpyxl":
+            raise ValueError(f"{action}() needs the openpyxl backend")
+
+    def _build_changed(self) -> List[str]:
+        """Rebuild sheets whose fingerprint changed; reuse the rest."""
+        self._require_workbook("rebuild")
+        self.row_refs = {}
+        rebuilt = []
+        for name in SHEET_SEQUENCE:
+            cached = self.sheet_cache.get(name)
+            if (
+                cached
+                and name in self.wb.sheetnames
+                and cached["fingerprint"] == self._fingerprint(name)
+            ):
+                self.row_refs.update(cached["row_refs"])
+                continue
+            if name in self.wb.sheetnames:
+                del self.wb[name]
+            self._build_sheet(name)
+            rebuilt.append(name)
+        order = {name: i for i, name in enumerate(SHEET_SEQUENCE)}
+        self.wb._sheets.sort(key=lambda ws: order.get(ws.title, len(order)))
+        print(f"Rebuilt {len(rebuilt)}/{len(SHEET_SEQUENCE)} sheets")
+        return rebuilt
+
+    def _fingerprint(self, name: str) -> str:
+        """Hash of everything the sheet's builder reads."""
+        fn = self._dispatch()[name]
+        paths = list(fn.config_inputs)
+        for key, extra in fn.conditional_inputs.items():
+            if self.config.get(key):
+                paths.extend(extra)
+        inputs = {
+            "code": _source_digest(fn),
+            "frame": [self.axis.spec(), self.starting_year, self.currency, self._terminal_yr],
+            "config": {p: resolve_config_path(self.config, p) for p in paths},
+            "refs": {r: self.row_refs.get(r) for r in fn.ref_inputs},
+        }
+        blob = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
     def _build_sheet(self, name: str):
-        dispatch = {
+        fn = self._dispatch().get(name)
+        if not fn:
+            print(f"  WARNING: No builder for '{name}'")
+            return
+        fingerprint = self._fingerprint(name)
+        before = dict(self.row_refs)
+        if self.profiler:
+            self._profiled(name, fn)
+        else:
+            fn()
+        self.sheet_cache[name] = {
+            "fingerprint": fingerprint,
+            "row_refs": {
+                k: v for k, v in self.row_refs.items() if before.get(k) != v
+            },
+        }
+
+    def _profiled(self, name: str, fn):
+        """Run one sheet builder and emit its timing and size metrics."""
+        streamed = (
+            (self.wb.cells_written, self.wb.formulas_written)
+            if self.backend == "streaming"
+            else None
+        )
+        created = self.styles.created
+        started = time.perf_counter()
+        fn()
+        wall_ms = (time.perf_counter() - started) * 1000
+        if streamed is not None:
+            self.wb[name].flush()  # count rows still buffered
+            cells = self.wb.cells_written - streamed[0]
+            formulas = self.wb.formulas_written - streamed[1]
+        else:
+            ws = self.wb[name]
+            if self.backend == "openpyxl":
+                values = [
+                    c.value for c in ws._cells.values() if not isinstance(c, MergedCell)
+                ]
+            else:
+                values = [c.value for row in ws._rows.values() for c in row.values()]
+            cells = len(values)
+            formulas = sum(map(_is_formula, values))
+        self._profile(
+            "sheet",
+            sheet=name,
+            wall_ms=round(wall_ms, 2),
+            cells=cells,
+            formulas=formulas,
+            style_objects=self.styles.created - created,
+        )
+
+    def _profile(self, event: str, **fields):
+        self.profiler.emit(
+            event,
+            model=self.config.get("company_name"),
+            backend=self.backend,
+            periods=self.num_periods,
+            **fields,
+        )
+
+    def _dispatch(self):
+        return {
             "Sources & References": self._build_sources,
             "Assumptions": self._build_assumptions,
             "Headcount Plan": self._build_headcount,
@@ -426,23 +746,19 @@ class FinancialModelBuilder:
             "Funding Cap Table": self._build_cap_table,
             "Charts Data": self._build_charts_data,
         }
-        fn = dispatch.get(name)
-        if fn:
-            fn()
-        else:
-            print(f"  WARNING: No builder for '{name}'")
 
     # ---- helpers ----
 
     def _set_col_widths(self, ws, label_width=30, val_width=15, year_width=14):
         ws.column_dimensions["A"].width = label_width
         ws.column_dimensions["B"].width = val_width
-        for i in range(3, 3 + self.num_years):
+        for i in range(3, 3 + self.num_periods):
             ws.column_dimensions[get_column_letter(i)].width = year_width
 
     # ================================================================
     # SHEET 1: Sources & References
     # ================================================================
+    @sheet_inputs(config=["tam.streams", "sam.regions", "som"])
     def _build_sources(self):
         print("  [1/14] Sources & References...")
         ws = self.wb.create_sheet("Sources & References")
@@ -479,7 +795,7 @@ class FinancialModelBuilder:
         tam_start = row
         for ts in tam_streams:
             ws.cell(row, 1).value = ts.get("name", "")
-            ws.cell(row, 1).font = Font(size=10)
+            style_font(ws.cell(row, 1), size=10)
             ws.cell(row, 2).value = ts.get("value_m", 0)
             ws.cell(row, 2).number_format = "#,##0"
             ws.cell(row, 3).value = ts.get("source", "")
@@ -489,13 +805,13 @@ class FinancialModelBuilder:
         tam_end = row - 1
 
         ws.cell(row, 1).value = "TOTAL TAM"
-        ws.cell(row, 1).font = Font(bold=True, size=10)
+        style_font(ws.cell(row, 1), bold=True, size=10)
         if tam_start <= tam_end:
             ws.cell(row, 2).value = f"=SUM(B{tam_start}:B{tam_end})"
         else:
             ws.cell(row, 2).value = 0
         ws.cell(row, 2).number_format = "#,##0"
-        ws.cell(row, 2).font = Font(bold=True)
+        style_font(ws.cell(row, 2), bold=True)
         style_total_row(ws, row, 1, 5)
         self.row_refs["tam_total"] = row
         row += 2
@@ -517,7 +833,7 @@ class FinancialModelBuilder:
         sam_start = row
         for sr in sam_regions:
             ws.cell(row, 1).value = sr.get("name", "")
-            ws.cell(row, 1).font = Font(size=10)
+            style_font(ws.cell(row, 1), size=10)
             ws.cell(row, 2).value = sr.get("value_m", 0)
             ws.cell(row, 2).number_format = "#,##0"
             ws.cell(row, 3).value = sr.get("years", "")
@@ -525,13 +841,13 @@ class FinancialModelBuilder:
         sam_end = row - 1
 
         ws.cell(row, 1).value = "TOTAL SAM"
-        ws.cell(row, 1).font = Font(bold=True, size=10)
+        style_font(ws.cell(row, 1), bold=True, size=10)
         if sam_start <= sam_end:
             ws.cell(row, 2).value = f"=SUM(B{sam_start}:B{sam_end})"
         else:
             ws.cell(row, 2).value = 0
         ws.cell(row, 2).number_format = "#,##0"
-        ws.cell(row, 2).font = Font(bold=True)
+        style_font(ws.cell(row, 2), bold=True)
         style_total_row(ws, row, 1, 5)
         self.row_refs["sam_total"] = row
         row += 2
@@ -547,7 +863,7 @@ class FinancialModelBuilder:
         som = self.config.get("som", {})
         terminal_label = f"Year {self._terminal_yr}"
         ws.cell(row, 1).value = f"{terminal_label} Revenue Target"
-        ws.cell(row, 1).font = Font(size=10)
+        style_font(ws.cell(row, 1), size=10)
         ws.cell(row, 2).value = som.get(
             "year8_revenue_m", som.get("terminal_revenue_m", 0)
         )
@@ -557,7 +873,7 @@ class FinancialModelBuilder:
         row += 1
 
         ws.cell(row, 1).value = "SAM Penetration"
-        ws.cell(row, 1).font = Font(size=10, bold=True)
+        style_font(ws.cell(row, 1), size=10, bold=True)
         sam_total_row = self.row_refs.get("sam_total", row - 3)
         ws.cell(row, 2).value = f"=IF(B{sam_total_row}=0,0,B{row-1}/B{sam_total_row})"
         ws.cell(row, 2).number_format = "0.00%"
@@ -575,14 +891,24 @@ class FinancialModelBuilder:
         # Placeholder rows for research citations
         for i in range(1, 6):
             ws.cell(row, 1).value = f"[{i}]"
-            ws.cell(row, 1).font = Font(size=10, color=Colors.GRAY)
+            style_font(ws.cell(row, 1), size=10, color=Colors.GRAY)
             ws.cell(row, 2).value = "(to be populated during research)"
-            ws.cell(row, 2).font = Font(size=10, italic=True, color=Colors.GRAY)
+            style_font(ws.cell(row, 2), size=10, italic=True, color=Colors.GRAY)
             row += 1
 
     # ================================================================
     # SHEET 2: Assumptions
     # ================================================================
+    @sheet_inputs(
+        config=[
+            "general",
+            "revenue_streams",
+            "fixed_costs",
+            "fixed_assets",
+            "funding.rounds",
+            "customer_acquisition",
+        ]
+    )
     def _build_assumptions(self):
         print("  [2/14] Assumptions...")
         ws = self.wb.create_sheet("Assumptions")
@@ -657,13 +983,16 @@ class FinancialModelBuilder:
             # Volume row (with growth formulas)
             ws.cell(row, 1).value = f"{name}: Volume"
             ws.cell(row, 3).value = "Units"
-            for yr in range(self.num_years):
-                col = 4 + yr
-                if yr == 0:
-                    ws.cell(row, col).value = volume
+            for p in self.axis:
+                col = 4 + p.index
+                if p.index == 0:
+                    ws.cell(row, col).value = self._share(volume, p)
                 else:
-                    prev = get_column_letter(col - 1)
-                    ws.cell(row, col).value = f"=ROUND({prev}{row}*(1+{growth}),0)"
+                    step = self._grow_expr(f"{get_column_letter(col - 1)}{row}", growth, p)
+                    # Whole units per year; monthly volumes are run-rate shares
+                    ws.cell(row, col).value = (
+                        f"=ROUND({step},0)" if p.is_annual else f"={step}"
+                    )
                 ws.cell(row, col).number_format = "#,##0"
             row += 1
 
@@ -699,6 +1028,30 @@ class FinancialModelBuilder:
         self.row_refs["fixed_costs_end"] = row - 1
         row += 1
 
+        # --- Fixed Assets (only when asset classes are configured) ---
+        if (self.config.get("fixed_assets") or {}).get("classes"):
+            from financial_engine import asset_classes
+
+            style_section_header(ws.cell(row, 1), "FIXED ASSETS (CapEx by Class)")
+            ws.merge_cells(f"A{row}:C{row}")
+            row += 1
+
+            class_capex = self._fixed_assets()["class_capex"]
+            self.row_refs["fixed_assets_start"] = row
+            for idx, cls in enumerate(asset_classes(self.config)):
+                ws.cell(row, 1).value = f"{cls['name']}: Useful Life"
+                ws.cell(row, 2).value = cls["useful_life"]
+                ws.cell(row, 3).value = "Years"
+                row += 1
+                ws.cell(row, 1).value = f"{cls['name']}: CapEx"
+                ws.cell(row, 3).value = self.currency
+                for p in self.axis:
+                    ws.cell(row, 4 + p.index).value = float(class_capex[idx, p.index])
+                    ws.cell(row, 4 + p.index).number_format = "#,##0"
+                row += 1
+            self.row_refs["fixed_assets_end"] = row - 1
+            row += 1
+
         # --- Funding Parameters ---
         style_section_header(ws.cell(row, 1), "FUNDING PARAMETERS")
         ws.merge_cells(f"A{row}:C{row}")
@@ -751,6 +1104,7 @@ class FinancialModelBuilder:
     # ================================================================
     # SHEET 3: Headcount Plan
     # ================================================================
+    @sheet_inputs(config=["headcount.departments"])
     def _build_headcount(self):
         print("  [3/14] Headcount Plan...")
         ws = self.wb.create_sheet("Headcount Plan")
@@ -776,13 +1130,18 @@ class FinancialModelBuilder:
             ws.cell(row, 1).value = name
             ws.cell(row, 2).value = salary
             ws.cell(row, 2).number_format = "#,##0"
-            for yr in range(self.num_years):
-                col = 3 + yr
-                if yr == 0:
+            for p in self.axis:
+                col = 3 + p.index
+                if p.index == 0:
                     ws.cell(row, col).value = y0
-                else:
+                elif p.is_annual and self.axis[p.index - 1].is_annual:
                     prev = get_column_letter(col - 1)
                     ws.cell(row, col).value = f"=ROUND({prev}{row}*(1+{growth}),0)"
+                else:
+                    # Closed form from Y0 so monthly rounding cannot stall growth
+                    ws.cell(row, col).value = (
+                        f"=ROUND($C{row}*(1+{growth})^({p.start}/12),0)"
+                    )
                 ws.cell(row, col).number_format = "#,##0"
             row += 1
 
@@ -790,23 +1149,23 @@ class FinancialModelBuilder:
 
         # Total headcount
         ws.cell(row, 1).value = "TOTAL HEADCOUNT"
-        ws.cell(row, 1).font = Font(bold=True)
-        for yr in range(self.num_years):
+        style_font(ws.cell(row, 1), bold=True)
+        for yr in range(self.num_periods):
             col = 3 + yr
             cl = get_column_letter(col)
             ws.cell(row, col).value = (
                 f'=SUM({cl}{self.row_refs["headcount_start"]}:{cl}{self.row_refs["headcount_end"]})'
             )
             ws.cell(row, col).number_format = "#,##0"
-            ws.cell(row, col).font = Font(bold=True)
+            style_font(ws.cell(row, col), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["headcount_total"] = row
         row += 2
 
         # Total salary cost
         ws.cell(row, 1).value = "TOTAL SALARY COST"
-        ws.cell(row, 1).font = Font(bold=True)
-        for yr in range(self.num_years):
+        style_font(ws.cell(row, 1), bold=True)
+        for yr in range(self.num_periods):
             col = 3 + yr
             cl = get_column_letter(col)
             parts = []
@@ -814,15 +1173,21 @@ class FinancialModelBuilder:
                 self.row_refs["headcount_start"], self.row_refs["headcount_end"] + 1
             ):
                 parts.append(f"({cl}{dr}*B{dr})")
-            ws.cell(row, col).value = f'={"+".join(parts)}'
+            if self.axis[yr].is_annual:
+                ws.cell(row, col).value = f'={"+".join(parts)}'
+            else:
+                ws.cell(row, col).value = (
+                    f'=({"+".join(parts)}){self._per_period(self.axis[yr])}'
+                )
             ws.cell(row, col).number_format = "#,##0"
-            ws.cell(row, col).font = Font(bold=True)
+            style_font(ws.cell(row, col), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["salary_cost_total"] = row
 
     # ================================================================
     # SHEET 4: Revenue
     # ================================================================
+    @sheet_inputs(config=["revenue_streams.*.name"], refs=["revenue_streams_start"])
     def _build_revenue(self):
         print("  [4/14] Revenue...")
         ws = self.wb.create_sheet("Revenue")
@@ -845,7 +1210,7 @@ class FinancialModelBuilder:
             ws.cell(row, 2).value = self.currency
             price_row = ass_start + (idx * 4)
             volume_row = price_row + 1
-            for yr in range(self.num_years):
+            for yr in range(self.num_periods):
                 col = 3 + yr
                 yr_col = get_column_letter(4 + yr)
                 ws.cell(row, col).value = (
@@ -859,16 +1224,16 @@ class FinancialModelBuilder:
 
         # Total Revenue
         ws.cell(row, 1).value = "TOTAL REVENUE"
-        ws.cell(row, 1).font = Font(bold=True, size=11)
+        style_font(ws.cell(row, 1), bold=True, size=11)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             col = 3 + yr
             cl = get_column_letter(col)
             ws.cell(row, col).value = (
                 f'=SUM({cl}{self.row_refs["revenue_start"]}:{cl}{self.row_refs["revenue_end"]})'
             )
             ws.cell(row, col).number_format = "#,##0"
-            ws.cell(row, col).font = Font(bold=True)
+            style_font(ws.cell(row, col), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["revenue_total"] = row
         row += 2
@@ -882,7 +1247,7 @@ class FinancialModelBuilder:
             ws.cell(row, 1).value = f"{stream['name']} %"
             ws.cell(row, 2).value = "%"
             sr = self.row_refs["revenue_start"] + idx
-            for yr in range(self.num_years):
+            for yr in range(self.num_periods):
                 col = 3 + yr
                 cl = get_column_letter(col)
                 ws.cell(row, col).value = (
@@ -894,6 +1259,10 @@ class FinancialModelBuilder:
     # ================================================================
     # SHEET 5: Operating Costs
     # ================================================================
+    @sheet_inputs(
+        config=["revenue_streams.*.name", "fixed_costs", "general.cost_inflation"],
+        refs=["revenue_streams_start", "revenue_start", "salary_cost_total"],
+    )
     def _build_operating_costs(self):
         print("  [5/14] Operating Costs...")
         ws = self.wb.create_sheet("Operating Costs")
@@ -917,7 +1286,7 @@ class FinancialModelBuilder:
             ws.cell(row, 2).value = self.currency
             cogs_pct_row = ass_start + (idx * 4) + 3
             rev_row = self.row_refs["revenue_start"] + idx
-            for yr in range(self.num_years):
+            for yr in range(self.num_periods):
                 col = 3 + yr
                 cl = get_column_letter(col)
                 ws.cell(row, col).value = (
@@ -930,16 +1299,16 @@ class FinancialModelBuilder:
 
         # Total COGS
         ws.cell(row, 1).value = "TOTAL COGS"
-        ws.cell(row, 1).font = Font(bold=True)
+        style_font(ws.cell(row, 1), bold=True)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             col = 3 + yr
             cl = get_column_letter(col)
             ws.cell(row, col).value = (
                 f'=SUM({cl}{self.row_refs["cogs_start"]}:{cl}{self.row_refs["cogs_end"]})'
             )
             ws.cell(row, col).number_format = "#,##0"
-            ws.cell(row, col).font = Font(bold=True)
+            style_font(ws.cell(row, col), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["cogs_total"] = row
         row += 2
@@ -953,7 +1322,7 @@ class FinancialModelBuilder:
         ws.cell(row, 1).value = "Salaries & Benefits"
         ws.cell(row, 2).value = self.currency
         sal_row = self.row_refs.get("salary_cost_total", 10)
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             col = 3 + yr
             cl = get_column_letter(col)
             ws.cell(row, col).value = f"='Headcount Plan'!{cl}{sal_row}"
@@ -970,51 +1339,63 @@ class FinancialModelBuilder:
                 continue
             ws.cell(row, 1).value = cname
             ws.cell(row, 2).value = self.currency
-            for yr in range(self.num_years):
-                col = 3 + yr
-                if yr == 0:
-                    ws.cell(row, col).value = cost["annual_cost"]
+            for p in self.axis:
+                col = 3 + p.index
+                if p.index == 0:
+                    ws.cell(row, col).value = self._share(cost["annual_cost"], p)
                 else:
                     prev = get_column_letter(col - 1)
-                    ws.cell(row, col).value = f"={prev}{row}*(1+{inflation})"
+                    ws.cell(row, col).value = (
+                        f"={self._grow_expr(f'{prev}{row}', inflation, p)}"
+                    )
                 ws.cell(row, col).number_format = "#,##0"
             row += 1
         self.row_refs["other_fixed_end"] = row - 1
 
         # Total Fixed
         ws.cell(row, 1).value = "TOTAL FIXED COSTS"
-        ws.cell(row, 1).font = Font(bold=True)
+        style_font(ws.cell(row, 1), bold=True)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             col = 3 + yr
             cl = get_column_letter(col)
             ws.cell(row, col).value = (
                 f'={cl}{self.row_refs["fixed_salaries"]}+SUM({cl}{self.row_refs["other_fixed_start"]}:{cl}{self.row_refs["other_fixed_end"]})'
             )
             ws.cell(row, col).number_format = "#,##0"
-            ws.cell(row, col).font = Font(bold=True)
+            style_font(ws.cell(row, col), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["fixed_total"] = row
         row += 2
 
         # Total Operating Costs
         ws.cell(row, 1).value = "TOTAL OPERATING COSTS"
-        ws.cell(row, 1).font = Font(bold=True, size=11)
+        style_font(ws.cell(row, 1), bold=True, size=11)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             col = 3 + yr
             cl = get_column_letter(col)
             ws.cell(row, col).value = (
                 f'={cl}{self.row_refs["cogs_total"]}+{cl}{self.row_refs["fixed_total"]}'
             )
             ws.cell(row, col).number_format = "#,##0"
-            ws.cell(row, col).font = Font(bold=True)
+            style_font(ws.cell(row, col), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["opex_total"] = row
 
     # ================================================================
     # SHEET 6: P&L
     # ================================================================
+    @sheet_inputs(
+        config=[
+            "general.capex_y0",
+            "general.capex_annual",
+            "general.depreciation_years",
+            "fixed_assets.classes",
+            "general.tax_rate",
+        ],
+        refs=["revenue_total", "cogs_total", "fixed_total"],
+    )
     def _build_pnl(self):
         print("  [6/14] P&L...")
         ws = self.wb.create_sheet("P&L")
@@ -1034,7 +1415,7 @@ class FinancialModelBuilder:
         # Revenue
         ws.cell(row, 1).value = "Revenue"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"=Revenue!{cl}{_ref('Revenue', 'revenue_total')}"
@@ -1046,7 +1427,7 @@ class FinancialModelBuilder:
         # COGS
         ws.cell(row, 1).value = "Cost of Goods Sold"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"='Operating Costs'!{cl}{_ref('OpCosts', 'cogs_total')}"
@@ -1057,22 +1438,22 @@ class FinancialModelBuilder:
 
         # Gross Profit
         ws.cell(row, 1).value = "GROSS PROFIT"
-        ws.cell(row, 1).font = Font(bold=True)
+        style_font(ws.cell(row, 1), bold=True)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"={cl}{self.row_refs['pnl_revenue']}-{cl}{self.row_refs['pnl_cogs']}"
             )
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         self.row_refs["pnl_gross_profit"] = row
         row += 1
 
         # Gross Margin %
         ws.cell(row, 1).value = "Gross Margin %"
         ws.cell(row, 2).value = "%"
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"=IF({cl}{self.row_refs['pnl_revenue']}=0,0,{cl}{self.row_refs['pnl_gross_profit']}/{cl}{self.row_refs['pnl_revenue']})"
@@ -1083,7 +1464,7 @@ class FinancialModelBuilder:
         # OpEx
         ws.cell(row, 1).value = "Operating Expenses"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"='Operating Costs'!{cl}{_ref('OpCosts', 'fixed_total')}"
@@ -1094,15 +1475,15 @@ class FinancialModelBuilder:
 
         # EBITDA
         ws.cell(row, 1).value = "EBITDA"
-        ws.cell(row, 1).font = Font(bold=True, size=11)
+        style_font(ws.cell(row, 1), bold=True, size=11)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"={cl}{self.row_refs['pnl_gross_profit']}-{cl}{self.row_refs['pnl_opex']}"
             )
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["pnl_ebitda"] = row
         row += 1
@@ -1110,7 +1491,7 @@ class FinancialModelBuilder:
         # EBITDA Margin
         ws.cell(row, 1).value = "EBITDA Margin %"
         ws.cell(row, 2).value = "%"
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"=IF({cl}{self.row_refs['pnl_revenue']}=0,0,{cl}{self.row_refs['pnl_ebitda']}/{cl}{self.row_refs['pnl_revenue']})"
@@ -1118,41 +1499,35 @@ class FinancialModelBuilder:
             ws.cell(row, 3 + yr).number_format = "0.0%"
         row += 2
 
-        # Depreciation
-        gen = self.config["general"]
-        capex_y0 = gen["capex_y0"]
-        capex_ann = gen["capex_annual"]
-        dep_yrs = gen["depreciation_years"]
+        # Depreciation (capex vintages, see financial_engine.fixed_asset_schedule)
+        depreciation = self._fixed_assets()["depreciation"]
 
         ws.cell(row, 1).value = "Depreciation"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
-            dep = capex_y0 / dep_yrs
-            if yr > 0:
-                dep += (capex_ann * min(yr, dep_yrs)) / dep_yrs
-            ws.cell(row, 3 + yr).value = round(dep)
-            ws.cell(row, 3 + yr).number_format = "#,##0"
+        for p in self.axis:
+            ws.cell(row, 3 + p.index).value = int(depreciation[p.index])
+            ws.cell(row, 3 + p.index).number_format = "#,##0"
         self.row_refs["pnl_depreciation"] = row
         row += 1
 
         # EBIT
         ws.cell(row, 1).value = "EBIT (Operating Profit)"
-        ws.cell(row, 1).font = Font(bold=True)
+        style_font(ws.cell(row, 1), bold=True)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"={cl}{self.row_refs['pnl_ebitda']}-{cl}{self.row_refs['pnl_depreciation']}"
             )
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         self.row_refs["pnl_ebit"] = row
         row += 2
 
         # Interest
         ws.cell(row, 1).value = "Interest Expense"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             ws.cell(row, 3 + yr).value = 0
             ws.cell(row, 3 + yr).number_format = "#,##0"
         self.row_refs["pnl_interest"] = row
@@ -1160,23 +1535,23 @@ class FinancialModelBuilder:
 
         # PBT
         ws.cell(row, 1).value = "PBT (Profit Before Tax)"
-        ws.cell(row, 1).font = Font(bold=True)
+        style_font(ws.cell(row, 1), bold=True)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"={cl}{self.row_refs['pnl_ebit']}-{cl}{self.row_refs['pnl_interest']}"
             )
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         self.row_refs["pnl_pbt"] = row
         row += 1
 
         # Tax
-        tax_rate = gen["tax_rate"]
+        tax_rate = self.config["general"]["tax_rate"]
         ws.cell(row, 1).value = f"Tax ({int(tax_rate*100)}%)"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"=MAX(0,{cl}{self.row_refs['pnl_pbt']}*{tax_rate})"
@@ -1187,15 +1562,15 @@ class FinancialModelBuilder:
 
         # Net Income
         ws.cell(row, 1).value = "NET INCOME (PAT)"
-        ws.cell(row, 1).font = Font(bold=True, size=11)
+        style_font(ws.cell(row, 1), bold=True, size=11)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"={cl}{self.row_refs['pnl_pbt']}-{cl}{self.row_refs['pnl_tax']}"
             )
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["pnl_net_income"] = row
         row += 1
@@ -1203,7 +1578,7 @@ class FinancialModelBuilder:
         # Net Margin
         ws.cell(row, 1).value = "Net Margin %"
         ws.cell(row, 2).value = "%"
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"=IF({cl}{self.row_refs['pnl_revenue']}=0,0,{cl}{self.row_refs['pnl_net_income']}/{cl}{self.row_refs['pnl_revenue']})"
@@ -1213,6 +1588,16 @@ class FinancialModelBuilder:
     # ================================================================
     # SHEET 7: Cash Flow
     # ================================================================
+    @sheet_inputs(
+        config=[
+            "general.capex_y0",
+            "general.capex_annual",
+            "fixed_assets.classes",
+            "funding.rounds.*.amount",
+            "funding.rounds.*.year",
+        ],
+        refs=["pnl_net_income", "pnl_depreciation"],
+    )
     def _build_cash_flow(self):
         print("  [7/14] Cash Flow...")
         ws = self.wb.create_sheet("Cash Flow")
@@ -1235,7 +1620,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Net Income"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = f"='P&L'!{cl}{self.row_refs['pnl_net_income']}"
             ws.cell(row, 3 + yr).number_format = "#,##0"
@@ -1244,7 +1629,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "+ Depreciation"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"='P&L'!{cl}{self.row_refs['pnl_depreciation']}"
@@ -1255,22 +1640,22 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Working Capital Change"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             ws.cell(row, 3 + yr).value = 0
             ws.cell(row, 3 + yr).number_format = "#,##0"
         self.row_refs["cf_wc_change"] = row
         row += 1
 
         ws.cell(row, 1).value = "Operating Cash Flow"
-        ws.cell(row, 1).font = Font(bold=True)
+        style_font(ws.cell(row, 1), bold=True)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"={cl}{self.row_refs['cf_net_income']}+{cl}{self.row_refs['cf_depreciation']}-{cl}{self.row_refs['cf_wc_change']}"
             )
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["cf_operating"] = row
         row += 2
@@ -1282,24 +1667,23 @@ class FinancialModelBuilder:
         ws.merge_cells(f"A{row}:{get_column_letter(self._end_col)}{row}")
         row += 1
 
-        gen = self.config["general"]
+        capex = self._fixed_assets()["capex"]
         ws.cell(row, 1).value = "Capital Expenditure"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
-            capex = gen["capex_y0"] if yr == 0 else gen["capex_annual"]
-            ws.cell(row, 3 + yr).value = -capex
-            ws.cell(row, 3 + yr).number_format = "#,##0"
+        for p in self.axis:
+            ws.cell(row, 3 + p.index).value = -float(capex[p.index])
+            ws.cell(row, 3 + p.index).number_format = "#,##0"
         self.row_refs["cf_capex"] = row
         row += 1
 
         ws.cell(row, 1).value = "Investing Cash Flow"
-        ws.cell(row, 1).font = Font(bold=True)
+        style_font(ws.cell(row, 1), bold=True)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = f"={cl}{self.row_refs['cf_capex']}"
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["cf_investing"] = row
         row += 2
@@ -1314,45 +1698,47 @@ class FinancialModelBuilder:
         rounds = self.config["funding"].get("rounds", [])
         ws.cell(row, 1).value = "Equity Raised"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
-            equity = sum(r["amount"] for r in rounds if r.get("year", -1) == yr)
-            ws.cell(row, 3 + yr).value = equity
-            ws.cell(row, 3 + yr).number_format = "#,##0"
+        for p in self.axis:
+            equity = 0
+            if p.is_year_start:
+                equity = sum(r["amount"] for r in rounds if r.get("year", -1) == p.year)
+            ws.cell(row, 3 + p.index).value = equity
+            ws.cell(row, 3 + p.index).number_format = "#,##0"
         self.row_refs["cf_equity"] = row
         row += 1
 
         ws.cell(row, 1).value = "Financing Cash Flow"
-        ws.cell(row, 1).font = Font(bold=True)
+        style_font(ws.cell(row, 1), bold=True)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = f"={cl}{self.row_refs['cf_equity']}"
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["cf_financing"] = row
         row += 2
 
         # Net Cash Flow
         ws.cell(row, 1).value = "NET CASH FLOW"
-        ws.cell(row, 1).font = Font(bold=True, size=11)
+        style_font(ws.cell(row, 1), bold=True, size=11)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"={cl}{self.row_refs['cf_operating']}+{cl}{self.row_refs['cf_investing']}+{cl}{self.row_refs['cf_financing']}"
             )
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["cf_net"] = row
         row += 2
 
         # Cumulative
         ws.cell(row, 1).value = "CUMULATIVE CASH"
-        ws.cell(row, 1).font = Font(bold=True, size=11)
+        style_font(ws.cell(row, 1), bold=True, size=11)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             if yr == 0:
                 ws.cell(row, 3 + yr).value = f"={cl}{self.row_refs['cf_net']}"
@@ -1362,13 +1748,24 @@ class FinancialModelBuilder:
                     f"={prev}{row}+{cl}{self.row_refs['cf_net']}"
                 )
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["cf_cumulative"] = row
 
     # ================================================================
     # SHEET 8: Balance Sheet
     # ================================================================
+    @sheet_inputs(
+        config=[
+            "general.capex_y0",
+            "general.capex_annual",
+            "general.depreciation_years",
+            "fixed_assets.classes",
+            "funding.rounds.*.amount",
+            "funding.rounds.*.year",
+        ],
+        refs=["cf_cumulative", "pnl_net_income"],
+    )
     def _build_balance_sheet(self):
         print("  [8/14] Balance Sheet...")
         ws = self.wb.create_sheet("Balance Sheet")
@@ -1389,7 +1786,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Cash & Equivalents"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"='Cash Flow'!{cl}{self.row_refs['cf_cumulative']}"
@@ -1398,35 +1795,26 @@ class FinancialModelBuilder:
         self.row_refs["bs_cash"] = row
         row += 1
 
-        gen = self.config["general"]
-        capex_y0 = gen["capex_y0"]
-        capex_ann = gen["capex_annual"]
-        dep_yrs = gen["depreciation_years"]
-
+        # Cumulative capex less the depreciation charged on the P&L
+        nfa = self._fixed_assets()["nfa"]
         ws.cell(row, 1).value = "Net Fixed Assets"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
-            cum_capex = capex_y0 + (capex_ann * yr)
-            cum_dep = (capex_y0 / dep_yrs) * min(yr + 1, dep_yrs)
-            if yr > 0:
-                cum_dep += sum(
-                    (capex_ann / dep_yrs) * min(yr - y, dep_yrs) for y in range(yr)
-                )
-            ws.cell(row, 3 + yr).value = round(max(0, cum_capex - cum_dep))
-            ws.cell(row, 3 + yr).number_format = "#,##0"
+        for p in self.axis:
+            ws.cell(row, 3 + p.index).value = float(nfa[p.index])
+            ws.cell(row, 3 + p.index).number_format = "#,##0"
         self.row_refs["bs_fixed_assets"] = row
         row += 1
 
         ws.cell(row, 1).value = "TOTAL ASSETS"
-        ws.cell(row, 1).font = Font(bold=True, size=11)
+        style_font(ws.cell(row, 1), bold=True, size=11)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"={cl}{self.row_refs['bs_cash']}+{cl}{self.row_refs['bs_fixed_assets']}"
             )
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["bs_total_assets"] = row
         row += 2
@@ -1440,7 +1828,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Total Liabilities"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             ws.cell(row, 3 + yr).value = 0
             ws.cell(row, 3 + yr).number_format = "#,##0"
         self.row_refs["bs_liabilities"] = row
@@ -1449,16 +1837,16 @@ class FinancialModelBuilder:
         rounds = self.config["funding"].get("rounds", [])
         ws.cell(row, 1).value = "Paid-in Capital"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
-            cum = sum(r["amount"] for r in rounds if r.get("year", 0) <= yr)
-            ws.cell(row, 3 + yr).value = cum
-            ws.cell(row, 3 + yr).number_format = "#,##0"
+        for p in self.axis:
+            cum = sum(r["amount"] for r in rounds if r.get("year", 0) <= p.year)
+            ws.cell(row, 3 + p.index).value = cum
+            ws.cell(row, 3 + p.index).number_format = "#,##0"
         self.row_refs["bs_paid_capital"] = row
         row += 1
 
         ws.cell(row, 1).value = "Retained Earnings"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             if yr == 0:
                 ws.cell(row, 3 + yr).value = (
@@ -1474,35 +1862,35 @@ class FinancialModelBuilder:
         row += 1
 
         ws.cell(row, 1).value = "Total Equity"
-        ws.cell(row, 1).font = Font(bold=True)
+        style_font(ws.cell(row, 1), bold=True)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"={cl}{self.row_refs['bs_paid_capital']}+{cl}{self.row_refs['bs_retained_earnings']}"
             )
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         self.row_refs["bs_total_equity"] = row
         row += 1
 
         ws.cell(row, 1).value = "TOTAL LIABILITIES & EQUITY"
-        ws.cell(row, 1).font = Font(bold=True, size=11)
+        style_font(ws.cell(row, 1), bold=True, size=11)
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"={cl}{self.row_refs['bs_liabilities']}+{cl}{self.row_refs['bs_total_equity']}"
             )
             ws.cell(row, 3 + yr).number_format = "#,##0"
-            ws.cell(row, 3 + yr).font = Font(bold=True)
+            style_font(ws.cell(row, 3 + yr), bold=True)
         style_total_row(ws, row, 1, self._end_col)
         self.row_refs["bs_total_le"] = row
         row += 2
 
         ws.cell(row, 1).value = "BALANCE CHECK (Assets = L+E)"
-        ws.cell(row, 1).font = Font(bold=True, color=Colors.GRAY)
-        for yr in range(self.num_years):
+        style_font(ws.cell(row, 1), bold=True, color=Colors.GRAY)
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"={cl}{self.row_refs['bs_total_assets']}-{cl}{self.row_refs['bs_total_le']}"
@@ -1513,6 +1901,16 @@ class FinancialModelBuilder:
     # ================================================================
     # SHEET 9: Summary
     # ================================================================
+    @sheet_inputs(
+        refs=[
+            "pnl_revenue",
+            "pnl_gross_profit",
+            "pnl_ebitda",
+            "headcount_total",
+            "cf_cumulative",
+            "cf_net",
+        ]
+    )
     def _build_summary(self):
         print("  [9/14] Summary...")
         ws = self.wb.create_sheet("Summary")
@@ -1537,7 +1935,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Total Revenue"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = f"='P&L'!{cl}{rev_r}"
             ws.cell(row, 3 + yr).number_format = "#,##0"
@@ -1545,7 +1943,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Revenue Growth %"
         ws.cell(row, 2).value = "%"
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             if yr == 0:
                 ws.cell(row, 3 + yr).value = 0
@@ -1559,7 +1957,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Gross Margin %"
         ws.cell(row, 2).value = "%"
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"=IF('P&L'!{cl}{rev_r}=0,0,'P&L'!{cl}{gp_r}/'P&L'!{cl}{rev_r})"
@@ -1569,7 +1967,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "EBITDA Margin %"
         ws.cell(row, 2).value = "%"
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"=IF('P&L'!{cl}{rev_r}=0,0,'P&L'!{cl}{ebitda_r}/'P&L'!{cl}{rev_r})"
@@ -1585,7 +1983,7 @@ class FinancialModelBuilder:
         hc_r = self.row_refs.get("headcount_total", 8)
         ws.cell(row, 1).value = "Total Headcount"
         ws.cell(row, 2).value = "FTE"
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = f"='Headcount Plan'!{cl}{hc_r}"
             ws.cell(row, 3 + yr).number_format = "#,##0"
@@ -1593,7 +1991,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Revenue per Employee"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"=IF('Headcount Plan'!{cl}{hc_r}=0,0,'P&L'!{cl}{rev_r}/'Headcount Plan'!{cl}{hc_r})"
@@ -1608,7 +2006,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Cash Balance"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"='Cash Flow'!{cl}{self.row_refs['cf_cumulative']}"
@@ -1618,7 +2016,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Net Cash Flow"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = f"='Cash Flow'!{cl}{self.row_refs['cf_net']}"
             ws.cell(row, 3 + yr).number_format = "#,##0"
@@ -1626,6 +2024,23 @@ class FinancialModelBuilder:
     # ================================================================
     # SHEET 10: Sensitivity Analysis
     # ================================================================
+    @sheet_inputs(
+        config=["monte_carlo"],
+        refs=["pnl_revenue", "pnl_ebitda", "cf_cumulative"],
+        # Monte Carlo bands are simulated from the whole model's drivers
+        when={
+            "monte_carlo": [
+                "revenue_streams",
+                "headcount",
+                "fixed_costs",
+                "fixed_assets",
+                "general",
+                "funding",
+                "valuation.terminal_year",
+                "customer_acquisition.churn_rate",
+            ]
+        },
+    )
     def _build_sensitivity(self):
         print("  [10/14] Sensitivity Analysis...")
         ws = self.wb.create_sheet("Sensitivity Analysis")
@@ -1648,13 +2063,15 @@ class FinancialModelBuilder:
         )
         row += 1
 
-        # Terminal year column (dynamic, not hardcoded to Year 8)
-        term_col = get_column_letter(3 + self._terminal_yr)
-        term_label = f"Year {self._terminal_yr}"
+        # Terminal year (dynamic, not hardcoded to Year 8)
+        term_yr = self._terminal_yr
+        term_label = f"Year {term_yr}"
 
         ws.cell(row, 1).value = f"{term_label} Revenue"
         ws.cell(row, 2).value = f"=0.8*C{row}"
-        ws.cell(row, 3).value = f"='P&L'!{term_col}{self.row_refs['pnl_revenue']}"
+        ws.cell(row, 3).value = (
+            "=" + self._year_ref("'P&L'", self.row_refs['pnl_revenue'], term_yr)
+        )
         ws.cell(row, 4).value = f"=1.2*C{row}"
         for c in range(2, 5):
             ws.cell(row, c).number_format = "#,##0"
@@ -1662,7 +2079,9 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = f"{term_label} EBITDA"
         ws.cell(row, 2).value = f"=0.7*C{row}"
-        ws.cell(row, 3).value = f"='P&L'!{term_col}{self.row_refs['pnl_ebitda']}"
+        ws.cell(row, 3).value = (
+            "=" + self._year_ref("'P&L'", self.row_refs['pnl_ebitda'], term_yr)
+        )
         ws.cell(row, 4).value = f"=1.3*C{row}"
         for c in range(2, 5):
             ws.cell(row, c).number_format = "#,##0"
@@ -1670,16 +2089,42 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = f"{term_label} Cash"
         ws.cell(row, 2).value = f"=0.75*C{row}"
-        ws.cell(row, 3).value = (
-            f"='Cash Flow'!{term_col}{self.row_refs['cf_cumulative']}"
+        ws.cell(row, 3).value = "=" + self._year_ref(
+            "'Cash Flow'", self.row_refs["cf_cumulative"], term_yr, stock=True
         )
         ws.cell(row, 4).value = f"=1.25*C{row}"
         for c in range(2, 5):
             ws.cell(row, c).number_format = "#,##0"
+        row += 2
+
+        # Monte Carlo bands (only when the config has a monte_carlo section)
+        if not self.config.get("monte_carlo"):
+            return
+        from monte_carlo import BAND_SERIES, run_monte_carlo
+
+        mc = run_monte_carlo(self.config, axis=self.axis)
+        style_section_header(
+            ws.cell(row, 1),
+            f"MONTE CARLO ({mc['trials']:,} trials, seed {mc['seed']})",
+        )
+        ws.merge_cells(f"A{row}:D{row}")
+        row += 1
+        style_column_headers(ws, row, ["Metric", "P10", "P50", "P90"], end_col=4)
+        row += 1
+        for label, key in BAND_SERIES:
+            ws.cell(row, 1).value = f"{term_label} {label}"
+            for c, pct in enumerate(["p10", "p50", "p90"], start=2):
+                ws.cell(row, c).value = round(mc["bands"][key][pct])
+                ws.cell(row, c).number_format = "#,##0"
+            row += 1
 
     # ================================================================
     # SHEET 11: Valuation
     # ================================================================
+    @sheet_inputs(
+        config=["valuation", "funding.rounds.*.amount"],
+        refs=["pnl_revenue", "pnl_ebitda"],
+    )
     def _build_valuation(self):
         print("  [11/14] Valuation...")
         ws = self.wb.create_sheet("Valuation")
@@ -1716,23 +2161,27 @@ class FinancialModelBuilder:
         ws.merge_cells(f"A{row}:B{row}")
         row += 1
 
-        term_col = get_column_letter(3 + self._terminal_yr)
-        term_label = f"Year {self._terminal_yr}"
+        term_yr = self._terminal_yr
+        term_label = f"Year {term_yr}"
         ws.cell(row, 1).value = f"{term_label} Revenue"
-        ws.cell(row, 2).value = f"='P&L'!{term_col}{self.row_refs['pnl_revenue']}"
+        ws.cell(row, 2).value = (
+            "=" + self._year_ref("'P&L'", self.row_refs['pnl_revenue'], term_yr)
+        )
         ws.cell(row, 2).number_format = "#,##0"
         rev_row = row
         row += 1
 
         ws.cell(row, 1).value = f"{term_label} EBITDA"
-        ws.cell(row, 2).value = f"='P&L'!{term_col}{self.row_refs['pnl_ebitda']}"
+        ws.cell(row, 2).value = (
+            "=" + self._year_ref("'P&L'", self.row_refs['pnl_ebitda'], term_yr)
+        )
         ws.cell(row, 2).number_format = "#,##0"
         row += 1
 
         ws.cell(row, 1).value = f"Implied Exit Valuation ({exit_multiple}x Rev)"
         ws.cell(row, 2).value = f"=B{rev_row}*B{exit_mult_row}"
         ws.cell(row, 2).number_format = "#,##0"
-        ws.cell(row, 2).font = Font(bold=True)
+        style_font(ws.cell(row, 2), bold=True)
         exit_val_row = row
         row += 2
 
@@ -1748,11 +2197,15 @@ class FinancialModelBuilder:
         ws.cell(row, 1).value = "Return Multiple (Exit / Raised)"
         ws.cell(row, 2).value = f"=IF(B{raised_row}=0,0,B{exit_val_row}/B{raised_row})"
         ws.cell(row, 2).number_format = "0.0x"
-        ws.cell(row, 2).font = Font(bold=True)
+        style_font(ws.cell(row, 2), bold=True)
 
     # ================================================================
     # SHEET 12: Break-even Analysis
     # ================================================================
+    @sheet_inputs(
+        config=["revenue_streams.*.name"],
+        refs=["revenue_start", "cogs_start", "pnl_opex"],
+    )
     def _build_breakeven(self):
         print("  [12/14] Break-even Analysis...")
         ws = self.wb.create_sheet("Break-even Analysis")
@@ -1786,7 +2239,7 @@ class FinancialModelBuilder:
             # Revenue per stream (reference Revenue sheet)
             ws.cell(row, 1).value = f"{name}: Revenue"
             ws.cell(row, 2).value = self.currency
-            for yr in range(self.num_years):
+            for yr in range(self.num_periods):
                 cl = get_column_letter(3 + yr)
                 ws.cell(row, 3 + yr).value = f"=Revenue!{cl}{rev_sheet_row}"
                 ws.cell(row, 3 + yr).number_format = "#,##0"
@@ -1796,7 +2249,7 @@ class FinancialModelBuilder:
             # COGS per stream (reference Operating Costs sheet)
             ws.cell(row, 1).value = f"{name}: COGS"
             ws.cell(row, 2).value = self.currency
-            for yr in range(self.num_years):
+            for yr in range(self.num_periods):
                 cl = get_column_letter(3 + yr)
                 ws.cell(row, 3 + yr).value = f"='Operating Costs'!{cl}{cogs_sheet_row}"
                 ws.cell(row, 3 + yr).number_format = "#,##0"
@@ -1806,8 +2259,8 @@ class FinancialModelBuilder:
             # Contribution margin per stream
             ws.cell(row, 1).value = f"{name}: Contribution Margin"
             ws.cell(row, 2).value = self.currency
-            ws.cell(row, 1).font = Font(bold=True)
-            for yr in range(self.num_years):
+            style_font(ws.cell(row, 1), bold=True)
+            for yr in range(self.num_periods):
                 cl = get_column_letter(3 + yr)
                 ws.cell(row, 3 + yr).value = f"={cl}{row-2}-{cl}{row-1}"
                 ws.cell(row, 3 + yr).number_format = "#,##0"
@@ -1823,7 +2276,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Total Revenue"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             refs = "+".join(f"{cl}{r}" for r in stream_rev_rows)
             ws.cell(row, 3 + yr).value = f"={refs}"
@@ -1833,7 +2286,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Total Variable Costs (COGS)"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             refs = "+".join(f"{cl}{r}" for r in stream_cogs_rows)
             ws.cell(row, 3 + yr).value = f"={refs}"
@@ -1843,8 +2296,8 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Total Contribution Margin"
         ws.cell(row, 2).value = self.currency
-        ws.cell(row, 1).font = Font(bold=True)
-        for yr in range(self.num_years):
+        style_font(ws.cell(row, 1), bold=True)
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = f"={cl}{total_rev_row}-{cl}{total_cogs_row}"
             ws.cell(row, 3 + yr).number_format = "#,##0"
@@ -1853,7 +2306,7 @@ class FinancialModelBuilder:
 
         ws.cell(row, 1).value = "Contribution Margin %"
         ws.cell(row, 2).value = "%"
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"=IF({cl}{total_rev_row}=0,0,{cl}{total_cm_row}/{cl}{total_rev_row})"
@@ -1864,7 +2317,7 @@ class FinancialModelBuilder:
         # Fixed costs (from P&L references)
         ws.cell(row, 1).value = "Total Fixed Costs (OpEx + Headcount)"
         ws.cell(row, 2).value = self.currency
-        for yr in range(self.num_years):
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = f"='P&L'!{cl}{self.row_refs['pnl_opex']}"
             ws.cell(row, 3 + yr).number_format = "#,##0"
@@ -1874,8 +2327,8 @@ class FinancialModelBuilder:
         # Break-even revenue
         ws.cell(row, 1).value = "Break-Even Revenue"
         ws.cell(row, 2).value = self.currency
-        ws.cell(row, 1).font = Font(bold=True, color="CC0000")
-        for yr in range(self.num_years):
+        style_font(ws.cell(row, 1), bold=True, color="CC0000")
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             cm_pct_row = total_cm_row + 1
             ws.cell(row, 3 + yr).value = (
@@ -1888,8 +2341,8 @@ class FinancialModelBuilder:
         # Margin of safety
         ws.cell(row, 1).value = "Margin of Safety"
         ws.cell(row, 2).value = "%"
-        ws.cell(row, 1).font = Font(bold=True)
-        for yr in range(self.num_years):
+        style_font(ws.cell(row, 1), bold=True)
+        for yr in range(self.num_periods):
             cl = get_column_letter(3 + yr)
             ws.cell(row, 3 + yr).value = (
                 f"=IF({cl}{total_rev_row}=0,0,({cl}{total_rev_row}-{cl}{be_rev_row})/{cl}{total_rev_row})"
@@ -1900,6 +2353,7 @@ class FinancialModelBuilder:
     # ================================================================
     # SHEET 13: Funding Cap Table
     # ================================================================
+    @sheet_inputs(config=["funding.rounds"])
     def _build_cap_table(self):
         print("  [13/14] Funding Cap Table...")
         ws = self.wb.create_sheet("Funding Cap Table")
@@ -1939,23 +2393,26 @@ class FinancialModelBuilder:
 
         row += 1
         ws.cell(row, 1).value = "TOTAL RAISED"
-        ws.cell(row, 1).font = Font(bold=True)
+        style_font(ws.cell(row, 1), bold=True)
         ws.cell(row, 2).value = f"=SUM(B{first_row}:B{last_row})"
         ws.cell(row, 2).number_format = "#,##0"
-        ws.cell(row, 2).font = Font(bold=True)
+        style_font(ws.cell(row, 2), bold=True)
         style_total_row(ws, row, 1, 5)
 
     # ================================================================
     # SHEET 14: Charts Data
     # ================================================================
+    @sheet_inputs(
+        refs=["pnl_revenue", "pnl_ebitda", "pnl_net_income", "cf_cumulative"]
+    )
     def _build_charts_data(self):
         print("  [14/14] Charts Data...")
         ws = self.wb.create_sheet("Charts Data")
         ws.column_dimensions["A"].width = 25
-        for i in range(2, 2 + self.num_years):
+        for i in range(2, 2 + self.num_periods):
             ws.column_dimensions[get_column_letter(i)].width = 12
 
-        end = 1 + self.num_years
+        end = 1 + self.num_periods
         style_title(ws["A1"], "CHARTS DATA")
         ws.merge_cells(f"A1:{get_column_letter(end)}1")
         row = 3
@@ -1974,13 +2431,192 @@ class FinancialModelBuilder:
         for label, ref_key, sheet in metrics:
             ws.cell(row, 1).value = label
             ref_row = self.row_refs.get(ref_key, 4)
-            for yr in range(self.num_years):
+            for yr in range(self.num_periods):
                 cl = get_column_letter(3 + yr)
                 ws.cell(row, 2 + yr).value = f"='{sheet}'!{cl}{ref_row}"
                 ws.cell(row, 2 + yr).number_format = "#,##0"
             row += 1
 
 
+# =============================================================================
+# BATCH BUILD
+# =============================================================================
+def _is_model_config(path: str) -> bool:
+    """False for JSON that is clearly not a model config (no revenue_streams).
+
+    Unreadable or malformed files are kept so the batch reports them.
+    """
+    try:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return True
+    return isinstance(data, dict) and "revenue_streams" in data
+
+
+def discover_configs(patterns: List[str], configs_dir: Optional[str] = None) -> List[str]:
+    """Expand config globs / a configs directory into a sorted file list.
+
+    A configs directory is searched for `<project>/config/*.json`. Build
+    sidecars (`*.build.json`) and JSON without `revenue_streams` (research
+    notes, stage state...) are skipped.
+    """
+    found = set()
+    for pattern in patterns or []:
+        found.update(glob.glob(pattern, recursive=True))
+    if configs_dir:
+        found.update(glob.glob(os.path.join(configs_dir, "**", "config", "*.json"), recursive=True))
+    return sorted(
+        path
+        for path in found
+        if path.endswith(".json") and not path.endswith(".build.json") and _is_model_config(path)
+    )
+
+
+def build_one(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Build (and optionally validate) one model; never raises.
+
+    Runs inside batch worker processes, so imports done here are paid once
+    per worker and reused for every later job it picks up.
+    """
+    result = {
+        "config": job["config"],
+        "output": job["output"],
+        "status": "ok",
+        "error": None,
+        "build_ms": None,
+        "save_ms": None,
+        "validate_ms": None,
+        "valid": None,
+    }
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            with open(job["config"], "r", encoding="utf-8-sig") as f:
+                config = json.load(f)
+            if not isinstance(config, dict):
+                raise ValueError("config root must be a JSON object")
+            if job["monte_carlo"]:
+                config["monte_carlo"] = dict(
+                    config.get("monte_carlo") or {}, trials=job["monte_carlo"]
+                )
+            started = time.perf_counter()
+            builder = FinancialModelBuilder(
+                config,
+                num_years=job["years"],
+                backend="layout" if job["formats"] else job["backend"],
+                granularity=job["granularity"],
+                monthly_months=job["monthly_months"],
+                profile=job["profile"],
+                shared_formulas=job["shared_formulas"],
+                cached_values=job["cached_values"],
+            )
+            builder.build_all()
+            built = time.perf_counter()
+            if job["formats"]:
+                builder.export(job["output"], sorted(set(job["formats"]) | {"xlsx"}))
+            else:
+                builder.save(job["output"])
+            saved = time.perf_counter()
+        result["build_ms"] = round((built - started) * 1000, 1)
+        result["save_ms"] = round((saved - built) * 1000, 1)
+
+        if job["validate"]:
+            from validate_excel_model import ExcelModelValidator
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                validator = ExcelModelValidator(job["output"])
+                valid, _ = validator.validate()
+            result["validate_ms"] = round((time.perf_counter() - saved) * 1000, 1)
+            result["valid"] = valid
+            if not valid:
+                result["status"] = "invalid"
+                result["error"] = "; ".join(validator.errors[:5])
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def build_batch(
+    configs: List[str],
+    output_dir: str,
+    years: int = 11,
+    validate: bool = False,
+    workers: Optional[int] = None,
+    backend: str = "openpyxl",
+    granularity: str = "annual",
+    monthly_months: int = 36,
+    monte_carlo: Optional[int] = None,
+    profile: Optional[str] = None,
+    shared_formulas: bool = False,
+    cached_values: bool = True,
+    formats: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Build many configs across a process pool; returns the aggregate report.
+
+    The options match the single-model CLI: `monte_carlo` trials are set on
+    every config, `profile` lines from all workers go to one file, and
+    `formats` exports each model through the layout backend (the xlsx is
+    always written).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = []
+    used = set()
+    for path in configs:
+        # <project>/config/<name>.json -> <project>__<name>.xlsx (unique per run)
+        parts = os.path.normpath(path).split(os.sep)
+        stem = os.path.splitext(parts[-1])[0]
+        name = f"{parts[-3]}__{stem}" if len(parts) >= 3 and parts[-2] == "config" else stem
+        while name in used:
+            name += "_"
+        used.add(name)
+        jobs.append(
+            {
+                "config": path,
+                "output": os.path.join(output_dir, f"{name}.xlsx"),
+                "years": years,
+                "validate": validate,
+                "backend": backend,
+                "granularity": granularity,
+                "monthly_months": monthly_months,
+                "monte_carlo": monte_carlo,
+                "profile": profile,
+                "shared_formulas": shared_formulas,
+                "cached_values": cached_values,
+                "formats": formats,
+            }
+        )
+
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(build_one, job): job for job in jobs}
+        for future in as_completed(futures):
+            res = future.result()
+            results.append(res)
+            mark = {"ok": "OK", "invalid": "INVALID", "failed": "FAILED"}[res["status"]]
+            timing = f"{res['build_ms']} ms" if res["build_ms"] is not None else ""
+            print(f"  [{len(results)}/{len(jobs)}] {mark:<8}{res['config']}  {timing}")
+            if res["error"]:
+                print(f"            {res['error']}")
+    elapsed = time.perf_counter() - started
+
+    results.sort(key=lambda r: r["config"])
+    counts = {k: sum(r["status"] == k for r in results) for k in ("ok", "invalid", "failed")}
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "output_dir": output_dir,
+        "workers": workers or os.cpu_count(),
+        "years": years,
+        "granularity": granularity,
+        "validated": validate,
+        "total": len(results),
+        **counts,
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "models": results,
+    }
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -1994,20 +2630,134 @@ def main():
     parser.add_argument(
         "--years", type=int, default=11, help="Years (default: 11 = Y0-Y10)"
     )
+    parser.add_argument(
+        "--granularity",
+        choices=TimeAxis.GRANULARITIES,
+        default="annual",
+        help="Period columns: annual, monthly, or hybrid (monthly then annual)",
+    )
+    parser.add_argument(
+        "--monthly-months",
+        type=int,
+        default=36,
+        help="Hybrid: months shown monthly before switching to annual (default: 36)",
+    )
     parser.add_argument("--output", "-o", help="Output .xlsx path")
     parser.add_argument("--up-to", dest="up_to", help="Build sheets up to this name")
     parser.add_argument("--sheets", nargs="+", help="Build only these specific sheets")
     parser.add_argument(
         "--validate", "-v", action="store_true", help="Validate after build"
     )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream sheets to disk row by row (constant memory, for large models)",
+    )
+    parser.add_argument(
+        "--shared-formulas",
+        action="store_true",
+        help="Streaming/--formats: write column-shifted formula runs as shared formulas "
+        "(~35-45%% smaller files, faster saves; openpyxl loads them ~2x slower)",
+    )
+    parser.add_argument(
+        "--no-cached-values",
+        action="store_true",
+        help="Leave formula cells without computed results (skips native evaluation)",
+    )
+    parser.add_argument(
+        "--build-cache",
+        action="store_true",
+        help="Also write <model>.build.json sheet fingerprints for later "
+        "build_incremental() runs",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help=f"Append per-sheet timing/size metrics as JSON lines ('-' = stderr; "
+        f"or set {PROFILE_ENV})",
+    )
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        choices=["xlsx", "sheets", "csv"],
+        help="Lay the model out once and write each format: xlsx, sheets "
+        "(batchUpdate JSON), csv (snapshot directory)",
+    )
+    parser.add_argument(
+        "--configs",
+        nargs="+",
+        help="Batch mode: config files or glob patterns (built in parallel)",
+    )
+    parser.add_argument(
+        "--configs-dir",
+        help="Batch mode: build every <project>/config/*.json under this directory",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Batch mode: worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=".tmp/batch_models",
+        help="Batch mode: output directory (default: .tmp/batch_models)",
+    )
+    parser.add_argument(
+        "--report", help="Batch mode: JSON report path (default: <output-dir>/batch_report.json)"
+    )
+    parser.add_argument(
+        "--monte-carlo",
+        type=int,
+        nargs="?",
+        const=10000,
+        metavar="TRIALS",
+        help="Add P10/P50/P90 bands to the Sensitivity sheet (default: 10000 trials)",
+    )
+    parser.add_argument(
+        "--compute",
+        action="store_true",
+        help="Also compute the model natively and print key metrics",
+    )
     args = parser.parse_args()
 
+    # Batch mode
+    if args.configs or args.configs_dir:
+        configs = discover_configs(args.configs, args.configs_dir)
+        if not configs:
+            print("ERROR: No config files matched")
+            sys.exit(1)
+        print(f"Batch building {len(configs)} models...")
+        print("=" * 60)
+        report = build_batch(
+            configs,
+            args.output_dir,
+            years=args.years,
+            validate=args.validate,
+            workers=args.workers,
+            backend="streaming" if args.streaming else "openpyxl",
+            granularity=args.granularity,
+            monthly_months=args.monthly_months,
+            monte_carlo=args.monte_carlo,
+            profile=args.profile,
+            shared_formulas=args.shared_formulas,
+            cached_values=not args.no_cached_values,
+            formats=args.formats,
+        )
+        report_path = args.report or os.path.join(args.output_dir, "batch_report.json")
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print("=" * 60)
+        print(
+            f"{report['ok']} ok, {report['invalid']} invalid, {report['failed']} failed "
+            f"in {report['elapsed_ms'] / 1000:.1f}s"
+        )
+        print(f"Report: {report_path}")
+        sys.exit(0 if report["ok"] == report["total"] else 1)
+
     # Load config
     if args.config:
         if not os.path.exists(args.config):
             print(f"ERROR: Config not found: {args.config}")
             sys.exit(1)
-        with open(args.config, "r", encoding="utf-8") as f:
+        with open(args.config, "r", encoding="utf-8-sig") as f:
             config = json.load(f)
     elif args.company:
         config = {
@@ -2037,9 +2787,12 @@ def main():
             "som": {"year8_revenue_m": 0},
         }
     else:
-        print("ERROR: Provide --config or --company")
+        print("ERROR: Provide --config, --company, --configs or --configs-dir")
         sys.exit(1)
 
+    if args.monte_carlo:
+        config["monte_carlo"] = dict(config.get("monte_carlo") or {}, trials=args.monte_carlo)
+
     # Output path
     company_name = config.get("company_name", config.get("company", "Model"))
     if args.output:
@@ -2050,14 +2803,46 @@ def main():
         output = f".tmp/{safe}_financial_model.xlsx"
 
     # Build
-    builder = FinancialModelBuilder(config, num_years=args.years)
+    if args.formats:
+        backend = "layout"
+    else:
+        backend = "streaming" if args.streaming else "openpyxl"
+    builder = FinancialModelBuilder(
+        config,
+        num_years=args.years,
+        backend=backend,
+        granularity=args.granularity,
+        monthly_months=args.monthly_months,
+        profile=args.profile,
+        shared_formulas=args.shared_formulas,
+        cached_values=not args.no_cached_values,
+        build_cache=args.build_cache,
+    )
     if args.up_to:
         builder.build_up_to(args.up_to)
     elif args.sheets:
         builder.build_sheets(args.sheets)
     else:
         builder.build_all()
-    builder.save(output)
+    if args.formats:
+        if "xlsx" not in args.formats:
+            args.formats.append("xlsx")  # validation and next steps read it
+        builder.export(output, args.formats)
+    else:
+        builder.save(output)
+
+    # Native computation (no Excel recalculation needed)
+    if args.compute:
+        results = builder.compute()
+        t = results.terminal_yr
+        print(f"\nNative computation ({results.elapsed_ms:.1f} ms):")
+        for label, key in [
+            ("Revenue", "pnl_revenue"),
+            ("EBITDA", "pnl_ebitda"),
+            ("Net Income", "pnl_net_income"),
+            ("Cash Balance", "cf_cumulative"),
+        ]:
+            print(f"  Year {t} {label}: {results.terminal(key):,.0f}")
 
     # Validate
     if args.validate:
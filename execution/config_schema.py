@@ -0,0 +1,709 @@
+#!/usr/bin/env python3
+"""
+Compiled Config Schema
+======================
+
+One traversal of a raw config that both normalizes it into the canonical
+shape the builder reads and collects validation issues. normalize_config
+(build_financial_model.py) and ConfigValidator (validate_config.py) are thin
+views over the same result, so the two can no longer disagree about legacy
+shapes (flat headcount prefixes, seed/series_* funding, numeric TAM/SAM,
+stream field aliases).
+
+Results are memoized by a hash of the config's content: repeated calls in
+one process return a copy of the cached result, and `cache_dir` persists it
+so later processes (the workflow validates in stages 0, 2 and 3) only read a
+small JSON file. Bump SCHEMA_VERSION whenever a rule changes so stale
+results are not reused.
+
+Usage:
+    compiled = compile_config(raw)
+    compiled.config        # normalized copy (safe to mutate)
+    compiled.issues        # [ValidationIssue]
+    compile_config(raw, cache_dir=".tmp/config_cache")  # also persisted
+"""
+
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict, namedtuple
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SCHEMA_VERSION = 1
+MEMO_SIZE = 64
+
+
+class ValidationLevel(Enum):
+    ERROR = "ERROR"
+    WARNING = "WARNING"
+    INFO = "INFO"
+
+
+@dataclass
+class ValidationIssue:
+    level: ValidationLevel
+    field: str
+    message: str
+    suggestion: Optional[str] = None
+
+
+CompiledConfig = namedtuple("CompiledConfig", "config, issues, digest")
+# Memo entry: the compiled result plus its config as JSON text (copies are
+# made by parsing the text, several times faster than deepcopy)
+_Entry = namedtuple("_Entry", "compiled, text")
+
+ERROR, WARNING, INFO = ValidationLevel.ERROR, ValidationLevel.WARNING, ValidationLevel.INFO
+
+GENERAL_DEFAULTS = {
+    "tax_rate": 0.25,
+    "capex_y0": 150000,
+    "capex_annual": 50000,
+    "depreciation_years": 5,
+    "debtor_days": 45,
+    "creditor_days": 30,
+    "interest_rate": 0.10,
+    "cost_inflation": 0.05,
+}
+
+# Legacy flat headcount: <prefix>_salary / <prefix>_y0 / <prefix>_growth
+HEADCOUNT_PREFIXES = [
+    ("engineering", "Engineering"),
+    ("sales", "Sales & Marketing"),
+    ("ops", "Operations"),
+    ("ga", "G&A"),
+    ("product", "Product"),
+    ("data", "Data Science"),
+    ("support", "Customer Support"),
+    ("marketing", "Marketing"),
+    ("finance", "Finance"),
+    ("hr", "Human Resources"),
+    ("design", "Design"),
+    ("devops", "DevOps"),
+    ("research", "Research"),
+]
+
+# Legacy flat funding: <key>, <key>_year, <key>_pre
+FUNDING_KEYS = [
+    ("seed", "Seed"),
+    ("series_a", "Series A"),
+    ("series_b", "Series B"),
+    ("series_c", "Series C"),
+]
+
+
+def _is_number(v) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def _first(d: Dict[str, Any], *keys, default=None):
+    """Value of the first key present (field aliases)."""
+    for key in keys:
+        if key in d:
+            return d[key]
+    return default
+
+
+class _Compiler:
+    """Single pass over a raw config: fills `cfg` and `issues` section by section."""
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        self.cfg: Dict[str, Any] = copy.deepcopy(raw)
+        self.issues: List[ValidationIssue] = []
+        self.default_team = False  # headcount fell back to the placeholder team
+
+    def issue(self, level, field, message, suggestion=None):
+        self.issues.append(ValidationIssue(level, field, message, suggestion))
+
+    def section(self, key: str, kind=dict):
+        """Copy of a section, replaced by an empty one when it has the wrong type."""
+        value = self.cfg.get(key)
+        return value if isinstance(value, kind) else kind()
+
+    # ---- required fields & general parameters ----
+
+    def company(self):
+        cfg = self.cfg
+        if "company_name" not in cfg:
+            company = cfg.get("company")
+            if isinstance(company, str):
+                cfg["company_name"] = company
+            elif isinstance(company, dict):
+                cfg["company_name"] = company.get("name", "")
+        if not cfg.get("company_name"):
+            self.issue(ERROR, "company_name", "Missing company name", "Add 'company' or 'company_name'")
+        if "company_name" not in cfg:
+            self.issue(ERROR, "company_name", "Required field 'company_name' is missing")
+        cfg["company_name"] = cfg.get("company_name") or "Company"
+
+    def general(self):
+        cfg = self.cfg
+        gen = self.section("general")
+        if "tax_rate" in cfg:
+            gen.setdefault("tax_rate", cfg["tax_rate"])
+        elif _is_number(gen.get("tax_rate")):
+            cfg["tax_rate"] = gen["tax_rate"]
+        else:
+            self.issue(ERROR, "tax_rate", "Required field 'tax_rate' is missing")
+
+        tax = cfg.get("tax_rate")
+        if tax is not None:
+            if not _is_number(tax):
+                self.issue(ERROR, "tax_rate", f"Must be a number, got {type(tax).__name__}")
+            elif not (0 <= tax <= 1):
+                self.issue(ERROR, "tax_rate", f"Must be 0-1, got {tax}", "Use 0.25 for 25%")
+
+        if "starting_year" not in cfg:
+            if isinstance(gen.get("starting_year"), int):
+                cfg["starting_year"] = gen["starting_year"]
+            else:
+                yr = datetime.now().year + 1
+                cfg["starting_year"] = yr
+                self.issue(
+                    WARNING, "starting_year", f"Missing; defaulting to {yr}",
+                    "Set starting_year explicitly",
+                )
+        yr = cfg["starting_year"]
+        if not isinstance(yr, int):
+            self.issue(ERROR, "starting_year", f"Must be int, got {type(yr).__name__}")
+        elif yr < 2020 or yr > 2035:
+            self.issue(WARNING, "starting_year", f"{yr} seems unusual (expected 2020-2035)")
+
+        for key, lo, hi, label in [
+            ("capex_y0", 0, 50_000_000, "Initial CapEx"),
+            ("capex_annual", 0, 10_000_000, "Annual CapEx"),
+            ("depreciation_years", 1, 30, "Depreciation period"),
+            ("debtor_days", 0, 365, "Debtor days"),
+            ("creditor_days", 0, 365, "Creditor days"),
+        ]:
+            v = gen.get(key)
+            if _is_number(v) and (v < lo or v > hi):
+                self.issue(
+                    WARNING, f"general.{key}", f"{label} = {v} outside typical range ({lo}-{hi})"
+                )
+        for key in ["interest_rate", "cost_inflation"]:
+            v = gen.get(key)
+            if _is_number(v) and not (0 <= v <= 1):
+                self.issue(ERROR, f"general.{key}", f"Must be 0-1, got {v}", "Use 0.05 for 5%")
+
+        for key, value in GENERAL_DEFAULTS.items():
+            gen.setdefault(key, value)
+        cfg["general"] = gen
+        cfg.setdefault("tax_rate", gen["tax_rate"])
+        cfg.setdefault("currency", gen.get("currency", "USD"))
+
+    # ---- revenue streams ----
+
+    def revenue_streams(self):
+        raw = self.cfg.get("revenue_streams", [])
+        streams = []
+        if not isinstance(raw, list):
+            self.issue(ERROR, "revenue_streams", "Must be a list")
+            raw = []
+        elif not raw:
+            self.issue(ERROR, "revenue_streams", "No revenue streams defined")
+        elif len(raw) > 10:
+            self.issue(WARNING, "revenue_streams", f"{len(raw)} streams (>10 may clutter the model)")
+
+        for i, s in enumerate(raw):
+            pfx = f"revenue_streams[{i}]"
+            if not isinstance(s, dict):
+                self.issue(ERROR, pfx, "Must be an object")
+                continue
+            if not s.get("name"):
+                self.issue(ERROR, f"{pfx}.name", "Missing stream name")
+            price = _first(s, "price", "unit_price")
+            growth = _first(s, "growth", "growth_rate")
+            cogs = _first(s, "cogs_pct", "cogs_percentage")
+            vol = _first(s, "volume", "initial_volume")
+
+            if price is not None:
+                if not _is_number(price):
+                    self.issue(ERROR, f"{pfx}.price", f"Must be number, got {type(price).__name__}")
+                elif price < 0:
+                    self.issue(ERROR, f"{pfx}.price", f"Cannot be negative: {price}")
+                elif price == 0:
+                    self.issue(WARNING, f"{pfx}.price", "Price is 0 — intentional?")
+            if growth is not None:
+                if not _is_number(growth):
+                    self.issue(ERROR, f"{pfx}.growth", "Must be number")
+                elif growth < -0.5 or growth > 10:
+                    self.issue(
+                        WARNING, f"{pfx}.growth", f"{growth*100:.0f}% seems extreme (-50% to 1000%)"
+                    )
+            if cogs is not None:
+                if not _is_number(cogs):
+                    self.issue(ERROR, f"{pfx}.cogs_pct", "Must be number")
+                elif not (0 <= cogs <= 1):
+                    self.issue(
+                        ERROR, f"{pfx}.cogs_pct", f"COGS % must be 0-1, got {cogs}", "Use 0.20 for 20%"
+                    )
+            if _is_number(vol) and vol < 0:
+                self.issue(ERROR, f"{pfx}.volume", f"Cannot be negative: {vol}")
+
+            stream = dict(s)
+            stream["name"] = s.get("name") or "Product"
+            stream["price"] = price if _is_number(price) else 1000
+            stream["volume"] = vol if _is_number(vol) else 10
+            stream["growth"] = growth if _is_number(growth) else 0.25
+            stream["cogs_pct"] = cogs if _is_number(cogs) else 0.30
+            streams.append(stream)
+        self.cfg["revenue_streams"] = streams
+
+    # ---- fixed costs ----
+
+    def fixed_costs(self):
+        fc = self.cfg.get("fixed_costs", [])
+        if isinstance(fc, dict):
+            fc = [{"name": k, "annual_cost": v} for k, v in fc.items()]
+        if not isinstance(fc, list):
+            self.issue(ERROR, "fixed_costs", f"Must be list or object, got {type(fc).__name__}")
+            fc = []
+        elif len(fc) > 15:
+            self.issue(WARNING, "fixed_costs", f"{len(fc)} categories — consider consolidating")
+
+        costs = []
+        for i, c in enumerate(fc):
+            pfx = f"fixed_costs[{i}]"
+            if not isinstance(c, dict):
+                self.issue(ERROR, pfx, "Must be an object")
+                continue
+            if not c.get("name") and not c.get("category"):
+                self.issue(ERROR, pfx, "Missing 'name' or 'category'")
+            amt = _first(c, "annual_cost", "amount", "value")
+            if amt is not None:
+                if not _is_number(amt):
+                    self.issue(ERROR, f"{pfx}.annual_cost", "Must be number")
+                elif amt < 0:
+                    self.issue(ERROR, f"{pfx}.annual_cost", f"Cannot be negative: {amt}")
+            costs.append(
+                {"name": c.get("name", c.get("category", "Cost")), "annual_cost": amt or 0}
+            )
+        self.cfg["fixed_costs"] = costs
+
+    # ---- headcount ----
+
+    def headcount(self):
+        hc = self.cfg.get("headcount", {})
+        if not isinstance(hc, dict):
+            self.issue(ERROR, "headcount", "Must be an object")
+            hc = {}
+        depts = hc.get("departments")
+        if isinstance(depts, list):
+            self._departments(depts)
+        else:
+            hc["departments"] = self._legacy_departments(hc)
+        self.cfg["headcount"] = hc
+
+    def _departments(self, depts: List[Any]):
+        if not depts:
+            self.issue(WARNING, "headcount.departments", "Empty departments list")
+        for i, d in enumerate(depts):
+            pfx = f"headcount.departments[{i}]"
+            if not isinstance(d, dict):
+                self.issue(ERROR, pfx, "Must be an object")
+                continue
+            if not d.get("name"):
+                self.issue(ERROR, f"{pfx}.name", "Missing department name")
+            for key in ("salary", "y0_count"):
+                v = d.get(key, 0)
+                if _is_number(v) and v < 0:
+                    self.issue(ERROR, f"{pfx}.{key}", f"Cannot be negative: {v}")
+            gr = d.get("growth", 0)
+            if _is_number(gr) and (gr < -0.5 or gr > 5):
+                self.issue(WARNING, f"{pfx}.growth", f"{gr*100:.0f}% growth seems extreme")
+
+    def _legacy_departments(self, hc: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Departments from flat <prefix>_salary / _y0 / _growth keys."""
+        detected = {k[: -len("_salary")] for k in hc if k.endswith("_salary")}
+        labels = dict(HEADCOUNT_PREFIXES)
+        prefixes = [p for p, _ in HEADCOUNT_PREFIXES]
+        prefixes += sorted(detected - set(labels))
+
+        depts = []
+        for prefix in prefixes:
+            salary, y0 = hc.get(f"{prefix}_salary"), hc.get(f"{prefix}_y0")
+            if salary is None and y0 is None:
+                continue
+            for key, v in ((f"{prefix}_salary", salary), (f"{prefix}_y0", y0)):
+                if _is_number(v) and v < 0:
+                    self.issue(ERROR, f"headcount.{key}", "Cannot be negative")
+            growth = hc.get(f"{prefix}_growth", 0.30)
+            if prefix in labels:
+                depts.append(
+                    {"name": labels[prefix], "salary": salary or 60000,
+                     "y0_count": y0 or 0, "growth": growth}
+                )
+            elif (_is_number(y0) and y0 > 0) or (_is_number(salary) and salary > 0):
+                depts.append(
+                    {"name": prefix.replace("_", " ").title(), "salary": salary or 60000,
+                     "y0_count": y0 or 0, "growth": growth}
+                )
+
+        if not depts:
+            self.issue(
+                WARNING,
+                "headcount",
+                "No departments found (legacy or canonical format)",
+                "Add headcount.departments list or legacy fields like engineering_salary",
+            )
+            self.default_team = True
+            depts = [{"name": "Team", "salary": 60000, "y0_count": 5, "growth": 0.30}]
+        return depts
+
+    # ---- funding ----
+
+    def funding(self):
+        fund = self.cfg.get("funding", {})
+        if not isinstance(fund, dict):
+            self.issue(WARNING, "funding", "Missing or invalid funding block")
+            fund = {}
+        rounds = fund.get("rounds")
+        if isinstance(rounds, list):
+            self._rounds(rounds, "funding.rounds")
+        else:
+            fund["rounds"] = self._legacy_rounds(fund)
+        self.cfg["funding"] = fund
+
+    def _rounds(self, rounds: List[Any], field: str):
+        for i, r in enumerate(rounds):
+            pfx = f"{field}[{i}]"
+            if not isinstance(r, dict):
+                self.issue(ERROR, pfx, "Must be an object")
+                continue
+            if not r.get("name") and field == "funding.rounds":
+                self.issue(WARNING, f"{pfx}.name", "Missing round name")
+            amt = r.get("amount")
+            if amt is not None:
+                if not _is_number(amt):
+                    self.issue(ERROR, f"{pfx}.amount", "Must be number")
+                elif amt < 0:
+                    self.issue(ERROR, f"{pfx}.amount", "Cannot be negative")
+            yr = r.get("year")
+            if yr is None:
+                continue
+            if not _is_number(yr) or yr != int(yr):
+                self.issue(
+                    ERROR, f"{pfx}.year", f"Year must be an integer model year, got {yr!r}",
+                    "Use 0 for the first model year",
+                )
+            elif yr < 0 or yr > 15:
+                self.issue(WARNING, f"{pfx}.year", f"Year {yr} outside 0-15 range")
+
+    def _legacy_rounds(self, fund: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Rounds from flat seed/series_* keys or a top-level funding_rounds list."""
+        rounds, found = [], False
+        for key, label in FUNDING_KEYS:
+            if key not in fund:
+                continue
+            found = True
+            amt = fund[key]
+            if _is_number(amt) and amt < 0:
+                self.issue(ERROR, f"funding.{key}", "Cannot be negative")
+            elif _is_number(amt) and amt > 0:
+                rounds.append(
+                    {"name": label, "amount": amt, "year": fund.get(f"{key}_year", 0),
+                     "pre_money": fund.get(f"{key}_pre", amt * 3)}
+                )
+
+        old = self.cfg.get("funding_rounds", [])
+        if isinstance(old, list) and old:
+            found = True
+            self._rounds(old, "funding_rounds")
+            for i, r in enumerate(old):
+                amt = r.get("amount") if isinstance(r, dict) else None
+                if _is_number(amt) and amt > 0:
+                    yr = r.get("year", 0)
+                    rounds.append(
+                        {"name": r.get("name", f"Round {i + 1}"), "amount": amt,
+                         "year": yr if isinstance(yr, int) else 0,
+                         "pre_money": r.get("pre_money", amt * 3)}
+                    )
+
+        if not found:
+            self.issue(INFO, "funding", "No funding rounds defined (bootstrapped?)")
+        return rounds
+
+    # ---- market data ----
+
+    def market(self):
+        cfg = self.cfg
+        tam = cfg.get("tam", {})
+        if _is_number(tam):
+            tam = {"total": tam}
+        tam = tam if isinstance(tam, dict) else {}
+        if not isinstance(tam.get("streams"), list):
+            tam["streams"] = [
+                {"name": k.title(), "value_m": v, "source": "", "confidence": "MEDIUM"}
+                for k, v in tam.items()
+                if _is_number(v)
+            ]
+        cfg["tam"] = tam
+
+        sam = cfg.get("sam", {})
+        if _is_number(sam):
+            sam = {"total": sam}
+        sam = sam if isinstance(sam, dict) else {}
+        if not isinstance(sam.get("regions"), list):
+            sam["regions"] = [
+                {"name": k.replace("_", " ").title(), "value_m": v, "years": ""}
+                for k, v in sam.items()
+                if _is_number(v)
+            ]
+        cfg["sam"] = sam
+
+        som = cfg.get("som", {})
+        if _is_number(som):
+            som = {"year8_revenue_m": som}
+        som = som if isinstance(som, dict) else {}
+        som_given = any(
+            _is_number(som.get(k)) for k in ("year8_revenue_m", "terminal_revenue_m", "year8_revenue")
+        )
+        if "year8_revenue_m" not in som:
+            som["year8_revenue_m"] = som.get("terminal_revenue_m", som.get("year8_revenue", 0))
+        cfg["som"] = som
+
+        def total(items):
+            values = [x.get("value_m", 0) for x in items if isinstance(x, dict)]
+            values = [v for v in values if _is_number(v)]
+            return sum(values) if values else None
+
+        sizes = {
+            "tam": total(tam["streams"]),
+            "sam": total(sam["regions"]),
+            "som": som["year8_revenue_m"] if som_given else None,
+        }
+        for key, value in sizes.items():
+            if value is not None and value < 0:
+                self.issue(ERROR, key, f"{key.upper()} cannot be negative: {value}")
+        tam_v, sam_v, som_v = sizes["tam"], sizes["sam"], sizes["som"]
+        if None not in (tam_v, sam_v, som_v):
+            if sam_v > tam_v:
+                self.issue(
+                    WARNING, "market_data", f"SAM ({sam_v}) > TAM ({tam_v}) — expected SAM <= TAM"
+                )
+            # SOM might be in $M while SAM is total, so just warn gently
+            if som_v > sam_v and som_v > 100:
+                self.issue(
+                    WARNING, "market_data", f"SOM ({som_v}) > SAM ({sam_v}) — check units match"
+                )
+
+        val = self.section("valuation")
+        val.setdefault("wacc", 0.15)
+        val.setdefault("terminal_growth", 0.03)
+        val.setdefault("exit_multiple", 5.0)
+        val.setdefault("terminal_year", 8)  # 0-indexed year offset for valuation/sensitivity
+        cfg["valuation"] = val
+
+    # ---- customer acquisition ----
+
+    def customer_acquisition(self):
+        cfg = self.cfg
+        ca = cfg.get("customer_acquisition")
+        if not isinstance(ca, dict):
+            # Older configs keep these at the top level
+            ca = {}
+            if "cac" in cfg or "cac_per_customer" in cfg:
+                ca["cac"] = _first(cfg, "cac", "cac_per_customer")
+            if "churn_rate" in cfg:
+                ca["churn_rate"] = cfg["churn_rate"]
+        elif "cac" not in ca and "cac_per_customer" in ca:
+            ca["cac"] = ca["cac_per_customer"]
+
+        cac = ca.get("cac")
+        if cac is not None:
+            if not _is_number(cac):
+                self.issue(ERROR, "customer_acquisition.cac", "Must be a number")
+            elif cac < 0:
+                self.issue(ERROR, "customer_acquisition.cac", f"Cannot be negative: {cac}")
+        churn = ca.get("churn_rate")
+        if churn is not None:
+            if not _is_number(churn):
+                self.issue(ERROR, "churn_rate", "Must be a number")
+            elif not (0 <= churn <= 1):
+                self.issue(ERROR, "churn_rate", f"Must be 0-1, got {churn}", "Use 0.05 for 5%")
+            elif churn > 0.20:
+                self.issue(
+                    WARNING, "churn_rate", f"{churn*100:.0f}% is very high (>20%)",
+                    "B2B SaaS average is 5-15%",
+                )
+
+        ca.setdefault("cac", 0)
+        ca.setdefault("churn_rate", 0.05)
+        ca.setdefault("new_customers_y0", 0)
+        cfg["customer_acquisition"] = ca
+
+    # ---- fixed assets ----
+
+    def fixed_assets(self):
+        fa = self.cfg.get("fixed_assets")
+        if fa is None:
+            return  # Optional block (defaults to general.capex_*)
+        classes = fa.get("classes") if isinstance(fa, dict) else None
+        if not isinstance(classes, list):
+            self.issue(
+                ERROR,
+                "fixed_assets.classes",
+                "Must be a list of asset classes",
+                'Use [{"name": "Equipment", "useful_life": 5, "capex": [150000, 50000]}]',
+            )
+            self.cfg.pop("fixed_assets")
+            return
+
+        for i, cls in enumerate(classes):
+            field = f"fixed_assets.classes[{i}]"
+            if not isinstance(cls, dict):
+                self.issue(ERROR, field, "Must be an object")
+                continue
+            life = cls.get("useful_life")
+            if not _is_number(life):
+                self.issue(ERROR, f"{field}.useful_life", f"Must be a number, got {type(life).__name__}")
+            elif life <= 0:
+                self.issue(ERROR, f"{field}.useful_life", f"Must be positive, got {life}")
+            elif life > 50:
+                self.issue(WARNING, f"{field}.useful_life", f"{life} years is unusually long (>50)")
+
+            capex = cls.get("capex", [])
+            if not isinstance(capex, list) or not all(_is_number(v) for v in capex):
+                self.issue(
+                    ERROR, f"{field}.capex", "Must be a list of per-year amounts (last entry repeats)"
+                )
+            elif any(v < 0 for v in capex):
+                self.issue(ERROR, f"{field}.capex", "Cannot contain negative amounts")
+
+    # ---- cross-validation ----
+
+    def consistency(self):
+        cfg = self.cfg
+        y0_revenue = sum(s["price"] * s["volume"] for s in cfg["revenue_streams"])
+        y0_fixed = sum(c["annual_cost"] for c in cfg["fixed_costs"] if _is_number(c["annual_cost"]))
+        hc_cost = 0
+        if not self.default_team:
+            for d in cfg["headcount"]["departments"]:
+                if isinstance(d, dict):
+                    sal, cnt = d.get("salary", 0), d.get("y0_count", 0)
+                    if _is_number(sal) and _is_number(cnt):
+                        hc_cost += sal * cnt
+
+        total_y0_costs = y0_fixed + hc_cost
+        if y0_revenue > 0 and total_y0_costs > y0_revenue * 5:
+            self.issue(
+                WARNING,
+                "consistency",
+                f"Year 0 costs (${total_y0_costs:,.0f}) are 5x+ revenue (${y0_revenue:,.0f})",
+                "Ensure funding covers the burn rate",
+            )
+
+        total_funding = sum(
+            r["amount"]
+            for r in cfg["funding"]["rounds"]
+            if isinstance(r, dict) and _is_number(r.get("amount"))
+        )
+        if total_funding > 0 and total_y0_costs > 0:
+            runway_years = total_funding / total_y0_costs
+            if runway_years < 1.5:
+                self.issue(
+                    WARNING,
+                    "consistency",
+                    f"Total funding ${total_funding:,.0f} only covers ~{runway_years:.1f} years at Year 0 burn",
+                    "Consider larger funding or lower costs",
+                )
+
+
+# Sections in traversal order (also the order issues are reported in)
+SCHEMA: Tuple[Callable[[_Compiler], None], ...] = (
+    _Compiler.company,
+    _Compiler.general,
+    _Compiler.revenue_streams,
+    _Compiler.fixed_costs,
+    _Compiler.headcount,
+    _Compiler.funding,
+    _Compiler.market,
+    _Compiler.customer_acquisition,
+    _Compiler.fixed_assets,
+    _Compiler.consistency,
+)
+
+
+# =============================================================================
+# MEMOIZED ENTRY POINT
+# =============================================================================
+_MEMO: "OrderedDict[str, _Entry]" = OrderedDict()
+
+
+def config_digest(raw: Dict[str, Any]) -> str:
+    """Content hash of a config (key order does not matter) plus SCHEMA_VERSION."""
+    text = json.dumps(raw, sort_keys=True, default=str)
+    return hashlib.sha256(f"{SCHEMA_VERSION}:{text}".encode("utf-8")).hexdigest()
+
+
+def _issue_to_dict(issue: ValidationIssue) -> Dict[str, Any]:
+    return dict(asdict(issue), level=issue.level.value)
+
+
+def _load(path: str, digest: str) -> Optional[CompiledConfig]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        issues = [
+            ValidationIssue(ValidationLevel(i["level"]), i["field"], i["message"], i["suggestion"])
+            for i in data["issues"]
+        ]
+        return CompiledConfig(data["config"], issues, digest)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store(path: str, compiled: CompiledConfig):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "config": compiled.config,
+                "issues": [_issue_to_dict(i) for i in compiled.issues],
+            },
+            f,
+            default=str,
+        )
+    os.replace(tmp, path)
+
+
+def compile_config(raw: Dict[str, Any], cache_dir: Optional[str] = None) -> CompiledConfig:
+    """Normalize and validate `raw` in one pass, memoized by content hash.
+
+    The returned config is a private copy; `raw` is never modified.
+    With `cache_dir`, the result is also read from / written to
+    `<cache_dir>/<digest>.json`.
+    """
+    digest = config_digest(raw)
+    entry = _MEMO.get(digest)
+    if entry is None:
+        compiled = _load(os.path.join(cache_dir, f"{digest}.json"), digest) if cache_dir else None
+        if compiled is None:
+            compiler = _Compiler(raw)
+            for rule in SCHEMA:
+                rule(compiler)
+            compiled = CompiledConfig(compiler.cfg, compiler.issues, digest)
+            if cache_dir:
+                try:
+                    _store(os.path.join(cache_dir, f"{digest}.json"), compiled)
+                except OSError:
+                    pass  # the cache is an optimization only
+        try:
+            text = json.dumps(compiled.config)
+        except (TypeError, ValueError):
+            text = None  # not plain JSON data: copy with deepcopy instead
+        entry = _MEMO[digest] = _Entry(compiled, text)
+    _MEMO.move_to_end(digest)
+    while len(_MEMO) > MEMO_SIZE:
+        _MEMO.popitem(last=False)
+
+    compiled = entry.compiled
+    config = json.loads(entry.text) if entry.text is not None else copy.deepcopy(compiled.config)
+    return CompiledConfig(config, list(compiled.issues), digest)
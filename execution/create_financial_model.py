@@ -74,28 +74,33 @@ Usage:
 
     # Use preset
     python create_financial_model.py --company "HumanoidRent" --humanoid-rent
+
+    # Several models concurrently under one shared API quota
+    python create_financial_model.py --batch portfolio.json --workers 4 --output .tmp/batch.json
+
+    portfolio.json: [{"company": "Acme", "config": "acme.json"},
+                     {"company": "Beta", "config": {...}, "method": "scratch"}]
 """
 
 import argparse
+import io
 import json
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-import gspread
 from dotenv import load_dotenv
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
-load_dotenv()
-
+from sheets_batch import BatchedSpreadsheet, write_changed_cells
+from sheets_quota import QUOTA, authorize, execute
 
-# Rate limiting helper
-def rate_limit_delay(seconds=5):
-    """Add delay to avoid API rate limits."""
-    time.sleep(seconds)
+load_dotenv()
 
 
 SCOPES = [
@@ -196,25 +201,30 @@ HUMANOID_RENT_CONFIG = {
 }
 
 
+_CREDENTIALS_LOCK = threading.Lock()
+
+
 def get_credentials():
     """Get OAuth2 credentials for Google Sheets API."""
-    creds = None
-    if os.path.exists("token.json"):
-        try:
-            creds = Credentials.from_authorized_user_file("token.json", SCOPES)
-        except Exception as e:
-            print(f"Error loading token: {e}")
+    # Locked so concurrent batch workers never refresh/write token.json at once
+    with _CREDENTIALS_LOCK:
+        creds = None
+        if os.path.exists("token.json"):
+            try:
+                creds = Credentials.from_authorized_user_file("token.json", SCOPES)
+            except Exception as e:
+                print(f"Error loading token: {e}")
 
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            creds_file = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "credentials.json")
-            flow = InstalledAppFlow.from_client_secrets_file(creds_file, SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open("token.json", "w") as token:
-            token.write(creds.to_json())
-    return creds
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                creds_file = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "credentials.json")
+                flow = InstalledAppFlow.from_client_secrets_file(creds_file, SCOPES)
+                creds = flow.run_local_server(port=0)
+            with open("token.json", "w") as token:
+                token.write(creds.to_json())
+        return creds
 
 
 def col_letter(n):
@@ -232,6 +242,9 @@ PERCENT_FORMAT = {"numberFormat": {"type": "PERCENT", "pattern": "0.0%"}}
 INTEGER_FORMAT = {"numberFormat": {"type": "NUMBER", "pattern": "#,##0"}}
 DECIMAL_FORMAT = {"numberFormat": {"type": "NUMBER", "pattern": "#,##0.0"}}
 
+# Standard 14-sheet template copied by create_from_template()
+TEMPLATE_SPREADSHEET_ID = "1-Ss62JDYgrD9W3vwAcmvdikdmoy-Ud--8wpBFRzkaXY"
+
 
 class FinancialModelBuilder:
     """Builds a comprehensive financial model spreadsheet."""
@@ -278,55 +291,42 @@ class FinancialModelBuilder:
 
         # 1. Sources & References - TAM/SAM/SOM with linkable values
         self.build_sources_sheet()
-        rate_limit_delay(3)
 
         # 2. Assumptions - all inputs (includes Customer Economics metrics)
         self.build_assumptions_sheet()
-        rate_limit_delay(3)
 
         # 3. Headcount Plan - team growth and salary costs
         self.build_headcount_sheet()
-        rate_limit_delay(3)
 
         # 4. Revenue - detailed by stream
         self.build_revenue_sheet()
-        rate_limit_delay(3)
 
         # 5. Operating Costs - COGS + Fixed + S&M
         self.build_costs_sheet()
-        rate_limit_delay(3)
 
         # 6. P&L - with Gross Margin, EBITDA, Net Margin
         self.build_pnl_sheet()
-        rate_limit_delay(3)
 
         # 7. Cash Flow (must be before Balance Sheet for row_map references)
         self.build_cash_flow_sheet()
-        rate_limit_delay(3)
 
         # 8. Balance Sheet
         self.build_balance_sheet()
-        rate_limit_delay(3)
 
         # 9. Summary Dashboard
         self.build_summary_sheet()
-        rate_limit_delay(3)
 
         # 10. Sensitivity Analysis
         self.build_sensitivity_sheet()
-        rate_limit_delay(3)
 
         # 11. Valuation (DCF + Multiples)
         self.build_valuation_sheet()
-        rate_limit_delay(3)
 
         # 12. Break-even Analysis
         self.build_breakeven_sheet()
-        rate_limit_delay(3)
 
         # 13. Funding Cap Table
         self.build_funding_captable_sheet()
-        rate_limit_delay(3)
 
         # 14. Charts Data - data for embedded charts
         self.build_charts_data_sheet()
@@ -487,6 +487,17 @@ class FinancialModelBuilder:
         self.row_map["lifetime"] = row
         row += 1
 
+        # Active customers: last year's base after churn plus new customers
+        total_cust_row = ["Total Customers", "#", f"=C{self.row_map['new_customers']}"]
+        for prev, col in zip(YEAR_COLS, YEAR_COLS[1:]):
+            total_cust_row.append(
+                f"=ROUND({prev}{row}*(1-{col}{self.row_map['churn']})"
+                f"+{col}{self.row_map['new_customers']},0)"
+            )
+        data.append(total_cust_row)
+        self.row_map["total_customers"] = row
+        row += 1
+
         # ========== UNIT ECONOMICS ==========
         data.append([""])
         row += 1
@@ -2064,7 +2075,6 @@ class FinancialModelBuilder:
 
         # Write all data
         sheet.update(values=data, range_name="A1", value_input_option="USER_ENTERED")
-        rate_limit_delay(2)
 
         # Apply formatting
         self._format_sources_sheet(sheet, len(data))
@@ -2093,8 +2103,6 @@ class FinancialModelBuilder:
         - NOTES Header: Gray BG RGB(0.5,0.5,0.5), white bold text
         """
         try:
-            import time
-
             from gspread_formatting import (
                 CellFormat,
                 Color,
@@ -2194,17 +2202,14 @@ class FinancialModelBuilder:
 
             # Get all data to analyze structure
             data = sheet.get_all_values()
-            time.sleep(0.5)
 
             # 1. Format main title (Row 1)
             format_cell_range(sheet, "A1:E1", title_fmt)
-            time.sleep(0.3)
 
             # 2. Find and format Section A header
             for i, row in enumerate(data):
                 if row[0] and "SECTION A:" in row[0]:
                     format_cell_range(sheet, f"A{i+1}:E{i+1}", section_header_fmt)
-                    time.sleep(0.2)
                     break
 
             # 3. Format Section A category headers
@@ -2225,7 +2230,6 @@ class FinancialModelBuilder:
                             format_cell_range(
                                 sheet, f"A{i+1}:E{i+1}", section_a_category_fmt
                             )
-                            time.sleep(0.2)
                             break
 
             # 4. Format regional headers
@@ -2239,7 +2243,6 @@ class FinancialModelBuilder:
             for i, row in enumerate(data):
                 if row[0] in regional_names:
                     format_cell_range(sheet, f"A{i+1}:E{i+1}", regional_fmt)
-                    time.sleep(0.2)
 
             # 5. Find and format Section B
             section_b_start = None
@@ -2247,11 +2250,9 @@ class FinancialModelBuilder:
                 if row[0] and "SECTION B:" in row[0]:
                     section_b_start = i + 1
                     format_cell_range(sheet, f"A{i+1}:E{i+1}", section_header_fmt)
-                    time.sleep(0.2)
                     # Format column headers (next row)
                     if i + 1 < len(data) and data[i + 1][0] == "Source Name":
                         format_cell_range(sheet, f"A{i+2}:E{i+2}", column_header_fmt)
-                        time.sleep(0.2)
                     break
 
             # 6. Format Section B category headers and apply zebra striping
@@ -2274,7 +2275,6 @@ class FinancialModelBuilder:
                 if row[0] in section_b_categories:
                     category_positions.append(i)
                     format_cell_range(sheet, f"A{i+1}:E{i+1}", section_b_category_fmt)
-                    time.sleep(0.2)
 
             # 7. Apply zebra striping to Section B data rows
             for cat_idx, cat_pos in enumerate(category_positions):
@@ -2308,13 +2308,11 @@ class FinancialModelBuilder:
                         # Apply URL formatting to column D
                         format_cell_range(sheet, f"D{row_idx+1}", url_fmt)
                         stripe_count += 1
-                        time.sleep(0.15)
 
             # 8. Format NOTES header
             for i, row in enumerate(data):
                 if row[0] == "NOTES":
                     format_cell_range(sheet, f"A{i+1}:E{i+1}", notes_header_fmt)
-                    time.sleep(0.2)
                     break
 
             # 9. Set column widths
@@ -2324,7 +2322,6 @@ class FinancialModelBuilder:
             set_column_width(sheet, "D", 300)
             set_column_width(sheet, "E", 200)
 
-            rate_limit_delay(1)
 
         except ImportError:
             print(
@@ -5245,10 +5242,8 @@ def create_from_template(
     Returns:
         Dict with spreadsheet info
     """
-    TEMPLATE_SPREADSHEET_ID = "1-Ss62JDYgrD9W3vwAcmvdikdmoy-Ud--8wpBFRzkaXY"
-
     creds = get_credentials()
-    client = gspread.authorize(creds)
+    client = authorize(creds)
 
     # Use preset if specified
     if use_humanoid_rent or config is None:
@@ -5278,10 +5273,10 @@ def create_from_template(
         title = f"{company_name} - Financial Model"
         file_metadata = {"name": title, "parents": [folder_id] if folder_id else []}
 
-        copied_file = (
-            drive_service.files()
-            .copy(fileId=TEMPLATE_SPREADSHEET_ID, body=file_metadata)
-            .execute()
+        copied_file = execute(
+            drive_service.files().copy(
+                fileId=TEMPLATE_SPREADSHEET_ID, body=file_metadata
+            )
         )
 
         spreadsheet_id = copied_file["id"]
@@ -5319,309 +5314,145 @@ def create_from_template(
         )
 
 
-def _update_template_values(spreadsheet, config):
-    """
-    Comprehensively update copied template with new business configuration.
-    Handles any business by updating all sections.
+def _template_value_targets(config):
     """
-    try:
-        assumptions = spreadsheet.worksheet("Assumptions")
-
-        # ====================
-        # 1. GENERAL PARAMETERS (Rows 4-12)
-        # ====================
-        general = config.get("general", {})
-        if general:
-            print("  Updating general parameters...")
-            updates = []
-
-            # Row 4: Tax Rate
-            if "tax_rate" in general:
-                updates.append(("C4", general["tax_rate"]))
-
-            # Row 5: Capex
-            if "capex" in general:
-                updates.append(("C5", general["capex"]))
-
-            # Row 6: Depreciation Years
-            if "depreciation_years" in general:
-                updates.append(("C6", general["depreciation_years"]))
-
-            # Row 7: Debtor Days
-            if "debtor_days" in general:
-                updates.append(("C7", general["debtor_days"]))
-
-            # Row 8: Creditor Days
-            if "creditor_days" in general:
-                updates.append(("C8", general["creditor_days"]))
-
-            # Row 9: Interest Rate
-            if "interest_rate" in general:
-                updates.append(("C9", general["interest_rate"]))
-
-            # Row 10-11: Funding (Equity & Debt)
-            if "equity_infusion" in general:
-                # Year 0 equity
-                updates.append(("C10", general["equity_infusion"].get("year_0", 0)))
-
-            if "debt_drawdown" in general:
-                updates.append(("C11", general["debt_drawdown"].get("year_0", 0)))
-
-            # Row 12: Cost Inflation Rate
-            if "cost_inflation" in general:
-                updates.append(("C12", general["cost_inflation"]))
-
-            # Apply all general parameter updates
-            for cell, value in updates:
-                assumptions.update(cell, [[value]], value_input_option="USER_ENTERED")
-                rate_limit_delay(0.5)
-
-            print(f"    ✓ Updated {len(updates)} general parameters")
-
-        # ====================
-        # 2. REVENUE STREAMS (Rows 15-38, supports up to 6 streams)
-        # ====================
-        streams = config.get("revenue_streams", [])
-        if streams:
-            print(f"  Updating {len(streams)} revenue streams...")
-
-            # Template rows start at 15 (after header at row 14)
-            # Each stream takes 4 rows: Price, Volume, Growth, COGS%
-            base_row = 15
-
-            for i, stream in enumerate(streams[:6]):  # Template supports max 6 streams
-                row_offset = i * 4
-                name = stream.get("name", f"Stream {i+1}")
-
-                # Update stream name (Column A)
-                name_cell = f"A{base_row + row_offset}"
-                assumptions.update(
-                    name_cell, [[name + ": Price"]], value_input_option="USER_ENTERED"
-                )
-                rate_limit_delay(0.3)
-
-                # Update Price (Row 1 of stream)
-                price_row = base_row + row_offset
-                if "price" in stream:
-                    assumptions.update(
-                        f"C{price_row}",
-                        [[stream["price"]]],
-                        value_input_option="USER_ENTERED",
-                    )
-                    rate_limit_delay(0.3)
-
-                # Update Volume (Row 2 of stream)
-                volume_row = price_row + 1
-                assumptions.update(
-                    f"A{volume_row}",
-                    [[name + ": Volume"]],
-                    value_input_option="USER_ENTERED",
-                )
-                rate_limit_delay(0.3)
-                if "volume" in stream:
-                    assumptions.update(
-                        f"C{volume_row}",
-                        [[stream["volume"]]],
-                        value_input_option="USER_ENTERED",
-                    )
-                    rate_limit_delay(0.3)
-
-                # Update Growth (Row 3 of stream)
-                growth_row = volume_row + 1
-                assumptions.update(
-                    f"A{growth_row}",
-                    [[name + ": Growth"]],
-                    value_input_option="USER_ENTERED",
-                )
-                rate_limit_delay(0.3)
-                if "growth" in stream:
-                    assumptions.update(
-                        f"C{growth_row}",
-                        [[stream["growth"]]],
-                        value_input_option="USER_ENTERED",
-                    )
-                    rate_limit_delay(0.3)
-
-                # Update COGS % (Row 4 of stream)
-                cogs_row = growth_row + 1
-                assumptions.update(
-                    f"A{cogs_row}",
-                    [[name + ": COGS %"]],
-                    value_input_option="USER_ENTERED",
-                )
-                rate_limit_delay(0.3)
-                if "cogs_percent" in stream:
-                    assumptions.update(
-                        f"C{cogs_row}",
-                        [[stream["cogs_percent"]]],
-                        value_input_option="USER_ENTERED",
-                    )
-                    rate_limit_delay(0.3)
-
-                print(f"    ✓ Updated stream {i+1}: {name}")
-
-            # If fewer than 6 streams, clear the unused ones
-            if len(streams) < 6:
-                print(f"  Clearing unused revenue streams ({len(streams)+1}-6)...")
-                for i in range(len(streams), 6):
-                    row_offset = i * 4
-                    # Clear the stream name and set values to 0
-                    for row in range(4):
-                        cell_row = base_row + row_offset + row
-                        assumptions.update(
-                            f"A{cell_row}",
-                            [[f"(Unused Stream {i+1})"]],
-                            value_input_option="USER_ENTERED",
-                        )
-                        assumptions.update(
-                            f"C{cell_row}", [[0]], value_input_option="USER_ENTERED"
-                        )
-                        rate_limit_delay(0.3)
-
-        # ====================
-        # 3. FIXED COSTS (Rows 41-50, supports up to 10 categories)
-        # ====================
-        fixed_costs = config.get("fixed_costs", [])
-        if fixed_costs:
-            print(f"  Updating {len(fixed_costs)} fixed cost categories...")
-
-            base_row = 41
-            for i, cost in enumerate(fixed_costs[:10]):  # Template supports max 10
-                cost_name = cost.get("name", f"Fixed Cost {i+1}")
-                cost_value = cost.get("annual_cost", 0)
-
-                # Update cost name (Column A) and value (Column C)
-                assumptions.update(
-                    f"A{base_row + i}", [[cost_name]], value_input_option="USER_ENTERED"
-                )
-                rate_limit_delay(0.3)
-                assumptions.update(
-                    f"C{base_row + i}",
-                    [[cost_value]],
-                    value_input_option="USER_ENTERED",
-                )
-                rate_limit_delay(0.3)
-
-            # Clear unused cost categories
-            if len(fixed_costs) < 10:
-                for i in range(len(fixed_costs), 10):
-                    assumptions.update(
-                        f"A{base_row + i}",
-                        [[f"(Unused Cost {i+1})"]],
-                        value_input_option="USER_ENTERED",
-                    )
-                    assumptions.update(
-                        f"C{base_row + i}", [[0]], value_input_option="USER_ENTERED"
-                    )
-                    rate_limit_delay(0.3)
+    Map every template cell the config sets to its new value.
 
-            print(f"    ✓ Updated {len(fixed_costs)} fixed costs")
-
-        # ====================
-        # 4. CUSTOMER ACQUISITION (Rows 48-56)
-        # ====================
-        cac_params = config.get("customer_acquisition", {})
-        if cac_params:
-            print("  Updating customer acquisition parameters...")
-
-            # Row 48: CAC
-            if "cac" in cac_params:
-                assumptions.update(
-                    "C48", [[cac_params["cac"]]], value_input_option="USER_ENTERED"
-                )
-                rate_limit_delay(0.3)
-
-            # Row 49: New Customers Year 0
-            if "new_customers_y0" in cac_params:
-                assumptions.update(
-                    "C49",
-                    [[cac_params["new_customers_y0"]]],
-                    value_input_option="USER_ENTERED",
-                )
-                rate_limit_delay(0.3)
-
-            # Row 50: New Customer Growth
-            if "new_customer_growth" in cac_params:
-                assumptions.update(
-                    "C50",
-                    [[cac_params["new_customer_growth"]]],
-                    value_input_option="USER_ENTERED",
-                )
-                rate_limit_delay(0.3)
-
-            # Row 51: Churned Customers (formula or value)
-            if "churned_customers" in cac_params:
-                assumptions.update(
-                    "C51",
-                    [[cac_params["churned_customers"]]],
-                    value_input_option="USER_ENTERED",
-                )
-                rate_limit_delay(0.3)
-
-            # Row 53: Churn Rate
-            if "churn_rate" in cac_params:
-                assumptions.update(
-                    "C53",
-                    [[cac_params["churn_rate"]]],
-                    value_input_option="USER_ENTERED",
-                )
-                rate_limit_delay(0.3)
-
-            # Row 54: Customer Growth Rate
-            if "customer_growth" in cac_params:
-                assumptions.update(
-                    "C54",
-                    [[cac_params["customer_growth"]]],
-                    value_input_option="USER_ENTERED",
-                )
-                rate_limit_delay(0.3)
-
-            # Row 55: Customer Lifetime
-            if "customer_lifetime" in cac_params:
-                assumptions.update(
-                    "C55",
-                    [[cac_params["customer_lifetime"]]],
-                    value_input_option="USER_ENTERED",
-                )
-                rate_limit_delay(0.3)
+    Returns {(sheet title, A1 cell): value}. Cells are added in the order
+    the template sections are filled, so where sections overlap the later
+    one wins.
+    """
+    targets = {}
+
+    def put(cell, value, sheet="Assumptions"):
+        targets[(sheet, cell)] = value
+
+    # ====================
+    # 1. GENERAL PARAMETERS (Rows 4-12)
+    # ====================
+    general = config.get("general", {})
+    if general:
+        general_cells = [
+            ("tax_rate", "C4"),  # Row 4: Tax Rate
+            ("capex", "C5"),  # Row 5: Capex
+            ("depreciation_years", "C6"),  # Row 6: Depreciation Years
+            ("debtor_days", "C7"),  # Row 7: Debtor Days
+            ("creditor_days", "C8"),  # Row 8: Creditor Days
+            ("interest_rate", "C9"),  # Row 9: Interest Rate
+            ("cost_inflation", "C12"),  # Row 12: Cost Inflation Rate
+        ]
+        count = 0
+        for key, cell in general_cells:
+            if key in general:
+                put(cell, general[key])
+                count += 1
+
+        # Row 10-11: Funding (Year 0 Equity & Debt)
+        if "equity_infusion" in general:
+            put("C10", general["equity_infusion"].get("year_0", 0))
+            count += 1
+        if "debt_drawdown" in general:
+            put("C11", general["debt_drawdown"].get("year_0", 0))
+            count += 1
+
+        print(f"  General parameters: {count}")
+
+    # ====================
+    # 2. REVENUE STREAMS (Rows 15-38, supports up to 6 streams)
+    # ====================
+    streams = config.get("revenue_streams", [])
+    if streams:
+        # Template rows start at 15 (after header at row 14)
+        # Each stream takes 4 rows: Price, Volume, Growth, COGS%
+        base_row = 15
+        fields = [("Price", "price"), ("Volume", "volume"), ("Growth", "growth"),
+                  ("COGS %", "cogs_percent")]
+
+        for i, stream in enumerate(streams[:6]):  # Template supports max 6 streams
+            name = stream.get("name", f"Stream {i+1}")
+            for offset, (label, key) in enumerate(fields):
+                row = base_row + i * 4 + offset
+                put(f"A{row}", f"{name}: {label}")
+                if key in stream:
+                    put(f"C{row}", stream[key])
+
+        # If fewer than 6 streams, clear the unused ones
+        for i in range(len(streams), 6):
+            for offset in range(4):
+                row = base_row + i * 4 + offset
+                put(f"A{row}", f"(Unused Stream {i+1})")
+                put(f"C{row}", 0)
+
+        print(f"  Revenue streams: {min(len(streams), 6)}")
+
+    # ====================
+    # 3. FIXED COSTS (Rows 41-50, supports up to 10 categories)
+    # ====================
+    fixed_costs = config.get("fixed_costs", [])
+    if isinstance(fixed_costs, dict):  # {"Rent": 36000, ...} shorthand
+        fixed_costs = [{"name": k, "annual_cost": v} for k, v in fixed_costs.items()]
+    fixed_costs = [cost for cost in fixed_costs if isinstance(cost, dict)]
+    if fixed_costs:
+        base_row = 41
+        for i, cost in enumerate(fixed_costs[:10]):  # Template supports max 10
+            put(f"A{base_row + i}", cost.get("name", cost.get("category", f"Fixed Cost {i+1}")))
+            put(f"C{base_row + i}", cost.get("annual_cost", cost.get("amount", 0)))
+
+        # Clear unused cost categories
+        for i in range(len(fixed_costs), 10):
+            put(f"A{base_row + i}", f"(Unused Cost {i+1})")
+            put(f"C{base_row + i}", 0)
+
+        print(f"  Fixed cost categories: {min(len(fixed_costs), 10)}")
+
+    # ====================
+    # 4. CUSTOMER ACQUISITION (Rows 48-56)
+    # ====================
+    cac_params = config.get("customer_acquisition", {})
+    if cac_params:
+        cac_cells = [
+            ("cac", "C48"),
+            ("new_customers_y0", "C49"),
+            ("new_customer_growth", "C50"),
+            ("churned_customers", "C51"),  # formula or value
+            ("churn_rate", "C53"),
+            ("customer_growth", "C54"),
+            ("customer_lifetime", "C55"),
+        ]
+        for key, cell in cac_cells:
+            if key in cac_params:
+                put(cell, cac_params[key])
+        print("  Customer acquisition parameters")
 
-            print("    ✓ Updated customer acquisition parameters")
+    # ====================
+    # 5. SOURCES & REFERENCES (Optional market sizing)
+    # ====================
+    sources_data = config.get("sources_references", {})
+    for key, cell in (("tam", "B7"), ("sam", "B41"), ("som", "B51")):
+        if key in sources_data:
+            put(cell, sources_data[key], sheet="Sources & References")
 
-        # ====================
-        # 5. UPDATE SOURCES & REFERENCES (Optional)
-        # ====================
-        sources_data = config.get("sources_references", {})
-        if sources_data:
-            try:
-                sources_sheet = spreadsheet.worksheet("Sources & References")
-                print("  Updating Sources & References with new market data...")
+    return targets
 
-                # Update TAM/SAM/SOM if provided
-                if "tam" in sources_data:
-                    sources_sheet.update(
-                        "B7", [[sources_data["tam"]]], value_input_option="USER_ENTERED"
-                    )
-                    rate_limit_delay(0.5)
 
-                if "sam" in sources_data:
-                    sources_sheet.update(
-                        "B41",
-                        [[sources_data["sam"]]],
-                        value_input_option="USER_ENTERED",
-                    )
-                    rate_limit_delay(0.5)
+def _update_template_values(spreadsheet, config):
+    """
+    Comprehensively update copied template with new business configuration.
 
-                if "som" in sources_data:
-                    sources_sheet.update(
-                        "B51",
-                        [[sources_data["som"]]],
-                        value_input_option="USER_ENTERED",
-                    )
-                    rate_limit_delay(0.5)
+    The target cells from _template_value_targets() are diffed against the
+    copied template (one read) and only changed cells are written (one
+    values.batchUpdate), however large the config is.
+    """
+    try:
+        targets = _template_value_targets(config)
+        if not targets:
+            return
 
-                print("    ✓ Updated market sizing data")
-            except Exception as e:
-                print(f"    ⚠ Could not update Sources sheet: {e}")
+        stats = write_changed_cells(spreadsheet, targets)
+        print(
+            f"    ✓ {stats['changed']} of {stats['cells']} cells changed "
+            f"({stats['read_calls']} read, {stats['write_calls']} write API calls)"
+        )
 
         print("  ✅ Template values comprehensively updated")
         print(f"     - Business model adapted to your config")
@@ -5653,7 +5484,7 @@ def create_financial_model_v2(
         Dict with spreadsheet info
     """
     creds = get_credentials()
-    client = gspread.authorize(creds)
+    client = authorize(creds)
 
     # Use preset if specified
     if use_humanoid_rent or config is None:
@@ -5668,9 +5499,17 @@ def create_financial_model_v2(
     print(f"\nCreated spreadsheet: {title}")
     print(f"ID: {spreadsheet_id}")
 
-    # Build all sheets
-    builder = FinancialModelBuilder(spreadsheet, config)
+    # Build all sheets: the builder's writes are recorded and sent as a
+    # few batchUpdate / values.batchUpdate calls (see sheets_batch.py)
+    batch = BatchedSpreadsheet(spreadsheet)
+    builder = FinancialModelBuilder(batch, config)
     builder.build_all_sheets()
+    print(f"\nSending {batch.pending} recorded writes...")
+    stats = batch.commit()
+    print(
+        f"  {stats['requests']} requests + {stats['value_ranges']} value ranges "
+        f"in {stats['api_calls']} API calls"
+    )
 
     # Move to folder if specified
     if folder_id:
@@ -5678,18 +5517,18 @@ def create_financial_model_v2(
             from googleapiclient.discovery import build
 
             drive_service = build("drive", "v3", credentials=creds)
-            file = (
-                drive_service.files()
-                .get(fileId=spreadsheet_id, fields="parents")
-                .execute()
+            file = execute(
+                drive_service.files().get(fileId=spreadsheet_id, fields="parents")
             )
             prev_parents = ",".join(file.get("parents", []))
-            drive_service.files().update(
-                fileId=spreadsheet_id,
-                addParents=folder_id,
-                removeParents=prev_parents,
-                fields="id, parents",
-            ).execute()
+            execute(
+                drive_service.files().update(
+                    fileId=spreadsheet_id,
+                    addParents=folder_id,
+                    removeParents=prev_parents,
+                    fields="id, parents",
+                )
+            )
             print(f"Moved to folder: {folder_id}")
         except Exception as e:
             print(f"Warning: Could not move to folder: {e}")
@@ -5718,6 +5557,129 @@ def create_financial_model_v2(
     }
 
 
+# =============================================================================
+# CONCURRENT CREATION (--batch)
+# =============================================================================
+class _ThreadOutput:
+    """sys.stdout proxy: batch worker threads print into their own buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def load_batch_jobs(path):
+    """Read a batch file: a JSON list of {"company", "config", ...} entries.
+
+    "config" is a path to a config JSON or an inline config dict; other keys
+    are "humanoid_rent", "folder_id" and "method" ("template" or "scratch").
+    """
+    with open(path, "r") as f:
+        entries = json.load(f)
+    jobs = []
+    for i, entry in enumerate(entries):
+        if "company" not in entry:
+            raise ValueError(f"Batch entry {i} has no 'company'")
+        job = dict(entry)
+        if isinstance(job.get("config"), str):
+            with open(job["config"], "r") as f:
+                job["config"] = json.load(f)
+        jobs.append(job)
+    return jobs
+
+
+def _create_one(job, build_from_scratch, output):
+    """Create one model inside a worker thread; never raises."""
+    method = job.get("method") or ("scratch" if build_from_scratch else "template")
+    create = create_financial_model_v2 if method == "scratch" else create_from_template
+    output.local.buffer = io.StringIO()
+    started = time.perf_counter()
+    try:
+        result = create(
+            company_name=job["company"],
+            config=job.get("config"),
+            use_humanoid_rent=job.get("humanoid_rent", False),
+            folder_id=job.get("folder_id"),
+        )
+        status, error = "ok", None
+    except Exception as e:
+        result, status, error = {}, "failed", f"{type(e).__name__}: {e}"
+    finally:
+        log = output.local.buffer.getvalue()
+        output.local.buffer = None
+    return {
+        "company": job["company"],
+        "method": result.get("method", method),
+        "status": status,
+        "error": error,
+        "elapsed_s": round(time.perf_counter() - started, 2),
+        "spreadsheet_id": result.get("spreadsheet_id"),
+        "url": result.get("url"),
+        "log": log if status != "ok" else None,
+    }
+
+
+def create_models_concurrently(jobs, workers=4, build_from_scratch=False):
+    """
+    Create several models in parallel threads under the shared API quota.
+
+    Every worker's gspread/Drive calls draw from the process-wide QUOTA
+    buckets, so adding workers overlaps network latency without exceeding
+    the per-minute Sheets limits. Worker output is captured per model and
+    kept in the report for failed models.
+
+    Returns:
+        Dict with per-model results, total elapsed time and throughput
+    """
+    get_credentials()  # any OAuth prompt or token refresh happens once, here
+    output = _ThreadOutput(sys.stdout)
+    requests_before, retries_before = QUOTA.requests, QUOTA.retries
+    started = time.perf_counter()
+    results = []
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_create_one, job, build_from_scratch, output) for job in jobs]
+            for future in as_completed(futures):
+                res = future.result()
+                results.append(res)
+                mark = "OK" if res["status"] == "ok" else "FAILED"
+                print(
+                    f"  [{len(results)}/{len(jobs)}] {mark:<7}{res['company']}  "
+                    f"{res['elapsed_s']:.1f}s  {res['url'] or res['error']}"
+                )
+    finally:
+        sys.stdout = output.stream
+    elapsed = time.perf_counter() - started
+
+    ok = sum(r["status"] == "ok" for r in results)
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "workers": workers,
+        "total": len(results),
+        "ok": ok,
+        "failed": len(results) - ok,
+        "elapsed_s": round(elapsed, 2),
+        "models_per_minute": round(ok / elapsed * 60, 2) if elapsed else None,
+        "mean_latency_s": (
+            round(sum(r["elapsed_s"] for r in results) / len(results), 2) if results else None
+        ),
+        "api_requests": QUOTA.requests - requests_before,
+        "api_retries": QUOTA.retries - retries_before,
+        "models": results,
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Create comprehensive financial model",
@@ -5731,10 +5693,20 @@ Examples:
 
   # Use preset configuration
   python create_financial_model.py --company "HumanoidRent" --humanoid-rent --from-template
+
+  # Several companies concurrently (shared API quota)
+  python create_financial_model.py --batch portfolio.json --workers 4 --output .tmp/batch.json
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
-    parser.add_argument("--company", required=True, help="Company name")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--company", help="Company name")
+    source.add_argument(
+        "--batch",
+        metavar="JOBS_JSON",
+        help="Create several models concurrently from a JSON list of "
+        '{"company", "config", "humanoid_rent", "folder_id", "method"} entries',
+    )
     parser.add_argument("--config", help="Path to JSON config file")
     parser.add_argument(
         "--humanoid-rent", action="store_true", help="Use HumanoidRent preset"
@@ -5751,9 +5723,39 @@ Examples:
         action="store_true",
         help="Build programmatically from scratch (slower, for debugging only)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Batch mode: models created in parallel (default: 4)",
+    )
 
     args = parser.parse_args()
 
+    # Batch mode: concurrent creation under the shared quota, no auto-validation
+    if args.batch:
+        jobs = load_batch_jobs(args.batch)
+        print(f"Creating {len(jobs)} models with {args.workers} workers...")
+        print("=" * 60)
+        report = create_models_concurrently(
+            jobs, workers=args.workers, build_from_scratch=args.build_from_scratch
+        )
+        print("=" * 60)
+        print(
+            f"{report['ok']} created, {report['failed']} failed in {report['elapsed_s']:.1f}s "
+            f"({report['models_per_minute']} models/min, "
+            f"mean latency {report['mean_latency_s']}s)"
+        )
+        print(QUOTA.summary())
+        for model in report["models"]:
+            if model["log"]:
+                print(f"\n--- {model['company']} output ---\n{model['log'][-2000:]}")
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"\nSaved to: {args.output}")
+        sys.exit(0 if report["failed"] == 0 else 1)
+
     config = None
     if args.config and os.path.exists(args.config):
         with open(args.config, "r") as f:
@@ -5783,6 +5785,7 @@ Examples:
             )
 
         print("\n" + json.dumps(result, indent=2))
+        print(QUOTA.summary())
 
         if args.output:
             with open(args.output, "w") as f:
@@ -24,7 +24,7 @@ from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-import gspread
+from sheets_quota import authorize, execute
 
 load_dotenv()
 
@@ -1237,7 +1237,7 @@ def build_executive_summary_content(slide_id, content):
 def load_financial_data(spreadsheet_url):
     """Load financial data from Google Sheets financial model."""
     creds = get_credentials()
-    gc = gspread.authorize(creds)
+    gc = authorize(creds)
     
     # Extract ID from URL
     if "spreadsheets/d/" in spreadsheet_url:
@@ -1311,7 +1311,7 @@ def create_charts_in_spreadsheet(spreadsheet_id):
     sheets_service = build("sheets", "v4", credentials=creds)
     
     # Get spreadsheet info
-    spreadsheet = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+    spreadsheet = execute(sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id))
     sheet_ids = {}
     for sheet in spreadsheet["sheets"]:
         sheet_ids[sheet["properties"]["title"]] = sheet["properties"]["sheetId"]
@@ -1338,7 +1338,7 @@ def create_charts_in_spreadsheet(spreadsheet_id):
                 }
             }]
         }
-        sheets_service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body=expand_request).execute()
+        execute(sheets_service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body=expand_request))
     except:
         pass  # Sheet may already have enough rows
     
@@ -1486,9 +1486,9 @@ def create_charts_in_spreadsheet(spreadsheet_id):
         return {}
     
     try:
-        response = sheets_service.spreadsheets().batchUpdate(
+        response = execute(sheets_service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id, body=chart_request
-        ).execute()
+        ))
         chart_id = response["replies"][0]["addChart"]["chart"]["chartId"]
         print(f"  Created revenue chart (ID: {chart_id})")
         return {"revenue_chart_id": chart_id, "spreadsheet_id": spreadsheet_id}
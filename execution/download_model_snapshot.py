@@ -19,10 +19,11 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-import gspread
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+from sheets_quota import authorize
+
 # Google Sheets API scopes
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
@@ -94,7 +95,7 @@ def download_snapshot(sheet_id, output_dir):
         print("Error: No credentials found. Run setup first.")
         return False
 
-    gc = gspread.authorize(creds)
+    gc = authorize(creds)
 
     try:
         spreadsheet = gc.open_by_key(sheet_id)
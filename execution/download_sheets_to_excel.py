@@ -16,6 +16,8 @@ from openpyxl import Workbook
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils import get_column_letter
 
+from sheets_quota import authorize
+
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive",
@@ -50,7 +52,7 @@ def download_google_sheets_to_excel(spreadsheet_id, output_path):
     """Download Google Sheets and convert to Excel."""
     print(f"Connecting to Google Sheets...")
     creds = get_credentials()
-    client = gspread.authorize(creds)
+    client = authorize(creds)
 
     spreadsheet = client.open_by_key(spreadsheet_id)
     print(f"Found: {spreadsheet.title}")
@@ -22,20 +22,13 @@ import argparse
 import json
 import os
 import sys
-import time
 from datetime import datetime
 from typing import Dict, List, Any
 from dotenv import load_dotenv
 
 load_dotenv()
 
-try:
-    import gspread
-except ImportError:
-    print("Installing gspread...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "gspread"])
-    import gspread
+from sheets_quota import authorize
 
 
 SCOPES = [
@@ -67,7 +60,7 @@ def get_sheets_client():
         with open('token.json', 'w') as token:
             token.write(creds.to_json())
     
-    return gspread.authorize(creds)
+    return authorize(creds)
 
 
 def parse_value(val) -> float:
@@ -131,7 +124,6 @@ def extract_summary(spreadsheet) -> Dict[str, Any]:
     # P&L Metrics
     try:
         pl = spreadsheet.worksheet("P&L")
-        time.sleep(0.5)
         pl_data = pl.get_all_values()
         
         revenue_row = find_row(pl_data, "total revenue")
@@ -167,7 +159,6 @@ def extract_summary(spreadsheet) -> Dict[str, Any]:
                 continue
         
         if fc:
-            time.sleep(0.5)
             fc_data = fc.get_all_values()
             
             seed_row = find_row(fc_data, "seed")
@@ -192,7 +183,6 @@ def extract_summary(spreadsheet) -> Dict[str, Any]:
                 continue
         
         if ce:
-            time.sleep(0.5)
             ce_data = ce.get_all_values()
             
             cac_row = find_row(ce_data, "cac")
@@ -210,7 +200,6 @@ def extract_summary(spreadsheet) -> Dict[str, Any]:
     # Balance Sheet Check
     try:
         bs = spreadsheet.worksheet("Balance Sheet")
-        time.sleep(0.5)
         bs_data = bs.get_all_values()
         
         assets_row = find_row(bs_data, "total assets")
@@ -244,7 +233,6 @@ def extract_summary(spreadsheet) -> Dict[str, Any]:
     # Cash Position
     try:
         cf = spreadsheet.worksheet("Cash Flow")
-        time.sleep(0.5)
         cf_data = cf.get_all_values()
         
         cum_cash_row = find_row(cf_data, "cumulative")
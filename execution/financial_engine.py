@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Native Financial Model Engine (NumPy)
+=====================================
+
+Evaluates the same sheet logic that build_financial_model.py writes as Excel
+formulas, but directly as NumPy arrays indexed by period (years, or months
+then years on a monthly/hybrid TimeAxis). Numbers are available
+in milliseconds without saving the workbook and recalculating it through
+`formulas` (validate_excel_model.py).
+
+Fixed assets follow a capex-vintage matrix (`fixed_asset_schedule`): each
+asset class buys a vintage per year and depreciates it straight-line over
+its useful life from the year of purchase. P&L depreciation, Cash Flow capex
+and Balance Sheet net fixed assets all come from the same schedule.
+
+Every series is keyed by the same names the builder stores in `row_refs`
+(e.g. "revenue_total", "pnl_ebitda", "cf_cumulative"), so a value can always
+be traced back to the Excel row that computes it. Per-stream / per-department
+series are 2-D arrays (item x period).
+
+Reference: directives/SHEET_BUILD_GUIDE.md
+
+Usage:
+    from financial_engine import compute_model
+    results = compute_model(config, num_years=11)
+    results["pnl_ebitda"]          # np.ndarray, one value per year
+    results = compute_model(config, axis=TimeAxis(11, "hybrid"))
+
+    python execution/financial_engine.py --config config.json
+    python execution/financial_engine.py --config config.json --granularity hybrid
+    python execution/financial_engine.py --config config.json --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from time_axis import TimeAxis
+
+
+# =============================================================================
+# EXCEL-COMPATIBLE PRIMITIVES
+# =============================================================================
+def excel_round(x):
+    """ROUND(x, 0) with Excel semantics (half away from zero)."""
+    x = np.asarray(x, dtype=float)
+    return np.sign(x) * np.floor(np.abs(x) + 0.5)
+
+
+def safe_div(num, den):
+    """IF(den=0, 0, num/den) evaluated element-wise."""
+    num = np.asarray(num, dtype=float)
+    den = np.asarray(den, dtype=float)
+    out = np.zeros(np.broadcast(num, den).shape)
+    np.divide(num, den, out=out, where=den != 0)
+    return out
+
+
+def _grow(start, growth, axis: TimeAxis, rounded):
+    """Compound a per-period flow from `start` by annual `growth`.
+
+    Mirrors FinancialModelBuilder._grow_expr: each step compounds by
+    (1+g)^(months/12) and rescales when the period length changes; annual
+    periods are optionally ROUNDed. `start` and `growth` broadcast over any
+    leading dimensions; the returned array has the period axis last. The
+    recurrence is sequential because Excel rounds before the next step.
+    """
+    start = np.asarray(start, dtype=float)
+    factor = 1 + np.asarray(growth, dtype=float)
+    shape = np.broadcast(start, factor).shape
+    out = np.empty(shape + (len(axis),))
+    out[..., 0] = start
+    for p in axis.periods[1:]:
+        prev = axis[p.index - 1]
+        nxt = out[..., p.index - 1] * (p.months // prev.months)
+        nxt = nxt * (factor if prev.months == 12 else factor ** (prev.months / 12))
+        out[..., p.index] = excel_round(nxt) if rounded and p.is_annual else nxt
+    return out
+
+
+def _grow_stock(start, growth, axis: TimeAxis):
+    """Headcount-style stock: ROUND per step between annual periods, closed
+    form ROUND(start*(1+g)^(t/12)) elsewhere (see the Headcount Plan)."""
+    start = np.asarray(start, dtype=float)
+    factor = 1 + np.asarray(growth, dtype=float)
+    shape = np.broadcast(start, factor).shape
+    out = np.empty(shape + (len(axis),))
+    out[..., 0] = start
+    for p in axis.periods[1:]:
+        if p.is_annual and axis[p.index - 1].is_annual:
+            out[..., p.index] = excel_round(out[..., p.index - 1] * factor)
+        else:
+            out[..., p.index] = excel_round(start * factor ** (p.start / 12))
+    return out
+
+
+# Period-end balances; every other series is a per-period flow
+STOCK_SERIES = {"headcount", "headcount_total", "cf_cumulative"}
+
+
+def is_stock(key: str) -> bool:
+    return key in STOCK_SERIES or key.startswith("bs_")
+
+
+# =============================================================================
+# FIXED ASSETS (CAPEX VINTAGES)
+# =============================================================================
+def asset_classes(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Asset classes from `fixed_assets.classes`, or one class built from
+    general.capex_y0 / capex_annual / depreciation_years."""
+    classes = (config.get("fixed_assets") or {}).get("classes")
+    if classes:
+        return [
+            {
+                "name": c.get("name", f"Class {i + 1}"),
+                "useful_life": float(c["useful_life"]),
+                "capex": [float(v) for v in c.get("capex", [])] or [0.0],
+            }
+            for i, c in enumerate(classes)
+        ]
+    gen = config["general"]
+    return [
+        {
+            "name": "Fixed Assets",
+            "useful_life": float(gen["depreciation_years"]),
+            "capex": [float(gen["capex_y0"]), float(gen["capex_annual"])],
+        }
+    ]
+
+
+def capex_by_year(capex: List[float], num_years: int) -> np.ndarray:
+    """Per-year capex of one class; the last entry repeats for later years."""
+    capex = list(capex) or [0.0]
+    return np.array((capex + capex[-1:] * num_years)[:num_years], dtype=float)
+
+
+def vintage_matrix(capex, lives) -> np.ndarray:
+    """Depreciation charged by each vintage: class x year x vintage.
+
+    Vintage v of a class with life L is written off straight-line over years
+    v .. v+L-1 (a fractional life leaves a part-year charge at the end).
+    """
+    capex = np.asarray(capex, dtype=float)  # class x vintage year
+    lives = np.asarray(lives, dtype=float)[:, None, None]
+    n = capex.shape[-1]
+    age = (np.arange(n)[:, None] - np.arange(n)[None, :])[None]  # year x vintage
+    share = (np.clip(age + 1, 0, lives) - np.clip(age, 0, lives)) / lives
+    return capex[:, None, :] * share
+
+
+def fixed_asset_schedule(
+    classes: List[Dict[str, Any]], axis: TimeAxis
+) -> Dict[str, np.ndarray]:
+    """Per-period capex, depreciation and net fixed assets in one pass.
+
+    Depreciation is the step in *rounded* cumulative depreciation, so the
+    whole-number P&L charges add up exactly to what leaves the balance
+    sheet (NFA = cumulative capex - cumulative depreciation). Sub-annual
+    periods take their share of the year's capex and depreciation.
+    """
+    years = np.array([p.year for p in axis])
+    frac = np.array([p.fraction for p in axis])
+    done = np.array([(p.start + p.months - 12 * p.year) / 12 for p in axis])
+
+    capex = np.stack([capex_by_year(c["capex"], axis.num_years) for c in classes])
+    lives = [c["useful_life"] for c in classes]
+    dep_year = vintage_matrix(capex, lives).sum(axis=-1)  # class x year
+    total_dep = dep_year.sum(axis=0)
+    opening = np.concatenate([[0.0], np.cumsum(total_dep)])[years]
+    cum_dep = excel_round(opening + done * total_dep[years])
+
+    class_capex = capex[:, years] * frac
+    period_capex = class_capex.sum(axis=0)
+    return {
+        "capex": period_capex,
+        "class_capex": class_capex,
+        "depreciation": np.diff(cum_dep, prepend=0.0),
+        "nfa": np.cumsum(period_capex) - cum_dep,
+    }
+
+
+# =============================================================================
+# RESULTS CONTAINER
+# =============================================================================
+class ModelResults:
+    """Computed series keyed by builder row_refs names."""
+
+    def __init__(self, axis: TimeAxis, terminal_yr: int):
+        self.axis = axis
+        self.num_years = axis.num_years
+        self.terminal_yr = terminal_yr
+        self.series: Dict[str, np.ndarray] = {}
+        self.scalars: Dict[str, float] = {}
+        self.labels: Dict[str, List[str]] = {}
+        self.elapsed_ms = 0.0
+
+    def __getitem__(self, key: str):
+        if key in self.series:
+            return self.series[key]
+        return self.scalars[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.series or key in self.scalars
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
+
+    def year_value(self, key: str, year: int):
+        """A series for one model year: summed over its periods for flows,
+        the year-end period for stocks."""
+        periods = self.axis.year_periods(year)
+        values = self.series[key]
+        if is_stock(key) or len(periods) == 1:
+            return values[..., periods[-1].index]
+        return values[..., periods[0].index : periods[-1].index + 1].sum(axis=-1)
+
+    def terminal(self, key: str) -> float:
+        """Value of a series at the valuation terminal year."""
+        return float(self.year_value(key, self.terminal_yr))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "num_years": self.num_years,
+            "axis": self.axis.spec(),
+            "terminal_year": self.terminal_yr,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+            "labels": self.labels,
+            "series": {k: v.tolist() for k, v in self.series.items()},
+            "scalars": {k: float(v) for k, v in self.scalars.items()},
+        }
+
+
+# =============================================================================
+# INPUT EXTRACTION
+# =============================================================================
+def extract_inputs(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Pull the numeric drivers out of a normalized config as arrays."""
+    gen = config["general"]
+    streams = config["revenue_streams"]
+    depts = config["headcount"]["departments"]
+    other_fixed = [
+        c
+        for c in config["fixed_costs"]
+        if "salary" not in c["name"].lower() and "salaries" not in c["name"].lower()
+    ]
+    rounds = config["funding"].get("rounds", [])
+    val = config.get("valuation", {})
+    return {
+        "price": np.array([s["price"] for s in streams], dtype=float),
+        "volume0": np.array([s["volume"] for s in streams], dtype=float),
+        "growth": np.array([s["growth"] for s in streams], dtype=float),
+        "cogs_pct": np.array([s["cogs_pct"] for s in streams], dtype=float),
+        "salary": np.array([d["salary"] for d in depts], dtype=float),
+        "hc0": np.array([d["y0_count"] for d in depts], dtype=float),
+        "hc_growth": np.array([d.get("growth", 0.30) for d in depts], dtype=float),
+        "fixed0": np.array([c["annual_cost"] for c in other_fixed], dtype=float),
+        "cost_inflation": float(gen["cost_inflation"]),
+        "tax_rate": float(gen["tax_rate"]),
+        "asset_classes": asset_classes(config),
+        "round_amount": np.array([r["amount"] for r in rounds], dtype=float),
+        "round_pre": np.array([r.get("pre_money", 0) for r in rounds], dtype=float),
+        "round_year_cf": [r.get("year", -1) for r in rounds],
+        "round_year_bs": [r.get("year", 0) for r in rounds],
+        "exit_multiple": float(val.get("exit_multiple", 5.0)),
+        "tam_values": [t.get("value_m", 0) for t in config.get("tam", {}).get("streams", [])],
+        "sam_values": [s.get("value_m", 0) for s in config.get("sam", {}).get("regions", [])],
+        "som_revenue": config.get("som", {}).get(
+            "year8_revenue_m", config.get("som", {}).get("terminal_revenue_m", 0)
+        ),
+        "names": {
+            "streams": [s["name"] for s in streams],
+            "departments": [d["name"] for d in depts],
+            "other_fixed": [c["name"] for c in other_fixed],
+            "rounds": [r["name"] for r in rounds],
+        },
+    }
+
+
+# =============================================================================
+# EVALUATION
+# =============================================================================
+def evaluate(inputs: Dict[str, Any], axis: TimeAxis, terminal_yr: int) -> ModelResults:
+    """Evaluate every sheet's logic from extracted inputs."""
+    res = ModelResults(axis, terminal_yr)
+    s = res.series
+    sc = res.scalars
+    res.labels = inputs["names"]
+    n = len(axis)
+    years = np.array([p.year for p in axis])  # model year of each period
+    frac = np.array([p.fraction for p in axis])  # share of a year per period
+    year_start = np.array([p.is_year_start for p in axis])
+
+    # --- Sources & References ---
+    sc["tam_total"] = float(sum(inputs["tam_values"]))
+    sc["sam_total"] = float(sum(inputs["sam_values"]))
+    sc["som_revenue"] = float(inputs["som_revenue"])
+    sc["sam_penetration"] = float(safe_div(sc["som_revenue"], sc["sam_total"]))
+
+    # --- Assumptions: volume growth (ROUND per annual period) ---
+    s["stream_volume"] = _grow(
+        inputs["volume0"] * frac[0], inputs["growth"], axis, True
+    )
+
+    # --- Headcount Plan ---
+    s["headcount"] = _grow_stock(inputs["hc0"], inputs["hc_growth"], axis)
+    s["headcount_total"] = s["headcount"].sum(axis=-2)
+    s["salary_cost_total"] = (
+        s["headcount"] * inputs["salary"][..., None]
+    ).sum(axis=-2) * frac
+
+    # --- Revenue ---
+    s["stream_revenue"] = inputs["price"][..., None] * s["stream_volume"]
+    s["revenue_total"] = s["stream_revenue"].sum(axis=-2)
+    s["revenue_mix"] = safe_div(s["stream_revenue"], s["revenue_total"][..., None, :])
+
+    # --- Operating Costs ---
+    s["stream_cogs"] = s["stream_revenue"] * inputs["cogs_pct"][..., None]
+    s["cogs_total"] = s["stream_cogs"].sum(axis=-2)
+    s["fixed_salaries"] = s["salary_cost_total"]
+    s["other_fixed"] = _grow(
+        inputs["fixed0"] * frac[0], inputs["cost_inflation"], axis, False
+    )
+    s["fixed_total"] = s["fixed_salaries"] + s["other_fixed"].sum(axis=-2)
+    s["opex_total"] = s["cogs_total"] + s["fixed_total"]
+
+    # --- Fixed assets (feeds P&L, Cash Flow and Balance Sheet) ---
+    assets = fixed_asset_schedule(inputs["asset_classes"], axis)
+
+    # --- P&L ---
+    s["pnl_revenue"] = s["revenue_total"]
+    s["pnl_cogs"] = s["cogs_total"]
+    s["pnl_gross_profit"] = s["pnl_revenue"] - s["pnl_cogs"]
+    s["pnl_gross_margin"] = safe_div(s["pnl_gross_profit"], s["pnl_revenue"])
+    s["pnl_opex"] = s["fixed_total"]
+    s["pnl_ebitda"] = s["pnl_gross_profit"] - s["pnl_opex"]
+    s["pnl_ebitda_margin"] = safe_div(s["pnl_ebitda"], s["pnl_revenue"])
+    s["pnl_depreciation"] = assets["depreciation"]
+    s["pnl_ebit"] = s["pnl_ebitda"] - s["pnl_depreciation"]
+    s["pnl_interest"] = np.zeros(n)
+    s["pnl_pbt"] = s["pnl_ebit"] - s["pnl_interest"]
+    s["pnl_tax"] = np.maximum(0, s["pnl_pbt"] * inputs["tax_rate"])
+    s["pnl_net_income"] = s["pnl_pbt"] - s["pnl_tax"]
+    s["pnl_net_margin"] = safe_div(s["pnl_net_income"], s["pnl_revenue"])
+
+    # --- Cash Flow ---
+    amounts = inputs["round_amount"]
+    yr_cf = np.array(inputs["round_year_cf"], dtype=float).reshape(-1, 1)
+    yr_bs = np.array(inputs["round_year_bs"], dtype=float).reshape(-1, 1)
+    s["cf_net_income"] = s["pnl_net_income"]
+    s["cf_depreciation"] = s["pnl_depreciation"]
+    s["cf_wc_change"] = np.zeros(n)
+    s["cf_operating"] = s["cf_net_income"] + s["cf_depreciation"] - s["cf_wc_change"]
+    s["cf_capex"] = -assets["capex"]
+    s["cf_investing"] = s["cf_capex"]
+    s["cf_equity"] = (amounts[..., None] * ((yr_cf == years) & year_start)).sum(axis=-2)
+    s["cf_financing"] = s["cf_equity"]
+    s["cf_net"] = s["cf_operating"] + s["cf_investing"] + s["cf_financing"]
+    s["cf_cumulative"] = np.cumsum(s["cf_net"], axis=-1)
+
+    # --- Balance Sheet ---
+    s["bs_cash"] = s["cf_cumulative"]
+    s["bs_fixed_assets"] = assets["nfa"]
+    s["bs_total_assets"] = s["bs_cash"] + s["bs_fixed_assets"]
+    s["bs_liabilities"] = np.zeros(n)
+    s["bs_paid_capital"] = (amounts[..., None] * (yr_bs <= years)).sum(axis=-2)
+    s["bs_retained_earnings"] = np.cumsum(s["pnl_net_income"], axis=-1)
+    s["bs_total_equity"] = s["bs_paid_capital"] + s["bs_retained_earnings"]
+    s["bs_total_le"] = s["bs_liabilities"] + s["bs_total_equity"]
+    s["bs_check"] = s["bs_total_assets"] - s["bs_total_le"]
+
+    # --- Summary ---
+    rev = s["pnl_revenue"]
+    prev = np.concatenate([np.zeros(rev.shape[:-1] + (1,)), rev[..., :-1]], axis=-1)
+    s["summary_revenue_growth"] = safe_div(rev - prev, prev)
+    s["summary_revenue_per_employee"] = safe_div(rev, s["headcount_total"])
+
+    # --- Sensitivity Analysis (terminal year) ---
+    t = terminal_yr
+    for key, src, lo, hi in [
+        ("sens_revenue", "pnl_revenue", 0.8, 1.2),
+        ("sens_ebitda", "pnl_ebitda", 0.7, 1.3),
+        ("sens_cash", "cf_cumulative", 0.75, 1.25),
+    ]:
+        base = res.year_value(src, t)
+        s[key] = np.stack([lo * base, base, hi * base], axis=-1)
+
+    # --- Valuation ---
+    total_raised = amounts.sum(axis=-1)
+    s["val_exit_value"] = res.year_value("pnl_revenue", t) * inputs["exit_multiple"]
+    s["val_total_raised"] = np.asarray(total_raised, dtype=float)
+    s["val_return_multiple"] = safe_div(s["val_exit_value"], total_raised)
+
+    # --- Break-even Analysis ---
+    s["be_stream_cm"] = s["stream_revenue"] - s["stream_cogs"]
+    s["be_total_revenue"] = s["revenue_total"]
+    s["be_total_cogs"] = s["cogs_total"]
+    s["be_total_cm"] = s["be_total_revenue"] - s["be_total_cogs"]
+    s["be_cm_pct"] = safe_div(s["be_total_cm"], s["be_total_revenue"])
+    s["be_fixed"] = s["pnl_opex"]
+    s["be_revenue"] = safe_div(s["be_fixed"], s["be_cm_pct"])
+    s["be_margin_of_safety"] = safe_div(
+        s["be_total_revenue"] - s["be_revenue"], s["be_total_revenue"]
+    )
+
+    # --- Funding Cap Table ---
+    s["cap_post_money"] = amounts + inputs["round_pre"]
+    s["cap_dilution"] = safe_div(amounts, s["cap_post_money"])
+    sc["cap_total_raised"] = float(np.sum(inputs["round_amount"]))
+
+    return res
+
+
+def compute_model(
+    config: Dict[str, Any], num_years: int = 11, axis: Optional[TimeAxis] = None
+) -> ModelResults:
+    """Compute every sheet of the model from a *normalized* config.
+
+    `axis` selects monthly/hybrid periods; by default one period per year.
+    """
+    started = time.perf_counter()
+    axis = axis or TimeAxis(num_years)
+    terminal_yr = min(
+        config.get("valuation", {}).get("terminal_year", 8), axis.num_years - 1
+    )
+    res = evaluate(extract_inputs(config), axis, terminal_yr)
+    res.elapsed_ms = (time.perf_counter() - started) * 1000
+    return res
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compute a financial model natively (no Excel recalculation)"
+    )
+    parser.add_argument("--config", "-c", required=True, help="Path to JSON config")
+    parser.add_argument(
+        "--years", type=int, default=11, help="Years (default: 11 = Y0-Y10)"
+    )
+    parser.add_argument(
+        "--granularity",
+        choices=TimeAxis.GRANULARITIES,
+        default="annual",
+        help="Period columns (default: annual)",
+    )
+    parser.add_argument(
+        "--monthly-months",
+        type=int,
+        default=36,
+        help="Hybrid: months shown monthly before switching to annual (default: 36)",
+    )
+    parser.add_argument("--json", "-j", action="store_true", help="Output JSON")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.config):
+        print(f"ERROR: Config not found: {args.config}")
+        sys.exit(1)
+    with open(args.config, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    from build_financial_model import normalize_config
+
+    axis = TimeAxis(args.years, args.granularity, args.monthly_months)
+    results = compute_model(normalize_config(raw), axis=axis)
+
+    if args.json:
+        print(json.dumps(results.to_dict(), indent=2))
+        return
+
+    print(f"Computed {len(results.series)} series in {results.elapsed_ms:.2f} ms")
+    print("=" * 60)
+    for label, key in [
+        ("Revenue", "pnl_revenue"),
+        ("EBITDA", "pnl_ebitda"),
+        ("Net Income", "pnl_net_income"),
+        ("Cash Balance", "cf_cumulative"),
+        ("Balance Check", "bs_check"),
+    ]:
+        row = "  ".join(f"{v:>12,.0f}" for v in results[key])
+        print(f"{label:<15}{row}")
+
+
+if __name__ == "__main__":
+    main()
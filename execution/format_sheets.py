@@ -21,7 +21,6 @@ Or standalone:
 import os
 import sys
 import argparse
-import time
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -98,10 +97,6 @@ class SheetFormatter:
         """Convert RGB tuple to gspread Color object."""
         return self.Color(rgb_tuple[0], rgb_tuple[1], rgb_tuple[2])
     
-    def _delay(self, seconds=0.3):
-        """Rate limit delay to avoid API limits."""
-        time.sleep(seconds)
-    
     # ========================================================================
     # STANDARD FORMAT DEFINITIONS
     # ========================================================================
@@ -207,7 +202,6 @@ class SheetFormatter:
             striped = (i % 2 == 1)
             fmt = self.get_data_row_format(striped=striped)
             self.format_cell_range(sheet, f'{start_col}{row}:{end_col}{row}', fmt)
-            self._delay(0.15)
     
     def format_header_row(self, sheet, row_num, end_col='M'):
         """Format a row as column headers.
@@ -221,7 +215,6 @@ class SheetFormatter:
             return
         
         self.format_cell_range(sheet, f'A{row_num}:{end_col}{row_num}', self.get_column_header_format())
-        self._delay()
     
     def format_section_by_markers(self, sheet, section_markers, category_markers=None):
         """Format a sheet based on section and category markers.
@@ -235,7 +228,6 @@ class SheetFormatter:
             return
         
         data = sheet.get_all_values()
-        self._delay(0.5)
         
         for i, row in enumerate(data):
             cell_value = row[0] if row else ''
@@ -244,7 +236,6 @@ class SheetFormatter:
             for marker in section_markers:
                 if marker in cell_value:
                     self.format_cell_range(sheet, f'A{i+1}:M{i+1}', self.get_section_header_format())
-                    self._delay(0.2)
                     break
             
             # Check for category headers
@@ -252,7 +243,6 @@ class SheetFormatter:
                 for marker in category_markers:
                     if marker in cell_value:
                         self.format_cell_range(sheet, f'A{i+1}:M{i+1}', self.get_category_header_format(section='A'))
-                        self._delay(0.2)
                         break
     
     # ========================================================================
@@ -273,17 +263,14 @@ class SheetFormatter:
         
         print("Formatting Assumptions sheet...")
         data = sheet.get_all_values()
-        self._delay(0.5)
         
         # 1. Format title row
         print("  - Title row...")
         self.format_cell_range(sheet, 'A1:M1', self.get_title_format())
-        self._delay()
         
         # 2. Format column header row (row 2 with Year labels)
         print("  - Column headers...")
         self.format_cell_range(sheet, 'A2:M2', self.get_column_header_format())
-        self._delay()
         
         # 3. Find and format section headers
         section_markers = [
@@ -309,7 +296,6 @@ class SheetFormatter:
                 if marker in cell_value:
                     section_rows.append(i + 1)
                     self.format_cell_range(sheet, f'A{i+1}:M{i+1}', self.get_section_header_format())
-                    self._delay(0.2)
                     break
         
         # 4. Apply zebra striping to data rows (between sections)
@@ -328,7 +314,6 @@ class SheetFormatter:
         self.set_column_width(sheet, 'B', 80)
         for col in ['C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M']:
             self.set_column_width(sheet, col, 100)
-        self._delay()
         
         print("  ✓ Assumptions sheet formatted")
     
@@ -344,15 +329,12 @@ class SheetFormatter:
         
         print("Formatting P&L sheet...")
         data = sheet.get_all_values()
-        self._delay(0.5)
         
         # Title
         self.format_cell_range(sheet, 'A1:M1', self.get_title_format())
-        self._delay()
         
         # Column headers
         self.format_cell_range(sheet, 'A2:M2', self.get_column_header_format())
-        self._delay()
         
         # Find key rows
         total_markers = ['Total Revenue', 'Gross Profit', 'EBITDA', 'Net Income', 'PAT']
@@ -365,14 +347,12 @@ class SheetFormatter:
             for marker in total_markers:
                 if marker in cell_value:
                     self.format_cell_range(sheet, f'A{i+1}:M{i+1}', self.get_total_row_format())
-                    self._delay(0.15)
                     break
             
             # Section headers
             for marker in section_markers:
                 if cell_value.strip() == marker or cell_value.startswith(f'{marker} '):
                     self.format_cell_range(sheet, f'A{i+1}:M{i+1}', self.get_section_header_format())
-                    self._delay(0.15)
                     break
         
         print("  ✓ P&L sheet formatted")
@@ -389,19 +369,15 @@ class SheetFormatter:
         
         print("Formatting Revenue sheet...")
         data = sheet.get_all_values()
-        self._delay(0.5)
         
         # Title and headers
         self.format_cell_range(sheet, 'A1:M1', self.get_title_format())
-        self._delay()
         self.format_cell_range(sheet, 'A2:M2', self.get_column_header_format())
-        self._delay()
         
         # Find Total Revenue row
         for i, row in enumerate(data):
             if row[0] and 'Total Revenue' in row[0]:
                 self.format_cell_range(sheet, f'A{i+1}:M{i+1}', self.get_total_row_format())
-                self._delay()
                 break
         
         print("  ✓ Revenue sheet formatted")
@@ -418,12 +394,9 @@ class SheetFormatter:
         
         print("Formatting Operating Costs sheet...")
         data = sheet.get_all_values()
-        self._delay(0.5)
         
         self.format_cell_range(sheet, 'A1:M1', self.get_title_format())
-        self._delay()
         self.format_cell_range(sheet, 'A2:M2', self.get_column_header_format())
-        self._delay()
         
         section_markers = ['COGS', 'Fixed Costs', 'S&M', 'Sales & Marketing']
         total_markers = ['Total COGS', 'Total Fixed', 'Total S&M', 'Total Operating']
@@ -434,13 +407,11 @@ class SheetFormatter:
             for marker in section_markers:
                 if cell_value.strip().startswith(marker):
                     self.format_cell_range(sheet, f'A{i+1}:M{i+1}', self.get_section_header_format())
-                    self._delay(0.15)
                     break
             
             for marker in total_markers:
                 if marker in cell_value:
                     self.format_cell_range(sheet, f'A{i+1}:M{i+1}', self.get_total_row_format())
-                    self._delay(0.15)
                     break
         
         print("  ✓ Operating Costs sheet formatted")
@@ -505,10 +476,10 @@ def main():
     
     args = parser.parse_args()
     
-    import gspread
+    from sheets_quota import authorize
     
     creds = get_credentials()
-    client = gspread.authorize(creds)
+    client = authorize(creds)
     spreadsheet = client.open_by_key(args.sheet_id)
     
     formatter = SheetFormatter(spreadsheet)
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Declarative Layout IR and Output Compilers
+==========================================
+
+The FinancialModelBuilder lays a model out once into a WorkbookPlan (see
+sheet_plan.py): per sheet, the cells with their value or formula, number
+format and interned style indices, plus merged ranges and column widths.
+That plan is the layout IR; this module compiles it to each output format
+with a cheap serialization pass and no further layout work:
+
+    xlsx    compile_xlsx()            xlsxwriter workbook (constant memory,
+                                      shared formulas)
+    sheets  compile_sheets_payload()  Google Sheets spreadsheets.batchUpdate
+                                      body (addSheet, updateCells, mergeCells,
+                                      updateDimensionProperties)
+    csv     write_snapshot()          snapshot.json + sheets/<name>.csv and
+                                      sheets/<name>_formulas.csv, the format
+                                      written by download_model_snapshot.py
+
+Style and number-format translation is cached per distinct style key, so
+each format costs one pass over the cells.
+
+Given the formula results (formula_eval.evaluate_workbook), the xlsx caches
+them in its formula cells and the snapshot values CSVs show them; without
+results, formula cells have no cached value and blank CSV values.
+
+Usage:
+    builder = FinancialModelBuilder(config, backend="layout")
+    builder.build_all()
+    builder.export("model.xlsx", formats=["xlsx", "sheets", "csv"])
+
+    python execution/build_financial_model.py --config config.json \\
+        --formats xlsx sheets csv
+"""
+
+import csv
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import xlsxwriter
+    from openpyxl.utils import column_index_from_string, get_column_letter
+except ImportError:
+    print("ERROR: xlsxwriter/openpyxl not installed. Run: pip install xlsxwriter openpyxl")
+    sys.exit(1)
+
+from sheet_plan import (
+    PlanCell,
+    SharedFormulaWorksheet,
+    SheetPlan,
+    WorkbookPlan,
+    XlsxFormatCache,
+    merge_index,
+    write_plan_row,
+)
+
+FORMATS = ("xlsx", "sheets", "csv")
+
+# Characters download_model_snapshot.sanitize_sheet_name replaces
+_UNSAFE_FILENAME_CHARS = ["/", "\\", ":", "*", "?", '"', "<", ">", "|", "&"]
+
+# Excel character-width units to Sheets pixels (default font)
+_PIXELS_PER_CHAR = 7
+_PIXEL_PADDING = 5
+
+_H_ALIGN = {"left": "LEFT", "center": "CENTER", "right": "RIGHT"}
+_V_ALIGN = {"top": "TOP", "center": "MIDDLE", "bottom": "BOTTOM"}
+
+
+def output_paths(xlsx_path: str) -> Dict[str, str]:
+    """Sibling output paths for each format, derived from the .xlsx path."""
+    stem = os.path.splitext(xlsx_path)[0]
+    return {
+        "xlsx": xlsx_path,
+        "sheets": f"{stem}.sheets.json",
+        "csv": f"{stem}_snapshot",
+    }
+
+
+def _column_widths(plan: SheetPlan) -> Iterator[Tuple[int, float]]:
+    """(1-based column, width) for every column with an explicit width."""
+    for letter, dim in sorted(plan.column_dimensions.items()):
+        if dim.width is not None:
+            yield column_index_from_string(letter), dim.width
+
+
+# =============================================================================
+# XLSX
+# =============================================================================
+def compile_xlsx(
+    book: WorkbookPlan,
+    filepath: str,
+    shared_formulas: bool = False,
+    values: Optional[Dict[str, Dict[Tuple[int, int], Any]]] = None,
+) -> str:
+    """Write the plan to an .xlsx file with xlsxwriter (optionally shared formulas).
+
+    `values` ({sheet: {(row, col): result}}) become the formula cells'
+    cached values.
+    """
+    values = values or {}
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    xlsx = xlsxwriter.Workbook(filepath, {"constant_memory": True})
+    formats = XlsxFormatCache(book, xlsx)
+    for title in book.sheetnames:
+        plan = book[title]
+        ws = xlsx.add_worksheet(title, worksheet_class=SharedFormulaWorksheet)
+        anchors, covered = merge_index(plan)
+        for _, cells in plan.iter_plan_rows():
+            write_plan_row(
+                ws, cells, formats, anchors, covered, shared_formulas, values.get(title)
+            )
+        for col, width in _column_widths(plan):
+            ws.set_column(col - 1, col - 1, width)
+    xlsx.close()
+    return filepath
+
+
+# =============================================================================
+# GOOGLE SHEETS BATCHUPDATE
+# =============================================================================
+def _color(color) -> Optional[Dict[str, float]]:
+    rgb = getattr(color, "rgb", None)
+    if not isinstance(rgb, str):
+        return None
+    hex6 = rgb[-6:]
+    return {
+        "red": int(hex6[0:2], 16) / 255,
+        "green": int(hex6[2:4], 16) / 255,
+        "blue": int(hex6[4:6], 16) / 255,
+    }
+
+
+class SheetsFormatCache:
+    """Maps plan style indices to (cached) Sheets CellFormat dicts."""
+
+    def __init__(self, book: WorkbookPlan):
+        self.book = book
+        self._formats: Dict[tuple, Optional[Dict[str, Any]]] = {}
+
+    def get(self, cell: PlanCell) -> Optional[Dict[str, Any]]:
+        style = tuple(cell._style) if cell._style is not None else None
+        key = (style, cell.number_format)
+        if key not in self._formats:
+            self._formats[key] = self._build(cell) if key != (None, "General") else None
+        return self._formats[key]
+
+    @staticmethod
+    def _build(cell: PlanCell) -> Optional[Dict[str, Any]]:
+        fmt: Dict[str, Any] = {}
+        if cell.number_format != "General":
+            kind = "PERCENT" if "%" in cell.number_format else "NUMBER"
+            fmt["numberFormat"] = {"type": kind, "pattern": cell.number_format}
+        font, fill = cell.font, cell.fill
+        border, alignment = cell.border, cell.alignment
+        if font is not None:
+            text: Dict[str, Any] = {}
+            if font.name:
+                text["fontFamily"] = font.name
+            if font.sz:
+                text["fontSize"] = int(font.sz)
+            if font.b:
+                text["bold"] = True
+            if font.i:
+                text["italic"] = True
+            if _color(font.color):
+                text["foregroundColor"] = _color(font.color)
+            if text:
+                fmt["textFormat"] = text
+        if fill is not None and fill.fill_type == "solid" and _color(fill.fgColor):
+            fmt["backgroundColor"] = _color(fill.fgColor)
+        if border is not None and border.left is not None and border.left.style:
+            side = {"style": "SOLID"}
+            fmt["borders"] = {"top": side, "bottom": side, "left": side, "right": side}
+        if alignment is not None:
+            if alignment.horizontal in _H_ALIGN:
+                fmt["horizontalAlignment"] = _H_ALIGN[alignment.horizontal]
+            if alignment.vertical in _V_ALIGN:
+                fmt["verticalAlignment"] = _V_ALIGN[alignment.vertical]
+            if alignment.wrap_text:
+                fmt["wrapStrategy"] = "WRAP"
+        return fmt or None
+
+
+def _sheets_value(value) -> Optional[Dict[str, Any]]:
+    if isinstance(value, str) and value.startswith("="):
+        return {"formulaValue": value}
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, (int, float)):
+        return {"numberValue": value}
+    if isinstance(value, str) and value:
+        return {"stringValue": value}
+    return None
+
+
+def _sheet_rows(plan: SheetPlan, formats: SheetsFormatCache) -> List[Dict[str, Any]]:
+    """Dense RowData list (row 1..max_row) for an updateCells request."""
+    _, covered = merge_index(plan)
+    rows: List[Dict[str, Any]] = []
+    for row, cells in plan.iter_plan_rows():
+        while len(rows) < row - 1:
+            rows.append({})
+        values: List[Dict[str, Any]] = []
+        for cell in cells:
+            if (cell.row, cell.column) in covered:
+                continue
+            data: Dict[str, Any] = {}
+            value = _sheets_value(cell.value)
+            if value is not None:
+                data["userEnteredValue"] = value
+            fmt = formats.get(cell)
+            if fmt is not None:
+                data["userEnteredFormat"] = fmt
+            if data:
+                while len(values) < cell.column - 1:
+                    values.append({})
+                values.append(data)
+        rows.append({"values": values} if values else {})
+    return rows
+
+
+def compile_sheets_payload(
+    book: WorkbookPlan,
+    first_sheet_id: int = 1,
+    default_sheet_id: Optional[int] = 0,
+) -> Dict[str, Any]:
+    """spreadsheets.batchUpdate body that recreates the plan in Google Sheets.
+
+    Sheets are added with explicit ids (`first_sheet_id` + index) so the
+    later requests in the same batch can address them. A new spreadsheet
+    already holds "Sheet1" (id 0): the ids start past it and the payload
+    deletes it once the model sheets exist. Pass `default_sheet_id=None`
+    to keep it.
+    """
+    if default_sheet_id is not None and (
+        first_sheet_id <= default_sheet_id < first_sheet_id + len(book.sheetnames)
+    ):
+        raise ValueError(
+            f"Sheet ids from {first_sheet_id} collide with the default sheet id {default_sheet_id}"
+        )
+    formats = SheetsFormatCache(book)
+    requests: List[Dict[str, Any]] = []
+    for index, title in enumerate(book.sheetnames):
+        plan = book[title]
+        requests.append(
+            {
+                "addSheet": {
+                    "properties": {
+                        "sheetId": first_sheet_id + index,
+                        "title": title,
+                        "index": index,
+                        "gridProperties": {
+                            "rowCount": max(plan.max_row, 1),
+                            "columnCount": max(plan.max_column, 1),
+                        },
+                    }
+                }
+            }
+        )
+    if default_sheet_id is not None:
+        requests.append({"deleteSheet": {"sheetId": default_sheet_id}})
+    for index, title in enumerate(book.sheetnames):
+        plan = book[title]
+        sheet_id = first_sheet_id + index
+        requests.append(
+            {
+                "updateCells": {
+                    "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+                    "rows": _sheet_rows(plan, formats),
+                    "fields": "userEnteredValue,userEnteredFormat",
+                }
+            }
+        )
+        for r1, c1, r2, c2 in plan.merged_ranges:
+            requests.append(
+                {
+                    "mergeCells": {
+                        "range": {
+                            "sheetId": sheet_id,
+                            "startRowIndex": r1 - 1,
+                            "endRowIndex": r2,
+                            "startColumnIndex": c1 - 1,
+                            "endColumnIndex": c2,
+                        },
+                        "mergeType": "MERGE_ALL",
+                    }
+                }
+            )
+        for col, width in _column_widths(plan):
+            requests.append(
+                {
+                    "updateDimensionProperties": {
+                        "range": {
+                            "sheetId": sheet_id,
+                            "dimension": "COLUMNS",
+                            "startIndex": col - 1,
+                            "endIndex": col,
+                        },
+                        "properties": {
+                            "pixelSize": round(width * _PIXELS_PER_CHAR + _PIXEL_PADDING)
+                        },
+                        "fields": "pixelSize",
+                    }
+                }
+            )
+    return {"requests": requests}
+
+
+# =============================================================================
+# SNAPSHOT CSVS
+# =============================================================================
+def sanitize_sheet_name(name: str) -> str:
+    """Sheet name -> snapshot file name (same rules as download_model_snapshot)."""
+    for char in _UNSAFE_FILENAME_CHARS:
+        name = name.replace(char, "_")
+    return name.strip()
+
+
+def _csv_text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def write_snapshot(
+    book: WorkbookPlan,
+    output_dir: str,
+    title: str = "",
+    spreadsheet_id: str = "",
+    values: Optional[Dict[str, Dict[Tuple[int, int], Any]]] = None,
+) -> str:
+    """Write snapshot.json and per-sheet values/formulas CSVs; returns the dir.
+
+    Formula cells show their result from `values` in the values CSV (blank
+    when no result is given).
+    """
+    values = values or {}
+    sheets_dir = os.path.join(output_dir, "sheets")
+    os.makedirs(sheets_dir, exist_ok=True)
+    metadata: Dict[str, Any] = {
+        "spreadsheet_id": spreadsheet_id,
+        "spreadsheet_title": title,
+        "snapshot_date": datetime.now().isoformat(),
+        "sheets": [],
+    }
+    for index, name in enumerate(book.sheetnames):
+        plan = book[name]
+        safe_name = sanitize_sheet_name(name)
+        rows, cols = plan.max_row, plan.max_column
+        header = ["Row"] + [get_column_letter(c) for c in range(1, cols + 1)]
+        shown = [[i] + [""] * cols for i in range(1, rows + 1)]
+        formulas = [[i] + [""] * cols for i in range(1, rows + 1)]
+        results = values.get(name, {})
+        for row, cells in plan.iter_plan_rows():
+            for cell in cells:
+                text = _csv_text(cell.value)
+                formulas[row - 1][cell.column] = text
+                if not text.startswith("="):
+                    shown[row - 1][cell.column] = text
+                elif (row, cell.column) in results:
+                    shown[row - 1][cell.column] = _csv_text(results[(row, cell.column)])
+
+        values_file = f"sheets/{safe_name}.csv"
+        formulas_file = f"sheets/{safe_name}_formulas.csv"
+        for rel, data in ((values_file, shown), (formulas_file, formulas)):
+            with open(os.path.join(output_dir, rel), "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(data)
+        metadata["sheets"].append(
+            {
+                "name": name,
+                "safe_name": safe_name,
+                "index": index,
+                "rows": rows,
+                "cols": cols,
+                "values_file": values_file,
+                "formulas_file": formulas_file,
+            }
+        )
+    with open(os.path.join(output_dir, "snapshot.json"), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+    return output_dir
+
+
+# =============================================================================
+# ALL FORMATS
+# =============================================================================
+def compile_outputs(
+    book: WorkbookPlan,
+    xlsx_path: str,
+    formats=FORMATS,
+    title: str = "",
+    shared_formulas: bool = False,
+    values: Optional[Dict[str, Dict[Tuple[int, int], Any]]] = None,
+) -> Dict[str, str]:
+    """Compile the plan to each requested format; returns format -> path."""
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown formats {sorted(unknown)}. Valid: {FORMATS}")
+    paths = output_paths(xlsx_path)
+    written = {}
+    if "xlsx" in formats:
+        written["xlsx"] = compile_xlsx(book, paths["xlsx"], shared_formulas, values)
+    if "sheets" in formats:
+        os.makedirs(os.path.dirname(paths["sheets"]) or ".", exist_ok=True)
+        with open(paths["sheets"], "w", encoding="utf-8") as f:
+            json.dump(compile_sheets_payload(book), f)
+        written["sheets"] = paths["sheets"]
+    if "csv" in formats:
+        written["csv"] = write_snapshot(book, paths["csv"], title=title, values=values)
+    return written
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lint Formulas - Static reference checks without recalculation
+
+Tokenizes every formula in a workbook (.xlsx) or a local snapshot directory
+(download_model_snapshot.py / layout_ir.write_snapshot layout) and checks
+each cell reference against the cells that actually exist. Nothing is
+evaluated, so a 14-sheet model lints in milliseconds and structural breaks
+surface before validate_excel_model.py spends seconds recalculating.
+
+Checks:
+    dangling         reference to a sheet that does not exist, an external
+                     workbook ([1]Sheet!A1) or a #REF! left by a deletion
+    out_of_range     reference past the last filled row/column of the target
+                     sheet (e.g. year columns cleared by trim_years)
+    period_mismatch  cross-sheet reference whose target column sits under a
+                     different period header than the formula's own column
+                     (or the one before it, for growth rates and openings)
+    empty_target     reference to a blank cell, or a range with no filled cells
+                     (e.g. a row_refs default pointing at a spacer row)
+
+empty_target is a warning (Excel reads blanks as 0); --strict makes it an
+error. Exit code is 1 when any error is found.
+
+Usage:
+    python lint_formulas.py --file .tmp/MyCompany_financial_model.xlsx
+    python lint_formulas.py --snapshot .tmp/snapshot
+    python lint_formulas.py --file .tmp/model.xlsx --strict --json
+"""
+
+import argparse
+import csv
+import functools
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from openpyxl import load_workbook
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+# Sheet name -> {(row, col): value}, in workbook order
+SheetCells = Dict[Tuple[int, int], Any]
+Book = Dict[str, SheetCells]
+
+ERROR_KINDS = ("dangling", "out_of_range", "period_mismatch")
+WARNING_KINDS = ("empty_target",)
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+def load_workbook_cells(filepath: str) -> Book:
+    """Read formulas and constants (not cached results) from an .xlsx file."""
+    wb = load_workbook(filepath, read_only=True)
+    book: Book = {}
+    try:
+        for ws in wb.worksheets:
+            cells: SheetCells = {}
+            for r, row in enumerate(ws.iter_rows(values_only=True), start=1):
+                for c, value in enumerate(row, start=1):
+                    if value is not None and value != "":
+                        cells[(r, c)] = value
+            book[ws.title] = cells
+    finally:
+        wb.close()
+    return book
+
+
+def load_snapshot_cells(snapshot_dir: str) -> Book:
+    """Read the per-sheet formulas CSVs of a snapshot directory."""
+    with open(os.path.join(snapshot_dir, "snapshot.json"), "r", encoding="utf-8") as f:
+        metadata = json.load(f)
+    book: Book = {}
+    for sheet in metadata["sheets"]:
+        cells: SheetCells = {}
+        with open(
+            os.path.join(snapshot_dir, sheet["formulas_file"]), "r", encoding="utf-8"
+        ) as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header
+            for row in reader:
+                if not row:
+                    continue
+                r = int(row[0])
+                for c, value in enumerate(row[1:], start=1):
+                    if value != "":
+                        cells[(r, c)] = value
+        book[sheet["name"]] = cells
+    return book
+
+
+# =============================================================================
+# TOKENIZING
+# =============================================================================
+_STRING_RE = re.compile(r'"(?:[^"]|"")*"')
+_REF_RE = re.compile(
+    r"""(?<![A-Za-z0-9_.$'\]])
+        (?:(?P<sheet>'(?:[^']|'')+'|\[\d+\][^!'\s(),]+|[A-Za-z_][A-Za-z0-9_.]*)!)?
+        (?P<c1>\$?[A-Z]{1,3})(?P<r1>\$?\d+)
+        (?::(?P<c2>\$?[A-Z]{1,3})(?P<r2>\$?\d+))?
+        (?![A-Za-z0-9_(!])""",
+    re.VERBOSE,
+)
+_PERIOD_RE = re.compile(
+    r"^(?:(?:FY|Y|Year)\s?\d{1,4}"
+    r"|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s\d{4}"
+    r"|(?:19|20)\d{2})$",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class Reference:
+    """One cell or range reference as written in a formula."""
+
+    text: str
+    sheet: Optional[str]  # None = same sheet
+    row: int
+    col: int
+    last_row: int
+    last_col: int
+    absolute_col: bool
+    external: bool = False
+
+    @property
+    def is_range(self) -> bool:
+        return (self.row, self.col) != (self.last_row, self.last_col)
+
+
+@functools.lru_cache(maxsize=None)
+def _sheet_name(token: str) -> str:
+    if token.startswith("'"):
+        return token[1:-1].replace("''", "'")
+    return token
+
+
+@functools.lru_cache(maxsize=None)
+def _cell(col: str, row: str) -> Tuple[int, int, bool]:
+    """('$D', '16') -> (16, 4, True)"""
+    return int(row.lstrip("$")), column_index_from_string(col.lstrip("$")), col[0] == "$"
+
+
+def tokenize_references(formula: str) -> List[Reference]:
+    """Cell/range references in a formula; string literals are ignored."""
+    text = _STRING_RE.sub('""', formula) if '"' in formula else formula
+    refs = []
+    for m in _REF_RE.finditer(text):
+        sheet_token, c1, r1, c2, r2 = m.group("sheet", "c1", "r1", "c2", "r2")
+        sheet = _sheet_name(sheet_token) if sheet_token else None
+        row, col, absolute_col = _cell(c1, r1)
+        last_row, last_col = (row, col) if c2 is None else _cell(c2, r2)[:2]
+        refs.append(
+            Reference(
+                m.group(0),
+                sheet,
+                min(row, last_row),
+                min(col, last_col),
+                max(row, last_row),
+                max(col, last_col),
+                absolute_col,
+                bool(sheet and sheet.startswith("[")),
+            )
+        )
+    return refs
+
+
+# =============================================================================
+# SHEET SHAPE
+# =============================================================================
+class SheetShape:
+    """Filled extent and period headers of one sheet."""
+
+    def __init__(self, cells: SheetCells):
+        self.cells = cells
+        self.max_row = max((r for r, _ in cells), default=0)
+        self.max_col = max((c for _, c in cells), default=0)
+        # Header rows: >= 2 period labels ("2026", "Y3", "Year 3", "Jan 2026")
+        by_row: Dict[int, Dict[int, str]] = {}
+        for (r, c), value in cells.items():
+            if isinstance(value, bool) or not isinstance(value, (str, int)):
+                continue
+            label = str(value).strip()
+            if _PERIOD_RE.match(label):
+                by_row.setdefault(r, {})[c] = label.upper()
+        self.headers = sorted(
+            (r, cols) for r, cols in by_row.items() if len(cols) >= 2
+        )
+        self._periods: Dict[Tuple[int, int], Optional[str]] = {}
+
+    @property
+    def has_periods(self) -> bool:
+        return bool(self.headers)
+
+    def period(self, row: int, col: int) -> Optional[str]:
+        """Period label over (row, col): the nearest header row at or above it."""
+        key = (row, col)
+        if key not in self._periods:
+            found = None
+            for header_row, cols in reversed(self.headers):
+                if header_row <= row:
+                    found = cols.get(col)
+                    break
+            self._periods[key] = found
+        return self._periods[key]
+
+    def any_filled(self, ref: Reference) -> bool:
+        """True if any cell of the reference (clipped to the extent) is filled."""
+        last_row = min(ref.last_row, self.max_row)
+        last_col = min(ref.last_col, self.max_col)
+        if (last_row - ref.row + 1) * (last_col - ref.col + 1) > len(self.cells):
+            return any(
+                ref.row <= r <= last_row and ref.col <= c <= last_col
+                for r, c in self.cells
+            )
+        return any(
+            (r, c) in self.cells
+            for r in range(ref.row, last_row + 1)
+            for c in range(ref.col, last_col + 1)
+        )
+
+
+# =============================================================================
+# LINTING
+# =============================================================================
+@dataclass
+class LintIssue:
+    kind: str
+    sheet: str
+    cell: str
+    ref: str
+    message: str
+
+    @property
+    def severity(self) -> str:
+        return "error" if self.kind in ERROR_KINDS else "warning"
+
+    def __str__(self) -> str:
+        return f"{self.sheet}!{self.cell}: [{self.kind}] {self.message}"
+
+
+@dataclass
+class LintResult:
+    source: str
+    issues: List[LintIssue] = field(default_factory=list)
+    sheets: int = 0
+    formulas: int = 0
+    references: int = 0
+    load_ms: float = 0.0
+    lint_ms: float = 0.0
+    strict: bool = False
+
+    @property
+    def errors(self) -> List[LintIssue]:
+        return [
+            i for i in self.issues if i.severity == "error" or self.strict
+        ]
+
+    @property
+    def warnings(self) -> List[LintIssue]:
+        return [] if self.strict else [
+            i for i in self.issues if i.severity == "warning"
+        ]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def counts(self) -> Dict[str, int]:
+        counts = {kind: 0 for kind in ERROR_KINDS + WARNING_KINDS}
+        for issue in self.issues:
+            counts[issue.kind] += 1
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "success": self.ok,
+            "strict": self.strict,
+            "sheets": self.sheets,
+            "formulas": self.formulas,
+            "references": self.references,
+            "load_ms": round(self.load_ms, 2),
+            "lint_ms": round(self.lint_ms, 2),
+            "counts": self.counts(),
+            "errors": [asdict(i) for i in self.errors],
+            "warnings": [asdict(i) for i in self.warnings],
+        }
+
+
+def lint_cells(book: Book, source: str = "", strict: bool = False) -> LintResult:
+    """Check every formula reference in `book` against its target cells."""
+    start = time.perf_counter()
+    result = LintResult(source=source, sheets=len(book), strict=strict)
+    shapes = {name: SheetShape(cells) for name, cells in book.items()}
+    by_folded = {name.casefold(): name for name in book}  # Excel names ignore case
+
+    for sheet, cells in book.items():
+        own = shapes[sheet]
+        for (row, col), value in cells.items():
+            if not isinstance(value, str) or not value.startswith("="):
+                continue
+            result.formulas += 1
+            address = f"{get_column_letter(col)}{row}"
+
+            def flag(kind, ref_text, message):
+                result.issues.append(LintIssue(kind, sheet, address, ref_text, message))
+
+            if "#REF!" in value:
+                flag("dangling", "#REF!", f"broken reference left in {value}")
+            seen = set()
+            for ref in tokenize_references(value):
+                result.references += 1
+                if ref.text in seen:
+                    continue
+                seen.add(ref.text)
+                if ref.external:
+                    flag("dangling", ref.text, f"external workbook reference {ref.text}")
+                    continue
+                target_name = sheet if ref.sheet is None else by_folded.get(ref.sheet.casefold())
+                if target_name is None:
+                    flag("dangling", ref.text, f"sheet '{ref.sheet}' does not exist")
+                    continue
+                target = shapes[target_name]
+                if ref.row > target.max_row or ref.col > target.max_col:
+                    flag(
+                        "out_of_range",
+                        ref.text,
+                        f"{ref.text} is past the last filled cell of '{target_name}' "
+                        f"({get_column_letter(max(target.max_col, 1))}{target.max_row})",
+                    )
+                    continue
+                if (
+                    target_name != sheet
+                    and not ref.is_range
+                    and not ref.absolute_col
+                    and target.has_periods
+                ):
+                    mine = own.period(row, col)
+                    theirs = target.period(ref.row, ref.col)
+                    # Same period, or the prior one (growth rates, opening balances)
+                    if mine and theirs not in (mine, own.period(row, col - 1)):
+                        flag(
+                            "period_mismatch",
+                            ref.text,
+                            f"column is {mine} but {ref.text} is under "
+                            f"{theirs or 'no period header'}",
+                        )
+                        continue
+                if not target.any_filled(ref):
+                    what = "range has no filled cells" if ref.is_range else "target cell is blank"
+                    flag("empty_target", ref.text, f"{ref.text}: {what}")
+
+    result.lint_ms = (time.perf_counter() - start) * 1000
+    return result
+
+
+def lint_path(path: str, strict: bool = False) -> LintResult:
+    """Lint an .xlsx file or a snapshot directory."""
+    start = time.perf_counter()
+    book = load_snapshot_cells(path) if os.path.isdir(path) else load_workbook_cells(path)
+    load_ms = (time.perf_counter() - start) * 1000
+    result = lint_cells(book, source=path, strict=strict)
+    result.load_ms = load_ms
+    return result
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+def format_report(result: LintResult, limit: int = 20) -> str:
+    lines = [
+        "=" * 60,
+        f"FORMULA LINT: {os.path.basename(os.path.normpath(result.source))}",
+        "=" * 60,
+        f"Sheets: {result.sheets} | Formulas: {result.formulas} | "
+        f"References: {result.references}",
+        f"Time: load {result.load_ms:.1f} ms, lint {result.lint_ms:.1f} ms",
+    ]
+    counts = {k: v for k, v in result.counts().items() if v}
+    if counts:
+        lines.append("Issues: " + ", ".join(f"{k} {v}" for k, v in counts.items()))
+    for title, issues in (("ERRORS", result.errors), ("WARNINGS", result.warnings)):
+        if not issues:
+            continue
+        lines.append(f"\n{title} ({len(issues)}):")
+        for issue in issues[:limit]:
+            lines.append(f"  - {issue}")
+        if len(issues) > limit:
+            lines.append(f"  ... and {len(issues) - limit} more")
+    lines.append("")
+    lines.append("STATUS: PASSED" if result.ok else "STATUS: FAILED")
+    return "\n".join(lines)
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(
+        description="Statically check formula references (no recalculation)"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", "-f", help="Path to Excel file (.xlsx)")
+    source.add_argument("--snapshot", "-s", help="Path to snapshot directory")
+    parser.add_argument(
+        "--strict", action="store_true", help="Treat empty targets as errors"
+    )
+    parser.add_argument(
+        "--json", "-j", action="store_true", help="Output results as JSON"
+    )
+    parser.add_argument(
+        "--limit", type=int, default=20, help="Issues listed per section (default: 20)"
+    )
+    args = parser.parse_args()
+
+    path = args.file or args.snapshot
+    if not os.path.exists(path):
+        print(f"ERROR: Not found: {path}")
+        sys.exit(1)
+
+    result = lint_path(path, strict=args.strict)
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print(format_report(result, limit=args.limit))
+    sys.exit(0 if result.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
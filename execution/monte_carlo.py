@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo Scenario Sweep
+==========================
+
+Samples the key model drivers from distributions configured in the
+`monte_carlo` config section and evaluates every trial in one vectorized
+pass of the native engine (financial_engine.evaluate broadcasts a leading
+trial axis through every sheet). Reports P10/P50/P90 bands for revenue,
+EBITDA and cash; the builder writes them into the Sensitivity Analysis
+sheet when the section is present.
+
+Config section (all keys optional):
+    "monte_carlo": {
+        "trials": 10000,
+        "seed": 42,
+        "distributions": {
+            "price":         {"dist": "normal", "sd": 0.10},
+            "volume_growth": {"dist": "normal", "sd": 0.10},
+            "cogs_pct":      {"dist": "triangular", "low": -0.05, "mode": 0, "high": 0.1},
+            "churn":         {"dist": "uniform", "low": 0, "high": 0.05},
+            "salary":        {"dist": "lognormal", "sigma": 0.05, "per_item": true}
+        }
+    }
+
+Each distribution draws a deviation centred on the configured value:
+price and salary are scaled by (1 + d); volume growth and COGS % are shifted
+by d; churn is the extra share of volume lost each year on top of the
+configured churn_rate, applied as growth' = (1 + growth) * (1 - d) - 1.
+One draw per trial is shared by all streams/departments unless
+"per_item": true. Supported: normal (sd), uniform (low, high),
+triangular (low, mode, high), lognormal (sigma; d = e^x - 1).
+
+Usage:
+    python execution/monte_carlo.py --config config.json
+    python execution/monte_carlo.py --config config.json --trials 50000 --seed 7
+    python execution/monte_carlo.py --config config.json --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from financial_engine import evaluate, extract_inputs
+from time_axis import TimeAxis
+
+DEFAULT_TRIALS = 10000
+DEFAULT_SEED = 42
+DEFAULT_DISTRIBUTIONS = {
+    "price": {"dist": "normal", "sd": 0.10},
+    "volume_growth": {"dist": "normal", "sd": 0.10},
+    "cogs_pct": {"dist": "normal", "sd": 0.03},
+    "churn": {"dist": "normal", "sd": 0.02},
+    "salary": {"dist": "normal", "sd": 0.05},
+}
+PERCENTILES = (10, 50, 90)
+BAND_SERIES = [
+    ("Revenue", "pnl_revenue"),
+    ("EBITDA", "pnl_ebitda"),
+    ("Cash", "cf_cumulative"),
+]
+
+
+# =============================================================================
+# SAMPLING
+# =============================================================================
+def draw(spec: Dict[str, Any], size, rng: np.random.Generator) -> np.ndarray:
+    """Deviations around the configured value for one distribution spec."""
+    dist = spec.get("dist", "normal")
+    if dist == "normal":
+        return rng.normal(0.0, spec.get("sd", 0.1), size)
+    if dist == "uniform":
+        return rng.uniform(spec.get("low", -0.1), spec.get("high", 0.1), size)
+    if dist == "triangular":
+        low, high = spec.get("low", -0.1), spec.get("high", 0.1)
+        return rng.triangular(low, spec.get("mode", (low + high) / 2), high, size)
+    if dist == "lognormal":
+        return np.expm1(rng.normal(0.0, spec.get("sigma", 0.1), size))
+    raise ValueError(f"Unknown distribution '{dist}' (normal, uniform, triangular, lognormal)")
+
+
+def settings(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Monte Carlo section merged over defaults."""
+    section = config.get("monte_carlo") or {}
+    dists = dict(DEFAULT_DISTRIBUTIONS)
+    dists.update(section.get("distributions", {}))
+    return {
+        "trials": int(section.get("trials", DEFAULT_TRIALS)),
+        "seed": section.get("seed", DEFAULT_SEED),
+        "distributions": dists,
+    }
+
+
+def sample_inputs(
+    inputs: Dict[str, Any],
+    distributions: Dict[str, Dict[str, Any]],
+    trials: int,
+    rng: np.random.Generator,
+    base_churn: float = 0.0,
+) -> Dict[str, Any]:
+    """Engine inputs with a leading trial axis on the sampled drivers."""
+
+    def deviations(name, n_items):
+        spec = distributions[name]
+        return draw(spec, (trials, n_items if spec.get("per_item") else 1), rng)
+
+    n_streams = len(inputs["price"])
+    sampled = dict(inputs)
+    sampled["price"] = np.maximum(
+        0.0, inputs["price"] * (1 + deviations("price", n_streams))
+    )
+    sampled["cogs_pct"] = np.clip(
+        inputs["cogs_pct"] + deviations("cogs_pct", n_streams), 0.0, 1.0
+    )
+    churn = np.clip(deviations("churn", n_streams), -base_churn, 1.0 - base_churn)
+    growth = inputs["growth"] + deviations("volume_growth", n_streams)
+    sampled["growth"] = np.maximum(-1.0, (1 + growth) * (1 - churn) - 1)
+    sampled["salary"] = np.maximum(
+        0.0, inputs["salary"] * (1 + deviations("salary", len(inputs["salary"])))
+    )
+    return sampled
+
+
+# =============================================================================
+# SIMULATION
+# =============================================================================
+def run_monte_carlo(
+    config: Dict[str, Any],
+    trials: Optional[int] = None,
+    seed: Optional[int] = None,
+    axis: Optional[TimeAxis] = None,
+) -> Dict[str, Any]:
+    """Run the sweep on a *normalized* config; returns percentile bands.
+
+    `bands[key]` holds P10/P50/P90 at the valuation terminal year and
+    `yearly[key]` the same percentiles for every model year.
+    """
+    started = time.perf_counter()
+    opts = settings(config)
+    trials = trials or opts["trials"]
+    seed = opts["seed"] if seed is None else seed
+    axis = axis or TimeAxis()
+    terminal_yr = min(
+        config.get("valuation", {}).get("terminal_year", 8), axis.num_years - 1
+    )
+
+    rng = np.random.default_rng(seed)
+    base_churn = config.get("customer_acquisition", {}).get("churn_rate", 0.0)
+    inputs = sample_inputs(
+        extract_inputs(config), opts["distributions"], trials, rng, base_churn
+    )
+    res = evaluate(inputs, axis, terminal_yr)
+
+    bands, yearly = {}, {}
+    for _, key in BAND_SERIES:
+        per_year = np.stack(
+            [res.year_value(key, yr) for yr in range(axis.num_years)], axis=-1
+        )
+        pct = np.percentile(per_year, PERCENTILES, axis=0)
+        yearly[key] = {f"p{p}": row.tolist() for p, row in zip(PERCENTILES, pct)}
+        bands[key] = {f"p{p}": float(row[terminal_yr]) for p, row in zip(PERCENTILES, pct)}
+
+    return {
+        "trials": trials,
+        "seed": seed,
+        "terminal_year": terminal_yr,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "bands": bands,
+        "yearly": yearly,
+    }
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo sweep over config assumptions (vectorized)"
+    )
+    parser.add_argument("--config", "-c", required=True, help="Path to JSON config")
+    parser.add_argument("--trials", "-n", type=int, help="Trials (default: config or 10000)")
+    parser.add_argument("--seed", type=int, help="Random seed (default: config or 42)")
+    parser.add_argument(
+        "--years", type=int, default=11, help="Years (default: 11 = Y0-Y10)"
+    )
+    parser.add_argument("--json", "-j", action="store_true", help="Output JSON")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.config):
+        print(f"ERROR: Config not found: {args.config}")
+        sys.exit(1)
+    with open(args.config, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    from build_financial_model import normalize_config
+
+    result = run_monte_carlo(
+        normalize_config(raw), trials=args.trials, seed=args.seed, axis=TimeAxis(args.years)
+    )
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    t = result["terminal_year"]
+    print(f"Ran {result['trials']:,} trials in {result['elapsed_ms']:,.0f} ms (seed {result['seed']})")
+    print("=" * 60)
+    print(f"{'Year ' + str(t):<16}{'P10':>14}{'P50':>14}{'P90':>14}")
+    for label, key in BAND_SERIES:
+        band = result["bands"][key]
+        print(f"{label:<16}{band['p10']:>14,.0f}{band['p50']:>14,.0f}{band['p90']:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
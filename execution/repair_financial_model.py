@@ -30,7 +30,6 @@ Actions:
 import argparse
 import os
 import sys
-import time
 from typing import Dict, List, Tuple
 
 from dotenv import load_dotenv
@@ -50,6 +49,8 @@ except ImportError:
     import gspread
     from gspread_formatting import CellFormat, NumberFormat, format_cell_range
 
+from sheets_quota import authorize
+
 
 # Constants
 SCOPES = [
@@ -98,12 +99,7 @@ def get_sheets_client():
         with open("token.json", "w") as token:
             token.write(creds.to_json())
 
-    return gspread.authorize(creds)
-
-
-def rate_limit(seconds=1):
-    """Rate limit API calls"""
-    time.sleep(seconds)
+    return authorize(creds)
 
 
 def find_row_by_label(data: List[List], label: str, partial: bool = True) -> int:
@@ -140,7 +136,6 @@ def fix_formulas(spreadsheet) -> Dict:
     total_errors = 0
 
     for ws in spreadsheet.worksheets():
-        rate_limit(0.5)
         data = ws.get_all_values()
         sheet_errors = []
 
@@ -201,7 +196,6 @@ def fix_formatting(spreadsheet) -> bool:
             print(f"\nFormatting {sheet_name}...")
 
             for range_str, fmt in rules:
-                rate_limit(0.5)
                 format_cell_range(ws, range_str, fmt)
                 print(f"  Applied format to {range_str}")
 
@@ -221,7 +215,6 @@ def fix_balance_sheet(spreadsheet) -> bool:
 
     try:
         bs = spreadsheet.worksheet("Balance Sheet")
-        rate_limit(1)
         data = bs.get_all_values()
 
         # Find key rows
@@ -240,7 +233,6 @@ def fix_balance_sheet(spreadsheet) -> bool:
         if cash_row >= 0:
             # Find cumulative cash row in Cash Flow
             cf = spreadsheet.worksheet("Cash Flow")
-            rate_limit(0.5)
             cf_data = cf.get_all_values()
             cum_cash_row = find_row_by_label(cf_data, "cumulative")
             if cum_cash_row < 0:
@@ -260,12 +252,10 @@ def fix_balance_sheet(spreadsheet) -> bool:
                     f"  Linked Cash row {cash_row+1} to Cash Flow row {cum_cash_row+1}"
                 )
 
-        rate_limit(1)
 
         # Fix Retained Earnings - cumulative PAT
         if retained_row >= 0:
             pl = spreadsheet.worksheet("P&L")
-            rate_limit(0.5)
             pl_data = pl.get_all_values()
             pat_row = find_row_by_label(pl_data, "net income")
             if pat_row < 0:
@@ -286,7 +276,6 @@ def fix_balance_sheet(spreadsheet) -> bool:
                 bs.update_cells(cells, value_input_option="USER_ENTERED")
                 print(f"  Fixed Retained Earnings with cumulative PAT formula")
 
-        rate_limit(1)
 
         # Verify balance check
         if check_row >= 0 and total_assets_row >= 0 and total_liab_row >= 0:
@@ -326,7 +315,6 @@ def fix_cash_flow(spreadsheet) -> bool:
 
     try:
         cf = spreadsheet.worksheet("Cash Flow")
-        rate_limit(1)
         data = cf.get_all_values()
 
         # Find key rows
@@ -340,7 +328,6 @@ def fix_cash_flow(spreadsheet) -> bool:
         # Link PAT to P&L
         if pat_row >= 0:
             pl = spreadsheet.worksheet("P&L")
-            rate_limit(0.5)
             pl_data = pl.get_all_values()
             pl_pat_row = find_row_by_label(pl_data, "net income")
             if pl_pat_row < 0:
@@ -358,13 +345,11 @@ def fix_cash_flow(spreadsheet) -> bool:
                 cf.update_cells(cells, value_input_option="USER_ENTERED")
                 print(f"  Linked PAT row {pat_row+1} to P&L row {pl_pat_row+1}")
 
-        rate_limit(1)
 
         # Link Equity to Funding
         if equity_row >= 0:
             try:
                 fc = spreadsheet.worksheet("Funding Cap Table")
-                rate_limit(0.5)
                 fc_data = fc.get_all_values()
 
                 # Find funding rows (supports both detailed rounds and template summary rows)
@@ -428,7 +413,6 @@ def fix_funding(spreadsheet) -> bool:
 
     try:
         fc = spreadsheet.worksheet("Funding Cap Table")
-        rate_limit(1)
         data = fc.get_all_values()
 
         # Find cumulative row
@@ -487,7 +471,6 @@ def trim_years(spreadsheet, num_years: int) -> bool:
     clear_start_col = col_letter(last_col + 1)  # First column to clear
 
     for ws in spreadsheet.worksheets():
-        rate_limit(0.5)
         try:
             data = ws.get_all_values()
             if not data:
@@ -511,7 +494,6 @@ def trim_years(spreadsheet, num_years: int) -> bool:
     print(f"\nUpdating headers to: {headers}")
 
     for ws in spreadsheet.worksheets():
-        rate_limit(0.5)
         try:
             row2 = ws.row_values(2)
             if row2 and len(row2) > 2 and any("Y" in str(cell) for cell in row2):
@@ -535,7 +517,6 @@ def rebalance_sm(spreadsheet, target_pct: float) -> bool:
     try:
         # Get revenue data
         rev = spreadsheet.worksheet("Revenue")
-        rate_limit(0.5)
         rev_data = rev.get_all_values()
 
         # Find total revenue row
@@ -572,7 +553,6 @@ def rebalance_sm(spreadsheet, target_pct: float) -> bool:
 
         # Update Operating Costs S&M row
         oc = spreadsheet.worksheet("Operating Costs")
-        rate_limit(0.5)
         oc_data = oc.get_all_values()
 
         sm_row = find_row_by_label(oc_data, "s&m")
@@ -616,7 +596,6 @@ def verify_links(spreadsheet) -> Dict:
     for source_sheet, target_sheet, description in expected_links:
         try:
             ws = spreadsheet.worksheet(source_sheet)
-            rate_limit(0.3)
             formulas = ws.get("C1:M30", value_render_option="FORMULA")
 
             has_link = False
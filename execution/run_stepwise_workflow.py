@@ -86,6 +86,9 @@ def project_paths(project: str) -> Dict[str, Path]:
         "research": base / "research",
         "state": base / "notes" / "stage_state.json",
         "gate_state": base / "notes" / "local_sheet_gates.json",
+        # compiled-config results shared by the validate_config calls
+        "config_cache": base / "notes" / "config_cache",
+        "model_cache": base / "notes" / "model_cache",
     }
 
 
@@ -179,6 +182,8 @@ def stage_0_init(
                     "execution/validate_config.py",
                     "--config",
                     args.config,
+                    "--cache-dir",
+                    str(paths["config_cache"]),
                 ],
             )
         )
@@ -256,6 +261,8 @@ def stage_2_revenue_config(
                 "execution/validate_config.py",
                 "--config",
                 output_config,
+                "--cache-dir",
+                str(paths["config_cache"]),
             ],
         ),
     ]
@@ -271,7 +278,9 @@ def stage_2_revenue_config(
     }
 
 
-def stage_3_cost_validation(args: argparse.Namespace, execute: bool) -> Dict:
+def stage_3_cost_validation(
+    args: argparse.Namespace, paths: Dict[str, Path], execute: bool
+) -> Dict:
     if not args.config:
         raise RuntimeError("Stage 3 requires --config")
 
@@ -283,6 +292,8 @@ def stage_3_cost_validation(args: argparse.Namespace, execute: bool) -> Dict:
                 "execution/validate_config.py",
                 "--config",
                 args.config,
+                "--cache-dir",
+                str(paths["config_cache"]),
             ],
         )
     ]
@@ -393,6 +404,17 @@ def stage_5_signoff(
                 "Stage 5 local-first requires --local-model-path or Stage 4 local model artifact"
             )
 
+        commands.append(
+            CommandStep(
+                "Lint local model formulas",
+                [
+                    sys.executable,
+                    "execution/lint_formulas.py",
+                    "--file",
+                    local_model_path,
+                ],
+            )
+        )
         commands.append(
             CommandStep(
                 "Validate local Excel model",
@@ -402,6 +424,8 @@ def stage_5_signoff(
                     "--file",
                     local_model_path,
                     "--check-balance",
+                    "--cache-dir",
+                    str(paths["model_cache"]),
                 ],
             )
         )
@@ -620,7 +644,7 @@ def main() -> int:
         elif args.stage == "2":
             artifacts = stage_2_revenue_config(args, paths, args.execute)
         elif args.stage == "3":
-            artifacts = stage_3_cost_validation(args, args.execute)
+            artifacts = stage_3_cost_validation(args, paths, args.execute)
         elif args.stage == "4":
             artifacts = stage_4_build_model(args, paths, args.execute)
         else:
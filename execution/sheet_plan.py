@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+"""
+Sheet Plans and Streaming Writer for the Financial Model Builder
+================================================================
+
+A SheetPlan is a lightweight stand-in for an openpyxl Worksheet: it exposes
+the small API the FinancialModelBuilder `_build_*` methods use (`cell()`,
+`ws["A1"]`, `merge_cells()`, `column_dimensions`) and records each cell's
+value, number format and interned style indices, row by row.
+
+StreamingWorkbook lays each plan out into an xlsxwriter workbook opened in
+constant-memory mode. Rows are flushed to disk as soon as the builder moves
+past them and each sheet plan is discarded once written, so peak memory
+stays flat however many years, streams or departments the model has.
+
+Runs of adjacent cells in a row whose formulas differ only by the column
+shift (`=Assumptions!$B$17*Assumptions!D$18`, `...E$18`, ...) are written
+as one Excel shared formula (shared_formulas=True): the first cell carries
+the text and the range, the others just point at it. This shrinks the sheet
+XML and speeds up saving, but openpyxl expands shared formulas on load,
+which makes openpyxl loads about 2x slower, so it is off by default.
+
+Usage:
+    builder = FinancialModelBuilder(config, backend="streaming")
+    builder.build_all()
+    builder.save("model.xlsx")
+
+    python execution/build_financial_model.py --config config.json --streaming
+"""
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import weakref
+from collections import namedtuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import xlsxwriter
+    from xlsxwriter.utility import xl_rowcol_to_cell
+    from xlsxwriter.worksheet import Worksheet
+    from openpyxl.styles.cell_style import StyleArray
+    from openpyxl.utils import column_index_from_string
+    from openpyxl.utils.indexed_list import IndexedList
+except ImportError:
+    print("ERROR: xlsxwriter/openpyxl not installed. Run: pip install xlsxwriter openpyxl")
+    sys.exit(1)
+
+
+def _discard_workbook(xlsx, path: str):
+    """Close an unsaved xlsxwriter workbook (and its row temp files) and delete it."""
+    try:
+        xlsx.close()
+    except Exception:
+        pass  # a half-built workbook may not assemble; it is deleted anyway
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+_COORD_RE = re.compile(r"^\$?([A-Z]{1,3})\$?(\d+)$")
+
+
+def parse_coordinate(coord: str) -> Tuple[int, int]:
+    """'B12' -> (12, 2)"""
+    m = _COORD_RE.match(coord.upper())
+    if not m:
+        raise ValueError(f"Invalid cell coordinate: {coord}")
+    return int(m.group(2)), column_index_from_string(m.group(1))
+
+
+# =============================================================================
+# PLAN OBJECTS (openpyxl-compatible subset)
+# =============================================================================
+class PlanCell:
+    """One planned cell: value, number format and style table indices."""
+
+    __slots__ = ("parent", "row", "column", "value", "number_format", "_style")
+
+    def __init__(self, parent: "SheetPlan", row: int, column: int):
+        self.parent = parent
+        self.row = row
+        self.column = column
+        self.value: Any = None
+        self.number_format = "General"
+        self._style: Optional[StyleArray] = None
+
+    def _get(self, slot: int, table: str):
+        idx = self._style[slot] if self._style is not None else 0
+        return getattr(self.parent.parent, table)[idx]
+
+    def _set(self, slot: int, table: str, obj):
+        if self._style is None:
+            self._style = StyleArray()
+        self._style[slot] = getattr(self.parent.parent, table).add(obj)
+
+    font = property(
+        lambda self: self._get(0, "_fonts"), lambda self, v: self._set(0, "_fonts", v)
+    )
+    fill = property(
+        lambda self: self._get(1, "_fills"), lambda self, v: self._set(1, "_fills", v)
+    )
+    border = property(
+        lambda self: self._get(2, "_borders"),
+        lambda self, v: self._set(2, "_borders", v),
+    )
+    alignment = property(
+        lambda self: self._get(5, "_alignments"),
+        lambda self, v: self._set(5, "_alignments", v),
+    )
+
+
+class _ColumnDimension:
+    __slots__ = ("width",)
+
+    def __init__(self):
+        self.width: Optional[float] = None
+
+
+class _ColumnDimensions(dict):
+    def __missing__(self, key):
+        dim = self[key] = _ColumnDimension()
+        return dim
+
+
+class SheetPlan:
+    """Row-ordered cell plan for one sheet.
+
+    With `on_rows` set, every row before the highest row touched so far is
+    handed to the callback and dropped; touching a row that has already been
+    flushed raises, because the builder is expected to lay sheets out top to
+    bottom.
+    """
+
+    def __init__(self, parent: "WorkbookPlan", title: str, on_rows=None):
+        self.parent = parent
+        self.title = title
+        self.column_dimensions = _ColumnDimensions()
+        self.merged_ranges: List[Tuple[int, int, int, int]] = []
+        self._rows: Dict[int, Dict[int, PlanCell]] = {}
+        self._on_rows = on_rows
+        self._frontier = 0
+        self._flushed_through = 0
+        self.max_row = 0
+        self.max_column = 0
+
+    def cell(self, row: int, column: int) -> PlanCell:
+        if row <= self._flushed_through:
+            raise RuntimeError(
+                f"{self.title}: row {row} was already streamed; "
+                "sheets must be laid out top to bottom"
+            )
+        if row > self._frontier:
+            self._frontier = row
+            if self._on_rows is not None:
+                self.flush(before=row)
+        cells = self._rows.get(row)
+        if cells is None:
+            cells = self._rows[row] = {}
+        c = cells.get(column)
+        if c is None:
+            c = cells[column] = PlanCell(self, row, column)
+            self.max_row = max(self.max_row, row)
+            self.max_column = max(self.max_column, column)
+        return c
+
+    def __getitem__(self, coord: str) -> PlanCell:
+        return self.cell(*parse_coordinate(coord))
+
+    def merge_cells(self, range_string: str):
+        start, _, end = range_string.partition(":")
+        r1, c1 = parse_coordinate(start)
+        r2, c2 = parse_coordinate(end or start)
+        self.merged_ranges.append((r1, c1, r2, c2))
+
+    def iter_plan_rows(self) -> Iterator[Tuple[int, List[PlanCell]]]:
+        """Yield (row, cells ordered by column) for all buffered rows."""
+        for row in sorted(self._rows):
+            cells = self._rows[row]
+            yield row, [cells[c] for c in sorted(cells)]
+
+    def flush(self, before: Optional[int] = None):
+        """Hand buffered rows (< `before`, or all) to the row callback."""
+        ready = sorted(r for r in self._rows if before is None or r < before)
+        if not ready:
+            return
+        rows = [(r, [self._rows[r][c] for c in sorted(self._rows[r])]) for r in ready]
+        for r in ready:
+            del self._rows[r]
+        self._flushed_through = max(self._flushed_through, ready[-1])
+        self._on_rows(self, rows)
+
+
+class WorkbookPlan:
+    """Collection of SheetPlans sharing one set of interned style tables."""
+
+    def __init__(self):
+        self._sheets: Dict[str, SheetPlan] = {}
+        self._fonts = IndexedList([None])
+        self._fills = IndexedList([None])
+        self._borders = IndexedList([None])
+        self._alignments = IndexedList([None])
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return list(self._sheets)
+
+    def create_sheet(self, title: str) -> SheetPlan:
+        ws = self._sheets[title] = SheetPlan(self, title)
+        return ws
+
+    def __getitem__(self, title: str) -> SheetPlan:
+        return self._sheets[title]
+
+    def __contains__(self, title: str) -> bool:
+        return title in self._sheets
+
+
+# =============================================================================
+# XLSXWRITER TRANSLATION
+# =============================================================================
+def _rgb(color) -> Optional[str]:
+    rgb = getattr(color, "rgb", None)
+    if not isinstance(rgb, str):
+        return None
+    return f"#{rgb[-6:]}"
+
+
+class XlsxFormatCache:
+    """Maps plan style indices to (cached) xlsxwriter Format objects."""
+
+    def __init__(self, book: WorkbookPlan, xlsx: "xlsxwriter.Workbook"):
+        self.book = book
+        self.xlsx = xlsx
+        self._formats: Dict[tuple, Any] = {}
+
+    def get(self, cell: PlanCell):
+        style = tuple(cell._style) if cell._style is not None else None
+        key = (style, cell.number_format)
+        if key not in self._formats:
+            self._formats[key] = self._build(cell) if key != (None, "General") else None
+        return self._formats[key]
+
+    def _build(self, cell: PlanCell):
+        props: Dict[str, Any] = {}
+        if cell.number_format != "General":
+            props["num_format"] = cell.number_format
+        font, fill = cell.font, cell.fill
+        border, alignment = cell.border, cell.alignment
+        if font is not None:
+            if font.name:
+                props["font_name"] = font.name
+            if font.sz:
+                props["font_size"] = font.sz
+            if font.b:
+                props["bold"] = True
+            if font.i:
+                props["italic"] = True
+            if _rgb(font.color):
+                props["font_color"] = _rgb(font.color)
+        if fill is not None and fill.fill_type == "solid":
+            props["bg_color"] = _rgb(fill.fgColor)
+            props["pattern"] = 1
+        if border is not None and border.left is not None and border.left.style:
+            props["border"] = 1
+        if alignment is not None:
+            if alignment.horizontal:
+                props["align"] = alignment.horizontal
+            if alignment.vertical:
+                props["valign"] = {"center": "vcenter"}.get(
+                    alignment.vertical, alignment.vertical
+                )
+            if alignment.wrap_text:
+                props["text_wrap"] = True
+        return self.xlsx.add_format(props)
+
+
+def write_cell(ws, cell: PlanCell, fmt, value=None):
+    """Write one plan cell to an xlsxwriter worksheet (0-indexed)."""
+    r, c, v = cell.row - 1, cell.column - 1, cell.value
+    if isinstance(v, str) and v.startswith("="):
+        ws.write_formula(r, c, v, fmt, "" if value is None else value)
+    elif isinstance(v, bool):
+        ws.write_boolean(r, c, v, fmt)
+    elif isinstance(v, (int, float)):
+        ws.write_number(r, c, v, fmt)
+    elif isinstance(v, str) and v:
+        ws.write_string(r, c, v, fmt)
+    elif fmt is not None:
+        ws.write_blank(r, c, None, fmt)
+
+
+# =============================================================================
+# SHARED FORMULAS
+# =============================================================================
+# Quoted strings / sheet names (left alone) or an A1 reference
+_REF_RE = re.compile(
+    r"\"[^\"]*\"|'[^']*'"
+    r"|(?<![A-Za-z0-9_.$])(\$?)([A-Z]{1,3})(\$?\d+)(?![A-Za-z0-9_(!])"
+)
+
+SharedFormula = namedtuple("SharedFormula", "formula, format, value, si, ref")
+ERROR_CODES = ("#DIV/0!", "#N/A", "#NAME?", "#NULL!", "#NUM!", "#REF!", "#VALUE!")
+
+_FUNCTION_RE = re.compile(r"([A-Z][A-Z0-9._]*)\(")
+# (function name, expand_future_functions) -> xlsxwriter leaves it unchanged
+_PLAIN_FUNCTIONS: Dict[Tuple[str, bool], bool] = {}
+
+
+def relative_key(formula: str, column: int) -> str:
+    """Formula with relative column letters replaced by offsets from `column`.
+
+    Two cells in a row with the same key hold the same formula shifted
+    across, so they can share one formula.
+    """
+
+    def offset(m):
+        if m.group(2) is None or m.group(1):
+            return m.group(0)
+        return f"[{column_index_from_string(m.group(2)) - column}]{m.group(3)}"
+
+    return _REF_RE.sub(offset, formula)
+
+
+def shared_runs(cells: List[PlanCell], skip=()) -> Dict[int, Tuple[int, int]]:
+    """Group a row's formula cells into runs of column-shifted formulas.
+
+    Returns {column: (run start column, run end column)} for every cell in
+    a run of two or more adjacent cells with the same relative_key.
+    """
+    runs: Dict[int, Tuple[int, int]] = {}
+    run: List[int] = []
+    key = None
+
+    def close():
+        if len(run) > 1:
+            for col in run:
+                runs[col] = (run[0], run[-1])
+
+    for cell in cells:
+        v = cell.value
+        if not (isinstance(v, str) and v.startswith("=")) or (cell.row, cell.column) in skip:
+            close()
+            run, key = [], None
+            continue
+        k = relative_key(v, cell.column)
+        if run and k == key and cell.column == run[-1] + 1:
+            run.append(cell.column)
+        else:
+            close()
+            run, key = [cell.column], k
+    close()
+    return runs
+
+
+# xlsxwriter internals SharedFormulaWorksheet overrides or writes to
+# (tested against xlsxwriter 3.2.x; pinned in requirements.txt).
+_XLSXWRITER_INTERNALS = (
+    "_prepare_formula", "_write_cell", "_write_single_row", "_check_dimensions",
+    "_escape_data", "fh", "table", "previous_row", "constant_memory",
+)
+
+
+class SharedFormulaWorksheet(Worksheet):
+    """xlsxwriter Worksheet that can also write shared formula groups.
+
+    Relies on xlsxwriter internals (see _XLSXWRITER_INTERNALS); raises
+    instead of writing a broken file when an upgrade removes one.
+    """
+
+    def __init__(self):
+        super().__init__()
+        missing = [name for name in _XLSXWRITER_INTERNALS if not hasattr(self, name)]
+        if missing:
+            raise RuntimeError(
+                f"xlsxwriter {xlsxwriter.__version__} lacks {', '.join(missing)} "
+                "needed for shared formulas; install xlsxwriter 3.2.x"
+            )
+        self.shared_groups = 0
+
+    def _prepare_formula(self, formula, expand_future_functions=False):
+        # xlsxwriter runs ~40 regex rewrites (dynamic / future functions) on
+        # every formula; skip them when no function in it needs one.
+        for name in _FUNCTION_RE.findall(formula):
+            key = (name, expand_future_functions)
+            if key not in _PLAIN_FUNCTIONS:
+                probe = f"{name}()"
+                _PLAIN_FUNCTIONS[key] = (
+                    super()._prepare_formula(probe, expand_future_functions) == probe
+                )
+            if not _PLAIN_FUNCTIONS[key]:
+                return super()._prepare_formula(formula, expand_future_functions)
+        if formula.startswith("{"):
+            formula = formula[1:]
+        if formula.startswith("="):
+            formula = formula[1:]
+        if formula.endswith("}"):
+            formula = formula[:-1]
+        return formula
+
+    def write_shared_formula(
+        self, row: int, col: int, formula: Optional[str], cell_format=None,
+        si: int = 0, ref: Optional[str] = None, value="",
+    ) -> int:
+        """Write one cell of shared group `si` (0-indexed row/col).
+
+        The group's first cell passes the formula and its `ref` range
+        ("D5:M5"); the other cells pass formula=None.
+        """
+        if self._check_dimensions(row, col):
+            return -1
+        if formula is not None:
+            formula = self._prepare_formula(formula)
+        if self.constant_memory and row > self.previous_row:
+            self._write_single_row(row)
+        self.table[row][col] = SharedFormula(formula, cell_format, value, si, ref)
+        return 0
+
+    def _write_cell(self, row: int, col: int, cell) -> None:
+        if cell.__class__.__name__ != "SharedFormula":
+            super()._write_cell(row, col, cell)
+            return
+        attr = f' r="{xl_rowcol_to_cell(row, col)}"'
+        if cell.format:
+            attr += f' s="{cell.format._get_xf_index()}"'
+        value = cell.value
+        if isinstance(value, bool):
+            attr += ' t="b"'
+            value = int(value)
+        elif isinstance(value, str) and value:
+            attr += ' t="e"' if value in ERROR_CODES else ' t="str"'
+        if cell.ref:
+            formula = self._escape_data(cell.formula)
+            f = f'<f t="shared" ref="{cell.ref}" si="{cell.si}">{formula}</f>'
+        else:
+            f = f'<f t="shared" si="{cell.si}"/>'
+        v = "" if value is None or value == "" else f"<v>{self._escape_data(str(value))}</v>"
+        self.fh.write(f"<c{attr}>{f}{v}</c>")
+
+
+def merge_index(
+    plan: "SheetPlan",
+    start: int = 0,
+    anchors: Optional[Dict[Tuple[int, int], tuple]] = None,
+    covered: Optional[set] = None,
+) -> Tuple[Dict[Tuple[int, int], tuple], set]:
+    """Merge anchors -> range, and the covered (non-anchor) cells.
+
+    With `start`, only `plan.merged_ranges[start:]` are added to the given
+    `anchors` / `covered` (for indexing a sheet as it grows).
+    """
+    anchors = {} if anchors is None else anchors
+    covered = set() if covered is None else covered
+    for rng in plan.merged_ranges[start:]:
+        if (rng[0], rng[1]) in anchors:
+            continue
+        anchors[(rng[0], rng[1])] = rng
+        for r in range(rng[0], rng[2] + 1):
+            for c in range(rng[1], rng[3] + 1):
+                if (r, c) != (rng[0], rng[1]):
+                    covered.add((r, c))
+    return anchors, covered
+
+
+def write_plan_row(
+    ws, cells: List[PlanCell], formats: XlsxFormatCache, anchors, covered,
+    shared: bool = True, values: Optional[Dict[Tuple[int, int], Any]] = None,
+) -> Tuple[int, int]:
+    """Write one planned row; returns (cells written, formulas written).
+
+    With `shared` (and a SharedFormulaWorksheet), column-shifted formula
+    runs are written as shared formulas. `values` maps (row, column) to
+    the cached result written into each formula cell.
+    """
+    values = values or {}
+    runs = shared_runs(cells, skip=anchors) if shared else {}
+    written = formulas = 0
+    for cell in cells:
+        key = (cell.row, cell.column)
+        if key in covered:
+            continue
+        fmt = formats.get(cell)
+        rng = anchors.get(key)
+        run = runs.get(cell.column)
+        if rng is not None:
+            value = cell.value if cell.value is not None else ""
+            ws.merge_range(rng[0] - 1, rng[1] - 1, rng[2] - 1, rng[3] - 1, value, fmt)
+        elif run is not None:
+            r, c = cell.row - 1, cell.column - 1
+            if cell.column == run[0]:
+                ws.shared_groups += 1
+                ref = f"{xl_rowcol_to_cell(r, c)}:{xl_rowcol_to_cell(r, run[1] - 1)}"
+                ws.write_shared_formula(
+                    r, c, cell.value, fmt, ws.shared_groups - 1, ref, values.get(key, "")
+                )
+            else:
+                ws.write_shared_formula(
+                    r, c, None, fmt, ws.shared_groups - 1, value=values.get(key, "")
+                )
+        else:
+            write_cell(ws, cell, fmt, values.get(key))
+        written += 1
+        if isinstance(cell.value, str) and cell.value.startswith("="):
+            formulas += 1
+    return written, formulas
+
+
+# =============================================================================
+# STREAMING WORKBOOK
+# =============================================================================
+class StreamingWorkbook(WorkbookPlan):
+    """WorkbookPlan that streams each sheet into a constant-memory xlsxwriter
+    workbook while it is being built.
+
+    Sheets are written in creation order; a sheet plan is discarded once the
+    next sheet starts (or on save), so only the rows currently being laid out
+    are held in memory.
+    """
+
+    def __init__(self, shared_formulas: bool = False):
+        super().__init__()
+        self.shared_formulas = shared_formulas
+        fd, self._tmp_path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(fd)
+        self._xlsx = xlsxwriter.Workbook(self._tmp_path, {"constant_memory": True})
+        # Removes the temp file if the build fails before save() moves it
+        self._discard = weakref.finalize(self, _discard_workbook, self._xlsx, self._tmp_path)
+        self._formats = XlsxFormatCache(self, self._xlsx)
+        self._names: List[str] = []
+        self._current: Optional[SheetPlan] = None
+        self._worksheet = None
+        self._merged_anchor: Dict[Tuple[int, int], Tuple[int, int, int, int]] = {}
+        self._merged_skip: set = set()
+        self._merges_indexed = 0
+        self.cells_written = 0
+        self.formulas_written = 0
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return list(self._names)
+
+    def __contains__(self, title: str) -> bool:
+        return title in self._names
+
+    def create_sheet(self, title: str) -> SheetPlan:
+        self._finish_sheet()
+        self._names.append(title)
+        self._worksheet = self._xlsx.add_worksheet(
+            title, worksheet_class=SharedFormulaWorksheet
+        )
+        self._current = SheetPlan(self, title, on_rows=self._write_rows)
+        self._sheets = {title: self._current}
+        return self._current
+
+    def _write_rows(self, plan: SheetPlan, rows):
+        # Only the merges added since the last flush need indexing
+        merge_index(plan, self._merges_indexed, self._merged_anchor, self._merged_skip)
+        self._merges_indexed = len(plan.merged_ranges)
+        for _, cells in rows:
+            cells_written, formulas_written = write_plan_row(
+                self._worksheet, cells, self._formats,
+                self._merged_anchor, self._merged_skip, self.shared_formulas,
+            )
+            self.cells_written += cells_written
+            self.formulas_written += formulas_written
+
+    def _finish_sheet(self):
+        plan = self._current
+        if plan is None:
+            return
+        plan.flush()
+        for letter, dim in plan.column_dimensions.items():
+            if dim.width is not None:
+                col = column_index_from_string(letter) - 1
+                self._worksheet.set_column(col, col, dim.width)
+        self._current = None
+        self._sheets = {}
+        self._merged_anchor = {}
+        self._merged_skip = set()
+        self._merges_indexed = 0
+
+    def save(self, filepath: str):
+        self._finish_sheet()
+        self._xlsx.close()
+        shutil.move(self._tmp_path, filepath)
+        self._discard.detach()
+
+    def close(self):
+        """Discard an unsaved build and its temp file."""
+        self._discard()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sheets Batch - Record gspread writes and send them as a few batch calls
+
+BatchedSpreadsheet wraps a gspread Spreadsheet and stands in for it while a
+model is built. add_worksheet(), Worksheet.update(), format(), batch_format()
+and the gspread_formatting helpers (which all end in
+`worksheet.spreadsheet.batch_update`) are recorded instead of sent. commit()
+then pushes everything in three phases, each split at payload limits:
+
+    1. spreadsheets.batchUpdate   addSheet for every new sheet
+    2. values.batchUpdate         every update(), grouped by input option
+    3. spreadsheets.batchUpdate   repeatCell / dimension / merge / deleteSheet
+
+Values go before formats so USER_ENTERED parsing never overrides an explicit
+number format, the same order the per-call code used. A batchUpdate is
+atomic; if one chunk is rejected, its requests are resent one at a time and
+failures are reported as warnings, as the per-call try/except blocks did.
+
+Usage:
+    from sheets_batch import BatchedSpreadsheet
+
+    batch = BatchedSpreadsheet(spreadsheet)
+    builder = FinancialModelBuilder(batch, config)
+    builder.build_all_sheets()
+    stats = batch.commit()      # {"api_calls": 3, "requests": 412, ...}
+
+write_changed_cells() is the counterpart for an existing (copied) workbook:
+one values.batchGet, a diff against the wanted cells, and one
+values.batchUpdate with only the cells that changed.
+
+    targets = {("Assumptions", "C4"): 0.25, ("Assumptions", "A15"): "Rent: Price"}
+    write_changed_cells(spreadsheet, targets)   # {"read_calls": 1, "write_calls": 1, ...}
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from gspread.utils import a1_range_to_grid_range, a1_to_rowcol, rowcol_to_a1
+
+# Google recommends keeping request payloads under 2 MB
+MAX_BATCH_BYTES = 2 * 1024 * 1024
+MAX_BATCH_REQUESTS = 1000
+
+
+def chunked(
+    items: Iterable[Any],
+    max_bytes: int = MAX_BATCH_BYTES,
+    max_items: int = MAX_BATCH_REQUESTS,
+) -> Iterator[List[Any]]:
+    """Split items into lists under `max_bytes` of JSON and `max_items` each.
+
+    An item larger than `max_bytes` on its own is sent alone.
+    """
+    chunk: List[Any] = []
+    size = 0
+    for item in items:
+        item_size = len(json.dumps(item, separators=(",", ":"), default=str)) + 1
+        if chunk and (size + item_size > max_bytes or len(chunk) >= max_items):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(item)
+        size += item_size
+    if chunk:
+        yield chunk
+
+
+def _quote(title: str) -> str:
+    return "'" + title.replace("'", "''") + "'"
+
+
+class BatchedWorksheet:
+    """Worksheet stand-in that records values and formats for its sheet."""
+
+    def __init__(self, spreadsheet: "BatchedSpreadsheet", title: str, sheet_id: int,
+                 rows: int, cols: int):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = sheet_id
+        self.row_count = rows
+        self.col_count = cols
+        self._grid: Dict[Tuple[int, int], Any] = {}
+
+    def update(
+        self,
+        values: Optional[List[List[Any]]] = None,
+        range_name: Optional[str] = None,
+        value_input_option: str = "RAW",
+        **kwargs,
+    ):
+        range_name = range_name or "A1"
+        self.spreadsheet.values.append(
+            (value_input_option, {"range": f"{_quote(self.title)}!{range_name}", "values": values or []})
+        )
+        start = a1_range_to_grid_range(range_name)
+        r0, c0 = start.get("startRowIndex", 0), start.get("startColumnIndex", 0)
+        for r, row in enumerate(values or []):
+            for c, value in enumerate(row):
+                self._grid[(r0 + r, c0 + c)] = value
+
+    def batch_format(self, formats: List[Dict[str, Any]]):
+        self.spreadsheet.requests.extend(
+            {
+                "repeatCell": {
+                    "range": a1_range_to_grid_range(f["range"], self.id),
+                    "cell": {"userEnteredFormat": f["format"]},
+                    "fields": "userEnteredFormat(%s)" % ",".join(f["format"].keys()),
+                }
+            }
+            for f in formats
+        )
+
+    def format(self, ranges: Union[List[str], str], format: Dict[str, Any]):
+        range_list = ranges if isinstance(ranges, list) else [ranges]
+        self.batch_format([{"range": r, "format": format} for r in range_list])
+
+    def get_all_values(self) -> List[List[str]]:
+        """Recorded values as text (formulas are not evaluated)."""
+        if not self._grid:
+            return []
+        rows = max(r for r, _ in self._grid) + 1
+        cols = max(c for _, c in self._grid) + 1
+        grid = [[""] * cols for _ in range(rows)]
+        for (r, c), value in self._grid.items():
+            grid[r][c] = "" if value is None else str(value)
+        return grid
+
+
+class BatchedSpreadsheet:
+    """Spreadsheet stand-in: records requests until commit()."""
+
+    def __init__(self, spreadsheet, max_bytes: int = MAX_BATCH_BYTES,
+                 max_requests: int = MAX_BATCH_REQUESTS):
+        self.spreadsheet = spreadsheet
+        self.id = spreadsheet.id
+        self.max_bytes = max_bytes
+        self.max_requests = max_requests
+        self.sheets: List[Dict[str, Any]] = []  # addSheet requests
+        self.values: List[Tuple[str, Dict[str, Any]]] = []  # (input option, ValueRange)
+        self.requests: List[Dict[str, Any]] = []  # formats, dimensions, deletes
+        self.deletes: List[Dict[str, Any]] = []
+        self._added: Dict[str, BatchedWorksheet] = {}
+        self._existing = None
+        self._next_id = None
+
+    def _existing_sheets(self):
+        if self._existing is None:
+            self._existing = {ws.title: ws for ws in self.spreadsheet.worksheets()}
+            self._next_id = max((ws.id for ws in self._existing.values()), default=0) + 1
+        return self._existing
+
+    def add_worksheet(self, title: str, rows: int, cols: int, index: Optional[int] = None):
+        self._existing_sheets()
+        properties = {
+            "title": title,
+            "sheetId": self._next_id,
+            "gridProperties": {"rowCount": rows, "columnCount": cols},
+        }
+        if index is not None:
+            properties["index"] = index
+        self.sheets.append({"addSheet": {"properties": properties}})
+        ws = BatchedWorksheet(self, title, self._next_id, rows, cols)
+        self._added[title] = ws
+        self._next_id += 1
+        return ws
+
+    def worksheet(self, title: str):
+        if title in self._added:
+            return self._added[title]
+        existing = self._existing_sheets()
+        if title not in existing:
+            return self.spreadsheet.worksheet(title)  # raises WorksheetNotFound
+        return existing[title]
+
+    def worksheets(self):
+        return list(self._existing_sheets().values()) + list(self._added.values())
+
+    def del_worksheet(self, worksheet):
+        self.deletes.append({"deleteSheet": {"sheetId": worksheet.id}})
+
+    def batch_update(self, body: Dict[str, Any]):
+        """Called by gspread_formatting helpers; recorded for commit()."""
+        self.requests.extend(body.get("requests", []))
+        return {"replies": []}
+
+    @property
+    def pending(self) -> int:
+        return len(self.sheets) + len(self.values) + len(self.requests) + len(self.deletes)
+
+    # ------------------------------------------------------------------
+    # COMMIT
+    # ------------------------------------------------------------------
+    def _send_requests(self, requests: List[Dict[str, Any]], stats: Dict[str, Any],
+                       fallback: bool):
+        for chunk in chunked(requests, self.max_bytes, self.max_requests):
+            stats["api_calls"] += 1
+            try:
+                self.spreadsheet.batch_update({"requests": chunk})
+            except Exception as e:
+                if not fallback or len(chunk) == 1:
+                    raise
+                print(f"    Warning: batch of {len(chunk)} requests rejected ({e}); "
+                      f"resending one at a time")
+                for request in chunk:
+                    stats["api_calls"] += 1
+                    try:
+                        self.spreadsheet.batch_update({"requests": [request]})
+                    except Exception as single:
+                        stats["failed"] += 1
+                        print(f"    Warning: {next(iter(request))} failed: {single}")
+
+    def commit(self) -> Dict[str, Any]:
+        """Send everything recorded; returns call/request counts."""
+        stats = {
+            "api_calls": 0,
+            "requests": len(self.sheets) + len(self.requests) + len(self.deletes),
+            "value_ranges": len(self.values),
+            "failed": 0,
+        }
+        if self.sheets:
+            self._send_requests(self.sheets, stats, fallback=False)
+
+        by_option: Dict[str, List[Dict[str, Any]]] = {}
+        for option, value_range in self.values:
+            by_option.setdefault(option, []).append(value_range)
+        for option, ranges in by_option.items():
+            for chunk in chunked(ranges, self.max_bytes, self.max_requests):
+                stats["api_calls"] += 1
+                self.spreadsheet.values_batch_update(
+                    {"valueInputOption": option, "data": chunk}
+                )
+
+        if self.requests or self.deletes:
+            self._send_requests(self.requests + self.deletes, stats, fallback=True)
+
+        self.sheets, self.values, self.requests, self.deletes = [], [], [], []
+        return stats
+
+
+def _same_value(current: Any, target: Any) -> bool:
+    """Whether a cell read with FORMULA rendering already holds `target`."""
+    if target is None:
+        target = ""
+    if isinstance(target, bool) or isinstance(current, bool):
+        return str(current).upper() == str(target).upper()
+    if isinstance(target, (int, float)) and current not in ("", None):
+        try:
+            return float(current) == float(target)
+        except (TypeError, ValueError):
+            return False
+    return str(current) == str(target)
+
+
+def write_changed_cells(
+    spreadsheet,
+    targets: Dict[Tuple[str, str], Any],
+    value_input_option: str = "USER_ENTERED",
+    max_bytes: int = MAX_BATCH_BYTES,
+) -> Dict[str, int]:
+    """Write only the cells whose value differs from `targets`.
+
+    `targets` maps (sheet title, A1 cell) to the wanted value. The current
+    values of every sheet are read in one values.batchGet (A1 through the
+    furthest target cell, formulas unrendered) and every changed cell is
+    sent in one values.batchUpdate (split only past `max_bytes`). A sheet
+    the read cannot find is skipped with a warning.
+    """
+    by_sheet: Dict[str, Dict[Tuple[int, int], Any]] = {}
+    for (title, cell), value in targets.items():
+        by_sheet.setdefault(title, {})[a1_to_rowcol(cell)] = value
+
+    def read_range(title: str) -> str:
+        cells = by_sheet[title]
+        last = rowcol_to_a1(max(r for r, _ in cells), max(c for _, c in cells))
+        return f"{_quote(title)}!A1:{last}"
+
+    stats = {"read_calls": 1, "write_calls": 0, "cells": len(targets), "changed": 0}
+    params = {"valueRenderOption": "FORMULA"}
+    titles = list(by_sheet)
+    grids: Dict[str, List[List[Any]]] = {}
+    try:
+        response = spreadsheet.values_batch_get([read_range(t) for t in titles], params=params)
+        for title, value_range in zip(titles, response.get("valueRanges", [])):
+            grids[title] = value_range.get("values", [])
+    except Exception:
+        # One missing sheet fails the whole batchGet; read them one by one
+        for title in titles:
+            stats["read_calls"] += 1
+            try:
+                response = spreadsheet.values_batch_get([read_range(title)], params=params)
+                grids[title] = response["valueRanges"][0].get("values", [])
+            except Exception as e:
+                print(f"    ⚠ Skipping sheet '{title}': {e}")
+
+    data = []
+    for title, grid in grids.items():
+        for (row, col), value in by_sheet[title].items():
+            cells = grid[row - 1] if row <= len(grid) else []
+            current = cells[col - 1] if col <= len(cells) else ""
+            if not _same_value(current, value):
+                data.append({"range": f"{_quote(title)}!{rowcol_to_a1(row, col)}", "values": [[value]]})
+
+    stats["changed"] = len(data)
+    for chunk in chunked(data, max_bytes, max_items=max(len(data), 1)):
+        stats["write_calls"] += 1
+        spreadsheet.values_batch_update({"valueInputOption": value_input_option, "data": chunk})
+    return stats
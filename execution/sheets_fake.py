@@ -0,0 +1,919 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sheets Fake - In-process Google Sheets / Drive stand-in for offline runs
+
+FakeGoogleAPI keeps spreadsheets as in-memory grids and answers the REST
+calls gspread and googleapiclient make, so the Google-facing scripts can run
+without credentials or network:
+
+- Sheets v4: spreadsheets get / create / batchUpdate (addSheet, deleteSheet,
+  duplicateSheet, updateSheetProperties, append/insert/deleteDimension,
+  updateCells values;
+  formatting requests are accepted and counted), values get / update /
+  append / clear / batchGet / batchUpdate / batchClear
+- Drive v3: files create / copy / get / list / update / delete, permissions
+
+Every request is counted by method. Sheets reads, Sheets writes and Drive
+calls each have a rolling per-minute quota (HTTP 429 when spent) and a
+latency. With a VirtualClock, latencies and the limiter's waits advance
+simulated time instead of sleeping, so a benchmark finishes instantly and
+reports the wall time the run would take against the real API.
+
+Formulas are stored, not calculated: value reads return the formula text.
+
+Usage:
+    from sheets_fake import FakeGoogleAPI, VirtualClock
+
+    fake = FakeGoogleAPI(clock=VirtualClock())
+    template_id = fake.load_workbook("10_Year_Financial_Model_Template.xlsx")
+    with fake.install():                 # gspread + googleapiclient -> fake
+        client = authorize(creds)        # any Credentials object
+        ...
+    print(fake.summary())                # requests by method, simulated time
+
+    python sheets_fake.py --benchmark                    # all scenarios
+    python sheets_fake.py --benchmark --scenarios template snapshot --json
+    python sheets_fake.py --benchmark --real-time --latency-scale 0.1
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import itertools
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from gspread.utils import a1_range_to_grid_range, rowcol_to_a1
+
+# Rolling per-minute quotas (per user)
+READS_PER_MINUTE = 60
+WRITES_PER_MINUTE = 60
+DRIVE_PER_MINUTE = 1000
+
+# Seconds per request; keys are request kinds or method names
+LATENCY = {
+    "read": 0.15,
+    "write": 0.30,
+    "drive": 0.40,
+    "drive.files.copy": 2.0,
+}
+
+SPREADSHEET_MIME = "application/vnd.google-apps.spreadsheet"
+DEFAULT_ROWS = 1000
+DEFAULT_COLS = 26
+
+
+# =============================================================================
+# CLOCK AND RESPONSES
+# =============================================================================
+class VirtualClock:
+    """Monotonic clock that only moves when something sleeps on it."""
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            with self._lock:
+                self.now += seconds
+
+
+class FakeResponse:
+    """Enough of requests.Response for gspread."""
+
+    def __init__(self, status: int, body: Any = None, headers: Optional[Dict[str, str]] = None):
+        self.status_code = status
+        self.ok = status < 400
+        self.reason = "OK" if self.ok else "Error"
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.text = json.dumps(body if body is not None else {})
+        self.content = self.text.encode("utf-8")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeAPIError(Exception):
+    """Raised inside a handler; becomes a Google-style error response."""
+
+    STATUS = {400: "INVALID_ARGUMENT", 404: "NOT_FOUND", 429: "RESOURCE_EXHAUSTED"}
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+    def response(self) -> FakeResponse:
+        return FakeResponse(
+            self.code,
+            {"error": {"code": self.code, "message": self.message,
+                       "status": self.STATUS.get(self.code, "UNKNOWN")}},
+        )
+
+
+# =============================================================================
+# STORAGE
+# =============================================================================
+class FakeSheet:
+    def __init__(self, sheet_id: int, title: str, rows: int = DEFAULT_ROWS,
+                 cols: int = DEFAULT_COLS):
+        self.id = sheet_id
+        self.title = title
+        self.rows = rows
+        self.cols = cols
+        self.cells: Dict[Tuple[int, int], Any] = {}  # 0-based (row, col) -> value
+
+    def properties(self, index: int) -> Dict[str, Any]:
+        return {
+            "sheetId": self.id,
+            "title": self.title,
+            "index": index,
+            "sheetType": "GRID",
+            "gridProperties": {"rowCount": self.rows, "columnCount": self.cols},
+        }
+
+    def grid(self, r0=0, r1=None, c0=0, c1=None) -> List[List[Any]]:
+        """Values in [r0, r1) x [c0, c1), trailing empties trimmed like the API."""
+        r1 = self.rows if r1 is None else r1
+        c1 = self.cols if c1 is None else c1
+        rows: Dict[int, Dict[int, Any]] = {}
+        for (r, c), value in self.cells.items():
+            if r0 <= r < r1 and c0 <= c < c1:
+                rows.setdefault(r - r0, {})[c - c0] = value
+        if not rows:
+            return []
+        out = []
+        for r in range(max(rows) + 1):
+            row = rows.get(r, {})
+            out.append([row.get(c, "") for c in range(max(row) + 1)] if row else [])
+        return out
+
+
+class FakeFile:
+    def __init__(self, file_id: str, name: str, mime_type: str = SPREADSHEET_MIME,
+                 parents: Optional[List[str]] = None):
+        self.id = file_id
+        self.name = name
+        self.mime_type = mime_type
+        self.parents = list(parents or [])
+        self.sheets: List[FakeSheet] = []
+
+    def metadata(self) -> Dict[str, Any]:
+        return {"kind": "drive#file", "id": self.id, "name": self.name,
+                "mimeType": self.mime_type, "parents": self.parents,
+                "createdTime": "2026-01-01T00:00:00.000Z",
+                "modifiedTime": "2026-01-01T00:00:00.000Z"}
+
+    def sheet(self, title: Optional[str] = None, sheet_id: Optional[int] = None) -> FakeSheet:
+        for sheet in self.sheets:
+            if (title is not None and sheet.title == title) or (
+                sheet_id is not None and sheet.id == sheet_id
+            ):
+                return sheet
+        if title is not None:
+            raise FakeAPIError(400, f"Unable to parse range: {title}")
+        raise FakeAPIError(400, f"No grid with id: {sheet_id}")
+
+
+# =============================================================================
+# VALUE CONVERSION
+# =============================================================================
+_NUMBER_RE = re.compile(r"^[-+]?\$?[\d,]*\.?\d+(?:[eE][-+]?\d+)?%?$")
+
+
+def parse_user_entered(value: Any) -> Any:
+    """What Sheets stores for a USER_ENTERED value (numbers, %, booleans)."""
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    if text.upper() in ("TRUE", "FALSE"):
+        return text.upper() == "TRUE"
+    if text and _NUMBER_RE.match(text) and any(ch.isdigit() for ch in text):
+        number = float(text.replace("$", "").replace(",", "").rstrip("%"))
+        if text.endswith("%"):
+            return number / 100
+        return int(number) if number.is_integer() and "." not in text else number
+    return value
+
+
+def render(value: Any, option: str) -> Any:
+    """Cell value as returned for a valueRenderOption."""
+    if option in ("FORMULA", "UNFORMATTED_VALUE"):
+        return value
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _split_range(range_name: str) -> Tuple[Optional[str], Optional[str]]:
+    """'Sheet'!A1:B2 -> ("Sheet", "A1:B2"); bare titles and bare A1 allowed."""
+    if range_name.startswith("'"):
+        end = 1
+        while True:
+            end = range_name.index("'", end)
+            if range_name[end + 1:end + 2] == "'":
+                end += 2
+                continue
+            break
+        title = range_name[1:end].replace("''", "'")
+        rest = range_name[end + 1:]
+        return title, rest[1:] if rest.startswith("!") else None
+    if "!" in range_name:
+        title, a1 = range_name.rsplit("!", 1)
+        return title, a1
+    return None, range_name
+
+
+# =============================================================================
+# FAKE SERVICE
+# =============================================================================
+class FakeGoogleAPI:
+    """In-memory Sheets/Drive backend with quotas, latencies and counters."""
+
+    _read_methods = {"sheets.spreadsheets.get", "sheets.values.get", "sheets.values.batchGet"}
+
+    def __init__(
+        self,
+        reads_per_minute: int = READS_PER_MINUTE,
+        writes_per_minute: int = WRITES_PER_MINUTE,
+        drive_per_minute: int = DRIVE_PER_MINUTE,
+        latency: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
+    ):
+        self.quotas = {"read": reads_per_minute, "write": writes_per_minute,
+                       "drive": drive_per_minute}
+        self.latency = dict(LATENCY if latency is None else latency)
+        self.clock = clock
+        self.sleep = sleep or getattr(clock, "sleep", time.sleep)
+        self.virtual = isinstance(clock, VirtualClock)
+        self.files: Dict[str, FakeFile] = {}
+        self.counts: Counter = Counter()
+        self.throttled = 0
+        self._windows = {kind: deque() for kind in self.quotas}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._started = clock()
+
+    # ------------------------------------------------------------------
+    # SEEDING AND INSPECTION
+    # ------------------------------------------------------------------
+    def _new_id(self) -> str:
+        return f"fake{next(self._ids):04d}"
+
+    def add_spreadsheet(self, title: str, sheets: Optional[Dict[str, List[List[Any]]]] = None,
+                        spreadsheet_id: Optional[str] = None) -> str:
+        """Seed a spreadsheet from {sheet title: rows}; returns its id."""
+        file = FakeFile(spreadsheet_id or self._new_id(), title)
+        for index, (name, rows) in enumerate((sheets or {"Sheet1": []}).items()):
+            sheet = FakeSheet(index, name,
+                              max(DEFAULT_ROWS, len(rows)),
+                              max([DEFAULT_COLS] + [len(r) for r in rows]))
+            for r, row in enumerate(rows):
+                for c, value in enumerate(row):
+                    if value not in ("", None):
+                        sheet.cells[(r, c)] = value
+            file.sheets.append(sheet)
+        self.files[file.id] = file
+        return file.id
+
+    def load_workbook(self, workbook, spreadsheet_id: Optional[str] = None,
+                      title: Optional[str] = None) -> str:
+        """Seed a spreadsheet from an openpyxl Workbook or .xlsx path."""
+        if isinstance(workbook, (str, os.PathLike)):
+            from openpyxl import load_workbook
+
+            title = title or os.path.splitext(os.path.basename(workbook))[0]
+            workbook = load_workbook(workbook)
+        sheets = {
+            ws.title: [list(row) for row in ws.iter_rows(values_only=True)]
+            for ws in workbook.worksheets
+        }
+        return self.add_spreadsheet(title or "Workbook", sheets, spreadsheet_id)
+
+    def values(self, spreadsheet_id: str, title: str) -> List[List[Any]]:
+        """Stored grid of one sheet (formulas as text)."""
+        return self.files[spreadsheet_id].sheet(title).grid()
+
+    @property
+    def requests(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def elapsed(self) -> float:
+        return self.clock() - self._started
+
+    def reset_counts(self):
+        with self._lock:
+            self.counts.clear()
+            self.throttled = 0
+            self._started = self.clock()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "sheets_reads": sum(n for m, n in self.counts.items() if m.startswith("sheets.") and
+                                m in self._read_methods),
+            "sheets_writes": sum(n for m, n in self.counts.items() if m.startswith("sheets.") and
+                                 m not in self._read_methods),
+            "drive": sum(n for m, n in self.counts.items() if m.startswith("drive.")),
+            "throttled": self.throttled,
+            "elapsed_s": round(self.elapsed, 2),
+            "by_method": dict(sorted(self.counts.items())),
+        }
+
+    def summary(self) -> str:
+        s = self.stats()
+        return (
+            f"{s['requests']} requests ({s['sheets_reads']} Sheets reads, "
+            f"{s['sheets_writes']} Sheets writes, {s['drive']} Drive), "
+            f"{s['throttled']} throttled, {s['elapsed_s']:.1f}s"
+            + (" simulated" if self.virtual else "")
+        )
+
+    # ------------------------------------------------------------------
+    # TRANSPORT
+    # ------------------------------------------------------------------
+    def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                body: Any = None, data: Any = None) -> FakeResponse:
+        """Handle one HTTP request the way the Google APIs would."""
+        method = method.upper()
+        parts = urlsplit(url)
+        query: Dict[str, Any] = {k: v if len(v) > 1 else v[0]
+                                 for k, v in parse_qs(parts.query).items()}
+        for key, value in (params or {}).items():
+            query[key] = value
+        if body is None and data:
+            body = json.loads(data.decode() if isinstance(data, bytes) else data)
+
+        try:
+            name, handler, args = self._route(method, parts.netloc, parts.path)
+        except FakeAPIError as e:
+            return e.response()
+        kind = "drive" if name.startswith("drive.") else (
+            "read" if name in self._read_methods else "write")
+
+        self.sleep(self.latency.get(name, self.latency.get(kind, 0.0)))
+        with self._lock:
+            self.counts[name] += 1
+            window = self._windows[kind]
+            now = self.clock()
+            while window and window[0] <= now - 60:
+                window.popleft()
+            if len(window) >= self.quotas[kind]:
+                self.throttled += 1
+                return FakeAPIError(
+                    429, f"Quota exceeded for quota metric '{kind} requests' per minute per user"
+                ).response()
+            window.append(now)
+            try:
+                return FakeResponse(200, handler(*args, query=query, body=body or {}))
+            except FakeAPIError as e:
+                return e.response()
+
+    _SHEETS_ROUTES = [
+        ("GET", r"/v4/spreadsheets/([^/:]+)", "sheets.spreadsheets.get", "_get_spreadsheet"),
+        ("POST", r"/v4/spreadsheets", "sheets.spreadsheets.create", "_create_spreadsheet"),
+        ("POST", r"/v4/spreadsheets/([^/:]+):batchUpdate", "sheets.spreadsheets.batchUpdate",
+         "_batch_update"),
+        ("GET", r"/v4/spreadsheets/([^/:]+)/values:batchGet", "sheets.values.batchGet",
+         "_values_batch_get"),
+        ("POST", r"/v4/spreadsheets/([^/:]+)/values:batchGet", "sheets.values.batchGet",
+         "_values_batch_get"),
+        ("POST", r"/v4/spreadsheets/([^/:]+)/values:batchUpdate", "sheets.values.batchUpdate",
+         "_values_batch_update"),
+        ("POST", r"/v4/spreadsheets/([^/:]+)/values:batchClear", "sheets.values.batchClear",
+         "_values_batch_clear"),
+        ("POST", r"/v4/spreadsheets/([^/:]+)/values/(.+):clear", "sheets.values.clear",
+         "_values_clear"),
+        ("POST", r"/v4/spreadsheets/([^/:]+)/values/(.+):append", "sheets.values.append",
+         "_values_append"),
+        ("GET", r"/v4/spreadsheets/([^/:]+)/values/(.+)", "sheets.values.get", "_values_get"),
+        ("PUT", r"/v4/spreadsheets/([^/:]+)/values/(.+)", "sheets.values.update",
+         "_values_update"),
+    ]
+    _DRIVE_ROUTES = [
+        ("POST", r"/drive/v3/files", "drive.files.create", "_drive_create"),
+        ("GET", r"/drive/v3/files", "drive.files.list", "_drive_list"),
+        ("POST", r"/drive/v3/files/([^/]+)/copy", "drive.files.copy", "_drive_copy"),
+        ("POST", r"/drive/v3/files/([^/]+)/permissions", "drive.permissions.create",
+         "_drive_permission"),
+        ("GET", r"/drive/v3/files/([^/]+)", "drive.files.get", "_drive_get"),
+        ("PATCH", r"/drive/v3/files/([^/]+)", "drive.files.update", "_drive_update"),
+        ("DELETE", r"/drive/v3/files/([^/]+)", "drive.files.delete", "_drive_delete"),
+    ]
+
+    def _route(self, method: str, host: str, path: str):
+        routes = self._SHEETS_ROUTES if "sheets.googleapis.com" in host else self._DRIVE_ROUTES
+        for route_method, pattern, name, handler in routes:
+            match = re.fullmatch(pattern, path)
+            if match and route_method == method:
+                return name, getattr(self, handler), [unquote(g) for g in match.groups()]
+        raise FakeAPIError(404, f"No fake handler for {method} {host}{path}")
+
+    def _file(self, file_id: str, spreadsheet: bool = True) -> FakeFile:
+        file = self.files.get(file_id)
+        if file is None or (spreadsheet and file.mime_type != SPREADSHEET_MIME):
+            raise FakeAPIError(404, "Requested entity was not found.")
+        return file
+
+    def _resolve(self, file: FakeFile, range_name: str):
+        """Range -> (sheet, r0, r1, c0, c1), 0-based, end exclusive."""
+        title, a1 = _split_range(range_name)
+        if title is None and a1 and any(s.title == a1 for s in file.sheets):
+            title, a1 = a1, None
+        sheet = file.sheet(title) if title is not None else file.sheets[0]
+        if not a1:
+            return sheet, 0, sheet.rows, 0, sheet.cols
+        try:
+            grid = a1_range_to_grid_range(a1)
+        except Exception:
+            raise FakeAPIError(400, f"Unable to parse range: {range_name}")
+        return (sheet, grid.get("startRowIndex", 0), grid.get("endRowIndex", sheet.rows),
+                grid.get("startColumnIndex", 0), grid.get("endColumnIndex", sheet.cols))
+
+    @staticmethod
+    def _a1(sheet: FakeSheet, r0: int, r1: int, c0: int, c1: int) -> str:
+        title = "'" + sheet.title.replace("'", "''") + "'"
+        return f"{title}!{rowcol_to_a1(r0 + 1, c0 + 1)}:{rowcol_to_a1(r1, c1)}"
+
+    # ------------------------------------------------------------------
+    # SHEETS: SPREADSHEETS
+    # ------------------------------------------------------------------
+    def _spreadsheet_json(self, file: FakeFile) -> Dict[str, Any]:
+        return {
+            "spreadsheetId": file.id,
+            "properties": {"title": file.name, "locale": "en_US", "timeZone": "Etc/GMT",
+                           "autoRecalc": "ON_CHANGE"},
+            "sheets": [{"properties": s.properties(i)} for i, s in enumerate(file.sheets)],
+            "spreadsheetUrl": f"https://docs.google.com/spreadsheets/d/{file.id}/edit",
+        }
+
+    def _get_spreadsheet(self, spreadsheet_id, query, body):
+        return self._spreadsheet_json(self._file(spreadsheet_id))
+
+    def _create_spreadsheet(self, query, body):
+        title = body.get("properties", {}).get("title", "Untitled spreadsheet")
+        return self._spreadsheet_json(self.files[self.add_spreadsheet(title)])
+
+    def _batch_update(self, spreadsheet_id, query, body):
+        file = self._file(spreadsheet_id)
+        staged = copy.deepcopy(file.sheets)  # batchUpdate is atomic
+        replies = []
+        for i, request in enumerate(body.get("requests", [])):
+            try:
+                replies.append(self._apply(staged, request))
+            except FakeAPIError as e:
+                raise FakeAPIError(400, f"Invalid requests[{i}]: {e.message}")
+        file.sheets = staged
+        return {"spreadsheetId": spreadsheet_id, "replies": replies}
+
+    def _apply(self, sheets: List[FakeSheet], request: Dict[str, Any]) -> Dict[str, Any]:
+        kind, spec = next(iter(request.items()))
+        by_id = {s.id: s for s in sheets}
+
+        def sheet(sheet_id):
+            if sheet_id not in by_id:
+                raise FakeAPIError(400, f"No grid with id: {sheet_id}")
+            return by_id[sheet_id]
+
+        if kind in ("addSheet", "duplicateSheet"):
+            if kind == "addSheet":
+                props = spec.get("properties", {})
+                grid = props.get("gridProperties", {})
+                new = FakeSheet(props.get("sheetId", max(by_id, default=-1) + 1),
+                                props.get("title", f"Sheet{len(sheets) + 1}"),
+                                grid.get("rowCount", DEFAULT_ROWS),
+                                grid.get("columnCount", DEFAULT_COLS))
+                index = props.get("index", len(sheets))
+            else:
+                new = copy.deepcopy(sheet(spec["sourceSheetId"]))
+                new.id = spec.get("newSheetId", max(by_id) + 1)
+                new.title = spec.get("newSheetName", f"Copy of {new.title}")
+                index = spec.get("insertSheetIndex", len(sheets))
+            if new.id in by_id:
+                raise FakeAPIError(400, f"Sheet with id {new.id} already exists")
+            if any(s.title == new.title for s in sheets):
+                raise FakeAPIError(400, f'A sheet with the name "{new.title}" already exists')
+            sheets.insert(index, new)
+            return {kind: {"properties": new.properties(sheets.index(new))}}
+
+        if kind == "deleteSheet":
+            target = sheet(spec["sheetId"])
+            if len(sheets) == 1:
+                raise FakeAPIError(400, "You can't remove all the sheets in a document.")
+            sheets.remove(target)
+            return {}
+
+        if kind == "updateSheetProperties":
+            props = spec["properties"]
+            target = sheet(props["sheetId"])
+            target.title = props.get("title", target.title)
+            grid = props.get("gridProperties", {})
+            target.rows = grid.get("rowCount", target.rows)
+            target.cols = grid.get("columnCount", target.cols)
+            if "index" in props:
+                sheets.remove(target)
+                sheets.insert(props["index"], target)
+            return {}
+
+        if kind in ("appendDimension", "insertDimension", "deleteDimension"):
+            rng = spec if kind == "appendDimension" else spec["range"]
+            target = sheet(rng["sheetId"])
+            rows = rng["dimension"] == "ROWS"
+            if kind == "appendDimension":
+                start, count = (target.rows if rows else target.cols), spec["length"]
+            else:
+                start, count = rng["startIndex"], rng["endIndex"] - rng["startIndex"]
+            sign = -1 if kind == "deleteDimension" else 1
+            moved = {}
+            for (r, c), value in target.cells.items():
+                pos = r if rows else c
+                if sign < 0 and start <= pos < start + count:
+                    continue
+                if pos >= start:
+                    pos += sign * count
+                moved[(pos, c) if rows else (r, pos)] = value
+            target.cells = moved
+            if rows:
+                target.rows += sign * count
+            else:
+                target.cols += sign * count
+            return {}
+
+        if kind == "updateCells" and "start" in spec:
+            start = spec["start"]
+            target = sheet(start["sheetId"])
+            r0, c0 = start.get("rowIndex", 0), start.get("columnIndex", 0)
+            rows = spec.get("rows", [])
+            width = max((len(row.get("values", [])) for row in rows), default=0)
+            if r0 + len(rows) > target.rows or c0 + width > target.cols:
+                raise FakeAPIError(400, f"updateCells exceeds grid limits of {target.title}")
+            for r, row in enumerate(rows):
+                for c, data in enumerate(row.get("values", [])):
+                    if "userEnteredValue" in data:
+                        target.cells[(r0 + r, c0 + c)] = next(iter(data["userEnteredValue"].values()))
+            return {}
+
+        # Formatting, merges, borders, charts...: accepted, grids untouched.
+        for sheet_id in re.findall(r'"sheetId": (\d+)', json.dumps(spec)):
+            sheet(int(sheet_id))
+        return {}
+
+    # ------------------------------------------------------------------
+    # SHEETS: VALUES
+    # ------------------------------------------------------------------
+    def _read(self, file: FakeFile, range_name: str, query) -> Dict[str, Any]:
+        sheet, r0, r1, c0, c1 = self._resolve(file, range_name)
+        option = query.get("valueRenderOption", "FORMATTED_VALUE")
+        grid = [[render(v, option) for v in row] for row in sheet.grid(r0, r1, c0, c1)]
+        result = {"range": self._a1(sheet, r0, min(r1, sheet.rows), c0, min(c1, sheet.cols)),
+                  "majorDimension": "ROWS"}
+        if grid:
+            result["values"] = grid
+        return result
+
+    def _write(self, file: FakeFile, range_name: str, values, option: str) -> Dict[str, Any]:
+        sheet, r0, r1, c0, c1 = self._resolve(file, range_name)
+        rows = values or []
+        width = max((len(row) for row in rows), default=0)
+        if r0 + len(rows) > sheet.rows or c0 + width > sheet.cols:
+            raise FakeAPIError(
+                400, f"Range ({sheet.title}!{rowcol_to_a1(r0 + len(rows), c0 + max(width, 1))}) "
+                "exceeds grid limits."
+            )
+        cells = 0
+        for r, row in enumerate(rows):
+            for c, value in enumerate(row):
+                if value is None:
+                    continue
+                if option == "USER_ENTERED":
+                    value = parse_user_entered(value)
+                if value == "":
+                    sheet.cells.pop((r0 + r, c0 + c), None)
+                else:
+                    sheet.cells[(r0 + r, c0 + c)] = value
+                cells += 1
+        return {"spreadsheetId": file.id, "updatedRange": range_name,
+                "updatedRows": len(rows), "updatedColumns": width, "updatedCells": cells}
+
+    def _clear(self, file: FakeFile, range_name: str):
+        sheet, r0, r1, c0, c1 = self._resolve(file, range_name)
+        sheet.cells = {(r, c): v for (r, c), v in sheet.cells.items()
+                       if not (r0 <= r < r1 and c0 <= c < c1)}
+        return self._a1(sheet, r0, min(r1, sheet.rows), c0, min(c1, sheet.cols))
+
+    def _values_get(self, spreadsheet_id, range_name, query, body):
+        return self._read(self._file(spreadsheet_id), range_name, query)
+
+    def _values_batch_get(self, spreadsheet_id, query, body):
+        file = self._file(spreadsheet_id)
+        ranges = body.get("ranges") or query.get("ranges") or []
+        ranges = [ranges] if isinstance(ranges, str) else ranges
+        return {"spreadsheetId": spreadsheet_id,
+                "valueRanges": [self._read(file, r, {**query, **body}) for r in ranges]}
+
+    def _values_update(self, spreadsheet_id, range_name, query, body):
+        file = self._file(spreadsheet_id)
+        return self._write(file, range_name, body.get("values"),
+                           query.get("valueInputOption", "RAW"))
+
+    def _values_batch_update(self, spreadsheet_id, query, body):
+        file = self._file(spreadsheet_id)
+        option = body.get("valueInputOption", "RAW")
+        replies = [self._write(file, d["range"], d.get("values"), option)
+                   for d in body.get("data", [])]
+        return {"spreadsheetId": spreadsheet_id, "responses": replies,
+                "totalUpdatedCells": sum(r["updatedCells"] for r in replies)}
+
+    def _values_append(self, spreadsheet_id, range_name, query, body):
+        file = self._file(spreadsheet_id)
+        sheet, _, _, c0, _ = self._resolve(file, range_name)
+        start = max((r for r, _ in sheet.cells), default=-1) + 1
+        rows = body.get("values") or []
+        sheet.rows = max(sheet.rows, start + len(rows))
+        target = self._a1(sheet, start, start + 1, c0, c0 + 1).split(":")[0]
+        return {"spreadsheetId": spreadsheet_id,
+                "updates": self._write(file, target, rows, query.get("valueInputOption", "RAW"))}
+
+    def _values_clear(self, spreadsheet_id, range_name, query, body):
+        return {"spreadsheetId": spreadsheet_id,
+                "clearedRange": self._clear(self._file(spreadsheet_id), range_name)}
+
+    def _values_batch_clear(self, spreadsheet_id, query, body):
+        file = self._file(spreadsheet_id)
+        return {"spreadsheetId": spreadsheet_id,
+                "clearedRanges": [self._clear(file, r) for r in body.get("ranges", [])]}
+
+    # ------------------------------------------------------------------
+    # DRIVE
+    # ------------------------------------------------------------------
+    def _drive_create(self, query, body):
+        mime_type = body.get("mimeType", "application/octet-stream")
+        if mime_type == SPREADSHEET_MIME:
+            file = self.files[self.add_spreadsheet(body.get("name", "Untitled spreadsheet"))]
+            file.parents = list(body.get("parents", []))
+        else:
+            file = FakeFile(self._new_id(), body.get("name", "Untitled"), mime_type,
+                            body.get("parents"))
+            self.files[file.id] = file
+        return file.metadata()
+
+    def _drive_copy(self, file_id, query, body):
+        source = self._file(file_id, spreadsheet=False)
+        file = copy.deepcopy(source)
+        file.id = self._new_id()
+        file.name = body.get("name") or f"Copy of {source.name}"
+        file.parents = list(body.get("parents") or source.parents)
+        self.files[file.id] = file
+        return file.metadata()
+
+    def _drive_get(self, file_id, query, body):
+        return self._file(file_id, spreadsheet=False).metadata()
+
+    def _drive_update(self, file_id, query, body):
+        file = self._file(file_id, spreadsheet=False)
+        file.name = body.get("name", file.name)
+        removed = [p for p in str(query.get("removeParents", "")).split(",") if p]
+        added = [p for p in str(query.get("addParents", "")).split(",") if p]
+        file.parents = [p for p in file.parents if p not in removed] + added
+        return file.metadata()
+
+    def _drive_delete(self, file_id, query, body):
+        self._file(file_id, spreadsheet=False)
+        del self.files[file_id]
+        return {}
+
+    def _drive_list(self, query, body):
+        q = query.get("q", "")
+        files = list(self.files.values())
+        for key, value in re.findall(r"(name|mimeType)\s*=\s*'((?:[^'\\]|\\.)*)'", q):
+            value = value.replace("\\'", "'")
+            files = [f for f in files if (f.name if key == "name" else f.mime_type) == value]
+        for parent in re.findall(r"'([^']+)'\s+in\s+parents", q):
+            files = [f for f in files if parent in f.parents]
+        return {"kind": "drive#fileList", "files": [f.metadata() for f in files]}
+
+    def _drive_permission(self, file_id, query, body):
+        self._file(file_id, spreadsheet=False)
+        return {"kind": "drive#permission", "id": self._new_id(), **body}
+
+    # ------------------------------------------------------------------
+    # INSTALL
+    # ------------------------------------------------------------------
+    @contextlib.contextmanager
+    def install(self, limiter=None):
+        """Route gspread and googleapiclient requests to this fake.
+
+        With a VirtualClock the limiter's buckets are rebuilt on the same
+        clock for the duration, so its waits advance simulated time too.
+        """
+        import httplib2
+        from google.auth.transport.requests import AuthorizedSession
+        from googleapiclient.errors import HttpError
+        from googleapiclient.http import HttpRequest
+
+        from sheets_quota import QUOTA, TokenBucket
+
+        fake = self
+        limiter = limiter or QUOTA
+
+        def session_request(session, method, url, data=None, headers=None, **kwargs):
+            return fake.request(method, url, params=kwargs.get("params"),
+                                body=kwargs.get("json"), data=data)
+
+        def execute(request, http=None, num_retries=0):
+            response = fake.request(request.method, request.uri, data=request.body)
+            resp = httplib2.Response({"status": response.status_code, **response.headers})
+            if not response.ok:
+                raise HttpError(resp, response.content, uri=request.uri)
+            return request.postproc(resp, response.content)
+
+        saved = (limiter.reads, limiter.writes, limiter.sleep)
+        if self.virtual:
+            for name in ("reads", "writes"):
+                bucket = getattr(limiter, name)
+                setattr(limiter, name, TokenBucket(bucket.rate, bucket.capacity,
+                                                   clock=self.clock, sleep=self.sleep))
+            limiter.sleep = self.sleep
+
+        originals = (AuthorizedSession.request, HttpRequest.execute)
+        AuthorizedSession.request = session_request
+        HttpRequest.execute = execute
+        try:
+            yield self
+        finally:
+            AuthorizedSession.request, HttpRequest.execute = originals
+            limiter.reads, limiter.writes, limiter.sleep = saved
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+def fake_credentials():
+    """OAuth credentials object that never refreshes (the fake ignores auth)."""
+    from google.oauth2.credentials import Credentials
+
+    return Credentials(token="fake-token")
+
+
+def _template_workbook():
+    """The 14-sheet model the local builder produces, used as the template."""
+    from build_financial_model import FinancialModelBuilder
+    from create_financial_model import HUMANOID_RENT_CONFIG
+
+    config = {"company_name": "Template", **HUMANOID_RENT_CONFIG}
+    builder = FinancialModelBuilder(config)
+    builder.build_all()
+    return builder.wb
+
+
+def _scenario_template(fake, state):
+    import create_financial_model as cfm
+
+    result = cfm.create_from_template("Benchmark Co", cfm.HUMANOID_RENT_CONFIG)
+    state["sheet_id"] = result["spreadsheet_id"]
+    return result.get("method")
+
+
+def _scenario_scratch(fake, state):
+    import create_financial_model as cfm
+
+    result = cfm.create_financial_model_v2("Scratch Co", cfm.HUMANOID_RENT_CONFIG)
+    return f"{len(fake.files[result['spreadsheet_id']].sheets)} sheets"
+
+
+def _scenario_snapshot(fake, state):
+    import download_model_snapshot as dms
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dms.download_snapshot(state["sheet_id"], tmp)
+        return f"{len(os.listdir(os.path.join(tmp, 'sheets')))} files"
+
+
+def _scenario_format(fake, state):
+    from format_sheets import SheetFormatter
+    from sheets_quota import authorize
+
+    spreadsheet = authorize(fake_credentials()).open_by_key(state["sheet_id"])
+    SheetFormatter(spreadsheet).format_all_sheets()
+    return "formatted"
+
+
+SCENARIOS = {
+    "template": _scenario_template,
+    "scratch": _scenario_scratch,
+    "snapshot": _scenario_snapshot,
+    "format": _scenario_format,
+}
+
+
+def run_benchmark(scenarios: Optional[List[str]] = None, virtual: bool = True,
+                  latency_scale: float = 1.0) -> Dict[str, Any]:
+    """Run pipeline scenarios against one fake; counts and time per scenario.
+
+    Scenarios share state in order (snapshot and format use the model the
+    template scenario created); scratch builds a model without the template.
+    """
+    from unittest.mock import patch
+
+    import create_financial_model
+    import download_model_snapshot
+    import format_sheets
+    from sheets_quota import QuotaLimiter
+
+    clock = VirtualClock() if virtual else time.monotonic
+    fake = FakeGoogleAPI(latency={k: v * latency_scale for k, v in LATENCY.items()},
+                         clock=clock)
+    with contextlib.redirect_stdout(io.StringIO()):
+        template_id = fake.load_workbook(_template_workbook(), title="Template")
+    fake.files[create_financial_model.TEMPLATE_SPREADSHEET_ID] = fake.files.pop(template_id)
+    fake.files[create_financial_model.TEMPLATE_SPREADSHEET_ID].id = (
+        create_financial_model.TEMPLATE_SPREADSHEET_ID
+    )
+
+    limiter = QuotaLimiter()
+    state: Dict[str, Any] = {}
+    results = []
+    credentials = [
+        patch.object(module, "get_credentials", fake_credentials)
+        for module in (create_financial_model, download_model_snapshot, format_sheets)
+    ]
+    with contextlib.ExitStack() as stack:
+        for patcher in credentials:
+            stack.enter_context(patcher)
+        stack.enter_context(patch("sheets_quota.QUOTA", limiter))
+        stack.enter_context(fake.install(limiter))
+        for name in scenarios or list(SCENARIOS):
+            fake.reset_counts()
+            wall = time.perf_counter()
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    detail = SCENARIOS[name](fake, state)
+                status, error = "ok", None
+            except Exception as e:
+                detail, status, error = None, "failed", f"{type(e).__name__}: {e}"
+            results.append({"scenario": name, "status": status, "detail": detail,
+                            "error": error, **fake.stats(),
+                            "cpu_s": round(time.perf_counter() - wall, 2)})
+    return {"virtual_clock": virtual, "latency_scale": latency_scale, "scenarios": results}
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(
+        description="Offline Google Sheets/Drive stand-in and API-call benchmark"
+    )
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Run pipeline scenarios against the fake")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS),
+                        help="Scenarios to run, in order (default: all)")
+    parser.add_argument("--real-time", action="store_true",
+                        help="Sleep for latencies/quota waits instead of simulating them")
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="Multiply all simulated latencies (default: 1.0)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.print_help()
+        return
+
+    report = run_benchmark(args.scenarios, virtual=not args.real_time,
+                           latency_scale=args.latency_scale)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        unit = "simulated" if report["virtual_clock"] else "wall"
+        print(f"{'Scenario':<10} {'Status':<7} {'Requests':>8} {'Reads':>6} {'Writes':>6} "
+              f"{'Drive':>6} {'429s':>5} {unit + ' s':>12}")
+        print("-" * 68)
+        for r in report["scenarios"]:
+            print(f"{r['scenario']:<10} {r['status']:<7} {r['requests']:>8} "
+                  f"{r['sheets_reads']:>6} {r['sheets_writes']:>6} {r['drive']:>6} "
+                  f"{r['throttled']:>5} {r['elapsed_s']:>12.1f}")
+            if r["error"]:
+                print(f"           {r['error'][:200]}")
+    sys.exit(0 if all(r["status"] == "ok" for r in report["scenarios"]) else 1)
+
+
+if __name__ == "__main__":
+    main()
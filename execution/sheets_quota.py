@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sheets Quota - Shared token-bucket pacing for Google Sheets API calls
+
+Every gspread client created with `authorize()` sends its requests through
+one process-wide limiter instead of sleeping a fixed time after each call:
+
+- Sheets reads and writes draw from separate token buckets sized to the
+  per-user per-minute quotas (60/min each by default). A bucket holds a
+  small burst and refills at (quota - burst) per minute, so no rolling
+  minute exceeds the quota and calls only wait when it is actually spent.
+- HTTP 429 / 5xx / Drive usageLimits responses are retried. Retry-After is
+  honored when the response carries one; otherwise the delay is exponential
+  backoff with jitter. The wait pauses the whole bucket, so every thread
+  backs off together.
+- Drive and other non-Sheets endpoints are not paced, only retried.
+
+Buckets are per process. Override the quotas with SHEETS_READS_PER_MINUTE,
+SHEETS_WRITES_PER_MINUTE and SHEETS_QUOTA_BURST.
+
+Usage:
+    from sheets_quota import QUOTA, authorize, execute
+
+    client = authorize(creds)                  # gspread.Client, paced
+    drive.files().copy(...)                    # googleapiclient request:
+    execute(drive.files().copy(fileId=...))    #   retried on 429/5xx
+    print(QUOTA.summary())                     # requests, waits, throttles
+
+    python sheets_quota.py --requests 200      # simulate pacing offline
+"""
+
+import argparse
+import functools
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+# Per-user Sheets API defaults (read and write quotas are separate)
+READS_PER_MINUTE = 60
+WRITES_PER_MINUTE = 60
+BURST = 10
+
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+SHEETS_HOST = "sheets.googleapis.com"
+
+
+# =============================================================================
+# TOKEN BUCKET
+# =============================================================================
+class TokenBucket:
+    """Thread-safe token bucket: `capacity` tokens, refilled at `rate`/s.
+
+    Tokens are reserved under the lock (the balance may go negative) and the
+    caller sleeps outside it, so concurrent callers queue in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = capacity
+        self.updated = clock()
+        self.blocked_until = 0.0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, quota: int, burst: int = BURST, **kwargs) -> "TokenBucket":
+        """Bucket for a per-minute quota: any 60 s window stays within `quota`."""
+        burst = max(1, min(burst, quota - 1))
+        return cls((quota - burst) / 60.0, burst, **kwargs)
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take `tokens`, sleeping if the bucket is empty; returns seconds waited."""
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self.tokens -= tokens
+            wait = max(-self.tokens / self.rate, self.blocked_until - now, 0.0)
+            self.waited += wait
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float):
+        """Hold every acquirer for `seconds` (server said the quota is spent)."""
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self.blocked_until = max(self.blocked_until, now + seconds)
+            self.tokens = min(self.tokens, 0.0)
+
+
+# =============================================================================
+# ERROR INSPECTION
+# =============================================================================
+def status_code(exc: BaseException) -> Optional[int]:
+    """HTTP status of a gspread APIError, googleapiclient HttpError or requests error."""
+    response = getattr(exc, "response", None)
+    if response is not None and getattr(response, "status_code", None) is not None:
+        return int(response.status_code)
+    resp = getattr(exc, "resp", None)  # googleapiclient (httplib2 response)
+    if resp is not None and getattr(resp, "status", None) is not None:
+        return int(resp.status)
+    return None
+
+
+def _headers(exc: BaseException):
+    response = getattr(exc, "response", None)
+    if response is not None and getattr(response, "headers", None) is not None:
+        return response.headers
+    return getattr(exc, "resp", None) or {}
+
+
+def retry_after(exc: BaseException, now: Optional[float] = None) -> Optional[float]:
+    """Seconds from the Retry-After header (delta or HTTP date), if present."""
+    headers = _headers(exc)
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when - (time.time() if now is None else now))
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Rate-limit or transient server error worth retrying."""
+    code = status_code(exc)
+    if code in RETRY_STATUSES:
+        return True
+    # Drive reports exhausted quota as 403 usageLimits / rateLimitExceeded
+    return code == 403 and any(
+        reason in str(exc) for reason in ("usageLimits", "rateLimitExceeded", "userRateLimitExceeded")
+    )
+
+
+# =============================================================================
+# LIMITER
+# =============================================================================
+class QuotaLimiter:
+    """Sheets read/write buckets plus retry with Retry-After / jittered backoff."""
+
+    def __init__(
+        self,
+        reads_per_minute: int = READS_PER_MINUTE,
+        writes_per_minute: int = WRITES_PER_MINUTE,
+        burst: int = BURST,
+        max_retries: int = 6,
+        base_delay: float = 1.0,
+        max_delay: float = 64.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.reads = TokenBucket.per_minute(reads_per_minute, burst, clock=clock, sleep=sleep)
+        self.writes = TokenBucket.per_minute(writes_per_minute, burst, clock=clock, sleep=sleep)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.rng = rng
+        self.requests = 0
+        self.retries = 0
+        self.backoff = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "QuotaLimiter":
+        return cls(
+            reads_per_minute=int(os.getenv("SHEETS_READS_PER_MINUTE", READS_PER_MINUTE)),
+            writes_per_minute=int(os.getenv("SHEETS_WRITES_PER_MINUTE", WRITES_PER_MINUTE)),
+            burst=int(os.getenv("SHEETS_QUOTA_BURST", BURST)),
+        )
+
+    def bucket_for(self, method: str, endpoint: str) -> Optional[TokenBucket]:
+        """Read bucket for Sheets GETs, write bucket for other Sheets calls."""
+        if SHEETS_HOST not in endpoint:
+            return None
+        return self.reads if method.upper() == "GET" else self.writes
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter: uniform in [cap/2, cap]."""
+        cap = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return cap / 2 + self.rng() * cap / 2
+
+    def run(self, send: Callable[[], Any], bucket: Optional[TokenBucket] = None) -> Any:
+        """Call `send()` once its bucket has a token; retry throttled calls."""
+        attempt = 0
+        while True:
+            if bucket is not None:
+                bucket.acquire()
+            with self._lock:
+                self.requests += 1
+            try:
+                return send()
+            except Exception as exc:
+                if attempt >= self.max_retries or not is_retryable(exc):
+                    raise
+                delay = retry_after(exc)
+                if delay is None:
+                    delay = self.backoff_delay(attempt)
+                with self._lock:
+                    self.retries += 1
+                    self.backoff += delay
+                if bucket is not None:
+                    bucket.pause(delay)  # next acquire() waits it out
+                else:
+                    self.sleep(delay)
+                attempt += 1
+
+    @property
+    def waited(self) -> float:
+        return self.reads.waited + self.writes.waited
+
+    def summary(self) -> str:
+        return (
+            f"API pacing: {self.requests} requests, {self.waited:.1f}s waiting for quota, "
+            f"{self.retries} throttled/retried ({self.backoff:.1f}s backoff)"
+        )
+
+
+# Process-wide limiter shared by every client from authorize()
+QUOTA = QuotaLimiter.from_env()
+
+
+# =============================================================================
+# CLIENTS
+# =============================================================================
+def authorize(creds, limiter: Optional[QuotaLimiter] = None):
+    """gspread.authorize() with every HTTP request paced by `limiter`."""
+    import gspread
+    from gspread.http_client import HTTPClient
+
+    limiter = limiter or QUOTA
+
+    class QuotaHTTPClient(HTTPClient):
+        def request(self, method, endpoint, *args, **kwargs):
+            send = functools.partial(super().request, method, endpoint, *args, **kwargs)
+            return limiter.run(send, limiter.bucket_for(method, endpoint))
+
+    return gspread.authorize(creds, http_client=QuotaHTTPClient)
+
+
+def execute(request, limiter: Optional[QuotaLimiter] = None):
+    """Execute a googleapiclient request, paced when it targets Sheets."""
+    limiter = limiter or QUOTA
+    return limiter.run(request.execute, limiter.bucket_for(request.method, request.uri))
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate Sheets quota pacing (no API calls)"
+    )
+    parser.add_argument("--requests", type=int, default=200, help="Write requests to pace")
+    parser.add_argument("--per-minute", type=int, default=WRITES_PER_MINUTE, help="Quota per minute")
+    parser.add_argument("--burst", type=int, default=BURST, help="Bucket capacity")
+    args = parser.parse_args()
+
+    clock = [0.0]
+    bucket = TokenBucket.per_minute(
+        args.per_minute,
+        args.burst,
+        clock=lambda: clock[0],
+        sleep=lambda s: clock.__setitem__(0, clock[0] + s),
+    )
+    for _ in range(args.requests):
+        bucket.acquire()
+    print(
+        f"{args.requests} writes at {args.per_minute}/min (burst {args.burst}): "
+        f"{clock[0]:.1f}s simulated wall clock, {bucket.waited:.1f}s waiting"
+    )
+
+
+if __name__ == "__main__":
+    main()
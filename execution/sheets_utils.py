@@ -22,6 +22,8 @@ from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+from sheets_quota import authorize
+
 load_dotenv()
 
 SCOPES = [
@@ -79,7 +81,7 @@ def read_sheet(sheet_url, worksheet_name=None):
     """
     try:
         creds = get_credentials()
-        client = gspread.authorize(creds)
+        client = authorize(creds)
 
         sheet_id = extract_sheet_id(sheet_url)
         spreadsheet = client.open_by_key(sheet_id)
@@ -107,7 +109,7 @@ def read_sheet_raw(sheet_url, worksheet_name=None):
     """
     try:
         creds = get_credentials()
-        client = gspread.authorize(creds)
+        client = authorize(creds)
 
         sheet_id = extract_sheet_id(sheet_url)
         spreadsheet = client.open_by_key(sheet_id)
@@ -145,7 +147,7 @@ def write_sheet(data, sheet_name=None, sheet_id=None):
     """
     try:
         creds = get_credentials()
-        client = gspread.authorize(creds)
+        client = authorize(creds)
 
         # Open existing or create new
         if sheet_id:
@@ -200,7 +202,7 @@ def append_rows(sheet_url, data, worksheet_name=None):
     """
     try:
         creds = get_credentials()
-        client = gspread.authorize(creds)
+        client = authorize(creds)
 
         sheet_id = extract_sheet_id(sheet_url)
         spreadsheet = client.open_by_key(sheet_id)
@@ -17,11 +17,10 @@ import sys
 import json
 import argparse
 import csv
-import time
 from pathlib import Path
 from collections import defaultdict
-import gspread
 from google.oauth2.credentials import Credentials
+from sheets_quota import authorize
 
 def get_credentials():
     """Get OAuth2 credentials for Google Sheets API."""
@@ -57,7 +56,7 @@ class SnapshotSyncer:
             print("Error: No credentials found. Run setup first.")
             return None
         
-        gc = gspread.authorize(creds)
+        gc = authorize(creds)
         
         try:
             spreadsheet = gc.open_by_key(self.sheet_id)
@@ -188,10 +187,6 @@ class SnapshotSyncer:
                     
                     worksheet.batch_update(updates)
                     print(f"   Updated {len(updates)} cells")
-                    
-                    # Rate limiting
-                    if i + batch_size < len(changes):
-                        time.sleep(2)
                 
                 print(f"   {len(changes)} changes applied\n")
                 
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Model Time Axis (annual, monthly, hybrid)
+=========================================
+
+Describes the period columns of a financial model. The builder lays out one
+column per period and the native engine evaluates one array element per
+period, so both read period lengths and year boundaries from here.
+
+Granularities:
+    annual    one column per year (Y0..Yn-1) - the classic 11-column model
+    monthly   twelve columns per year for the whole horizon
+    hybrid    monthly for the first `monthly_months` months, then annual
+
+Conventions shared by builder and engine:
+    - Flows (revenue, costs, capex, depreciation) are per period: an annual
+      amount contributes `fraction` of itself to a period.
+    - Annual growth rates compound per period as (1 + g) ^ (months / 12).
+    - Stocks (headcount, cash, balance sheet) are period-end values.
+    - Funding rounds land in the first period of their year.
+
+Usage:
+    axis = TimeAxis(num_years=11, granularity="hybrid", monthly_months=36)
+    len(axis)                    # 36 months + 8 years = 44 columns
+    axis.labels(2026)            # ["Jan 2026", ..., "Dec 2028", "2029", ...]
+    axis.year_periods(8)         # periods that make up model year 8
+"""
+
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+MONTH_NAMES = [
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+]
+
+
+class Period(NamedTuple):
+    index: int  # column offset (0 = first period)
+    year: int  # model year the period falls in (0-based)
+    month: Optional[int]  # 1-12 for monthly periods, None for annual
+    start: int  # months since model start
+    months: int  # period length in months (1 or 12)
+
+    @property
+    def fraction(self) -> float:
+        """Share of a year covered by the period."""
+        return self.months / 12
+
+    @property
+    def is_annual(self) -> bool:
+        return self.months == 12
+
+    @property
+    def is_year_start(self) -> bool:
+        return self.start % 12 == 0
+
+    @property
+    def is_year_end(self) -> bool:
+        return (self.start + self.months) % 12 == 0
+
+
+class TimeAxis:
+    """Ordered model periods for a horizon of `num_years` years."""
+
+    GRANULARITIES = ("annual", "monthly", "hybrid")
+
+    def __init__(
+        self, num_years: int = 11, granularity: str = "annual", monthly_months: int = 36
+    ):
+        if granularity not in self.GRANULARITIES:
+            raise ValueError(
+                f"Unknown granularity '{granularity}'. Valid: {self.GRANULARITIES}"
+            )
+        if num_years < 1:
+            raise ValueError("num_years must be at least 1")
+        if granularity == "hybrid" and (monthly_months < 12 or monthly_months % 12):
+            raise ValueError("monthly_months must be a positive multiple of 12")
+        self.num_years = num_years
+        self.granularity = granularity
+        if granularity == "annual":
+            monthly_months = 0
+        elif granularity == "monthly":
+            monthly_months = 12 * num_years
+        self.monthly_months = min(monthly_months, 12 * num_years)
+
+        self.periods: List[Period] = []
+        for start in range(self.monthly_months):
+            self.periods.append(
+                Period(len(self.periods), start // 12, start % 12 + 1, start, 1)
+            )
+        for year in range(self.monthly_months // 12, num_years):
+            self.periods.append(Period(len(self.periods), year, None, 12 * year, 12))
+
+        self._by_year: Dict[int, List[Period]] = {}
+        for p in self.periods:
+            self._by_year.setdefault(p.year, []).append(p)
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    def __iter__(self) -> Iterator[Period]:
+        return iter(self.periods)
+
+    def __getitem__(self, index: int) -> Period:
+        return self.periods[index]
+
+    @property
+    def is_annual(self) -> bool:
+        return self.monthly_months == 0
+
+    def spec(self) -> Dict[str, int]:
+        """JSON-friendly description (for reports and build caches)."""
+        return {
+            "num_years": self.num_years,
+            "granularity": self.granularity,
+            "monthly_months": self.monthly_months,
+            "num_periods": len(self),
+        }
+
+    def year_periods(self, year: int) -> List[Period]:
+        """Periods that make up a model year."""
+        return self._by_year[year]
+
+    def year_end(self, year: int) -> Period:
+        """Last period of a model year (where stocks are read)."""
+        return self._by_year[year][-1]
+
+    def labels(self, starting_year: Optional[int] = None) -> List[str]:
+        """Column headers: years as in year_headers(), months as 'Jan 2026'."""
+        out = []
+        for p in self.periods:
+            if p.is_annual:
+                out.append(str(starting_year + p.year) if starting_year else f"Year {p.year}")
+            elif starting_year:
+                out.append(f"{MONTH_NAMES[p.month - 1]} {starting_year + p.year}")
+            else:
+                out.append(f"Y{p.year} M{p.month}")
+        return out
@@ -30,13 +30,13 @@ Examples:
 import os
 import sys
 import json
-import time
 import argparse
 from dotenv import load_dotenv
 import gspread
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from sheets_quota import authorize
 
 load_dotenv()
 
@@ -68,11 +68,6 @@ def get_credentials():
     return creds
 
 
-def rate_limit_delay(seconds=2):
-    """Add delay to avoid Google API rate limits."""
-    time.sleep(seconds)
-
-
 def update_sources(spreadsheet, sources_data):
     """Update the Sources & References sheet."""
     print("Updating Sources & References sheet...")
@@ -82,12 +77,9 @@ def update_sources(spreadsheet, sources_data):
     except gspread.WorksheetNotFound:
         sources = spreadsheet.add_worksheet('Sources & References', rows=60, cols=10)
     
-    rate_limit_delay(2)
     sources.clear()
-    rate_limit_delay(2)
     
     sources.update(values=sources_data, range_name='A1', value_input_option='USER_ENTERED')
-    rate_limit_delay(2)
     
     # Format headers
     pct_format = {'numberFormat': {'type': 'PERCENT', 'pattern': '0.0%'}}
@@ -95,7 +87,6 @@ def update_sources(spreadsheet, sources_data):
         'textFormat': {'bold': True, 'fontSize': 14},
         'backgroundColor': {'red': 0.2, 'green': 0.3, 'blue': 0.5}
     })
-    rate_limit_delay(1)
     sources.format('A4:E4', {
         'textFormat': {'bold': True},
         'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
@@ -110,7 +101,6 @@ def update_growth_rates(spreadsheet, growth_config):
     print("Updating growth rates...")
     
     assumptions = spreadsheet.worksheet('Assumptions')
-    rate_limit_delay(2)
     
     # Get current data to find rows
     data = assumptions.get_all_values()
@@ -125,7 +115,6 @@ def update_growth_rates(spreadsheet, growth_config):
                     for year, rate in enumerate(rates):
                         col = chr(ord('C') + year)  # C, D, E, ...
                         assumptions.update_acell(f'{col}{i+1}', rate)
-                        rate_limit_delay(0.3)
                     print(f"  Updated: {row[0]}")
     
     print("  Growth rates updated!")
@@ -141,7 +130,6 @@ def add_headcount_sheet(spreadsheet, headcount_config):
     except:
         hc = spreadsheet.worksheet('Headcount Plan')
     
-    rate_limit_delay(2)
     
     data = [
         ['HEADCOUNT PLAN', ''] + YEAR_HEADERS,
@@ -161,7 +149,6 @@ def add_headcount_sheet(spreadsheet, headcount_config):
     ]
     
     hc.update(values=data, range_name='A1', value_input_option='USER_ENTERED')
-    rate_limit_delay(2)
     
     hc.format('A1:M1', {
         'textFormat': {'bold': True},
@@ -184,7 +171,6 @@ def add_remaining_sheets(spreadsheet):
     except:
         breakeven = spreadsheet.worksheet('Break-even Analysis')
     
-    rate_limit_delay(2)
     
     be_data = [
         ['BREAK-EVEN ANALYSIS', ''] + YEAR_HEADERS,
@@ -203,23 +189,18 @@ def add_remaining_sheets(spreadsheet):
     ]
     
     breakeven.update(values=be_data, range_name='A1', value_input_option='USER_ENTERED')
-    rate_limit_delay(2)
     breakeven.format('A1:M1', {'textFormat': {'bold': True}, 'backgroundColor': {'red': 0.2, 'green': 0.3, 'blue': 0.5}})
-    rate_limit_delay(1)
     breakeven.format('C8:M8', pct_format)
-    rate_limit_delay(0.5)
     breakeven.format('C13:M13', pct_format)
     print("    Break-even Analysis done!")
     
     # Sheet 2: Funding & Cap Table
     print("  Creating Funding & Cap Table...")
-    rate_limit_delay(3)
     try:
         funding = spreadsheet.add_worksheet('Funding Cap Table', rows=30, cols=15)
     except:
         funding = spreadsheet.worksheet('Funding Cap Table')
     
-    rate_limit_delay(2)
     
     fund_data = [
         ['FUNDING & CAP TABLE', ''] + YEAR_HEADERS,
@@ -240,23 +221,18 @@ def add_remaining_sheets(spreadsheet):
     ]
     
     funding.update(values=fund_data, range_name='A1', value_input_option='USER_ENTERED')
-    rate_limit_delay(2)
     funding.format('A1:M1', {'textFormat': {'bold': True}, 'backgroundColor': {'red': 0.2, 'green': 0.3, 'blue': 0.5}})
-    rate_limit_delay(1)
     for row in [10, 11, 12, 13]:
         funding.format(f'C{row}:M{row}', pct_format)
-        rate_limit_delay(0.3)
     print("    Funding & Cap Table done!")
     
     # Sheet 3: Financial Ratios
     print("  Creating Financial Ratios...")
-    rate_limit_delay(3)
     try:
         ratios = spreadsheet.add_worksheet('Financial Ratios', rows=25, cols=15)
     except:
         ratios = spreadsheet.worksheet('Financial Ratios')
     
-    rate_limit_delay(2)
     
     ratio_data = [
         ['FINANCIAL RATIOS', ''] + YEAR_HEADERS,
@@ -274,12 +250,9 @@ def add_remaining_sheets(spreadsheet):
     ]
     
     ratios.update(values=ratio_data, range_name='A1', value_input_option='USER_ENTERED')
-    rate_limit_delay(2)
     ratios.format('A1:M1', {'textFormat': {'bold': True}, 'backgroundColor': {'red': 0.2, 'green': 0.3, 'blue': 0.5}})
-    rate_limit_delay(1)
     for row in [4, 5, 6, 9]:
         ratios.format(f'C{row}:M{row}', pct_format)
-        rate_limit_delay(0.3)
     print("    Financial Ratios done!")
     
     return True
@@ -294,10 +267,8 @@ def fix_percentage_formatting(spreadsheet):
     print("  Fixing P&L...")
     try:
         pl = spreadsheet.worksheet('P&L')
-        rate_limit_delay(2)
         for row in [9, 14, 23]:  # Gross, EBITDA, Net margins
             pl.format(f'C{row}:M{row}', pct_format)
-            rate_limit_delay(0.5)
     except Exception as e:
         print(f"    P&L error: {e}")
     
@@ -305,10 +276,8 @@ def fix_percentage_formatting(spreadsheet):
     print("  Fixing Customer Economics...")
     try:
         ce = spreadsheet.worksheet('Customer Economics')
-        rate_limit_delay(2)
         for row in [3, 4]:  # Churn, Retention
             ce.format(f'C{row}:M{row}', pct_format)
-            rate_limit_delay(0.5)
     except Exception as e:
         print(f"    Customer Economics error: {e}")
     
@@ -316,9 +285,7 @@ def fix_percentage_formatting(spreadsheet):
     print("  Fixing Sensitivity Analysis...")
     try:
         sens = spreadsheet.worksheet('Sensitivity Analysis')
-        rate_limit_delay(2)
         sens.format('C4:M5', pct_format)
-        rate_limit_delay(0.5)
         sens.format('C10:M11', pct_format)
     except Exception as e:
         print(f"    Sensitivity error: {e}")
@@ -327,7 +294,6 @@ def fix_percentage_formatting(spreadsheet):
     print("  Fixing Valuation...")
     try:
         val = spreadsheet.worksheet('Valuation')
-        rate_limit_delay(2)
         val.format('B4:B6', pct_format)
     except Exception as e:
         print(f"    Valuation error: {e}")
@@ -336,13 +302,11 @@ def fix_percentage_formatting(spreadsheet):
     print("  Fixing Assumptions...")
     try:
         assumptions = spreadsheet.worksheet('Assumptions')
-        rate_limit_delay(2)
         data = assumptions.get_all_values()
         for i, row in enumerate(data):
             if len(row) > 0 and ('growth' in row[0].lower() or 'rate' in row[0].lower() or 
                                 'margin' in row[0].lower() or 'cogs' in row[0].lower()):
                 assumptions.format(f'C{i+1}:M{i+1}', pct_format)
-                rate_limit_delay(0.3)
     except Exception as e:
         print(f"    Assumptions error: {e}")
     
@@ -365,7 +329,7 @@ def main():
     
     # Connect to spreadsheet
     creds = get_credentials()
-    client = gspread.authorize(creds)
+    client = authorize(creds)
     spreadsheet = client.open_by_key(args.sheet_id)
     print(f"Opened: {spreadsheet.title}")
     
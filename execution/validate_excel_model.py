@@ -10,23 +10,364 @@ Usage:
     python validate_excel_model.py --file .tmp/MyCompany_financial_model.xlsx
     python validate_excel_model.py --file .tmp/model.xlsx --verbose
     python validate_excel_model.py --file .tmp/model.xlsx --check-balance
+    python validate_excel_model.py --file .tmp/model.xlsx --targets balance pnl
+    python validate_excel_model.py --file .tmp/model.xlsx --targets "P&L!C19:M19"
+    python validate_excel_model.py --batch .tmp/batch_models --workers 4 --timeout 300
+    python validate_excel_model.py --batch ".tmp/*/financial_model/*.xlsx" -b \
+        --report .tmp/validation_report.json
+
+--targets evaluates only the dependency subgraph of the given output cells
+instead of recalculating the whole workbook. A target is a preset
+(balance, pnl) or a Sheet!A1[:B2] reference. Error detection then covers
+the cells that feed those outputs.
+
+--cache-dir keeps the compiled calculation graph on disk, keyed by a hash of
+the workbook's formula structure (formulas and filled-cell positions, not
+values). Re-validating after a value-only edit loads the graph and re-solves
+it with the current input values instead of re-parsing every formula. The
+cache is pickled; only point it at a directory you trust.
+
+--batch validates every .xlsx under the given directories / glob patterns
+across a process pool, with a per-file timeout, writes one JSON report and
+exits 1 if any model is invalid, failed or timed out.
 """
 
 import argparse
+import contextlib
+import functools
+import glob
+import hashlib
+import importlib
+import io
 import json
+import marshal
+import multiprocessing
 import os
+import pickle
+import queue
+import re
+import signal
 import sys
-from typing import Any, Dict, List, Tuple
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
+from datetime import datetime
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 try:
     import formulas
     import numpy as np
+    from openpyxl import load_workbook
 except ImportError:
     print("ERROR: Required libraries not installed.")
-    print("Run: pip install formulas numpy")
+    print("Run: pip install formulas numpy openpyxl")
     sys.exit(1)
 
 
+# =============================================================================
+# COMPILED MODEL CACHE
+# =============================================================================
+# Bump when the cached layout changes. The formulas and Python versions are
+# part of every key too (cell functions are stored as marshalled code).
+MODEL_CACHE_VERSION = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _code(data: bytes) -> types.CodeType:
+    return marshal.loads(data)
+
+
+def _function(module, code, name, qualname, defaults, kwdefaults, cells, attrs):
+    closure = None if cells is None else tuple(types.CellType(v) for v in cells)
+    fn = types.FunctionType(
+        _code(code), vars(importlib.import_module(module)), name, defaults, closure
+    )
+    fn.__qualname__ = qualname
+    fn.__kwdefaults__ = kwdefaults
+    fn.__dict__.update(attrs)
+    return fn
+
+
+def _is_global(fn) -> bool:
+    try:
+        obj = importlib.import_module(fn.__module__)
+        for part in fn.__qualname__.split("."):
+            obj = getattr(obj, part)
+        return obj is fn
+    except (ImportError, AttributeError):
+        return False
+
+
+class _ModelPickler(pickle.Pickler):
+    """Pickles a formulas.ExcelModel.
+
+    Its cell functions are closures built by decorators, which plain pickle
+    refuses; those are stored as code + closure contents instead.
+    """
+
+    def __init__(self, file):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._codes: Dict[types.CodeType, bytes] = {}
+
+    def reducer_override(self, obj):
+        if type(obj) is types.FunctionType and not _is_global(obj):
+            code = self._codes.get(obj.__code__)
+            if code is None:
+                code = self._codes[obj.__code__] = marshal.dumps(obj.__code__)
+            cells = None
+            if obj.__closure__ is not None:
+                cells = tuple(c.cell_contents for c in obj.__closure__)
+            return _function, (
+                obj.__globals__["__name__"],  # __module__ is copied by functools.wraps
+                code,
+                obj.__name__,
+                obj.__qualname__,
+                obj.__defaults__,
+                obj.__kwdefaults__,
+                cells,
+                obj.__dict__,
+            )
+        if isinstance(obj, types.ModuleType):
+            return importlib.import_module, (obj.__name__,)
+        return NotImplemented
+
+
+def read_workbook_inputs(filepath: str) -> Tuple[str, Dict[Tuple[str, str], Any]]:
+    """Formula-structure hash and input values of a workbook.
+
+    The hash covers sheet names, formulas, error cells and which cells are
+    filled; input values are {(SHEET, A1): value} for non-formula cells.
+    """
+    digest = hashlib.sha256()
+    values = {}
+    wb = load_workbook(filepath, read_only=True)
+    try:
+        for ws in wb.worksheets:
+            sheet = ws.title.upper()
+            digest.update(f"\0{sheet}\0".encode("utf-8"))
+            for row in ws.iter_rows():
+                for cell in row:
+                    value = cell.value
+                    if value is None:
+                        continue
+                    if cell.data_type in ("f", "e"):
+                        digest.update(f"{cell.coordinate}={value}\n".encode("utf-8"))
+                    else:
+                        digest.update(f"{cell.coordinate}\n".encode("utf-8"))
+                        values[(sheet, cell.coordinate)] = value
+    finally:
+        wb.close()
+    return digest.hexdigest(), values
+
+
+def model_cache_key(structure: str, filename: str, target_ranges: Sequence[str]) -> str:
+    """Cache file stem for a workbook structure and set of target ranges."""
+    material = json.dumps(
+        [
+            MODEL_CACHE_VERSION,
+            formulas.__version__,
+            list(sys.version_info[:2]),
+            structure,
+            filename,
+            sorted(target_ranges),
+        ]
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _load_model(path: str):
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+        return None
+
+
+def _store_model(path: str, xl_model):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            _ModelPickler(f).dump(xl_model)
+        os.replace(tmp, path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        # Caching is best-effort; the validation result is unaffected
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _input_name(name: str) -> Tuple[str, str]:
+    # "'[model.xlsx]BALANCE SHEET'!C17" -> ("BALANCE SHEET", "C17")
+    sheet, _, cell = name.rpartition("!")
+    return sheet.strip("'").rpartition("]")[2], cell
+
+
+# =============================================================================
+# TYPED VALUE ARRAYS
+# =============================================================================
+_A1_RE = re.compile(r"^\$?([A-Z]{1,3})\$?(\d+)$")
+
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for ch in letters:
+        index = index * 26 + ord(ch) - 64
+    return index
+
+
+@dataclass
+class SheetValues:
+    """Computed values of one sheet as parallel arrays.
+
+    numbers holds floats (NaN where numeric is False); errors holds an index
+    into the error patterns, or -1. rows/cols are 1-based (-1 for range
+    keys); text maps (row, col) to the sheet's string values.
+    """
+
+    name: str
+    prefix: str  # "'[model.xlsx]SHEET'" as it appears in cell keys
+    cells: List[str]
+    numbers: np.ndarray
+    numeric: np.ndarray
+    errors: np.ndarray
+    rows: np.ndarray
+    cols: np.ndarray
+    text: Dict[Tuple[int, int], str]
+
+    def matrix(self) -> np.ndarray:
+        """Numbers as a dense [row, col] array (NaN elsewhere), built once."""
+        if self._matrix is None:
+            mask = self.numeric & (self.rows > 0)
+            shape = (int(self.rows.max(initial=0)) + 1, int(self.cols.max(initial=0)) + 1)
+            self._matrix = np.full(shape, np.nan)
+            self._matrix[self.rows[mask], self.cols[mask]] = self.numbers[mask]
+        return self._matrix
+
+    def __post_init__(self):
+        self._matrix: Optional[np.ndarray] = None
+
+
+def index_computed_values(
+    computed_values: Dict[str, Any], patterns: Sequence[str]
+) -> Dict[str, SheetValues]:
+    """Group {cell key: value} by sheet into typed arrays in one pass.
+
+    Only non-numeric values are stringified (to look for error codes).
+    """
+    grouped: Dict[str, Tuple[str, List[str], List[float], List[bool], List[int], List[int], List[int], Dict]] = {}
+    for cell, value in computed_values.items():
+        prefix, _, ref = cell.rpartition("!")
+        name = prefix.split("]")[1].strip("'") if "]" in prefix else ""
+        entry = grouped.get(name)
+        if entry is None:
+            entry = grouped[name] = (prefix, [], [], [], [], [], [], {})
+        match = _A1_RE.match(ref)
+        row, col = (int(match.group(2)), _column_index(match.group(1))) if match else (-1, -1)
+        entry[1].append(cell)
+        entry[5].append(row)
+        entry[6].append(col)
+        if isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_)):
+            entry[2].append(value)
+            entry[3].append(True)
+            entry[4].append(-1)
+        else:
+            text = str(value)
+            entry[2].append(np.nan)
+            entry[3].append(False)
+            code = next((i for i, p in enumerate(patterns) if p in text), -1)
+            entry[4].append(code)
+            if code < 0 and isinstance(value, str) and row > 0:
+                entry[7][(row, col)] = value
+
+    return {
+        name: SheetValues(
+            name,
+            prefix,
+            cells,
+            np.array(numbers, dtype=float),
+            np.array(numeric, dtype=bool),
+            np.array(errors, dtype=np.int8),
+            np.array(rows, dtype=np.int64),
+            np.array(cols, dtype=np.int64),
+            text,
+        )
+        for name, (prefix, cells, numbers, numeric, errors, rows, cols, text) in grouped.items()
+    }
+
+
+def label_key(label: Any) -> str:
+    """Normalized row label: case-insensitive, trailing "(...)" dropped."""
+    return str(label).split(" (")[0].strip().upper()
+
+
+class LabelIndex:
+    """Column-A labels of each sheet -> row -> per-period values.
+
+    Built once from the typed arrays; every lookup afterwards is a dict hit
+    plus an array slice. Period columns come from the header row (the
+    "Line Item" row, else row 1), skipping a "Unit" column.
+    """
+
+    def __init__(self, grid: Dict[str, SheetValues], texts: Dict[str, Dict[Tuple[int, int], str]]):
+        self.grid = grid
+        self.labels: Dict[str, Dict[str, int]] = {}
+        self.periods: Dict[str, List[Tuple[int, str]]] = {}
+        for sheet, cells in texts.items():
+            labels = {}
+            for (row, col), text in sorted(cells.items()):
+                if col == 1:
+                    labels.setdefault(label_key(text), row)
+            header = labels.get("LINE ITEM", 1)
+            periods = [
+                (col, str(text).strip())
+                for (row, col), text in cells.items()
+                if row == header and col > 1 and label_key(text) != "UNIT"
+            ]
+            if sheet in grid:  # numeric headers (2026 rather than "2026")
+                matrix = grid[sheet].matrix()
+                if header < matrix.shape[0]:
+                    for col in np.flatnonzero(~np.isnan(matrix[header])):
+                        if col > 1:
+                            periods.append((int(col), f"{matrix[header, col]:g}"))
+            periods.sort()
+            self.labels[sheet] = labels
+            self.periods[sheet] = periods
+
+    def sheet(self, *names: str) -> Optional[str]:
+        """First sheet whose name contains one of `names` (case-insensitive)."""
+        for name in names:
+            for sheet in self.labels:
+                if name.upper() in sheet.upper():
+                    return sheet
+        return None
+
+    def row(self, sheet: Optional[str], *labels: str) -> Optional[np.ndarray]:
+        """Per-period values of the first row found under one of `labels`."""
+        if sheet not in self.grid:
+            return None
+        index = self.labels.get(sheet, {})
+        row = next((index[k] for k in map(label_key, labels) if k in index), None)
+        if row is None:
+            return None
+        matrix = self.grid[sheet].matrix()
+        if row >= matrix.shape[0]:
+            return np.full(len(self.periods[sheet]), np.nan)
+        if self.periods[sheet]:
+            cols = np.array([col for col, _ in self.periods[sheet]])
+        else:  # no header row: every numeric column after A
+            cols = np.flatnonzero(~np.isnan(matrix[row]))
+            cols = cols[cols > 1]
+        values = np.full(len(cols), np.nan)
+        inside = cols < matrix.shape[1]
+        values[inside] = matrix[row, cols[inside]]
+        return values
+
+    def period_labels(self, sheet: Optional[str]) -> List[str]:
+        return [label for _, label in self.periods.get(sheet, [])]
+
+
 class ExcelModelValidator:
     """Validates Excel financial models by computing all formulas."""
 
@@ -40,26 +381,147 @@ class ExcelModelValidator:
         "#NUM!",
     ]
 
-    def __init__(self, filepath: str):
+    # Target presets: sheet -> row labels (case-insensitive, ignoring a
+    # trailing "(...)" such as "NET INCOME (PAT)").
+    # Each matching row is evaluated across all period columns.
+    TARGET_PRESETS = {
+        "balance": (
+            "Balance Sheet",
+            ("TOTAL ASSETS", "TOTAL LIABILITIES & EQUITY", "BALANCE CHECK"),
+        ),
+        "pnl": (
+            "P&L",
+            ("Revenue", "GROSS PROFIT", "EBITDA", "NET INCOME"),
+        ),
+    }
+
+    # Row labels for the balance, cash and metric lookups (first found wins)
+    BALANCE_ROWS = {
+        "assets": ("TOTAL ASSETS",),
+        "liabilities_equity": (
+            "TOTAL LIABILITIES & EQUITY",
+            "TOTAL LIABILITIES AND EQUITY",
+            "Total Liabilities",  # template: liabilities incl. equity
+        ),
+        "cash": ("Cash & Equivalents", "Cash"),
+    }
+    CASH_FLOW_ROWS = {
+        "closing": ("CUMULATIVE CASH", "Closing Cash", "Ending Cash"),
+        "net": ("NET CASH FLOW",),
+    }
+    METRIC_ROWS = {
+        "Total Revenue": ("Total Revenue", "Revenue"),
+        "Gross Profit": ("GROSS PROFIT",),
+        "EBITDA": ("EBITDA",),
+        "Net Income": ("NET INCOME", "PAT", "Net Profit"),
+    }
+    BALANCE_TOLERANCE = 1.0
+
+    def __init__(
+        self,
+        filepath: str,
+        targets: Optional[Sequence[str]] = None,
+        cache_dir: Optional[str] = None,
+    ):
         self.filepath = filepath
         self.filename = os.path.basename(filepath)
+        self.targets = list(targets or [])
+        self.target_ranges: List[str] = []
+        self.cache_dir = cache_dir
+        self.cache_hit: Optional[bool] = None  # None when no cache_dir
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.results: Dict[str, Any] = {}
         self.computed_values: Dict[str, Any] = {}
+        self._grid: Optional[Dict[str, SheetValues]] = None
+        self._labels: Optional[LabelIndex] = None
+        self.metrics_period: Optional[str] = None
+
+    def resolve_targets(self, targets: Sequence[str]) -> List[str]:
+        """Turn presets and Sheet!A1 references into formulas range names."""
+        path = os.path.abspath(self.filepath).replace("'", "''")
+        ranges = []
+        wb = None
+        try:
+            for target in targets:
+                if target in self.TARGET_PRESETS:
+                    if wb is None:
+                        wb = load_workbook(self.filepath, read_only=True)
+                    sheet, labels = self.TARGET_PRESETS[target]
+                    if sheet not in wb.sheetnames:
+                        self.warnings.append(f"Target '{target}': no '{sheet}' sheet")
+                        continue
+                    ws = wb[sheet]
+                    last_col = ws.max_column
+                    wanted = {label_key(label) for label in labels}
+                    for row in ws.iter_rows(min_col=1, max_col=1):
+                        label = row[0].value
+                        if isinstance(label, str) and label_key(label) in wanted:
+                            r = row[0].row
+                            ranges.append(f"'[{path}]{sheet}'!B{r}:{_column(last_col)}{r}")
+                elif "!" in target:
+                    sheet, ref = target.rsplit("!", 1)
+                    sheet = sheet.strip("'")
+                    ranges.append(f"'[{path}]{sheet}'!{ref}")
+                else:
+                    self.warnings.append(f"Unknown target: {target}")
+        finally:
+            if wb is not None:
+                wb.close()
+        return ranges
 
-    def load_and_calculate(self) -> bool:
-        """Load Excel file and compute all formulas."""
+    def load_and_calculate(self, targets: Optional[Sequence[str]] = None) -> bool:
+        """Load Excel file and compute its formulas.
+
+        With targets, only the dependency subgraph of those output cells is
+        loaded and calculated; otherwise every formula is. With a cache_dir,
+        a graph compiled for the same formula structure is re-solved with
+        the workbook's current input values.
+        """
         print(f"Loading: {self.filepath}")
 
         if not os.path.exists(self.filepath):
             self.errors.append(f"File not found: {self.filepath}")
             return False
 
+        if targets is not None:
+            self.targets = list(targets)
+        self.computed_values = {}
+        self._grid = self._labels = None
+
         try:
-            # Load and compute all formulas
-            xl_model = formulas.ExcelModel().loads(self.filepath).finish()
-            solution = xl_model.calculate()
+            if self.targets:
+                self.target_ranges = self.resolve_targets(self.targets)
+                if not self.target_ranges:
+                    self.errors.append(f"No target cells found for: {', '.join(self.targets)}")
+                    return False
+
+            xl_model = cache_path = None
+            if self.cache_dir:
+                structure, values = read_workbook_inputs(self.filepath)
+                key = model_cache_key(structure, self.filename, self.target_ranges)
+                cache_path = os.path.join(self.cache_dir, f"{key}.pkl")
+                xl_model = _load_model(cache_path)
+                self.cache_hit = xl_model is not None
+
+            if xl_model is not None:
+                # Same formulas, possibly new numbers: re-solve with current inputs
+                inputs = {}
+                for name in xl_model.dsp.default_values:
+                    value = values.get(_input_name(name))
+                    if value is not None:
+                        inputs[name] = value
+                solution = xl_model.calculate(inputs=inputs)
+            else:
+                if self.target_ranges:
+                    # Walks precedents from the targets; untouched cells are never parsed
+                    xl_model = formulas.ExcelModel().from_ranges(*self.target_ranges).finish()
+                else:
+                    # Load and compute all formulas
+                    xl_model = formulas.ExcelModel().loads(self.filepath).finish()
+                if cache_path:
+                    _store_model(cache_path, xl_model)
+                solution = xl_model.calculate()
 
             # Extract values from solution
             for key, value in solution.items():
@@ -79,88 +541,131 @@ class ExcelModelValidator:
             self.errors.append(f"Failed to load/calculate: {str(e)}")
             return False
 
+    @property
+    def grid(self) -> Dict[str, SheetValues]:
+        """Computed values as per-sheet typed arrays, built once per load."""
+        if self._grid is None:
+            self._grid = index_computed_values(self.computed_values, self.ERROR_PATTERNS)
+        return self._grid
+
     def check_formula_errors(self) -> int:
         """Check all computed values for Excel errors."""
         error_count = 0
 
-        for cell, value in self.computed_values.items():
-            val_str = str(value)
-
-            # Check for Excel error values
-            for error_pattern in self.ERROR_PATTERNS:
-                if error_pattern in val_str:
-                    self.errors.append(f"{cell}: {error_pattern}")
-                    error_count += 1
-                    break
-
-            # Check for numeric errors
-            if isinstance(value, (int, float)):
-                if np.isnan(value):
+        for sheet in self.grid.values():
+            nan = sheet.numeric & np.isnan(sheet.numbers)
+            inf = sheet.numeric & np.isinf(sheet.numbers)
+            for i in np.flatnonzero((sheet.errors >= 0) | nan | inf):
+                cell = sheet.cells[i]
+                if sheet.errors[i] >= 0:
+                    self.errors.append(f"{cell}: {self.ERROR_PATTERNS[sheet.errors[i]]}")
+                elif nan[i]:
                     self.errors.append(f"{cell}: NaN (Not a Number)")
-                    error_count += 1
-                elif np.isinf(value):
-                    if value > 0:
-                        self.errors.append(f"{cell}: +Infinity (division by zero?)")
-                    else:
-                        self.errors.append(f"{cell}: -Infinity (division by zero?)")
-                    error_count += 1
+                elif sheet.numbers[i] > 0:
+                    self.errors.append(f"{cell}: +Infinity (division by zero?)")
+                else:
+                    self.errors.append(f"{cell}: -Infinity (division by zero?)")
+                error_count += 1
 
         return error_count
 
+    @property
+    def labels(self) -> LabelIndex:
+        """Row-label index over the typed arrays, built once per load."""
+        if self._labels is None:
+            texts = {name: sheet.text for name, sheet in self.grid.items() if name}
+            # Targeted runs only compute the value columns; read labels from the file
+            missing = [n for n, cells in texts.items() if not any(c == 1 for _, c in cells)]
+            if missing and os.path.exists(self.filepath):
+                texts.update(self._read_labels(missing))
+            self._labels = LabelIndex(self.grid, texts)
+        return self._labels
+
+    def _read_labels(self, sheets: Sequence[str]) -> Dict[str, Dict[Tuple[int, int], str]]:
+        """Column-A labels and header rows of `sheets` (upper-case names)."""
+        texts: Dict[str, Dict[Tuple[int, int], str]] = {}
+        wb = load_workbook(self.filepath, read_only=True)
+        try:
+            for ws in wb.worksheets:
+                if ws.title.upper() not in sheets:
+                    continue
+                cells = texts[ws.title.upper()] = {}
+                for r, row in enumerate(ws.iter_rows(), start=1):
+                    label = row[0].value if row else None
+                    if isinstance(label, str):
+                        cells[(r, 1)] = label
+                    if r == 1 or (isinstance(label, str) and label_key(label) == "LINE ITEM"):
+                        for c, cell in enumerate(row[1:], start=2):
+                            value = cell.value
+                            if value is not None and not str(value).startswith("="):
+                                cells[(r, c)] = str(value)
+        finally:
+            wb.close()
+        return texts
+
+    def _mismatches(self, check, periods, left, right, left_name, right_name) -> List[str]:
+        n = min(len(left), len(right))
+        left, right = np.nan_to_num(left[:n]), np.nan_to_num(right[:n])  # blanks are 0
+        diff = left - right
+        return [
+            f"{check} {periods[i] if i < len(periods) else i + 1}: {left_name} "
+            f"{left[i]:,.0f} vs {right_name} {right[i]:,.0f} (diff {diff[i]:,.0f})"
+            for i in np.flatnonzero(np.abs(diff) > self.BALANCE_TOLERANCE)
+        ]
+
     def check_balance_sheet(self) -> bool:
-        """Check that Assets = Liabilities + Equity for all years."""
-        # Find balance sheet cells by pattern
-        assets_cells = {}
-        liab_eq_cells = {}
-
-        for cell, value in self.computed_values.items():
-            cell_lower = cell.lower()
-            # Look for typical balance sheet patterns
-            if "balance" in cell_lower or "sheet" in cell_lower:
-                if (
-                    isinstance(value, (int, float))
-                    and not np.isnan(value)
-                    and not np.isinf(value)
-                ):
-                    # This is a simplified check - real implementation would parse row labels
-                    pass
-
-        # For now, just return True (full implementation would parse sheet structure)
-        return True
+        """Check that Assets = Liabilities + Equity for all years.
 
-    def get_sheet_summary(self) -> Dict[str, int]:
-        """Get count of computed cells per sheet."""
-        sheets = {}
-        for cell in self.computed_values.keys():
-            # Parse sheet name from cell reference like '[file.xlsx]SHEET'!A1
-            if "]" in cell and "!" in cell:
-                sheet_part = cell.split("]")[1].split("!")[0]
-                sheet_name = sheet_part.strip("'")
-                sheets[sheet_name] = sheets.get(sheet_name, 0) + 1
-        return sheets
+        Also reconciles balance-sheet cash with the cash flow statement
+        (closing cash, and closing = previous closing + net cash flow).
+        Mismatches are added to errors; missing rows to warnings.
+        """
+        idx = self.labels
+        bs = idx.sheet("BALANCE SHEET", "BALANCE")
+        assets = idx.row(bs, *self.BALANCE_ROWS["assets"])
+        liabilities_equity = idx.row(bs, *self.BALANCE_ROWS["liabilities_equity"])
+        if assets is None or liabilities_equity is None:
+            self.warnings.append(
+                "Balance sheet: TOTAL ASSETS / TOTAL LIABILITIES & EQUITY rows not found"
+            )
+            return False
 
-    def get_key_metrics(self) -> Dict[str, Any]:
-        """Extract key financial metrics from computed values."""
-        metrics = {}
+        periods = idx.period_labels(bs)
+        issues = self._mismatches(
+            "Balance sheet", periods, assets, liabilities_equity, "Assets", "L+E"
+        )
 
-        for cell, value in self.computed_values.items():
-            if not isinstance(value, (int, float)):
-                continue
-            if np.isnan(value) or np.isinf(value):
-                continue
+        cf = idx.sheet("CASH FLOW")
+        cash = idx.row(bs, *self.BALANCE_ROWS["cash"])
+        closing = idx.row(cf, *self.CASH_FLOW_ROWS["closing"])
+        net = idx.row(cf, *self.CASH_FLOW_ROWS["net"])
+        if cash is not None and closing is not None:
+            issues += self._mismatches("Cash", periods, cash, closing, "Balance Sheet", "Cash Flow")
+        if closing is not None and net is not None and len(closing) > 1:
+            rolled = np.nan_to_num(closing[:-1]) + np.nan_to_num(net[1:len(closing)])
+            issues += self._mismatches(
+                "Cash roll-forward", periods[1:], closing[1:], rolled, "Closing", "Opening + net"
+            )
 
-            cell_upper = cell.upper()
+        self.errors.extend(issues)
+        return not issues
 
-            # Look for common financial terms
-            if "REVENUE" in cell_upper and "TOTAL" in cell_upper:
-                metrics["Total Revenue"] = value
-            elif "EBITDA" in cell_upper and value > 0:
-                metrics["EBITDA"] = value
-            elif "NET" in cell_upper and "INCOME" in cell_upper:
-                metrics["Net Income"] = value
-            elif "GROSS" in cell_upper and "PROFIT" in cell_upper:
-                metrics["Gross Profit"] = value
+    def get_sheet_summary(self) -> Dict[str, int]:
+        """Get count of computed cells per sheet."""
+        return {name: len(sheet.cells) for name, sheet in self.grid.items() if name}
 
+    def get_key_metrics(self) -> Dict[str, Any]:
+        """Final-period values of the key P&L rows (see METRIC_ROWS)."""
+        idx = self.labels
+        pnl = idx.sheet("P&L", "PROFIT", "INCOME")
+        periods = idx.period_labels(pnl)
+        self.metrics_period = periods[-1] if periods else None
+
+        metrics = {}
+        for name, labels in self.METRIC_ROWS.items():
+            values = idx.row(pnl, *labels)
+            if values is not None and len(values) and np.isfinite(values[-1]):
+                metrics[name] = float(values[-1])
         return metrics
 
     def validate(
@@ -173,7 +678,9 @@ class ExcelModelValidator:
         report_lines.append("=" * 70)
         report_lines.append("")
 
-        # Step 1: Load and calculate
+        # Step 1: Load and calculate (the balance check needs its rows in a targeted run)
+        if check_balance and self.targets and "balance" not in self.targets:
+            self.targets.append("balance")
         if not self.load_and_calculate():
             report_lines.append("❌ FAILED TO LOAD FILE")
             for error in self.errors:
@@ -181,6 +688,14 @@ class ExcelModelValidator:
             return False, "\n".join(report_lines)
 
         report_lines.append(f"✓ Loaded successfully")
+        if self.targets:
+            report_lines.append(
+                f"  Targeted: {', '.join(self.targets)} "
+                f"({len(self.target_ranges)} ranges, subgraph only)"
+            )
+        if self.cache_hit is not None:
+            state = "reused (inputs re-solved)" if self.cache_hit else "compiled and cached"
+            report_lines.append(f"  Calculation graph: {state}")
         report_lines.append(f"  Total computed cells: {len(self.computed_values)}")
         report_lines.append("")
 
@@ -208,24 +723,33 @@ class ExcelModelValidator:
         # Step 4: Balance sheet check (if requested)
         if check_balance:
             report_lines.append("Checking balance sheet...")
+            seen = len(self.errors)
             if self.check_balance_sheet():
                 report_lines.append("✓ Balance sheet validation passed")
+            elif len(self.errors) > seen:
+                issues = self.errors[seen:]
+                error_count += len(issues)
+                report_lines.append(f"❌ Balance sheet does not balance ({len(issues)} issues):")
+                for issue in issues[:10]:
+                    report_lines.append(f"   {issue}")
             else:
-                report_lines.append("❌ Balance sheet does not balance")
+                report_lines.append("⚠ Balance sheet rows not found; check skipped")
             report_lines.append("")
 
         # Step 5: Key metrics (if verbose)
         if verbose:
             metrics = self.get_key_metrics()
             if metrics:
-                report_lines.append("Key metrics detected:")
+                period = f" ({self.metrics_period})" if self.metrics_period else ""
+                report_lines.append(f"Key metrics, final period{period}:")
                 for name, value in metrics.items():
-                    if value >= 1_000_000:
-                        report_lines.append(f"  • {name}: ${value/1_000_000:.1f}M")
-                    elif value >= 1_000:
-                        report_lines.append(f"  • {name}: ${value/1_000:.1f}K")
+                    sign, size = ("-" if value < 0 else ""), abs(value)
+                    if size >= 1_000_000:
+                        report_lines.append(f"  • {name}: {sign}${size/1_000_000:.1f}M")
+                    elif size >= 1_000:
+                        report_lines.append(f"  • {name}: {sign}${size/1_000:.1f}K")
                     else:
-                        report_lines.append(f"  • {name}: ${value:.0f}")
+                        report_lines.append(f"  • {name}: {sign}${size:.0f}")
                 report_lines.append("")
 
         # Step 6: Detailed cell values (if very verbose)
@@ -262,25 +786,233 @@ class ExcelModelValidator:
                 "warnings": self.warnings,
                 "sheets": self.get_sheet_summary(),
                 "cell_count": len(self.computed_values),
+                "targets": self.targets,
+                "cache_hit": self.cache_hit,
             },
             indent=2,
         )
 
 
+def _column(index: int) -> str:
+    letters = ""
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
 def validate_excel_model(
-    filepath: str, verbose: bool = False, check_balance: bool = False
+    filepath: str,
+    verbose: bool = False,
+    check_balance: bool = False,
+    targets: Optional[Sequence[str]] = None,
+    cache_dir: Optional[str] = None,
 ) -> Tuple[bool, str]:
     """Convenience function for validating an Excel model."""
-    validator = ExcelModelValidator(filepath)
+    validator = ExcelModelValidator(filepath, targets=targets, cache_dir=cache_dir)
     return validator.validate(verbose=verbose, check_balance=check_balance)
 
 
+# =============================================================================
+# BATCH VALIDATION
+# =============================================================================
+# Extra seconds the parent waits past the per-file budgets before giving up
+# on workers the in-process timer could not interrupt (e.g. stuck in C code)
+BATCH_GRACE_S = 30.0
+
+
+class ValidationTimeout(BaseException):
+    """One workbook exceeded its time budget (BaseException so the
+    validator's own `except Exception` handlers do not swallow it)."""
+
+
+def _raise_timeout(signum, frame):
+    raise ValidationTimeout()
+
+
+def discover_workbooks(patterns: Sequence[str]) -> List[str]:
+    """Expand directories (recursively) and glob patterns into .xlsx paths."""
+    found = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = glob.glob(os.path.join(pattern, "**", "*.xlsx"), recursive=True)
+        else:
+            matches = glob.glob(pattern, recursive=True)
+        found.update(
+            m for m in matches
+            if m.endswith(".xlsx") and not os.path.basename(m).startswith("~$")  # Excel lock files
+        )
+    return sorted(found)
+
+
+def validate_one(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one workbook; never raises.
+
+    Runs inside batch worker processes. The timeout uses an interval timer
+    where the platform has one (POSIX); elsewhere only the batch deadline
+    applies.
+    """
+    result = {
+        "file": job["file"],
+        "status": "ok",
+        "error": None,
+        "elapsed_ms": None,
+        "error_count": 0,
+        "errors": [],
+        "warnings": [],
+        "cell_count": 0,
+        "sheets": {},
+        "metrics": {},
+    }
+    timer = bool(job["timeout"]) and hasattr(signal, "setitimer")
+    started = time.perf_counter()
+    try:
+        if timer:
+            signal.signal(signal.SIGALRM, _raise_timeout)
+            signal.setitimer(signal.ITIMER_REAL, job["timeout"])
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            validator = ExcelModelValidator(
+                job["file"], targets=job["targets"], cache_dir=job["cache_dir"]
+            )
+            valid, _ = validator.validate(check_balance=job["check_balance"])
+            metrics = validator.get_key_metrics() if validator.computed_values else {}
+        if timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        result.update(
+            error_count=len(validator.errors),
+            errors=validator.errors[:50],
+            warnings=validator.warnings,
+            cell_count=len(validator.computed_values),
+            sheets=validator.get_sheet_summary() if validator.computed_values else {},
+            metrics=metrics,
+        )
+        if not valid:
+            result["status"] = "invalid"
+            result["error"] = "; ".join(validator.errors[:5])
+    except ValidationTimeout:
+        result["status"] = "timeout"
+        result["error"] = f"Exceeded {job['timeout']:g}s timeout"
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def _register_worker(pids) -> None:
+    """Pool initializer: report this worker's PID so a stuck batch can kill it."""
+    pids.put(os.getpid())
+
+
+def _terminate_workers(pids) -> None:
+    """Terminate every worker that registered in `pids`."""
+    while True:
+        try:
+            pid = pids.get(timeout=0.5)
+        except queue.Empty:
+            return
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass  # already exited
+
+
+def _unfinished(job: Dict[str, Any], status: str, error: str) -> Dict[str, Any]:
+    return {
+        "file": job["file"], "status": status, "error": error, "elapsed_ms": None,
+        "error_count": 0, "errors": [], "warnings": [], "cell_count": 0,
+        "sheets": {}, "metrics": {},
+    }
+
+
+def validate_batch(
+    files: List[str],
+    workers: Optional[int] = None,
+    timeout: Optional[float] = 300.0,
+    check_balance: bool = False,
+    targets: Optional[Sequence[str]] = None,
+    cache_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Validate many workbooks across a process pool; returns the aggregate report."""
+    jobs = [
+        {
+            "file": path,
+            "timeout": timeout,
+            "check_balance": check_balance,
+            "targets": list(targets or []),
+            "cache_dir": cache_dir,
+        }
+        for path in files
+    ]
+    workers = workers or os.cpu_count() or 1
+    deadline = None
+    if timeout:
+        rounds = -(-len(jobs) // workers)
+        deadline = timeout * rounds + BATCH_GRACE_S
+
+    started = time.perf_counter()
+    results = []
+    # Workers register their PIDs so the deadline can kill hung ones without
+    # reaching into the executor's private process table.
+    pids = multiprocessing.Queue()
+    pool = ProcessPoolExecutor(
+        max_workers=workers, initializer=_register_worker, initargs=(pids,)
+    )
+    futures = {pool.submit(validate_one, job): job for job in jobs}
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            try:
+                res = future.result()
+            except Exception as e:  # worker died (BrokenProcessPool, MemoryError, ...)
+                res = _unfinished(futures[future], "failed", f"{type(e).__name__}: {e}")
+            results.append(res)
+            mark = {"ok": "OK", "invalid": "INVALID", "failed": "FAILED", "timeout": "TIMEOUT"}
+            timing = f"{res['elapsed_ms']} ms" if res["elapsed_ms"] is not None else ""
+            print(f"  [{len(results)}/{len(jobs)}] {mark[res['status']]:<8}{res['file']}  {timing}")
+            if res["error"]:
+                print(f"            {res['error'][:200]}")
+    except FuturesTimeout:
+        for future, job in futures.items():
+            if not future.done():
+                results.append(_unfinished(job, "timeout", "Batch deadline reached"))
+                print(f"  TIMEOUT {job['file']}  (batch deadline)")
+        _terminate_workers(pids)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        pids.close()
+    elapsed = time.perf_counter() - started
+
+    results.sort(key=lambda r: r["file"])
+    counts = {
+        k: sum(r["status"] == k for r in results) for k in ("ok", "invalid", "failed", "timeout")
+    }
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "workers": workers,
+        "timeout_s": timeout,
+        "check_balance": check_balance,
+        "targets": list(targets or []),
+        "total": len(results),
+        **counts,
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "models": results,
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate Excel financial models by computing all formulas"
     )
-    parser.add_argument(
-        "--file", "-f", required=True, help="Path to Excel file (.xlsx)"
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", "-f", help="Path to Excel file (.xlsx)")
+    source.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="PATH",
+        help="Batch mode: directories and/or glob patterns of .xlsx files",
     )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Show detailed output"
@@ -294,10 +1026,63 @@ def main():
     parser.add_argument(
         "--json", "-j", action="store_true", help="Output results as JSON"
     )
+    parser.add_argument(
+        "--targets",
+        "-t",
+        nargs="+",
+        help="Evaluate only these outputs and their precedents: "
+        "presets (balance, pnl) or Sheet!A1[:B2] references",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse compiled calculation graphs across runs (keyed by formula structure)",
+    )
+
+    parser.add_argument(
+        "--workers", type=int, help="Batch mode: worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=300.0,
+        help="Batch mode: seconds allowed per workbook (default: 300; 0 = no limit)",
+    )
+    parser.add_argument(
+        "--report",
+        default=".tmp/validation_report.json",
+        help="Batch mode: JSON report path (default: .tmp/validation_report.json)",
+    )
 
     args = parser.parse_args()
 
-    validator = ExcelModelValidator(args.file)
+    # Batch mode
+    if args.batch:
+        files = discover_workbooks(args.batch)
+        if not files:
+            print("ERROR: No .xlsx files matched")
+            sys.exit(1)
+        print(f"Batch validating {len(files)} workbooks...")
+        print("=" * 60)
+        report = validate_batch(
+            files,
+            workers=args.workers,
+            timeout=args.timeout or None,
+            check_balance=args.check_balance,
+            targets=args.targets,
+            cache_dir=args.cache_dir,
+        )
+        os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=str)
+        print("=" * 60)
+        print(
+            f"{report['ok']} ok, {report['invalid']} invalid, {report['failed']} failed, "
+            f"{report['timeout']} timed out in {report['elapsed_ms'] / 1000:.1f}s"
+        )
+        print(f"Report: {args.report}")
+        sys.exit(0 if report["ok"] == report["total"] else 1)
+
+    validator = ExcelModelValidator(args.file, targets=args.targets, cache_dir=args.cache_dir)
     success, report = validator.validate(
         verbose=args.verbose, check_balance=args.check_balance
     )
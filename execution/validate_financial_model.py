@@ -16,6 +16,7 @@ import sys
 from typing import Dict, List, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
+from sheets_quota import authorize
 
 class CheckStatus(Enum):
     PASS = " PASS"
@@ -33,7 +34,7 @@ class ValidationResult:
 class FinancialModelValidator:
     def __init__(self, spreadsheet_id: str):
         self.creds = Credentials.from_authorized_user_file('token.json')
-        self.client = gspread.authorize(self.creds)
+        self.client = authorize(self.creds)
         self.ss = self.client.open_by_key(spreadsheet_id)
         self.results: List[ValidationResult] = []
         self.sheets_data: Dict[str, List[List[Any]]] = {}
@@ -2,11 +2,11 @@
 """Verify Sheet Integrity - Check formulas after restructuring"""
 import argparse, re
 from google.oauth2.credentials import Credentials
-import gspread
+from sheets_quota import authorize
 
 def verify_formulas(sheet_id, sheet_name):
     creds = Credentials.from_authorized_user_file("token.json", scopes=["https://www.googleapis.com/auth/spreadsheets"])
-    client = gspread.authorize(creds)
+    client = authorize(creds)
     spreadsheet = client.open_by_key(sheet_id)
     sheet = spreadsheet.worksheet(sheet_name)
     
@@ -40,6 +40,8 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "gspread"])
     import gspread
 
+from sheets_quota import authorize
+
 
 # Expected 14-Sheet Template Structure
 EXPECTED_SHEETS = [
@@ -88,7 +90,7 @@ def get_sheets_client():
         with open("token.json", "w") as token:
             token.write(creds.to_json())
 
-    return gspread.authorize(creds)
+    return authorize(creds)
 
 
 def verify_sheet_structure(spreadsheet) -> Dict[str, Any]:
@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+'''
+Test Suite for build_financial_model.py
+=======================================
+Tests the config-driven workbook builder, incremental rebuilds and output
+backends.
+
+Usage:
+    python -m pytest tests/test_build_financial_model.py -v
+    python tests/test_build_financial_model.py  # Run without pytest
+'''
+
+import contextlib
+import csv
+import gc
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'execution'))
+
+from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter
+
+from build_financial_model import (
+    PROFILE_ENV,
+    SHEET_SEQUENCE,
+    FinancialModelBuilder,
+    build_batch,
+    discover_configs,
+)
+from formula_eval import evaluate_workbook
+from layout_ir import compile_sheets_payload
+from sheets_fake import FakeGoogleAPI, VirtualClock, fake_credentials
+from sheets_quota import QuotaLimiter, authorize
+from sheet_plan import SharedFormulaWorksheet, relative_key
+
+
+def sample_config():
+    '''Small config with two streams and legacy funding format'''
+    return {
+        'company_name': 'BuilderCo',
+        'starting_year': 2026,
+        'revenue_streams': [
+            {'name': 'Software', 'price': 2500, 'volume': 25, 'growth': 0.5, 'cogs_pct': 0.15},
+            {'name': 'Services', 'price': 10000, 'volume': 5, 'growth': 0.4, 'cogs_pct': 0.45},
+        ],
+        'fixed_costs': [{'name': 'Office', 'annual_cost': 36000}],
+        'headcount': {'engineering_salary': 80000, 'engineering_y0': 5},
+        'funding': {'seed': 3000000, 'seed_year': 0},
+    }
+
+
+def build(tmp, name='model.xlsx', **kwargs):
+    '''Build all sheets quietly and save; returns (builder, path)'''
+    path = os.path.join(tmp, name)
+    with contextlib.redirect_stdout(io.StringIO()):
+        builder = FinancialModelBuilder(sample_config(), **kwargs)
+        builder.build_all()
+        builder.save(path)
+    return builder, path
+
+
+class TestStreamingBackend(unittest.TestCase):
+    '''Test the constant-memory xlsxwriter backend'''
+
+    def test_streaming_matches_openpyxl(self):
+        '''Streaming output has the same sheets, values and formulas'''
+        with tempfile.TemporaryDirectory() as tmp:
+            _, ref_path = build(tmp, 'ref.xlsx')
+            _, stream_path = build(tmp, 'stream.xlsx', backend='streaming')
+            ref = load_workbook(ref_path)
+            streamed = load_workbook(stream_path)
+
+            self.assertEqual(streamed.sheetnames, SHEET_SEQUENCE)
+            for ws in ref.worksheets:
+                other = streamed[ws.title]
+                for row in ws.iter_rows():
+                    for cell in row:
+                        self.assertEqual(
+                            cell.value, other[cell.coordinate].value,
+                            f'{ws.title}!{cell.coordinate} should match',
+                        )
+                self.assertEqual(
+                    sorted(map(str, ws.merged_cells.ranges)),
+                    sorted(map(str, other.merged_cells.ranges)),
+                )
+
+    def test_failed_build_leaves_no_temp_file(self):
+        '''An unsaved streaming build deletes its temp .xlsx (close() or garbage collection)'''
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder = FinancialModelBuilder(sample_config(), backend='streaming')
+            tmp_path = builder.wb._tmp_path
+            builder.build_up_to(SHEET_SEQUENCE[3])
+            with patch.object(builder, '_build_sheet', side_effect=RuntimeError('boom')):
+                with self.assertRaises(RuntimeError):
+                    builder.build_all()
+        self.assertTrue(os.path.exists(tmp_path))
+        builder.wb.close()
+        self.assertFalse(os.path.exists(tmp_path))
+
+        builder = FinancialModelBuilder(sample_config(), backend='streaming')
+        tmp_path = builder.wb._tmp_path
+        del builder
+        gc.collect()
+        self.assertFalse(os.path.exists(tmp_path))
+
+    def test_row_uniform_formulas_are_shared(self):
+        '''Column-shifted formula runs become shared formulas; smaller file'''
+        with tempfile.TemporaryDirectory() as tmp:
+            _, shared_path = build(tmp, 'shared.xlsx', backend='streaming', shared_formulas=True)
+            _, plain_path = build(tmp, 'plain.xlsx', backend='streaming')
+
+            def shared_count(path):
+                with zipfile.ZipFile(path) as zf:
+                    return sum(
+                        zf.read(name).count(b't="shared"')
+                        for name in zf.namelist()
+                        if name.startswith('xl/worksheets/sheet')
+                    )
+
+            self.assertGreater(shared_count(shared_path), 0)
+            self.assertEqual(shared_count(plain_path), 0)
+            self.assertLess(os.path.getsize(shared_path), os.path.getsize(plain_path))
+            self.assertEqual(
+                sheet_values(load_workbook(shared_path)),
+                sheet_values(load_workbook(plain_path)),
+            )
+
+    def test_missing_xlsxwriter_internals_fail_loudly(self):
+        '''An xlsxwriter without the overridden internals raises instead of writing bad XML'''
+        import sheet_plan
+
+        with patch.object(sheet_plan, '_XLSXWRITER_INTERNALS', ('table', '_gone_in_next_release')):
+            with self.assertRaisesRegex(RuntimeError, '_gone_in_next_release'):
+                SharedFormulaWorksheet()
+
+    def test_relative_key(self):
+        '''Only relative column letters are normalised'''
+        self.assertEqual(
+            relative_key('=Assumptions!$B$17*Assumptions!D$18', 4),
+            relative_key('=Assumptions!$B$17*Assumptions!E$18', 5),
+        )
+        self.assertEqual(
+            relative_key("='P&L'!C5+SUM(C6:C9)", 3), relative_key("='P&L'!D5+SUM(D6:D9)", 4)
+        )
+        self.assertNotEqual(relative_key('=$C5', 3), relative_key('=$D5', 4))
+        self.assertNotEqual(relative_key('=IF(C5>0,"C5","")', 3), relative_key('=IF(D5>0,"D5","")', 4))
+        self.assertEqual(relative_key('=LOG10(C5)', 3), '=LOG10([0]5)')
+
+    def test_unknown_backend_rejected(self):
+        '''Unknown backend names raise instead of silently falling back'''
+        with self.assertRaises(ValueError):
+            FinancialModelBuilder(sample_config(), backend='csv')
+
+
+def sheet_values(wb):
+    '''{(sheet, coordinate): value} for every non-empty cell'''
+    return {
+        (ws.title, cell.coordinate): cell.value
+        for ws in wb.worksheets
+        for row in ws.iter_rows()
+        for cell in row
+        if cell.value is not None
+    }
+
+
+class TestIncrementalRebuild(unittest.TestCase):
+    '''Test sheet-level rebuilds keyed by declared config/row_ref inputs'''
+
+    def rebuilt_for(self, edit):
+        '''Apply edit to a fresh config; return (rebuilt sheets, builder, full build)'''
+        config = sample_config()
+        edit(config)
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder = FinancialModelBuilder(sample_config())
+            builder.build_all()
+            rebuilt = builder.rebuild(config)
+            full = FinancialModelBuilder(config)
+            full.build_all()
+        return rebuilt, builder, full
+
+    def test_price_change_rebuilds_assumptions_only(self):
+        '''Prices only appear on Assumptions; every other sheet is reused'''
+        def edit(config):
+            config['revenue_streams'][0]['price'] = 3000
+        rebuilt, builder, full = self.rebuilt_for(edit)
+        self.assertEqual(rebuilt, ['Assumptions'])
+        self.assertEqual(sheet_values(builder.wb), sheet_values(full.wb))
+
+    def test_new_stream_rebuilds_dependents(self):
+        '''Adding a stream shifts rows, so downstream sheets follow'''
+        def edit(config):
+            config['revenue_streams'].append(
+                {'name': 'Support', 'price': 500, 'volume': 40, 'growth': 0.2, 'cogs_pct': 0.1}
+            )
+        rebuilt, builder, full = self.rebuilt_for(edit)
+        self.assertIn('Revenue', rebuilt)
+        self.assertIn('Break-even Analysis', rebuilt)
+        self.assertNotIn('Headcount Plan', rebuilt)
+        self.assertEqual(builder.wb.sheetnames, SHEET_SEQUENCE)
+        self.assertEqual(sheet_values(builder.wb), sheet_values(full.wb))
+
+    def test_asset_classes_rebuild_fixed_asset_sheets(self):
+        '''fixed_assets feeds Assumptions, P&L, Cash Flow and Balance Sheet'''
+        def edit(config):
+            config['fixed_assets'] = {'classes': [
+                {'name': 'Equipment', 'useful_life': 4, 'capex': [120000, 20000]},
+                {'name': 'Fit-out', 'useful_life': 10, 'capex': [300000, 0]},
+            ]}
+        rebuilt, builder, full = self.rebuilt_for(edit)
+        for sheet in ('Assumptions', 'P&L', 'Cash Flow', 'Balance Sheet'):
+            self.assertIn(sheet, rebuilt)
+        self.assertNotIn('Revenue', rebuilt)
+        self.assertEqual(sheet_values(builder.wb), sheet_values(full.wb))
+        labels = [c.value for c in builder.wb['Assumptions']['A']]
+        self.assertIn('Fit-out: CapEx', labels)
+
+    def test_asset_classes_rebuild_monte_carlo_bands(self):
+        '''With monte_carlo on, fixed_assets edits also refresh the Sensitivity bands'''
+        def with_mc(config):
+            config['monte_carlo'] = {'trials': 300, 'seed': 7}
+            return config
+
+        config = with_mc(sample_config())
+        config['fixed_assets'] = {'classes': [
+            {'name': 'Equipment', 'useful_life': 4, 'capex': [900000, 50000]},
+        ]}
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder = FinancialModelBuilder(with_mc(sample_config()))
+            builder.build_all()
+            rebuilt = builder.rebuild(config)
+            full = FinancialModelBuilder(config)
+            full.build_all()
+        self.assertIn('Sensitivity Analysis', rebuilt)
+        self.assertEqual(sheet_values(builder.wb), sheet_values(full.wb))
+
+    def test_incremental_from_saved_workbook(self):
+        '''A saved workbook plus its build cache seeds the next run'''
+        config = sample_config()
+        config['funding']['seed'] = 4000000
+        with tempfile.TemporaryDirectory() as tmp:
+            _, path = build(tmp, build_cache=True)
+            with contextlib.redirect_stdout(io.StringIO()):
+                builder = FinancialModelBuilder(config)
+                rebuilt = builder.build_incremental(path)
+                unchanged = FinancialModelBuilder(sample_config()).build_incremental(path)
+        self.assertNotIn('Revenue', rebuilt)
+        self.assertIn('Cap Table', ' '.join(rebuilt))
+        self.assertEqual(unchanged, [])
+
+    def test_build_cache_sidecar_only_when_requested(self):
+        '''Plain saves write only the workbook; rebuild() turns the sidecar on'''
+        with tempfile.TemporaryDirectory() as tmp:
+            builder, path = build(tmp)
+            self.assertEqual(os.listdir(tmp), ['model.xlsx'])
+            with contextlib.redirect_stdout(io.StringIO()):
+                builder.rebuild(sample_config())
+                builder.save(path)
+            self.assertTrue(os.path.exists(os.path.join(tmp, 'model.build.json')))
+
+
+class TestBatchBuild(unittest.TestCase):
+    '''Test building many configs across a process pool'''
+
+    def test_batch_reports_each_model(self):
+        '''Good configs build; broken ones are reported, not raised'''
+        with tempfile.TemporaryDirectory() as tmp:
+            configs = []
+            for name, content in [('alpha', sample_config()), ('beta', sample_config())]:
+                configs.append(os.path.join(tmp, f'{name}.json'))
+                with open(configs[-1], 'w') as f:
+                    json.dump(content, f)
+            configs.append(os.path.join(tmp, 'broken.json'))
+            with open(configs[-1], 'w') as f:
+                f.write('{not json')
+
+            out = os.path.join(tmp, 'out')
+            with contextlib.redirect_stdout(io.StringIO()):
+                report = build_batch(configs, out, workers=2)
+
+            self.assertEqual((report['total'], report['ok'], report['failed']), (3, 2, 1))
+            by_name = {os.path.basename(m['config']): m for m in report['models']}
+            self.assertTrue(os.path.exists(by_name['alpha.json']['output']))
+            self.assertGreater(by_name['alpha.json']['build_ms'], 0)
+            self.assertIn('JSONDecodeError', by_name['broken.json']['error'])
+
+    def test_discover_skips_non_model_json(self):
+        '''Configs dir finds <project>/config/*.json; sidecars and research JSON are skipped'''
+        with tempfile.TemporaryDirectory() as tmp:
+            files = {
+                'acme/config/acme_config.json': sample_config(),
+                'acme/config/acme_config.build.json': {'version': 1, 'sheets': {}},
+                'acme/config/stage_state.json': {'stage': 4},
+                'acme/research/market.json': {'revenue_streams': []},
+                'beta/config/model.json': sample_config(),
+            }
+            for rel, content in files.items():
+                path = os.path.join(tmp, rel)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'w', encoding='utf-8-sig') as f:  # BOM, as Windows editors save
+                    json.dump(content, f)
+            found = [os.path.relpath(p, tmp) for p in discover_configs([], tmp)]
+            self.assertEqual(found, [os.path.join('acme', 'config', 'acme_config.json'),
+                                     os.path.join('beta', 'config', 'model.json')])
+            pattern = os.path.join(tmp, 'acme', 'config', '*.json')
+            self.assertEqual(len(discover_configs([pattern])), 1)
+
+            out = os.path.join(tmp, 'out')
+            log = os.path.join(tmp, 'profile.jsonl')
+            with contextlib.redirect_stdout(io.StringIO()):
+                report = build_batch(discover_configs([], tmp), out, workers=2, monte_carlo=200,
+                                     profile=log, cached_values=False, formats=['csv'])
+            self.assertEqual(report['ok'], 2, report['models'])
+            output = report['models'][0]['output']
+            sensitivity = load_workbook(output)['Sensitivity Analysis']
+            self.assertIn('MONTE CARLO (200 trials', '\n'.join(
+                str(c.value) for row in sensitivity.iter_rows() for c in row))
+            cached = load_workbook(output, data_only=True)
+            formulas = [(title, coord) for (title, coord), v in
+                        sheet_values(load_workbook(output)).items() if str(v).startswith('=')]
+            self.assertTrue(formulas)
+            self.assertTrue(all(cached[title][coord].value is None for title, coord in formulas))
+            self.assertTrue(os.path.isdir(os.path.splitext(output)[0] + '_snapshot'))
+            with open(log, encoding='utf-8') as f:
+                events = [json.loads(line)['event'] for line in f]
+            self.assertEqual(events.count('export'), 2)
+
+
+class TestCachedValues(unittest.TestCase):
+    '''Test computed results cached in formula cells on save'''
+
+    def cached(self, path):
+        '''{(sheet, row, col): cached value} for every formula cell'''
+        formulas_wb, values_wb = load_workbook(path), load_workbook(path, data_only=True)
+        return {
+            (ws.title, cell.row, cell.column): values_wb[ws.title][cell.coordinate].value
+            for ws in formulas_wb.worksheets
+            for row in ws.iter_rows()
+            for cell in row
+            if isinstance(cell.value, str) and cell.value.startswith('=')
+        }
+
+    def test_openpyxl_and_layout_cache_results(self):
+        '''data_only readers see the evaluated numbers on both backends'''
+        with tempfile.TemporaryDirectory() as tmp:
+            builder, path = build(tmp, 'openpyxl.xlsx')
+            expected = {
+                (sheet, row, col): value
+                for sheet, cells in evaluate_workbook(builder.wb).items()
+                for (row, col), value in cells.items()
+            }
+            _, layout_path = build(tmp, 'layout.xlsx', backend='layout')
+            for p in (path, layout_path):
+                cached = self.cached(p)
+                self.assertEqual(set(cached), set(expected))
+                for key, value in cached.items():
+                    self.assertAlmostEqual(value, expected[key], places=6, msg=key)
+
+    def test_long_sum_chains_save(self):
+        '''250 streams: the Break-even totals' long + chains are cached, not a crash'''
+        config = sample_config()
+        config['revenue_streams'] = [
+            {'name': f'S{i}', 'price': 100, 'volume': 10, 'growth': 0.1, 'cogs_pct': 0.2}
+            for i in range(250)
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'big.xlsx')
+            with contextlib.redirect_stdout(io.StringIO()):
+                builder = FinancialModelBuilder(config)
+                builder.build_all()
+                builder.save(path)
+            ws = load_workbook(path, data_only=True)['Break-even Analysis']
+            totals = {ws.cell(r, 1).value: ws.cell(r, 3).value for r in range(1, ws.max_row + 1)}
+            self.assertEqual(totals['Total Revenue'], 250 * 100 * 10)
+            self.assertAlmostEqual(totals['Total Variable Costs (COGS)'], 250 * 100 * 10 * 0.2)
+
+    def test_cached_values_can_be_disabled(self):
+        '''cached_values=False and the streaming backend leave results empty'''
+        with tempfile.TemporaryDirectory() as tmp:
+            _, plain = build(tmp, 'plain.xlsx', cached_values=False)
+            _, streamed = build(tmp, 'streamed.xlsx', backend='streaming')
+            for p in (plain, streamed):
+                cached = self.cached(p)
+                self.assertTrue(cached)
+                self.assertEqual(set(cached.values()), {None})
+
+
+class TestBuildProfile(unittest.TestCase):
+    '''Test per-sheet JSON lines instrumentation'''
+
+    def read_events(self, path):
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def test_profile_records_each_sheet_and_save(self):
+        '''One line per sheet plus save, with counts matching the workbook'''
+        with tempfile.TemporaryDirectory() as tmp:
+            log = os.path.join(tmp, 'build.jsonl')
+            _, path = build(tmp, profile=log)
+            events = self.read_events(log)
+
+            sheets = [e for e in events if e['event'] == 'sheet']
+            self.assertEqual([e['sheet'] for e in sheets], SHEET_SEQUENCE)
+            self.assertEqual(events[-1]['event'], 'save')
+            self.assertEqual(events[-1]['file_bytes'], os.path.getsize(path))
+
+            values = sheet_values(load_workbook(path))
+            pnl = next(e for e in sheets if e['sheet'] == 'P&L')
+            pnl_formulas = [
+                v for (title, _), v in values.items()
+                if title == 'P&L' and str(v).startswith('=')
+            ]
+            self.assertEqual(pnl['formulas'], len(pnl_formulas))
+            self.assertGreaterEqual(pnl['cells'], pnl['formulas'])
+            self.assertGreater(sum(e['style_objects'] for e in sheets), 0)
+
+    def test_env_var_and_backends_agree(self):
+        '''FINANCIAL_MODEL_PROFILE enables it; streaming counts match openpyxl'''
+        with tempfile.TemporaryDirectory() as tmp:
+            counts = {}
+            for backend in ['openpyxl', 'streaming']:
+                log = os.path.join(tmp, f'{backend}.jsonl')
+                os.environ[PROFILE_ENV] = log
+                try:
+                    build(tmp, f'{backend}.xlsx', backend=backend)
+                finally:
+                    del os.environ[PROFILE_ENV]
+                counts[backend] = [
+                    (e['sheet'], e['cells'], e['formulas'])
+                    for e in self.read_events(log) if e['event'] == 'sheet'
+                ]
+            self.assertEqual(counts['openpyxl'], counts['streaming'])
+
+
+class TestLayoutIR(unittest.TestCase):
+    '''Test compiling one layout pass to xlsx, Sheets payload and CSVs'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        _, ref_path = build(cls.tmp.name, 'ref.xlsx')
+        cls.ref = sheet_values(load_workbook(ref_path))
+        cls.path = os.path.join(cls.tmp.name, 'layout.xlsx')
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.builder = FinancialModelBuilder(sample_config(), backend='layout')
+            cls.builder.build_all()
+            cls.written = cls.builder.export(cls.path, ['xlsx', 'sheets', 'csv'])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_xlsx_matches_openpyxl(self):
+        '''Compiled xlsx holds the same values and formulas'''
+        self.assertEqual(sheet_values(load_workbook(self.written['xlsx'])), self.ref)
+
+    def test_sheets_payload_matches_layout(self):
+        '''batchUpdate payload adds every sheet and carries every cell'''
+        with open(self.written['sheets'], encoding='utf-8') as f:
+            payload = json.load(f)
+        self.assertEqual(payload, compile_sheets_payload(self.builder.wb))
+        requests = payload['requests']
+        titles = {r['addSheet']['properties']['sheetId']: r['addSheet']['properties']['title']
+                  for r in requests if 'addSheet' in r}
+        self.assertEqual(list(titles.values()), SHEET_SEQUENCE)
+
+        cells = {}
+        for req in requests:
+            if 'updateCells' not in req:
+                continue
+            title = titles[req['updateCells']['start']['sheetId']]
+            for r, row in enumerate(req['updateCells']['rows'], start=1):
+                for c, data in enumerate(row.get('values', []), start=1):
+                    value = data.get('userEnteredValue')
+                    if value:
+                        cells[(title, f'{get_column_letter(c)}{r}')] = next(iter(value.values()))
+        self.assertEqual(cells, self.ref)
+        self.assertTrue(any('mergeCells' in r for r in requests))
+        self.assertTrue(any('updateDimensionProperties' in r for r in requests))
+
+    def test_sheets_payload_applies_to_new_spreadsheet(self):
+        '''Payload applies in one batchUpdate to a fresh file and replaces Sheet1'''
+        fake = FakeGoogleAPI(clock=VirtualClock())
+        limiter = QuotaLimiter(rng=lambda: 0.5)
+        with open(self.written['sheets'], encoding='utf-8') as f:
+            payload = json.load(f)
+        with fake.install(limiter):
+            spreadsheet = authorize(fake_credentials(), limiter=limiter).create('BuilderCo')
+            spreadsheet.batch_update(payload)
+            self.assertEqual([ws.title for ws in spreadsheet.worksheets()], SHEET_SEQUENCE)
+        self.assertEqual(fake.counts['sheets.spreadsheets.batchUpdate'], 1)
+        cells = {
+            (title, f'{get_column_letter(c)}{r}'): value
+            for title in SHEET_SEQUENCE
+            for r, row in enumerate(fake.values(spreadsheet.id, title), start=1)
+            for c, value in enumerate(row, start=1)
+            if value != ''
+        }
+        self.assertEqual(cells, self.ref)
+
+    def test_snapshot_csvs_match_layout(self):
+        '''Snapshot uses the download_model_snapshot layout and formulas'''
+        snapshot = self.written['csv']
+        with open(os.path.join(snapshot, 'snapshot.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        by_name = {s['name']: s for s in meta['sheets']}
+        self.assertEqual(list(by_name), SHEET_SEQUENCE)
+        self.assertEqual(by_name['P&L']['safe_name'], 'P_L')
+
+        with open(os.path.join(snapshot, by_name['P&L']['formulas_file']), encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0][:3], ['Row', 'A', 'B'])
+        for row in rows[1:]:
+            for c, text in enumerate(row[1:], start=1):
+                expected = self.ref.get(('P&L', f'{get_column_letter(c)}{row[0]}'))
+                if expected is not None:
+                    self.assertEqual(text, str(expected))
+
+        with open(os.path.join(snapshot, by_name['P&L']['values_file']), encoding='utf-8') as f:
+            values = list(csv.reader(f))
+        self.assertFalse(any(v.startswith('=') for row in values for v in row))
+        revenue = self.builder.row_refs['pnl_revenue']
+        self.assertEqual(
+            float(values[revenue][3]), self.builder.compute()['pnl_revenue'][0]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+'''
+Test Suite for create_financial_model.py batch mode
+====================================================
+Tests concurrent multi-model creation (create functions are faked; no network).
+
+Usage:
+    python -m pytest tests/test_create_financial_model.py -v
+    python tests/test_create_financial_model.py  # Run without pytest
+'''
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'execution'))
+
+import create_financial_model as cfm
+
+
+def fake_create(method, delay=0.2):
+    '''Stand-in for create_from_template / create_financial_model_v2'''
+    def create(company_name, config=None, use_humanoid_rent=False, folder_id=None):
+        print(f'building {company_name}')
+        time.sleep(delay)
+        if company_name == 'Broken':
+            raise RuntimeError('quota exhausted')
+        return {'spreadsheet_id': f'id-{company_name}', 'method': method,
+                'url': f'https://docs.google.com/spreadsheets/d/id-{company_name}/edit'}
+    return create
+
+
+class TestConcurrentCreation(unittest.TestCase):
+    '''Test create_models_concurrently'''
+
+    def run_batch(self, jobs, **kwargs):
+        out = io.StringIO()
+        with patch.object(cfm, 'get_credentials'), \
+                patch.object(cfm, 'create_from_template', fake_create('template_copy')), \
+                patch.object(cfm, 'create_financial_model_v2', fake_create('build_from_scratch')), \
+                contextlib.redirect_stdout(out):
+            report = cfm.create_models_concurrently(jobs, **kwargs)
+        return report, out.getvalue()
+
+    def test_models_created_in_parallel(self):
+        '''Four 0.2 s creations on four workers take well under 0.8 s'''
+        jobs = [{'company': f'Co{i}'} for i in range(4)]
+        report, _ = self.run_batch(jobs, workers=4)
+        self.assertEqual((report['total'], report['ok'], report['failed']), (4, 4, 0))
+        self.assertLess(report['elapsed_s'], 0.7)
+        self.assertGreater(report['models_per_minute'], 4 / 0.7 * 60)
+        for model in report['models']:
+            self.assertGreaterEqual(model['elapsed_s'], 0.2)
+            self.assertEqual(model['method'], 'template_copy')
+
+    def test_failures_and_output_captured(self):
+        '''A failed model is reported with its output; worker prints stay off stdout'''
+        jobs = [{'company': 'Good'}, {'company': 'Broken', 'method': 'scratch'}]
+        report, printed = self.run_batch(jobs, workers=2, build_from_scratch=False)
+        self.assertEqual((report['ok'], report['failed']), (1, 1))
+        broken = next(m for m in report['models'] if m['company'] == 'Broken')
+        self.assertEqual(broken['error'], 'RuntimeError: quota exhausted')
+        self.assertIn('building Broken', broken['log'])
+        self.assertNotIn('building', printed)
+        self.assertIn('FAILED Broken', printed)
+        self.assertNotIsInstance(sys.stdout, cfm._ThreadOutput)
+
+    def test_load_batch_jobs(self):
+        '''Config paths are loaded; entries without a company are rejected'''
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = os.path.join(tmp, 'acme.json')
+            with open(config_path, 'w') as f:
+                json.dump({'general': {'tax_rate': 0.2}}, f)
+            jobs_path = os.path.join(tmp, 'jobs.json')
+            with open(jobs_path, 'w') as f:
+                json.dump([{'company': 'Acme', 'config': config_path},
+                           {'company': 'Beta', 'config': {'general': {}}}], f)
+            jobs = cfm.load_batch_jobs(jobs_path)
+            self.assertEqual(jobs[0]['config'], {'general': {'tax_rate': 0.2}})
+            self.assertEqual(jobs[1]['config'], {'general': {}})
+
+            with open(jobs_path, 'w') as f:
+                json.dump([{'config': {}}], f)
+            with self.assertRaises(ValueError):
+                cfm.load_batch_jobs(jobs_path)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
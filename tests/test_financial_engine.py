@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+'''
+Test Suite for financial_engine.py
+==================================
+Checks that the native NumPy engine agrees with the Excel formulas written by
+build_financial_model.py (recalculated through the `formulas` library).
+
+Usage:
+    python -m pytest tests/test_financial_engine.py -v
+    python tests/test_financial_engine.py  # Run without pytest
+'''
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'execution'))
+
+from build_financial_model import FinancialModelBuilder
+from financial_engine import (
+    asset_classes,
+    compute_model,
+    excel_round,
+    fixed_asset_schedule,
+    vintage_matrix,
+)
+from formula_eval import evaluate_workbook
+from monte_carlo import run_monte_carlo
+from time_axis import TimeAxis
+
+try:
+    import formulas
+    HAS_FORMULAS = True
+except ImportError:
+    HAS_FORMULAS = False
+
+
+def sample_config():
+    '''Multi-stream config exercising legacy headcount/funding formats'''
+    return {
+        'company_name': 'EngineCo',
+        'starting_year': 2026,
+        'general': {'capex_y0': 120000, 'capex_annual': 40000, 'depreciation_years': 4},
+        'revenue_streams': [
+            {'name': 'Software', 'price': 2500, 'volume': 25, 'growth': 0.5, 'cogs_pct': 0.15},
+            {'name': 'Hardware', 'price': 5000, 'volume': 15, 'growth': 0.35, 'cogs_pct': 0.6},
+            {'name': 'Services', 'price': 9999, 'volume': 7, 'growth': 0.45, 'cogs_pct': 0.45},
+        ],
+        'fixed_costs': [
+            {'name': 'Office', 'annual_cost': 36000},
+            {'name': 'Founder Salaries', 'annual_cost': 90000},
+            {'name': 'Marketing', 'annual_cost': 60000},
+        ],
+        'headcount': {
+            'engineering_salary': 80000, 'engineering_y0': 5,
+            'sales_salary': 60000, 'sales_y0': 3, 'sales_growth': 0.25,
+        },
+        'funding': {
+            'seed': 3000000, 'seed_year': 0,
+            'series_a': 10000000, 'series_a_year': 2,
+        },
+        'tam': {'software': 10000, 'services': 20000},
+        'sam': {'india': 1800},
+        'som': {'year8_revenue': 104},
+    }
+
+
+def recalculate(builder):
+    '''Save the workbook and recalculate it; returns {(SHEET, cell): value}'''
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model.xlsx')
+        builder.wb.save(path)
+        solution = formulas.ExcelModel().loads(path).finish().calculate()
+    values = {}
+    for key, value in solution.items():
+        sheet, cell = key.split(']', 1)[1].rsplit('!', 1)
+        val = value.value[0][0] if hasattr(value, 'value') else value
+        values[(sheet.strip("'"), cell)] = val
+    return values
+
+
+class TestExcelPrimitives(unittest.TestCase):
+    '''Test Excel-compatible helpers'''
+
+    def test_round_half_away_from_zero(self):
+        '''Excel ROUND rounds .5 away from zero (unlike numpy banker's rounding)'''
+        self.assertEqual(list(excel_round([0.5, 1.5, 2.5, -2.5])), [1, 2, 3, -3])
+
+
+@unittest.skipUnless(HAS_FORMULAS, 'formulas library not installed')
+class TestEngineMatchesExcel(unittest.TestCase):
+    '''Test native numbers against recalculated Excel formulas'''
+
+    ROWS = [
+        ('Headcount Plan', 'headcount_total'),
+        ('Headcount Plan', 'salary_cost_total'),
+        ('Revenue', 'revenue_total'),
+        ('Operating Costs', 'cogs_total'),
+        ('Operating Costs', 'fixed_total'),
+        ('Operating Costs', 'opex_total'),
+        ('P&L', 'pnl_gross_profit'),
+        ('P&L', 'pnl_ebitda'),
+        ('P&L', 'pnl_depreciation'),
+        ('P&L', 'pnl_tax'),
+        ('P&L', 'pnl_net_income'),
+        ('Cash Flow', 'cf_operating'),
+        ('Cash Flow', 'cf_net'),
+        ('Cash Flow', 'cf_cumulative'),
+        ('Balance Sheet', 'bs_fixed_assets'),
+        ('Balance Sheet', 'bs_total_assets'),
+        ('Balance Sheet', 'bs_total_le'),
+        ('Balance Sheet', 'bs_check'),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.builder = FinancialModelBuilder(sample_config())
+        cls.builder.build_all()
+        cls.excel = recalculate(cls.builder)
+        cls.native = cls.builder.compute()
+
+    def excel_row(self, sheet, row, first_col=3):
+        from openpyxl.utils import get_column_letter
+        return [
+            self.excel[(sheet.upper(), f'{get_column_letter(first_col + yr)}{row}')]
+            for yr in range(self.builder.num_periods)
+        ]
+
+    def test_yearly_rows_agree(self):
+        '''Every tracked yearly row matches Excel within floating-point noise'''
+        for sheet, key in self.ROWS:
+            with self.subTest(row=key):
+                expected = self.excel_row(sheet, self.builder.row_refs[key])
+                for got, want in zip(self.native[key], expected):
+                    self.assertAlmostEqual(got, want, delta=1e-6 * max(1, abs(want)))
+
+    def test_volume_rounding_agrees(self):
+        '''Per-stream volumes (ROUND each year) match Assumptions sheet'''
+        start = self.builder.row_refs['revenue_streams_start']
+        for idx, volumes in enumerate(self.native['stream_volume']):
+            expected = self.excel_row('Assumptions', start + idx * 4 + 1, first_col=4)
+            for got, want in zip(volumes, expected):
+                self.assertAlmostEqual(got, want, delta=1e-9 * max(1, abs(want)))
+
+    def test_balance_sheet_balances(self):
+        '''Depreciation and NFA come from one schedule, so the check is zero'''
+        check = self.excel_row('Balance Sheet', self.builder.row_refs['bs_check'])
+        for value in check:
+            self.assertAlmostEqual(value, 0, delta=1e-6)
+
+    def test_formula_evaluator_agrees(self):
+        '''Cached values from formula_eval match Excel for every formula cell'''
+        from openpyxl.utils import get_column_letter
+        compared = 0
+        for sheet, cells in evaluate_workbook(self.builder.wb).items():
+            for (row, col), got in cells.items():
+                want = self.excel.get((sheet.upper(), f'{get_column_letter(col)}{row}'))
+                if isinstance(want, (int, float)) and not isinstance(want, bool):
+                    compared += 1
+                    self.assertAlmostEqual(got, want, delta=1e-6 * max(1, abs(want)))
+                elif want is not None:
+                    compared += 1
+                    self.assertEqual(str(got), str(want))
+        self.assertGreater(compared, 500)
+
+    def test_terminal_metrics_agree(self):
+        '''Valuation uses the terminal-year revenue'''
+        rev = self.native.terminal('pnl_revenue')
+        self.assertAlmostEqual(float(self.native['val_exit_value']), rev * 5.0)
+
+
+class TestFixedAssets(unittest.TestCase):
+    '''Test the capex-vintage depreciation schedule'''
+
+    def test_vintages_depreciate_over_their_life(self):
+        '''Straight line from the purchase year; fractional lives end part-year'''
+        dep = vintage_matrix([[100, 100, 0, 0]], [2.5])[0]
+        self.assertEqual(dep[:, 0].tolist(), [40, 40, 20, 0])
+        self.assertEqual(dep[:, 1].tolist(), [0, 40, 40, 20])
+        self.assertEqual(dep.sum(), 200)
+
+    def test_default_class_from_general(self):
+        '''Without fixed_assets, one class uses capex_y0 then capex_annual'''
+        config = {'general': {'capex_y0': 150000, 'capex_annual': 50000,
+                              'depreciation_years': 5}}
+        schedule = fixed_asset_schedule(asset_classes(config), TimeAxis(8))
+        self.assertEqual(schedule['capex'].tolist(), [150000] + [50000] * 7)
+        # Year-0 capex stops depreciating after five years
+        self.assertEqual(schedule['depreciation'].tolist(),
+                         [30000, 40000, 50000, 60000, 70000, 50000, 50000, 50000])
+
+    def test_schedule_ties_out_per_class(self):
+        '''Cumulative capex = cumulative depreciation + NFA on any axis'''
+        config = {'fixed_assets': {'classes': [
+            {'name': 'Equipment', 'useful_life': 3, 'capex': [90000, 10000, 0]},
+            {'name': 'Buildings', 'useful_life': 20, 'capex': [1000000, 0]},
+        ]}}
+        for axis in (TimeAxis(6), TimeAxis(6, 'hybrid', 24)):
+            with self.subTest(granularity=axis.granularity):
+                schedule = fixed_asset_schedule(asset_classes(config), axis)
+                self.assertEqual(schedule['class_capex'].shape, (2, len(axis)))
+                tied = schedule['depreciation'].cumsum() + schedule['nfa']
+                for got, want in zip(tied, schedule['capex'].cumsum()):
+                    self.assertAlmostEqual(got, want, places=6)
+                self.assertEqual(schedule['depreciation'].sum(), 100000 + 6 * 50000)
+
+
+class TestTimeAxis(unittest.TestCase):
+    '''Test period layout of the monthly/hybrid time axes'''
+
+    def test_hybrid_layout(self):
+        '''36 months then one column per remaining year'''
+        axis = TimeAxis(11, 'hybrid', 36)
+        self.assertEqual(len(axis), 44)
+        self.assertEqual(axis.labels(2026)[:2], ['Jan 2026', 'Feb 2026'])
+        self.assertEqual(axis.labels(2026)[36], '2029')
+        self.assertEqual(len(axis.year_periods(2)), 12)
+        self.assertEqual(axis.year_end(3).index, 36)
+
+    def test_monthly_flows_sum_to_year(self):
+        '''Monthly flat inputs add up to the annual figure per year'''
+        config = sample_config()
+        for stream in config['revenue_streams']:
+            stream['growth'] = 0
+        annual = compute_model(FinancialModelBuilder(config).config, num_years=3)
+        monthly = compute_model(
+            FinancialModelBuilder(config).config, axis=TimeAxis(3, 'monthly')
+        )
+        for year in range(3):
+            self.assertAlmostEqual(
+                monthly.year_value('revenue_total', year),
+                annual.year_value('revenue_total', year),
+            )
+
+
+class TestMonteCarlo(unittest.TestCase):
+    '''Test the vectorized Monte Carlo sweep'''
+
+    def setUp(self):
+        self.config = FinancialModelBuilder(sample_config()).config
+
+    def test_zero_spread_reproduces_base_case(self):
+        '''With no variance every trial equals the deterministic model'''
+        self.config['monte_carlo'] = {
+            'trials': 50,
+            'distributions': {
+                name: {'dist': 'normal', 'sd': 0}
+                for name in ['price', 'volume_growth', 'cogs_pct', 'churn', 'salary']
+            },
+        }
+        mc = run_monte_carlo(self.config)
+        base = compute_model(self.config)
+        for key in ['pnl_revenue', 'pnl_ebitda', 'cf_cumulative']:
+            for pct in ['p10', 'p50', 'p90']:
+                self.assertAlmostEqual(mc['bands'][key][pct], base.terminal(key), places=4)
+
+    def test_bands_ordered_and_seeded(self):
+        '''P10 <= P50 <= P90, and a fixed seed gives identical bands'''
+        first = run_monte_carlo(self.config, trials=2000, seed=7)
+        again = run_monte_carlo(self.config, trials=2000, seed=7)
+        self.assertEqual(first['bands'], again['bands'])
+        for band in first['bands'].values():
+            self.assertLessEqual(band['p10'], band['p50'])
+            self.assertLessEqual(band['p50'], band['p90'])
+        self.assertLess(first['bands']['pnl_revenue']['p10'],
+                        first['bands']['pnl_revenue']['p90'])
+
+    def test_ten_thousand_trials_in_seconds(self):
+        '''A 10k-trial sweep runs in one vectorized pass'''
+        started = time.perf_counter()
+        mc = run_monte_carlo(self.config, trials=10000)
+        self.assertEqual(mc['trials'], 10000)
+        self.assertLess(time.perf_counter() - started, 5.0)
+
+    def test_sensitivity_sheet_bands(self):
+        '''Builder writes the bands when the config has a monte_carlo section'''
+        config = sample_config()
+        config['monte_carlo'] = {'trials': 500}
+        builder = FinancialModelBuilder(config)
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder.build_all()
+        labels = [c.value for c in builder.wb['Sensitivity Analysis']['A']]
+        self.assertIn('MONTE CARLO (500 trials, seed 42)', labels)
+
+
+@unittest.skipUnless(HAS_FORMULAS, 'formulas library not installed')
+class TestHybridAxisMatchesExcel(TestEngineMatchesExcel):
+    '''Same checks on a hybrid axis (24 months, then annual)'''
+
+    @classmethod
+    def setUpClass(cls):
+        config = sample_config()
+        config['valuation'] = {'terminal_year': 1}  # inside the monthly span
+        cls.builder = FinancialModelBuilder(
+            config, num_years=4, granularity='hybrid', monthly_months=24
+        )
+        cls.builder.build_all()
+        cls.excel = recalculate(cls.builder)
+        cls.native = cls.builder.compute()
+
+    def test_terminal_metrics_agree(self):
+        '''Valuation sums the terminal year's twelve months like Excel does'''
+        self.assertEqual(self.builder.num_periods, 26)
+        ws = self.builder.wb['Valuation']
+        row = next(r for r in range(1, ws.max_row + 1)
+                   if ws.cell(r, 1).value == 'Year 1 Revenue')
+        want = self.excel[('VALUATION', f'B{row}')]
+        self.assertAlmostEqual(
+            self.native.terminal('pnl_revenue'), want, delta=1e-6 * want
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
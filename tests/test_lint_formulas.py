@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+'''
+Test Suite for lint_formulas.py
+===============================
+Tests the static reference checks on workbooks and snapshots written by
+build_financial_model.py.
+
+Usage:
+    python -m pytest tests/test_lint_formulas.py -v
+    python tests/test_lint_formulas.py  # Run without pytest
+'''
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'execution'))
+
+from openpyxl import load_workbook
+
+from build_financial_model import FinancialModelBuilder
+from lint_formulas import lint_cells, lint_path, tokenize_references
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'execution', 'lint_formulas.py')
+
+
+def sample_config():
+    '''Two streams, one fixed cost, seed funding'''
+    return {
+        'company_name': 'LintCo',
+        'starting_year': 2026,
+        'revenue_streams': [
+            {'name': 'Software', 'price': 2500, 'volume': 25, 'growth': 0.5, 'cogs_pct': 0.15},
+            {'name': 'Services', 'price': 10000, 'volume': 5, 'growth': 0.4, 'cogs_pct': 0.45},
+        ],
+        'fixed_costs': [{'name': 'Office', 'annual_cost': 36000}],
+        'headcount': {'engineering_salary': 80000, 'engineering_y0': 5},
+        'funding': {'seed': 3000000, 'seed_year': 0},
+    }
+
+
+class TestTokenizer(unittest.TestCase):
+    '''Test reference extraction from formula text'''
+
+    def test_references(self):
+        '''Quoted sheets, absolute parts, ranges and external links'''
+        refs = tokenize_references(
+            "=SUM(C5:C9)+'Cash Flow'!$D$20*Assumptions!D$16+[1]Debt!B3"
+        )
+        self.assertEqual([r.text for r in refs], [
+            'C5:C9', "'Cash Flow'!$D$20", 'Assumptions!D$16', '[1]Debt!B3',
+        ])
+        rng, cash, assumption, debt = refs
+        self.assertTrue(rng.is_range)
+        self.assertEqual((rng.row, rng.col, rng.last_row, rng.last_col), (5, 3, 9, 3))
+        self.assertEqual((cash.sheet, cash.row, cash.col, cash.absolute_col), ('Cash Flow', 20, 4, True))
+        self.assertFalse(assumption.absolute_col)
+        self.assertTrue(debt.external)
+
+    def test_strings_and_functions_ignored(self):
+        '''Text inside quotes and function names are not references'''
+        refs = tokenize_references('=IF(LOG10(C4)>1,"see A1",ROUND(D4,0))')
+        self.assertEqual([r.text for r in refs], ['C4', 'D4'])
+
+
+class TestLint(unittest.TestCase):
+    '''Test the structural checks against a built model'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, 'model.xlsx')
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder = FinancialModelBuilder(sample_config(), 6, backend='layout')
+            builder.build_all()
+            builder.export(cls.path, ('xlsx', 'csv'))
+        cls.snapshot = os.path.join(cls.tmp.name, 'model_snapshot')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def tampered(self, edit):
+        wb = load_workbook(self.path)
+        edit(wb)
+        path = os.path.join(self.tmp.name, 'tampered.xlsx')
+        wb.save(path)
+        return lint_path(path)
+
+    def test_built_model_is_clean(self):
+        '''Workbook and snapshot of a built model have no issues'''
+        result = lint_path(self.path)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.issues, [])
+        self.assertGreater(result.formulas, 300)
+
+        snapshot = lint_path(self.snapshot)
+        self.assertEqual(snapshot.issues, [])
+        self.assertEqual(snapshot.formulas, result.formulas)
+
+    def test_missing_sheet_is_dangling(self):
+        '''Deleting a sheet leaves dangling references in its dependents'''
+        result = self.tampered(lambda wb: wb.remove(wb['Cash Flow']))
+        self.assertFalse(result.ok)
+        dangling = [i for i in result.errors if i.kind == 'dangling']
+        self.assertIn(('Balance Sheet', 'C5'), [(i.sheet, i.cell) for i in dangling])
+        self.assertIn("'Cash Flow' does not exist", str(dangling[0]))
+
+    def test_trimmed_years_out_of_range(self):
+        '''Year columns cleared on one sheet break references from the others'''
+        result = self.tampered(lambda wb: wb['P&L'].delete_cols(6, 10))
+        cells = {(i.sheet, i.cell) for i in result.errors if i.kind == 'out_of_range'}
+        self.assertIn(('Summary', 'F5'), cells)
+        self.assertNotIn(('Summary', 'E5'), cells)
+
+    def test_period_mismatch(self):
+        '''A cross-sheet reference to another year is flagged; the prior year is not'''
+        def shift(wb):
+            wb['Balance Sheet']['D5'] = "='Cash Flow'!F20"
+            wb['Balance Sheet']['E5'] = "='Cash Flow'!D20"
+        result = self.tampered(shift)
+        mismatches = [i for i in result.errors if i.kind == 'period_mismatch']
+        self.assertEqual([(i.sheet, i.cell) for i in mismatches], [('Balance Sheet', 'D5')])
+        self.assertIn('column is 2027', mismatches[0].message)
+
+    def test_empty_target_is_warning_unless_strict(self):
+        '''A reference to a spacer row warns; --strict turns it into an error'''
+        wb = load_workbook(self.path)
+        book = {
+            ws.title: {(c.row, c.column): c.value for row in ws.iter_rows() for c in row
+                       if c.value is not None}
+            for ws in wb.worksheets
+        }
+        book['Summary'][(5, 3)] = "='P&L'!C2"
+        result = lint_cells(book)
+        self.assertTrue(result.ok)
+        self.assertEqual([(i.kind, i.cell) for i in result.warnings], [('empty_target', 'C5')])
+        self.assertFalse(lint_cells(book, strict=True).ok)
+
+    def test_cli_exit_code_and_json(self):
+        '''CLI exits 1 on errors and emits the JSON report'''
+        wb = load_workbook(self.path)
+        wb['P&L']['C7'] = '=Debt!C3*2'
+        path = os.path.join(self.tmp.name, 'broken.xlsx')
+        wb.save(path)
+        result = subprocess.run(
+            [sys.executable, SCRIPT, '--file', path, '--json'],
+            capture_output=True, text=True,
+        )
+        self.assertEqual(result.returncode, 1, result.stdout + result.stderr)
+        report = json.loads(result.stdout)
+        self.assertEqual(report['counts']['dangling'], 1)
+        self.assertEqual(report['errors'][0]['cell'], 'C7')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
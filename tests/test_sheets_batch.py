@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+'''
+Test Suite for sheets_batch.py
+==============================
+Tests that recorded gspread writes are sent as a few batchUpdate /
+values.batchUpdate calls, split at payload limits, and that template
+updates write only changed cells (no network).
+
+Usage:
+    python -m pytest tests/test_sheets_batch.py -v
+    python tests/test_sheets_batch.py  # Run without pytest
+'''
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'execution'))
+
+from gspread_formatting import CellFormat, TextFormat, format_cell_range, set_column_width
+
+from sheets_batch import BatchedSpreadsheet, chunked, write_changed_cells
+
+
+def fake_spreadsheet():
+    '''gspread Spreadsheet double holding the default Sheet1 (id 0)'''
+    spreadsheet = MagicMock()
+    spreadsheet.id = 'sheet-id'
+    default = MagicMock()
+    default.title, default.id = 'Sheet1', 0
+    spreadsheet.worksheets.return_value = [default]
+    return spreadsheet
+
+
+class TestChunking(unittest.TestCase):
+    '''Test payload splitting'''
+
+    def test_splits_by_bytes_and_count(self):
+        '''Chunks stay under the byte and item limits; oversize items go alone'''
+        items = [{'v': 'x' * 40}] * 10
+        self.assertEqual([len(c) for c in chunked(items, max_bytes=200)], [4, 4, 2])
+        self.assertEqual([len(c) for c in chunked(items, max_items=3)], [3, 3, 3, 1])
+        self.assertEqual([len(c) for c in chunked([{'v': 'x' * 500}, {'v': 1}], max_bytes=100)], [1, 1])
+
+
+class TestBatchedSpreadsheet(unittest.TestCase):
+    '''Test recording and the three-phase commit'''
+
+    def record(self, batch):
+        sheet = batch.add_worksheet("P&L", rows=20, cols=13)
+        sheet.update(values=[['Revenue', '$', 100], ['', '', '=C1*2']], range_name='A1',
+                     value_input_option='USER_ENTERED')
+        sheet.format('A1:M1', {'textFormat': {'bold': True}})
+        sheet.batch_format([{'range': 'C1:M2', 'format': {'numberFormat': {'type': 'NUMBER'}}}])
+        format_cell_range(sheet, 'A2', CellFormat(textFormat=TextFormat(italic=True)))
+        set_column_width(sheet, 'A', 250)
+        batch.del_worksheet(batch.worksheet('Sheet1'))
+        return sheet
+
+    def test_three_calls_in_order(self):
+        '''addSheet, then values, then formats and the deleteSheet last'''
+        spreadsheet = fake_spreadsheet()
+        batch = BatchedSpreadsheet(spreadsheet)
+        sheet = self.record(batch)
+        spreadsheet.batch_update.assert_not_called()
+        self.assertEqual(sheet.get_all_values(), [['Revenue', '$', '100'], ['', '', '=C1*2']])
+
+        stats = batch.commit()
+        self.assertEqual(stats, {'api_calls': 3, 'requests': 6, 'value_ranges': 1, 'failed': 0})
+        (structure,), (formats,) = [c.args for c in spreadsheet.batch_update.call_args_list]
+        add = structure['requests'][0]['addSheet']['properties']
+        self.assertEqual((add['title'], add['sheetId']), ('P&L', 1))
+        values = spreadsheet.values_batch_update.call_args.args[0]
+        self.assertEqual(values['valueInputOption'], 'USER_ENTERED')
+        self.assertEqual(values['data'][0]['range'], "'P&L'!A1")
+        kinds = [next(iter(r)) for r in formats['requests']]
+        self.assertEqual(kinds, ['repeatCell'] * 3 + ['updateDimensionProperties', 'deleteSheet'])
+        self.assertEqual(formats['requests'][0]['repeatCell']['range']['sheetId'], 1)
+        self.assertEqual(formats['requests'][0]['repeatCell']['fields'], 'userEnteredFormat(textFormat)')
+        self.assertEqual(batch.pending, 0)
+
+    def test_split_at_payload_limit(self):
+        '''Large value payloads are sent in several values.batchUpdate calls'''
+        spreadsheet = fake_spreadsheet()
+        batch = BatchedSpreadsheet(spreadsheet, max_bytes=4000)
+        for i in range(6):
+            sheet = batch.add_worksheet(f'S{i}', rows=50, cols=13)
+            sheet.update(values=[[f'=A{r}+1'] * 13 for r in range(1, 20)], range_name='A1',
+                         value_input_option='USER_ENTERED')
+        batch.commit()
+        calls = spreadsheet.values_batch_update.call_args_list
+        self.assertGreater(len(calls), 1)
+        self.assertEqual(sum(len(c.args[0]['data']) for c in calls), 6)
+
+    def test_rejected_batch_resent_singly(self):
+        '''One bad format request does not drop the rest of its batch'''
+        spreadsheet = fake_spreadsheet()
+
+        def batch_update(body):
+            requests = body['requests']
+            if len(requests) > 1 and any('deleteSheet' in r for r in requests):
+                raise RuntimeError('Invalid requests[4]')
+            if requests == [{'deleteSheet': {'sheetId': 0}}]:
+                raise RuntimeError('cannot delete')
+        spreadsheet.batch_update.side_effect = batch_update
+
+        batch = BatchedSpreadsheet(spreadsheet)
+        self.record(batch)
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = batch.commit()
+        self.assertEqual(stats['failed'], 1)
+        self.assertEqual(stats['api_calls'], 3 + 5)
+
+
+class TestModelBuilder(unittest.TestCase):
+    '''Test the build-from-scratch builder against the batched spreadsheet'''
+
+    def test_sources_sheet_is_one_batch(self):
+        '''A full sheet with gspread_formatting helpers costs three API calls'''
+        import create_financial_model as cfm
+
+        spreadsheet = fake_spreadsheet()
+        batch = BatchedSpreadsheet(spreadsheet)
+        with contextlib.redirect_stdout(io.StringIO()):
+            cfm.FinancialModelBuilder(batch, cfm.HUMANOID_RENT_CONFIG).build_sources_sheet()
+        self.assertGreater(len(batch.requests), 20)
+        stats = batch.commit()
+        self.assertEqual(stats['api_calls'], 3)
+        self.assertEqual(stats['failed'], 0)
+
+
+def template_spreadsheet(grids):
+    '''Spreadsheet double answering values.batchGet from in-memory grids'''
+    spreadsheet = MagicMock()
+
+    def batch_get(ranges, params=None):
+        titles = [r.rsplit('!', 1)[0].strip("'") for r in ranges]
+        missing = [t for t in titles if t not in grids]
+        if missing:
+            raise RuntimeError(f'Unable to parse range: {missing[0]}')
+        return {'valueRanges': [{'range': r, 'values': grids[t]} for r, t in zip(ranges, titles)]}
+    spreadsheet.values_batch_get.side_effect = batch_get
+    return spreadsheet
+
+
+class TestWriteChangedCells(unittest.TestCase):
+    '''Test the diff-based bulk writer for copied templates'''
+
+    def test_one_read_one_write_only_changes(self):
+        '''Unchanged cells are not sent; all sheets share one read and one write'''
+        spreadsheet = template_spreadsheet({
+            'Assumptions': [['Tax'], ['', '', 0.25], ['', '', '=C2*2']],
+            'Sources & References': [],
+        })
+        targets = {
+            ('Assumptions', 'C2'): 0.25,
+            ('Assumptions', 'C3'): 100,
+            ('Assumptions', 'A1'): 'Tax',
+            ('Assumptions', 'A5'): 'New row',
+            ('Sources & References', 'B7'): '$12B',
+        }
+        stats = write_changed_cells(spreadsheet, targets)
+        self.assertEqual(stats, {'read_calls': 1, 'write_calls': 1, 'cells': 5, 'changed': 3})
+        ranges = spreadsheet.values_batch_get.call_args.args[0]
+        self.assertEqual(ranges, ["'Assumptions'!A1:C5", "'Sources & References'!A1:B7"])
+        self.assertEqual(spreadsheet.values_batch_get.call_args.kwargs['params'],
+                         {'valueRenderOption': 'FORMULA'})
+        body = spreadsheet.values_batch_update.call_args.args[0]
+        self.assertEqual([d['range'] for d in body['data']],
+                         ["'Assumptions'!C3", "'Assumptions'!A5", "'Sources & References'!B7"])
+
+    def test_missing_sheet_skipped(self):
+        '''A sheet missing from the copy is skipped; the others are still written'''
+        spreadsheet = template_spreadsheet({'Assumptions': []})
+        targets = {('Assumptions', 'C4'): 0.3, ('Sources & References', 'B7'): 1}
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = write_changed_cells(spreadsheet, targets)
+        self.assertEqual((stats['read_calls'], stats['changed']), (3, 1))
+        body = spreadsheet.values_batch_update.call_args.args[0]
+        self.assertEqual(body['data'], [{'range': "'Assumptions'!C4", 'values': [[0.3]]}])
+
+    def test_template_update_is_two_calls(self):
+        '''A full config update on a copied template costs one read and one write'''
+        import create_financial_model as cfm
+
+        spreadsheet = template_spreadsheet({'Assumptions': [], 'Sources & References': []})
+        with contextlib.redirect_stdout(io.StringIO()):
+            cfm._update_template_values(spreadsheet, cfm.HUMANOID_RENT_CONFIG)
+        self.assertEqual(spreadsheet.values_batch_get.call_count, 1)
+        self.assertEqual(spreadsheet.values_batch_update.call_count, 1)
+        spreadsheet.worksheet.assert_not_called()
+        data = spreadsheet.values_batch_update.call_args.args[0]['data']
+        self.assertIn({'range': "'Assumptions'!C4", 'values': [[0.25]]}, data)
+
+    def test_template_update_dict_fixed_costs(self):
+        '''{name: amount} fixed costs are written like the list form, in the same two calls'''
+        import create_financial_model as cfm
+
+        config = dict(cfm.HUMANOID_RENT_CONFIG, fixed_costs={'Office': 36000, 'Insurance': 12000})
+        spreadsheet = template_spreadsheet({'Assumptions': [], 'Sources & References': []})
+        with contextlib.redirect_stdout(io.StringIO()):
+            cfm._update_template_values(spreadsheet, config)
+        self.assertEqual(spreadsheet.values_batch_get.call_count, 1)
+        self.assertEqual(spreadsheet.values_batch_update.call_count, 1)
+        data = spreadsheet.values_batch_update.call_args.args[0]['data']
+        for cell, value in [('A41', 'Office'), ('C41', 36000), ('A42', 'Insurance'),
+                            ('C42', 12000), ('A43', '(Unused Cost 3)')]:
+            self.assertIn({'range': f"'Assumptions'!{cell}", 'values': [[value]]}, data)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
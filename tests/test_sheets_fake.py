@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+'''
+Test Suite for sheets_fake.py
+=============================
+Tests the in-process Sheets/Drive stand-in through real gspread and
+googleapiclient clients, and the API-call counts of pipeline scenarios
+(no network).
+
+Usage:
+    python -m pytest tests/test_sheets_fake.py -v
+    python tests/test_sheets_fake.py  # Run without pytest
+'''
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'execution'))
+
+import gspread
+from google.auth.transport.requests import AuthorizedSession
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+from sheets_fake import FakeGoogleAPI, VirtualClock, fake_credentials, run_benchmark
+from sheets_quota import QuotaLimiter, authorize, execute
+
+
+def fake_api(**kwargs):
+    '''Fake on a virtual clock with its own (deterministic) limiter'''
+    clock = VirtualClock()
+    return FakeGoogleAPI(clock=clock, **kwargs), QuotaLimiter(max_retries=10, rng=lambda: 0.5), clock
+
+
+class TestGspreadRoundTrip(unittest.TestCase):
+    '''Test gspread calls against the in-memory grids'''
+
+    def test_create_write_read(self):
+        '''Values are parsed like USER_ENTERED input and read back per render option'''
+        fake, limiter, _ = fake_api()
+        with fake.install(limiter):
+            client = authorize(fake_credentials(), limiter=limiter)
+            spreadsheet = client.create('Acme - Financial Model')
+            sheet = spreadsheet.add_worksheet('P&L', rows=20, cols=5)
+            sheet.update(values=[['Revenue', '1,000', '25%', '=B1*C1']], range_name='A1',
+                         value_input_option='USER_ENTERED')
+            self.assertEqual(sheet.get_all_values(), [['Revenue', '1000', '0.25', '=B1*C1']])
+            self.assertEqual(sheet.get('B1:D1', value_render_option='FORMULA'), [[1000, 0.25, '=B1*C1']])
+            ranges = spreadsheet.values_batch_get(["'P&L'!A1:B1", 'Sheet1!A1'])['valueRanges']
+            self.assertEqual(ranges[0]['values'], [['Revenue', '1000']])
+            self.assertNotIn('values', ranges[1])
+            self.assertEqual([ws.title for ws in spreadsheet.worksheets()], ['Sheet1', 'P&L'])
+        self.assertEqual(fake.counts['drive.files.create'], 1)
+        self.assertEqual(fake.counts['sheets.values.update'], 1)
+        self.assertEqual(AuthorizedSession.request.__name__, 'request')  # restored
+
+    def test_batch_update_is_atomic(self):
+        '''A bad request rejects the whole batchUpdate; nothing is applied'''
+        fake, limiter, _ = fake_api()
+        sheet_id = fake.add_spreadsheet('Model', {'Assumptions': [['Tax', 0.25]]})
+        with fake.install(limiter):
+            spreadsheet = authorize(fake_credentials(), limiter=limiter).open_by_key(sheet_id)
+            with self.assertRaises(gspread.exceptions.APIError) as ctx:
+                spreadsheet.batch_update({'requests': [
+                    {'addSheet': {'properties': {'title': 'Revenue'}}},
+                    {'repeatCell': {'range': {'sheetId': 99}, 'fields': 'userEnteredFormat'}},
+                ]})
+            self.assertIn('requests[1]', str(ctx.exception))
+            self.assertEqual([ws.title for ws in spreadsheet.worksheets()], ['Assumptions'])
+            with self.assertRaises(gspread.exceptions.APIError):
+                spreadsheet.worksheet('Assumptions').update(values=[[1]] * 2000, range_name='A1')
+
+    def test_quota_throttles_and_limiter_recovers(self):
+        '''Past the fake per-minute quota requests get 429; the limiter retries them'''
+        fake, limiter, clock = fake_api(writes_per_minute=5)
+        sheet_id = fake.add_spreadsheet('Model')
+        with fake.install(limiter):
+            sheet = authorize(fake_credentials(), limiter=limiter).open_by_key(sheet_id).sheet1
+            for i in range(8):
+                sheet.update(values=[[i]], range_name=f'A{i + 1}')
+        self.assertGreater(fake.throttled, 0)
+        self.assertEqual(limiter.retries, fake.throttled)
+        self.assertEqual(fake.values(sheet_id, 'Sheet1'), [[i] for i in range(8)])
+        self.assertGreater(clock.now, 60)
+
+
+class TestDriveClient(unittest.TestCase):
+    '''Test googleapiclient Drive calls against the fake'''
+
+    def test_copy_move_and_missing_file(self):
+        '''files.copy duplicates the grids; a missing file is an HttpError 404'''
+        fake, limiter, _ = fake_api()
+        source = fake.add_spreadsheet('Template', {'Assumptions': [['Tax', 0.25]]})
+        with fake.install(limiter):
+            drive = build('drive', 'v3', credentials=fake_credentials())
+            copied = execute(drive.files().copy(fileId=source, body={'name': 'Acme'}), limiter)
+            execute(drive.files().update(fileId=copied['id'], addParents='folder1',
+                                         removeParents='', fields='id, parents'), limiter)
+            self.assertEqual(execute(drive.files().get(fileId=copied['id']), limiter)['parents'],
+                             ['folder1'])
+            with self.assertRaises(HttpError) as ctx:
+                execute(drive.files().get(fileId='missing'), limiter)
+            self.assertEqual(ctx.exception.resp.status, 404)
+        self.assertEqual(fake.values(copied['id'], 'Assumptions'), [['Tax', 0.25]])
+        self.assertEqual(fake.counts['drive.files.copy'], 1)
+
+
+class TestPipelineBenchmark(unittest.TestCase):
+    '''Test API-call budgets of the Google-facing scripts'''
+
+    def test_scenario_call_counts(self):
+        '''Template creation is one copy, one metadata read, one read and one write'''
+        report = run_benchmark(['template', 'snapshot'])
+        template, snapshot = report['scenarios']
+        self.assertEqual(template['status'], 'ok', template['error'])
+        self.assertEqual(template['by_method'], {
+            'drive.files.copy': 1,
+            'sheets.spreadsheets.get': 1,
+            'sheets.values.batchGet': 1,
+            'sheets.values.batchUpdate': 1,
+        })
+        self.assertEqual(snapshot['status'], 'ok', snapshot['error'])
+        self.assertEqual(snapshot['sheets_writes'], 0)
+        self.assertEqual(snapshot['by_method']['sheets.values.get'], 28)  # values + formulas x 14
+        self.assertGreater(snapshot['elapsed_s'], 0)
+
+    def test_scratch_build_call_counts(self):
+        '''A from-scratch 14-sheet build commits in three batched write calls'''
+        scratch = run_benchmark(['scratch'])['scenarios'][0]
+        self.assertEqual(scratch['status'], 'ok', scratch['error'])
+        self.assertEqual(scratch['detail'], '14 sheets')
+        self.assertEqual(scratch['by_method'], {
+            'drive.files.create': 1,
+            'sheets.spreadsheets.get': 2,
+            'sheets.spreadsheets.batchUpdate': 2,  # addSheet, then formats + deleteSheet
+            'sheets.values.batchUpdate': 1,
+        })
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+'''
+Test Suite for sheets_quota.py
+==============================
+Tests the shared Sheets API token bucket and 429 / Retry-After handling
+on a simulated clock (no network).
+
+Usage:
+    python -m pytest tests/test_sheets_quota.py -v
+    python tests/test_sheets_quota.py  # Run without pytest
+'''
+
+import os
+import sys
+import threading
+import unittest
+from email.utils import formatdate
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'execution'))
+
+from sheets_quota import QuotaLimiter, TokenBucket, authorize, retry_after
+
+
+class FakeClock:
+    '''Monotonic clock advanced only by sleep()'''
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None):
+        self.status_code = status
+        self.headers = headers or {}
+        self.ok = status < 400
+        self.text = ''
+
+    def json(self):
+        return {'error': {'code': self.status_code, 'message': 'quota', 'status': 'RESOURCE_EXHAUSTED'}}
+
+
+class FakeAPIError(Exception):
+    def __init__(self, status, headers=None):
+        super().__init__(f'HTTP {status}')
+        self.response = FakeResponse(status, headers)
+
+
+def limiter(clock, **kwargs):
+    return QuotaLimiter(clock=clock, sleep=clock.sleep, rng=lambda: 0.5, **kwargs)
+
+
+class TestTokenBucket(unittest.TestCase):
+    '''Test pacing against a per-minute quota'''
+
+    def test_burst_then_paced(self):
+        '''The burst is free; later calls wait only for refilled tokens'''
+        clock = FakeClock()
+        bucket = TokenBucket.per_minute(60, burst=10, clock=clock, sleep=clock.sleep)
+        for _ in range(10):
+            self.assertEqual(bucket.acquire(), 0.0)
+        self.assertAlmostEqual(bucket.acquire(), 60 / 50)
+        clock.now += 30  # idle time refills the bucket (up to the burst)
+        for _ in range(10):
+            self.assertEqual(bucket.acquire(), 0.0)
+
+    def test_no_rolling_minute_exceeds_quota(self):
+        '''200 back-to-back calls never put more than 60 in any 60 s window'''
+        clock = FakeClock()
+        bucket = TokenBucket.per_minute(60, burst=10, clock=clock, sleep=clock.sleep)
+        times = []
+        for _ in range(200):
+            bucket.acquire()
+            times.append(clock.now)
+        for i, start in enumerate(times):
+            in_window = sum(1 for t in times[i:] if t < start + 60)
+            self.assertLessEqual(in_window, 60)
+
+    def test_pause_holds_acquirers(self):
+        '''pause() (server Retry-After) blocks the next acquire for that long'''
+        clock = FakeClock()
+        bucket = TokenBucket.per_minute(60, burst=10, clock=clock, sleep=clock.sleep)
+        bucket.pause(5)
+        self.assertAlmostEqual(bucket.acquire(), 5.0)
+
+
+class TestRetries(unittest.TestCase):
+    '''Test 429 / Retry-After / backoff handling'''
+
+    def flaky(self, failures):
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) <= len(failures):
+                raise failures[len(calls) - 1]
+            return 'ok'
+        return send, calls
+
+    def test_retry_after_honored(self):
+        '''A 429 with Retry-After waits exactly that long, then succeeds'''
+        clock = FakeClock()
+        quota = limiter(clock)
+        send, calls = self.flaky([FakeAPIError(429, {'Retry-After': '7'})])
+        self.assertEqual(quota.run(send, quota.writes), 'ok')
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(clock.sleeps, [7.0])
+        self.assertEqual((quota.requests, quota.retries), (2, 1))
+
+    def test_jittered_exponential_backoff(self):
+        '''Without Retry-After the delay doubles, jittered within [cap/2, cap]'''
+        clock = FakeClock()
+        quota = limiter(clock)
+        send, _ = self.flaky([FakeAPIError(503), FakeAPIError(429), FakeAPIError(429)])
+        self.assertEqual(quota.run(send), 'ok')
+        self.assertEqual(clock.sleeps, [0.75, 1.5, 3.0])
+
+    def test_gives_up_and_skips_client_errors(self):
+        '''Retries stop at max_retries; a 400 is raised at once'''
+        clock = FakeClock()
+        quota = limiter(clock, max_retries=2)
+        send, calls = self.flaky([FakeAPIError(429)] * 5)
+        with self.assertRaises(FakeAPIError):
+            quota.run(send)
+        self.assertEqual(len(calls), 3)
+
+        send, calls = self.flaky([FakeAPIError(400)])
+        with self.assertRaises(FakeAPIError):
+            quota.run(send)
+        self.assertEqual(len(calls), 1)
+
+    def test_retry_after_http_date(self):
+        '''Retry-After may be an HTTP date'''
+        exc = FakeAPIError(429, {'Retry-After': formatdate(1000.0 + 30, usegmt=True)})
+        self.assertAlmostEqual(retry_after(exc, now=1000.0), 30.0)
+        self.assertIsNone(retry_after(FakeAPIError(429)))
+
+    def test_bucket_routing(self):
+        '''Sheets GETs use the read quota, other Sheets calls the write quota'''
+        quota = QuotaLimiter()
+        sheets = 'https://sheets.googleapis.com/v4/spreadsheets/abc'
+        self.assertIs(quota.bucket_for('get', sheets + '/values/A1'), quota.reads)
+        self.assertIs(quota.bucket_for('post', sheets + ':batchUpdate'), quota.writes)
+        self.assertIsNone(quota.bucket_for('post', 'https://www.googleapis.com/drive/v3/files'))
+
+
+class TestGspreadClient(unittest.TestCase):
+    '''Test that authorize() routes gspread requests through the limiter'''
+
+    def test_client_requests_are_paced_and_retried(self):
+        '''A worksheet update retries a 429 and is charged to the write bucket'''
+        from google.oauth2.credentials import Credentials
+
+        clock = FakeClock()
+        quota = limiter(clock, burst=1)
+        client = authorize(Credentials(token='test'), limiter=quota)
+        responses = [FakeResponse(429, {'Retry-After': '2'}), FakeResponse(200), FakeResponse(200)]
+
+        class Session:
+            def request(self, **kwargs):
+                return responses.pop(0)
+
+        client.http_client.session = Session()
+        url = 'https://sheets.googleapis.com/v4/spreadsheets/abc:batchUpdate'
+        self.assertEqual(client.http_client.request('post', url).status_code, 200)
+        self.assertEqual((quota.requests, quota.retries), (2, 1))
+        self.assertEqual(clock.sleeps, [2.0])
+        client.http_client.request('post', url)  # third token at 2 / (59/60) s
+        self.assertAlmostEqual(clock.now, 2 * 60 / 59)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -18,6 +18,9 @@ import unittest
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'execution'))
 
+import config_schema
+from build_financial_model import normalize_config
+from config_schema import compile_config, config_digest
 from validate_config import ConfigValidator, ValidationLevel
 
 
@@ -209,6 +212,88 @@ class TestConfigValidator(unittest.TestCase):
         self.assertTrue(any('negative' in msg.lower() for msg in error_messages))
         self.assertTrue(any('integer' in msg.lower() for msg in error_messages))
 
+    def test_fixed_asset_classes(self):
+        '''Test fixed_assets.classes lives and capex arrays'''
+        config = {
+            'company_name': 'TestCo',
+            'tax_rate': 0.25,
+            'starting_year': 2026,
+            'fixed_assets': {
+                'classes': [
+                    {'name': 'Equipment', 'useful_life': 5, 'capex': [150000, 50000]},
+                    {'name': 'Broken', 'useful_life': 0, 'capex': [100, -5]},
+                ]
+            },
+        }
+
+        validator = ConfigValidator(config)
+        validator.validate_all()
+
+        fields = [i.field for i in validator.issues if i.level == ValidationLevel.ERROR]
+        self.assertNotIn('fixed_assets.classes[0].useful_life', fields)
+        self.assertIn('fixed_assets.classes[1].useful_life', fields)
+        self.assertIn('fixed_assets.classes[1].capex', fields)
+
+
+class TestCompiledSchema(unittest.TestCase):
+    '''Test the single-pass schema shared by normalize_config and the validator'''
+
+    def legacy_config(self):
+        return {
+            'company': 'TestCo',
+            'tax_rate': 0.3,
+            'revenue_streams': [{'name': 'A', 'unit_price': 250, 'growth_rate': 0.4}],
+            'headcount': {'engineering_salary': 90000, 'engineering_y0': 4, 'finance_salary': -1},
+            'funding': {'seed': 1000000, 'seed_year': 0},
+            'tam': 5000,
+        }
+
+    def test_normalizer_and_validator_share_rules(self):
+        '''Aliases the validator accepts are the values the builder uses'''
+        config = self.legacy_config()
+        normalized = normalize_config(config)
+        stream = normalized['revenue_streams'][0]
+        self.assertEqual((stream['price'], stream['growth']), (250, 0.4))
+        self.assertEqual(normalized['general']['tax_rate'], 0.3)
+        self.assertEqual(normalized['headcount']['departments'][0]['name'], 'Engineering')
+        self.assertEqual(normalized['tam']['streams'][0]['value_m'], 5000)
+
+        validator = ConfigValidator(config)
+        validator.validate_all()
+        self.assertEqual(validator.normalized, normalized)
+        fields = [i.field for i in validator.issues if i.level == ValidationLevel.ERROR]
+        self.assertIn('headcount.finance_salary', fields)
+        self.assertNotIn('departments', config['headcount'])  # raw config is left untouched
+
+    def test_memoized_by_content(self):
+        '''Key order does not matter; every call gets its own copy'''
+        config = self.legacy_config()
+        reordered = dict(reversed(list(config.items())))
+        self.assertEqual(config_digest(config), config_digest(reordered))
+
+        first = compile_config(config)
+        first.config['revenue_streams'].clear()
+        second = compile_config(reordered)
+        self.assertEqual(len(second.config['revenue_streams']), 1)
+        self.assertEqual(second.issues, first.issues)
+
+    def test_cache_dir_skips_recompile(self):
+        '''A persisted result is reused by a fresh process (memo cleared)'''
+        config = self.legacy_config()
+        config['company'] = 'CachedCo'
+        with tempfile.TemporaryDirectory() as tmp:
+            expected = compile_config(config, cache_dir=tmp)
+            self.assertEqual(len(os.listdir(tmp)), 1)
+            config_schema._MEMO.clear()
+            schema = config_schema.SCHEMA
+            config_schema.SCHEMA = ()  # any recompile would now lose every rule
+            try:
+                cached = compile_config(config, cache_dir=tmp)
+            finally:
+                config_schema.SCHEMA = schema
+        self.assertEqual(cached.config, expected.config)
+        self.assertEqual(cached.issues, expected.issues)
+
 
 class TestConfigValidatorCLI(unittest.TestCase):
     '''Test CLI functionality'''
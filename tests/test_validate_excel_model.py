@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+'''
+Test Suite for validate_excel_model.py
+======================================
+Tests formula recalculation and error detection on workbooks written by
+build_financial_model.py.
+
+Usage:
+    python -m pytest tests/test_validate_excel_model.py -v
+    python tests/test_validate_excel_model.py  # Run without pytest
+'''
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'execution'))
+
+
+def _hang(job):
+    '''Batch worker stand-in that never finishes (ignores the per-file timer)'''
+    time.sleep(60)
+
+from openpyxl import load_workbook
+
+from build_financial_model import FinancialModelBuilder
+
+try:
+    import formulas  # noqa: F401
+    HAS_FORMULAS = True
+except ImportError:
+    HAS_FORMULAS = False
+
+if HAS_FORMULAS:
+    import numpy as np
+    from formulas.tokens.operand import Error
+
+    from validate_excel_model import (
+        ExcelModelValidator,
+        LabelIndex,
+        discover_workbooks,
+        index_computed_values,
+        read_workbook_inputs,
+        validate_batch,
+    )
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'execution', 'validate_excel_model.py')
+
+
+def sample_config():
+    '''Two streams, one fixed cost, seed funding'''
+    return {
+        'company_name': 'ValidateCo',
+        'starting_year': 2026,
+        'revenue_streams': [
+            {'name': 'Software', 'price': 2500, 'volume': 25, 'growth': 0.5, 'cogs_pct': 0.15},
+            {'name': 'Services', 'price': 10000, 'volume': 5, 'growth': 0.4, 'cogs_pct': 0.45},
+        ],
+        'fixed_costs': [{'name': 'Office', 'annual_cost': 36000}],
+        'headcount': {'engineering_salary': 80000, 'engineering_y0': 5},
+        'funding': {'seed': 3000000, 'seed_year': 0},
+    }
+
+
+def run(validator, method, *args, **kwargs):
+    '''Call a validator method with its progress output suppressed'''
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        return getattr(validator, method)(*args, **kwargs)
+
+
+@unittest.skipUnless(HAS_FORMULAS, 'formulas library not installed')
+class TestValueScan(unittest.TestCase):
+    '''Test the shared typed-array pass over computed values'''
+
+    def validator(self):
+        validator = ExcelModelValidator('model.xlsx')
+        validator.computed_values = {
+            "'[model.xlsx]P&L'!C4": 100.0,
+            "'[model.xlsx]P&L'!C5": float('nan'),
+            "'[model.xlsx]P&L'!C6": Error.errors['#DIV/0!'],
+            "'[model.xlsx]P&L'!C7": 'See #N/A note',
+            "'[model.xlsx]P&L'!A8": True,
+            "'[model.xlsx]CASH FLOW'!C9": -float('inf'),
+            "'[model.xlsx]CASH FLOW'!C10": np.int64(7),
+            "'[model.xlsx]NET INCOME'!C11": np.float64(42.0),
+            "'[model.xlsx]NET INCOME'!C12": 'Total',
+        }
+        return validator
+
+    def test_typed_arrays(self):
+        '''One pass splits numbers, non-numeric cells and error codes per sheet'''
+        validator = self.validator()
+        grid = index_computed_values(validator.computed_values, validator.ERROR_PATTERNS)
+        self.assertEqual(list(grid), ['P&L', 'CASH FLOW', 'NET INCOME'])
+        pnl = grid['P&L']
+        self.assertEqual(pnl.numeric.tolist(), [True, True, False, False, False])
+        self.assertEqual(pnl.errors.tolist(), [-1, -1, 2, 4, -1])
+        self.assertEqual(pnl.numbers[0], 100.0)
+        self.assertEqual(grid['CASH FLOW'].numbers[1], 7.0)
+
+    def test_checks_share_the_arrays(self):
+        '''Error scan and sheet summary read the same arrays'''
+        validator = self.validator()
+        self.assertEqual(validator.check_formula_errors(), 4)
+        self.assertEqual(validator.errors, [
+            "'[model.xlsx]P&L'!C5: NaN (Not a Number)",
+            "'[model.xlsx]P&L'!C6: #DIV/0!",
+            "'[model.xlsx]P&L'!C7: #N/A",
+            "'[model.xlsx]CASH FLOW'!C9: -Infinity (division by zero?)",
+        ])
+        self.assertEqual(
+            validator.get_sheet_summary(), {'P&L': 5, 'CASH FLOW': 2, 'NET INCOME': 2}
+        )
+        self.assertIs(validator.grid, validator.grid)
+
+    def test_label_index(self):
+        '''Column-A labels map to rows; values come back per header period'''
+        values = {
+            "'[m.xlsx]BS'!A1": 'Line Item', "'[m.xlsx]BS'!B1": 'Unit',
+            "'[m.xlsx]BS'!C1": 'FY1', "'[m.xlsx]BS'!D1": 2027,
+            "'[m.xlsx]BS'!A2": 'NET INCOME (PAT)', "'[m.xlsx]BS'!B2": 'USD',
+            "'[m.xlsx]BS'!C2": 5.0, "'[m.xlsx]BS'!D2": 7.0,
+            "'[m.xlsx]BS'!A3": 'Cash',
+            "'[m.xlsx]BS'!D3": 3.0,
+        }
+        grid = index_computed_values(values, ExcelModelValidator.ERROR_PATTERNS)
+        index = LabelIndex(grid, {'BS': grid['BS'].text})
+        self.assertEqual(index.period_labels('BS'), ['FY1', '2027'])
+        self.assertEqual(index.row('BS', 'Net Income').tolist(), [5.0, 7.0])
+        self.assertTrue(np.isnan(index.row('BS', 'Closing Cash', 'cash')[0]))
+        self.assertIsNone(index.row('BS', 'EBITDA'))
+        self.assertIsNone(index.row('P&L', 'Revenue'))
+        self.assertEqual(index.sheet('balance', 'bs'), 'BS')
+
+    def test_missing_balance_rows_warn(self):
+        '''Without labelled totals the check is skipped with a warning'''
+        validator = self.validator()
+        validator.filepath = os.path.join(tempfile.gettempdir(), 'no-such-model.xlsx')
+        self.assertFalse(validator.check_balance_sheet())
+        self.assertEqual(validator.errors, [])
+        self.assertIn('rows not found', validator.warnings[0])
+
+
+@unittest.skipUnless(HAS_FORMULAS, 'formulas library not installed')
+class TestBalanceAndMetrics(unittest.TestCase):
+    '''Test the label-indexed balance sheet, cash and metric checks'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, 'model.xlsx')
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder = FinancialModelBuilder(sample_config(), 6)
+            builder.build_all()
+            builder.save(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def tampered(self, sheet, cell, value):
+        path = os.path.join(self.tmp.name, f'tampered_{sheet[0]}{cell}.xlsx')
+        wb = load_workbook(self.path)
+        wb[sheet][cell] = value
+        wb.save(path)
+        return path
+
+    def test_balanced_model_and_metrics(self):
+        '''Built model balances; metrics are the final-year P&L rows'''
+        validator = ExcelModelValidator(self.path)
+        run(validator, 'load_and_calculate')
+        self.assertTrue(validator.check_balance_sheet(), validator.errors)
+        self.assertEqual(validator.errors, [])
+
+        metrics = validator.get_key_metrics()
+        self.assertEqual(validator.metrics_period, '2031')
+        self.assertEqual(set(metrics), {'Total Revenue', 'Gross Profit', 'EBITDA', 'Net Income'})
+        net_income = [v for k, v in validator.computed_values.items() if k.endswith("P&L'!H19")][0]
+        self.assertAlmostEqual(metrics['Net Income'], net_income)
+
+    def test_imbalance_and_cash_mismatch_reported(self):
+        '''Per-period identity and cash roll-forward failures fail validation'''
+        validator = ExcelModelValidator(self.tampered('Balance Sheet', 'E6', 999999))
+        success, report = run(validator, 'validate', check_balance=True)
+        self.assertFalse(success)
+        self.assertTrue(validator.errors[0].startswith('Balance sheet 2028: Assets'))
+        self.assertEqual(len(validator.errors), 1)
+
+        validator = ExcelModelValidator(self.tampered('Cash Flow', 'F20', '=E20+F18+5000'))
+        run(validator, 'load_and_calculate')
+        self.assertFalse(validator.check_balance_sheet())
+        self.assertIn('Cash roll-forward 2029: Closing', validator.errors[-1])
+
+    def test_targeted_run_reads_labels_from_file(self):
+        '''Subgraph runs have no label cells; the index falls back to column A'''
+        validator = ExcelModelValidator(self.path, targets=['balance'])
+        run(validator, 'load_and_calculate')
+        self.assertTrue(validator.check_balance_sheet(), validator.errors)
+        self.assertIn('TOTAL ASSETS', validator.labels.labels['BALANCE SHEET'])
+
+
+@unittest.skipUnless(HAS_FORMULAS, 'formulas library not installed')
+class TestTargetedValidation(unittest.TestCase):
+    '''Test subgraph evaluation for a set of output cells'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, 'model.xlsx')
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder = FinancialModelBuilder(sample_config(), 6)
+            builder.build_all()
+            builder.save(cls.path)
+        cls.full = ExcelModelValidator(cls.path)
+        run(cls.full, 'load_and_calculate')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_balance_subgraph_matches_full_recalculation(self):
+        '''Only precedents of the balance rows are computed, with equal values'''
+        validator = ExcelModelValidator(self.path, targets=['balance'])
+        self.assertTrue(run(validator, 'load_and_calculate'))
+        self.assertEqual(len(validator.target_ranges), 3)
+        self.assertLess(len(validator.computed_values), len(self.full.computed_values))
+
+        check = [k for k in validator.computed_values if k.endswith("BALANCE SHEET'!C17")]
+        self.assertEqual(len(check), 1)
+        for key, value in validator.computed_values.items():
+            self.assertEqual(str(value), str(self.full.computed_values[key]), key)
+        sheets = validator.get_sheet_summary()
+        self.assertNotIn('VALUATION', sheets)
+        self.assertNotIn('SUMMARY', sheets)
+
+    def test_cell_reference_targets(self):
+        '''Sheet!A1 targets; unknown targets fail the load'''
+        validator = ExcelModelValidator(self.path)
+        self.assertTrue(run(validator, 'load_and_calculate', targets=["'P&L'!C19:D19"]))
+        net_income = [k for k in validator.computed_values if k.endswith("P&L'!C19")]
+        self.assertEqual(len(net_income), 1)
+
+        missing = ExcelModelValidator(self.path, targets=['cash'])
+        self.assertFalse(run(missing, 'load_and_calculate'))
+        self.assertIn('Unknown target: cash', missing.warnings)
+
+    def test_check_balance_adds_balance_rows(self):
+        '''A targeted run with --check-balance evaluates the balance rows'''
+        validator = ExcelModelValidator(self.path, targets=['pnl'])
+        success, report = run(validator, 'validate', check_balance=True)
+        self.assertTrue(success, report)
+        self.assertEqual(validator.targets, ['pnl', 'balance'])
+        self.assertIn('subgraph only', report)
+
+
+@unittest.skipUnless(HAS_FORMULAS, 'formulas library not installed')
+class TestCompiledModelCache(unittest.TestCase):
+    '''Test reuse of the compiled calculation graph across runs'''
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = os.path.join(self.tmp.name, 'cache')
+        self.path = os.path.join(self.tmp.name, 'model.xlsx')
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder = FinancialModelBuilder(sample_config(), 6)
+            builder.build_all()
+            builder.save(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def edit(self, sheet, cell, value, path=None):
+        wb = load_workbook(self.path)
+        wb[sheet][cell] = value
+        wb.save(path or self.path)
+
+    def validate(self, cache_dir=None):
+        validator = ExcelModelValidator(self.path, targets=['pnl'], cache_dir=cache_dir)
+        self.assertTrue(run(validator, 'load_and_calculate'), validator.errors)
+        return validator
+
+    def revenue(self, validator):
+        return [v for k, v in validator.computed_values.items() if k.endswith("P&L'!C4")][0]
+
+    def test_structure_hash_ignores_values(self):
+        '''Value edits keep the hash; formula edits change it'''
+        structure, values = read_workbook_inputs(self.path)
+        self.assertEqual(values[('ASSUMPTIONS', 'B15')], 2500)
+
+        edited = os.path.join(self.tmp.name, 'edited.xlsx')
+        self.edit('Assumptions', 'B15', 3000, edited)
+        self.assertEqual(read_workbook_inputs(edited)[0], structure)
+        self.edit('P&L', 'C6', '=C4-C5-1', edited)
+        self.assertNotEqual(read_workbook_inputs(edited)[0], structure)
+
+    def test_value_edit_resolves_cached_graph(self):
+        '''A value-only edit reuses the graph and matches a fresh recalculation'''
+        first = self.validate(self.cache)
+        self.assertFalse(first.cache_hit)
+        self.assertEqual(len(os.listdir(self.cache)), 1)
+
+        self.edit('Assumptions', 'B15', 5000)  # Software price 2500 -> 5000
+        cached = self.validate(self.cache)
+        fresh = self.validate()
+        self.assertTrue(cached.cache_hit)
+        self.assertIsNone(fresh.cache_hit)
+        self.assertNotEqual(self.revenue(cached), self.revenue(first))
+        self.assertEqual(cached.computed_values.keys(), fresh.computed_values.keys())
+        for key, value in fresh.computed_values.items():
+            self.assertEqual(str(cached.computed_values[key]), str(value), key)
+
+    def test_formula_edit_recompiles(self):
+        '''A changed formula gets its own entry; corrupt entries are rebuilt'''
+        self.validate(self.cache)
+        self.edit('P&L', 'C4', '=Revenue!C6*2')
+        validator = self.validate(self.cache)
+        self.assertFalse(validator.cache_hit)
+        entries = os.listdir(self.cache)
+        self.assertEqual(len(entries), 2)
+
+        for name in entries:
+            with open(os.path.join(self.cache, name), 'wb') as f:
+                f.write(b'not a pickle')
+        self.assertFalse(self.validate(self.cache).cache_hit)
+        self.assertTrue(self.validate(self.cache).cache_hit)
+
+
+
+@unittest.skipUnless(HAS_FORMULAS, 'formulas library not installed')
+class TestBatchValidation(unittest.TestCase):
+    '''Test validating many workbooks across a process pool'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        root = cls.tmp.name
+        os.makedirs(os.path.join(root, 'nested'))
+        cls.good = os.path.join(root, 'nested', 'good.xlsx')
+        with contextlib.redirect_stdout(io.StringIO()):
+            builder = FinancialModelBuilder(sample_config(), 6)
+            builder.build_all()
+            builder.save(cls.good)
+        cls.broken = os.path.join(root, 'broken.xlsx')
+        for path, text in ((cls.broken, 'not a zip'), (os.path.join(root, '~$good.xlsx'), ''),
+                           (os.path.join(root, 'notes.txt'), '')):
+            with open(path, 'w') as f:
+                f.write(text)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_discover_workbooks(self):
+        '''Directories are searched recursively; lock files and non-xlsx skipped'''
+        found = discover_workbooks([self.tmp.name, self.good])
+        self.assertEqual(found, sorted([self.broken, self.good]))
+
+    def test_report_covers_every_file(self):
+        '''One report with per-file status, errors and metrics'''
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = validate_batch([self.good, self.broken], workers=2, check_balance=True)
+        self.assertEqual((report['total'], report['ok'], report['invalid']), (2, 1, 1))
+        by_file = {m['file']: m for m in report['models']}
+        self.assertEqual(by_file[self.good]['status'], 'ok')
+        self.assertIn('Net Income', by_file[self.good]['metrics'])
+        self.assertIn('BALANCE SHEET', by_file[self.good]['sheets'])
+        self.assertIn('Failed to load', by_file[self.broken]['error'])
+        json.dumps(report)
+
+    def test_per_file_timeout(self):
+        '''A workbook over its budget is reported as timed out'''
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = validate_batch([self.good], workers=1, timeout=0.05)
+        self.assertEqual(report['timeout'], 1)
+        self.assertIn('timeout', report['models'][0]['error'])
+
+    def test_batch_deadline_kills_hung_worker(self):
+        '''A worker stuck past the batch deadline is terminated and reported'''
+        import validate_excel_model
+
+        with patch.object(validate_excel_model, 'validate_one', _hang), \
+                patch.object(validate_excel_model, 'BATCH_GRACE_S', 0.5), \
+                contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            report = validate_batch([self.good], workers=1, timeout=0.1)
+        self.assertLess(time.perf_counter() - started, 10)
+        self.assertEqual(report['timeout'], 1)
+        self.assertEqual(report['models'][0]['error'], 'Batch deadline reached')
+
+    def test_cli_exit_code_and_report(self):
+        '''--batch writes the JSON report and exits 1 when any model fails'''
+        report_path = os.path.join(self.tmp.name, 'report.json')
+        result = subprocess.run(
+            [sys.executable, SCRIPT, '--batch', self.broken, '--report', report_path],
+            capture_output=True, text=True,
+        )
+        self.assertEqual(result.returncode, 1, result.stdout + result.stderr)
+        with open(report_path, encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual(report['invalid'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)